@@ -0,0 +1,38 @@
+"""agent memory window index
+
+Revision ID: 002_agent_memory_window_index
+Revises: 001_initial
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002_agent_memory_window_index'
+down_revision: str | None = '001_initial'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _has_agent_memory() -> bool:
+    # agent_memory is created from the models by init_db, not by 001_initial
+    return sa.inspect(op.get_bind()).has_table('agent_memory')
+
+
+def upgrade() -> None:
+    # Serves "latest N memory entries for a session" without a sort
+    if _has_agent_memory():
+        op.create_index(
+            'idx_agent_memory_session_timestamp',
+            'agent_memory',
+            ['session_id', 'timestamp'],
+        )
+
+
+def downgrade() -> None:
+    if _has_agent_memory():
+        op.drop_index('idx_agent_memory_session_timestamp', table_name='agent_memory')
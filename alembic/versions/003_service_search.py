@@ -0,0 +1,77 @@
+"""service full-text search index
+
+Revision ID: 003_service_search
+Revises: 002_agent_memory_window_index
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003_service_search'
+down_revision: str | None = '002_agent_memory_window_index'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Same objects as src/models/services.py creates for new databases
+POSTGRES_SEARCH_DDL = [
+    """
+    ALTER TABLE services ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_services_search ON services USING GIN (search_vector)",
+]
+
+# External-content FTS5 table kept in sync with services by triggers
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS services_fts USING fts5(
+        name, description, content='services', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_ai AFTER INSERT ON services BEGIN
+        INSERT INTO services_fts(rowid, name, description)
+        VALUES (new.rowid, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_ad AFTER DELETE ON services BEGIN
+        INSERT INTO services_fts(services_fts, rowid, name, description)
+        VALUES ('delete', old.rowid, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_au AFTER UPDATE OF name, description ON services BEGIN
+        INSERT INTO services_fts(services_fts, rowid, name, description)
+        VALUES ('delete', old.rowid, old.name, old.description);
+        INSERT INTO services_fts(rowid, name, description)
+        VALUES (new.rowid, new.name, new.description);
+    END
+    """,
+    "INSERT INTO services_fts(services_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    # Postgres: generated tsvector column + GIN index; SQLite: FTS5 table + triggers
+    dialect = op.get_bind().dialect.name
+    statements = {"postgresql": POSTGRES_SEARCH_DDL, "sqlite": SQLITE_SEARCH_DDL}.get(dialect, [])
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS idx_services_search")
+        op.execute("ALTER TABLE services DROP COLUMN IF EXISTS search_vector")
+    elif dialect == "sqlite":
+        for trigger in ("services_fts_ai", "services_fts_ad", "services_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS services_fts")
@@ -0,0 +1,40 @@
+"""keyset pagination indexes
+
+Revision ID: 004_keyset_pagination_indexes
+Revises: 003_service_search
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_keyset_pagination_indexes'
+down_revision: str | None = '003_service_search'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Serve "ORDER BY created_at DESC, id DESC" after a (created_at, id) cursor
+    op.create_index('idx_payments_wallet_created', 'payments', ['agent_wallet', 'created_at', 'id'])
+    op.create_index('idx_payments_created_id', 'payments', ['created_at', 'id'])
+    op.create_index(
+        'idx_execution_logs_session_created',
+        'execution_logs',
+        ['session_id', 'created_at', 'id'],
+    )
+    op.create_index('idx_execution_logs_created_id', 'execution_logs', ['created_at', 'id'])
+    # Prefixes of the composite indexes above
+    op.drop_index('idx_payments_wallet', table_name='payments')
+    op.drop_index('idx_execution_session', table_name='execution_logs')
+
+
+def downgrade() -> None:
+    op.create_index('idx_execution_session', 'execution_logs', ['session_id'])
+    op.create_index('idx_payments_wallet', 'payments', ['agent_wallet'])
+    op.drop_index('idx_execution_logs_created_id', table_name='execution_logs')
+    op.drop_index('idx_execution_logs_session_created', table_name='execution_logs')
+    op.drop_index('idx_payments_created_id', table_name='payments')
+    op.drop_index('idx_payments_wallet_created', table_name='payments')
@@ -0,0 +1,36 @@
+"""payment statistics rollups
+
+Revision ID: 005_payment_stats_rollups
+Revises: 004_keyset_pagination_indexes
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '005_payment_stats_rollups'
+down_revision: str | None = '004_keyset_pagination_indexes'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Filled by scripts/backfill_payment_rollups.py, then kept current by payment writes
+    op.create_table(
+        'payment_stats_rollups',
+        sa.Column('granularity', sa.String(8), nullable=False),
+        sa.Column('bucket_start', sa.DateTime, nullable=False),
+        sa.Column('agent_wallet', sa.String(42), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('payment_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('amount_total', sa.Float, nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('granularity', 'bucket_start', 'agent_wallet', 'status'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('payment_stats_rollups')
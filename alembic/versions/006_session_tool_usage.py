@@ -0,0 +1,46 @@
+"""session tool usage counters
+
+Revision ID: 006_session_tool_usage
+Revises: 005_payment_stats_rollups
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006_session_tool_usage'
+down_revision: str | None = '005_payment_stats_rollups'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _has_tool_calls() -> bool:
+    # tool_calls is created from the models by init_db, not by 001_initial
+    return sa.inspect(op.get_bind()).has_table('tool_calls')
+
+
+def upgrade() -> None:
+    # Filled by scripts/backfill_tool_usage.py, then kept current by tool call writes
+    op.create_table(
+        'session_tool_usage',
+        sa.Column('session_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('agent_sessions.id'), nullable=False),
+        sa.Column('tool_name', sa.String(100), nullable=False),
+        sa.Column('call_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('failure_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('total_duration_ms', sa.BigInteger, nullable=False, server_default='0'),
+        sa.Column('last_called_at', sa.DateTime),
+        sa.PrimaryKeyConstraint('session_id', 'tool_name'),
+    )
+    if _has_tool_calls():
+        op.create_index('idx_tool_calls_log_tool', 'tool_calls', ['execution_log_id', 'tool_name'])
+
+
+def downgrade() -> None:
+    if _has_tool_calls():
+        op.drop_index('idx_tool_calls_log_tool', table_name='tool_calls')
+    op.drop_table('session_tool_usage')
@@ -0,0 +1,96 @@
+"""key the SQLite service search index by service id
+
+Revision ID: 007_service_fts_by_id
+Revises: 006_session_tool_usage
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_service_fts_by_id'
+down_revision: str | None = '006_session_tool_usage'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SQLITE_TRIGGERS = ("services_fts_ai", "services_fts_ad", "services_fts_au")
+
+# Same objects as src/models/services.py creates for new databases. The
+# 003 index was external content keyed by services.rowid, which VACUUM may
+# renumber on a table with a UUID primary key.
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS services_fts USING fts5(
+        id UNINDEXED, name, description
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_ai AFTER INSERT ON services BEGIN
+        INSERT INTO services_fts(id, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_ad AFTER DELETE ON services BEGIN
+        DELETE FROM services_fts WHERE id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_au AFTER UPDATE OF name, description ON services BEGIN
+        UPDATE services_fts SET name = new.name, description = new.description
+        WHERE id = old.id;
+    END
+    """,
+    "INSERT INTO services_fts(id, name, description) SELECT id, name, description FROM services",
+]
+
+# The 003_service_search objects, restored on downgrade
+SQLITE_ROWID_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS services_fts USING fts5(
+        name, description, content='services', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_ai AFTER INSERT ON services BEGIN
+        INSERT INTO services_fts(rowid, name, description)
+        VALUES (new.rowid, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_ad AFTER DELETE ON services BEGIN
+        INSERT INTO services_fts(services_fts, rowid, name, description)
+        VALUES ('delete', old.rowid, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_au AFTER UPDATE OF name, description ON services BEGIN
+        INSERT INTO services_fts(services_fts, rowid, name, description)
+        VALUES ('delete', old.rowid, old.name, old.description);
+        INSERT INTO services_fts(rowid, name, description)
+        VALUES (new.rowid, new.name, new.description);
+    END
+    """,
+    "INSERT INTO services_fts(services_fts) VALUES ('rebuild')",
+]
+
+
+def _replace_sqlite_index(statements: list[str]) -> None:
+    for trigger in SQLITE_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS services_fts")
+    for statement in statements:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    # Postgres uses the generated tsvector column and is unaffected
+    if op.get_bind().dialect.name == "sqlite":
+        _replace_sqlite_index(SQLITE_SEARCH_DDL)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        _replace_sqlite_index(SQLITE_ROWID_SEARCH_DDL)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Backfill or verify payment statistics rollups.
+
+Payment stats are answered from payment_stats_rollups, which payment writes
+keep current. Run this once after migration 005 to build the rollups from
+existing payments, or with --check to compare them against raw rows.
+
+Usage:
+    python scripts/backfill_payment_rollups.py          # rebuild, then check
+    python scripts/backfill_payment_rollups.py --check  # check only; exit 1 on mismatch
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.database import background_session, close_db  # noqa: E402
+from src.services.payment_rollups import check_rollups, rebuild_rollups  # noqa: E402
+
+
+async def run(check_only: bool, batch_size: int) -> int:
+    try:
+        if not check_only:
+            # One transaction: stats readers see the old rollups until commit
+            async with background_session() as db:
+                processed = await rebuild_rollups(db, batch_size=batch_size)
+            print(f"rebuilt rollups from {processed} payments")
+
+        async with background_session() as db:
+            mismatches = await check_rollups(db)
+    finally:
+        await close_db()
+
+    if not mismatches:
+        print("rollups match raw payments")
+        return 0
+
+    print(f"{len(mismatches)} mismatches:")
+    for m in mismatches:
+        print(
+            f"  {m['granularity']:<4} {m['agent_wallet']} {m['status']:<10} "
+            f"count raw={m['raw_count']} rollup={m['rollup_count']}  "
+            f"amount raw={m['raw_amount']:.6f} rollup={m['rollup_amount']:.6f}"
+        )
+    return 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--check", action="store_true", help="only compare rollups to raw payments")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.check, args.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
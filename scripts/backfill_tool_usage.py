@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""
+Backfill tool call rows and per-session tool counters.
+
+Session summaries read session_tool_usage, and tool statistics group over
+tool_calls. Both are kept current on write. Run this once after migration
+006 to copy tool calls of older execution logs (stored only as JSON) into
+tool_calls and rebuild the counters.
+
+Usage:
+    python scripts/backfill_tool_usage.py [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.database import background_session, close_db  # noqa: E402
+from src.services.tool_usage import backfill_tool_usage  # noqa: E402
+
+
+async def run(batch_size: int) -> None:
+    try:
+        async with background_session() as db:
+            created = await backfill_tool_usage(db, batch_size=batch_size)
+        print(f"created {created} tool call rows and rebuilt session tool counters")
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
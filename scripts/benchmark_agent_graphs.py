@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Benchmark command latency with cold versus warm agent graphs.
+
+Runs the same stream of commands, one new session each, the way a subagent
+is spawned per swap, trade or bet:
+
+- cold: create_deep_agent for every command, then ainvoke (the previous
+  per-session / per-request construction)
+- warm: the graph from the shared registry, built once, then ainvoke with
+  the session passed in the run config
+
+By default the agent answers through a local chat model that replies
+immediately, so the timings isolate graph construction and orchestration.
+Pass --model (e.g. anthropic:claude-sonnet-4-20250514) to include a real
+LLM round trip; that needs the provider's API key.
+
+Usage:
+    python scripts/benchmark_agent_graphs.py [--agent vvs_trader] [--commands 50]
+        [--model MODEL]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any
+from uuid import uuid4
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.agent_graphs import (  # noqa: E402
+    AgentGraphRegistry,
+    agent_graph_specs,
+    create_deep_agent,
+    session_config,
+)
+
+COMMANDS = {
+    "paygent": "What services are available?",
+    "vvs_trader": "Swap 100 USDC for CRO on VVS Finance with 1.0% slippage tolerance",
+    "moonlander_trader": "Open a 100 USDC long position on BTC with 5x leverage",
+    "delphi_predictor": "Show the open markets on Delphi",
+}
+
+
+def instant_chat_model() -> Any:
+    """Chat model that answers at once without calling tools."""
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, ChatResult
+
+    class InstantChatModel(BaseChatModel):
+        @property
+        def _llm_type(self) -> str:
+            return "instant"
+
+        def _generate(self, *_args, **_kwargs) -> ChatResult:
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content="Done."))])
+
+        def bind_tools(self, *_args, **_kwargs):
+            return self
+
+    return InstantChatModel()
+
+
+def _summary(label: str, samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"{label:<6} {statistics.mean(ordered) * 1000:>10.1f} "
+        f"{statistics.median(ordered) * 1000:>10.1f} {p95 * 1000:>10.1f}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    if create_deep_agent is None:
+        sys.exit("deepagents is not installed")
+
+    specs = {name: (tools, prompt) for name, tools, prompt in agent_graph_specs()}
+    tools, prompt = specs[args.agent]
+    model = args.model or instant_chat_model()
+    # Model instances are not hashable registry keys; key on a label instead
+    model_key = args.model or "instant"
+
+    def build(**kwargs: Any) -> Any:
+        return create_deep_agent(**{**kwargs, "model": model})
+
+    registry = AgentGraphRegistry(max_graphs=4, factory=build)
+    command = COMMANDS[args.agent]
+    payload = {"messages": [{"role": "user", "content": command}]}
+
+    async def cold() -> None:
+        graph = build(model=model_key, tools=list(tools), system_prompt=prompt)
+        await graph.ainvoke(payload, config=session_config(uuid4()))
+
+    async def warm() -> None:
+        graph = registry.get(model_key, tools, prompt)
+        await graph.ainvoke(payload, config=session_config(uuid4()))
+
+    # First warm command builds the graph, as warm_agent_graphs does at startup
+    started = time.perf_counter()
+    registry.get(model_key, tools, prompt)
+    print(f"{args.agent}: graph build {(time.perf_counter() - started) * 1000:.1f} ms\n")
+
+    print(f"{'mode':<6} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10}")
+    for label, command_fn in (("cold", cold), ("warm", warm)):
+        await command_fn()
+        samples = []
+        for _ in range(args.commands):
+            started = time.perf_counter()
+            await command_fn()
+            samples.append(time.perf_counter() - started)
+        print(_summary(label, samples))
+    print(f"\nregistry: {registry.builds} build(s), {registry.hits} hit(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--agent", choices=sorted(COMMANDS), default="vvs_trader")
+    parser.add_argument("--commands", type=int, default=50)
+    parser.add_argument("--model", default=None)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
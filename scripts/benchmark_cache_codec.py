@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Benchmark cache value encoding for typical service registry payloads.
+
+For discovery result lists (20 and 100 services) and a single pricing
+entry, reports per-value encode and decode time and the stored size for:
+
+- legacy: json.dumps / json.loads of text (the previous CacheService path)
+- each available serializer (json, orjson, msgpack) x compression
+  (none, zlib, zstd, lz4) through CacheCodec
+
+With --redis-url, also stores each encoding and reports Redis MEMORY USAGE.
+
+Usage:
+    python scripts/benchmark_cache_codec.py [--iterations 2000] [--redis-url redis://localhost:6379]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import cache_codec as codecs  # noqa: E402
+from src.core.cache_codec import CacheCodec  # noqa: E402
+
+
+def _service(i: int) -> dict:
+    created = datetime(2026, 1, 1) + timedelta(hours=i)
+    return {
+        "id": str(uuid.UUID(int=i)),
+        "name": f"Market Data Feed {i}",
+        "description": f"Real-time OHLCV and order book snapshots for Cronos pair #{i}, "
+        "with historical backfill and websocket streaming.",
+        "endpoint": f"https://api.provider-{i % 7}.example.com/v1/feeds/{i}",
+        "pricing_model": "pay-per-call",
+        "price_amount": 0.001 * (i + 1),
+        "price_token": "USDC",
+        "mcp_compatible": i % 2 == 0,
+        "reputation_score": 3.5 + (i % 15) / 10,
+        "total_calls": 1000 + i * 37,
+        "created_at": created.isoformat(),
+        "updated_at": (created + timedelta(days=3)).isoformat(),
+    }
+
+
+PAYLOADS = {
+    "pricing": {
+        "service_id": str(uuid.UUID(int=1)),
+        "name": "Market Data Feed 1",
+        "pricing_model": "pay-per-call",
+        "price_amount": 0.002,
+        "price_token": "USDC",
+        "currency": "USD",
+        "last_updated": "2026-01-04T01:00:00",
+    },
+    "discover_20": [_service(i) for i in range(20)],
+    "discover_100": [_service(i) for i in range(100)],
+}
+
+
+def _variants() -> list[tuple[str, CacheCodec]]:
+    serializers = ["json"]
+    serializers += ["orjson"] if codecs.ORJSON_AVAILABLE else []
+    serializers += ["msgpack"] if codecs.MSGPACK_AVAILABLE else []
+    compressions = ["none", "zlib"]
+    compressions += ["zstd"] if codecs.ZSTD_AVAILABLE else []
+    compressions += ["lz4"] if codecs.LZ4_AVAILABLE else []
+    return [
+        (f"{serializer}+{compression}", CacheCodec(serializer, compression, compress_min_bytes=1024))
+        for serializer in serializers
+        for compression in compressions
+    ]
+
+
+def _time_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def _redis_memory(redis_url: str, encoded: dict[str, bytes]) -> dict[str, int]:
+    import redis.asyncio as aioredis
+
+    client = aioredis.from_url(redis_url)
+    try:
+        usage = {}
+        for name, data in encoded.items():
+            key = f"benchmark:codec:{name}"
+            await client.set(key, data)
+            usage[name] = await client.memory_usage(key)
+            await client.delete(key)
+        return usage
+    finally:
+        await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    for payload_name, payload in PAYLOADS.items():
+        print(f"\n{payload_name}")
+        print(f"{'codec':<18} {'encode µs':>10} {'decode µs':>10} {'bytes':>8} {'redis':>8}")
+
+        legacy = json.dumps(payload)
+        rows = [(
+            "legacy json text",
+            _time_us(lambda payload=payload: json.dumps(payload), args.iterations),
+            _time_us(lambda legacy=legacy: json.loads(legacy), args.iterations),
+            legacy.encode("utf-8"),
+        )]
+        for name, codec in _variants():
+            encoded = codec.encode(payload)
+            assert codec.decode(encoded) == payload
+            rows.append((
+                name,
+                _time_us(lambda codec=codec, payload=payload: codec.encode(payload), args.iterations),
+                _time_us(lambda codec=codec, encoded=encoded: codec.decode(encoded), args.iterations),
+                encoded,
+            ))
+
+        memory = {}
+        if args.redis_url:
+            memory = asyncio.run(_redis_memory(args.redis_url, {row[0]: row[3] for row in rows}))
+
+        for name, encode_us, decode_us, data in rows:
+            redis_bytes = str(memory.get(name, "-"))
+            print(f"{name:<18} {encode_us:>10.1f} {decode_us:>10.1f} {len(data):>8} {redis_bytes:>8}")
+
+
+if __name__ == "__main__":
+    main()
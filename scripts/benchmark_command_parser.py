@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+Benchmark command parsing throughput over a realistic command corpus.
+
+Builds a corpus of payment, swap, balance, discovery, perpetual trade and
+unmatched commands. Commands repeat with a skewed distribution, as they do
+in practice. It then times:
+
+- baseline: every pattern of every intent tried in turn, then keyword
+  scoring, logging at INFO (the previous CommandParser.parse)
+- compiled: an intent's patterns tried only if its trigger verbs occur
+- compiled+cache: compiled, behind the parse LRU
+
+Results of baseline and compiled are compared for every distinct command.
+
+Usage:
+    python scripts/benchmark_command_parser.py [--distinct 2000] [--commands 50000]
+        [--cache-size 4096]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.command_parser import CommandParser, ParsedCommand  # noqa: E402
+
+logger = logging.getLogger("src.agents.command_parser")
+
+TOKENS = ["CRO", "USDC", "USDT", "ETH", "BTC", "WBTC"]
+MARKETS = ["BTC", "ETH", "CRO", "BTC/USDC", "ETH/USDT"]
+RECIPIENTS = [
+    "the market data API", "0x8f3a9c2b1d4e5f60718293a4b5c6d7e8f9012345", "weather service",
+    "sentiment analytics feed", "the inference endpoint", "alice.cro",
+]
+CATEGORIES = ["market data", "defi", "prediction", "trading", "analytics", "oracle"]
+TEMPLATES = [
+    "Pay {amount} {token} to {recipient}",
+    "pay {amount} {token} for {recipient}",
+    "Transfer {amount} {token} to {recipient}",
+    "send {amount} {token} to {recipient}",
+    "Swap {amount} {token} for {token2}",
+    "exchange {amount} {token} to {token2}",
+    "Trade {amount} {token} for {token2}",
+    "Check my balance",
+    "What is my wallet balance",
+    "How much {token} do I have",
+    "show my {token} balance",
+    "Find {category} services",
+    "search for {category} protocols",
+    "What services are available",
+    "Open a {leverage}x long position on {market}",
+    "open a {amount} USDC short position on {market}",
+    "Open a {amount} USDC long position on {market} with {leverage}x leverage",
+    "short {leverage}x {market}",
+    "Long {amount} USDC {market}",
+    "I want to pay for market data",
+    "Can you help me get started",
+    "Tell me about the protocols you support",
+]
+
+
+def build_corpus(distinct: int, commands: int, seed: int = 7) -> tuple[list[str], list[str]]:
+    """Distinct commands and a stream drawing from them with a Zipf-like skew."""
+    rng = random.Random(seed)
+    unique: dict[str, None] = {}
+    while len(unique) < distinct:
+        template = rng.choice(TEMPLATES)
+        token, token2 = rng.sample(TOKENS, 2)
+        unique[template.format(
+            amount=rng.choice([0.1, 1, 5, 10, 25, 100, 250, round(rng.uniform(0.01, 500), 2)]),
+            token=token,
+            token2=token2,
+            recipient=rng.choice(RECIPIENTS),
+            category=rng.choice(CATEGORIES),
+            leverage=rng.choice([2, 5, 10, 20]),
+            market=rng.choice(MARKETS),
+        ) + " " * rng.randint(0, 1)] = None
+    pool = list(unique)
+    weights = [1 / (rank + 1) for rank in range(len(pool))]
+    return pool, rng.choices(pool, weights=weights, k=commands)
+
+
+def baseline_parse(parser: CommandParser, command: str) -> ParsedCommand:
+    """The previous parse: every pattern of every intent in order, then keywords."""
+    command = command.strip()
+    logger.info(f"Parsing command: {command}")
+    for intent, patterns in parser.compiled_patterns.items():
+        for pattern in patterns:
+            match = pattern.search(command)
+            if match:
+                parsed = parser._extract_parameters_from_match(intent, match, command)
+                logger.info(f"Pattern matched: intent={intent}, confidence={parsed.confidence}")
+                return parsed
+    return parser._parse_by_keywords(command)
+
+
+def _key(parsed: ParsedCommand) -> tuple:
+    return parsed.intent, parsed.action, parsed.parameters, parsed.confidence, parsed.raw_command
+
+
+def _time(parse, stream: list[str]) -> float:
+    start = time.perf_counter()
+    for command in stream:
+        parse(command)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--distinct", type=int, default=2000)
+    parser.add_argument("--commands", type=int, default=50_000)
+    parser.add_argument("--cache-size", type=int, default=4096)
+    args = parser.parse_args()
+    # Parsing cost only: log calls are made but not emitted
+    logging.getLogger("src.agents.command_parser").setLevel(logging.WARNING)
+
+    pool, stream = build_corpus(args.distinct, args.commands)
+    uncached = CommandParser(cache_size=0)
+    cached = CommandParser(cache_size=args.cache_size)
+
+    mismatches = [c for c in pool if _key(baseline_parse(uncached, c)) != _key(uncached.parse(c))]
+    print(f"{len(pool)} distinct commands, {len(stream)} parses, {len(mismatches)} result mismatches")
+    for command in mismatches[:5]:
+        print(f"  mismatch: {command!r}")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        CommandParser()
+    print(f"parser construction: {(time.perf_counter() - start) * 10:.3f} ms\n")
+
+    print(f"{'mode':<16} {'parses/s':>12} {'us/parse':>10}")
+    for mode, parse in (
+        ("baseline", lambda c: baseline_parse(uncached, c)),
+        ("compiled", uncached.parse),
+        ("compiled+cache", cached.parse),
+    ):
+        elapsed = _time(parse, stream)
+        print(f"{mode:<16} {len(stream) / elapsed:>12,.0f} {elapsed / len(stream) * 1e6:>10.2f}")
+    hit_rate = cached.cache_hits / max(cached.cache_hits + cached.cache_misses, 1)
+    print(f"\ncache hit rate: {hit_rate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
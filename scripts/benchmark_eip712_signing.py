@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Benchmark EIP-712 payment signing and verification throughput.
+
+Compares, in signatures per second:
+
+- before: encode_typed_data + Account.sign_message / recover_message per
+  payment, with PaymentSignatureData validation (the previous code path)
+- engine: TypedDataEngine with the precomputed domain separator and type hash
+- sign_many/verify_many: the batch API, using the process pool when the
+  batch reaches --pool-threshold
+
+Usage:
+    python scripts/benchmark_eip712_signing.py [--count 2000] [--pool-threshold 512] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eth_account import Account  # noqa: E402
+from eth_account.messages import encode_typed_data  # noqa: E402
+
+from src.core.config import settings  # noqa: E402
+from src.x402.eip712 import shutdown_process_pool  # noqa: E402
+from src.x402.signature import EIP712SignatureGenerator  # noqa: E402
+
+WALLET = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0"
+
+
+def _rate(name: str, count: int, seconds: float, baseline: float | None = None) -> float:
+    rate = count / seconds
+    speedup = f"   {rate / baseline:5.1f}x" if baseline else ""
+    print(f"{name:<24} {rate:10.0f}/s{speedup}")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--pool-threshold", type=int, default=512)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    settings.x402_sign_process_pool_threshold = args.pool_threshold
+    settings.x402_sign_process_workers = args.workers
+
+    generator = EIP712SignatureGenerator(private_key=Account.create().key.hex())
+    account = generator.account
+    payment_types = {"Payment": generator.TYPES["Payment"]}
+    payments = [
+        {
+            "service_url": f"https://api.example.com/v1/data/{i}",
+            "amount": 0.10,
+            "token": "USDC",
+            "wallet_address": WALLET,
+            "description": "benchmark",
+        }
+        for i in range(args.count)
+    ]
+    messages = [generator.create_payment_message(**payment) for payment in payments]
+    print(f"{args.count} payments\n\nsigning")
+
+    start = time.perf_counter()
+    before_signatures = []
+    for payment in payments:
+        data = generator.create_payment_data(**payment)
+        message = {
+            "serviceUrl": data.service_url,
+            "amount": data.amount,
+            "token": data.token,
+            "description": data.description or "",
+            "timestamp": data.timestamp,
+            "nonce": data.nonce,
+            "walletAddress": data.wallet_address,
+        }
+        signable = encode_typed_data(
+            domain_data=generator.domain, message_types=payment_types, message_data=message
+        )
+        before_signatures.append((message, account.sign_message(signable).signature))
+    baseline = _rate("before", args.count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    signatures = [generator.engine.sign(message) for message in messages]
+    _rate("engine", args.count, time.perf_counter() - start, baseline)
+
+    generator.engine.sign_many(messages[: args.pool_threshold])  # start the pool
+    start = time.perf_counter()
+    generator.engine.sign_many(messages)
+    _rate("sign_many", args.count, time.perf_counter() - start, baseline)
+
+    print("\nverification")
+    start = time.perf_counter()
+    for message, signature in before_signatures:
+        signable = encode_typed_data(
+            domain_data=generator.domain, message_types=payment_types, message_data=message
+        )
+        Account.recover_message(signable, signature=signature)
+    baseline = _rate("before", args.count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for message, signature in zip(messages, signatures, strict=True):
+        generator.engine.verify(message, signature, account.address)
+    _rate("engine", args.count, time.perf_counter() - start, baseline)
+
+    items = [
+        (message, signature, account.address)
+        for message, signature in zip(messages, signatures, strict=True)
+    ]
+    start = time.perf_counter()
+    generator.engine.verify_many(items)
+    _rate("verify_many", args.count, time.perf_counter() - start, baseline)
+
+    shutdown_process_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Benchmark rate limiting middleware overhead per request.
+
+Drives rate_limit_middleware directly with a no-op downstream handler and
+reports the added latency per request for each available backend:
+
+- in-memory sliding-window fallback
+- fakeredis with the Lua script (requires lupa)
+- a real Redis server, when --redis-url is given and reachable
+
+Usage:
+    python scripts/benchmark_rate_limiter.py [--requests 20000] [--clients 100]
+        [--redis-url redis://localhost:6379/0]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.middleware import rate_limiter  # noqa: E402
+from src.middleware.rate_limiter import RateLimiter, rate_limit_middleware  # noqa: E402
+
+
+class _Response:
+    def __init__(self) -> None:
+        self.headers: dict[str, str] = {}
+
+
+async def _call_next(_request):
+    return _Response()
+
+
+def _make_requests(count: int, clients: int) -> list[SimpleNamespace]:
+    """Build lightweight request stand-ins spread over many client IPs."""
+    return [
+        SimpleNamespace(
+            url=SimpleNamespace(path="/api/v1/services/discover"),
+            headers={},
+            client=SimpleNamespace(host=f"10.0.{(i % clients) // 256}.{(i % clients) % 256}"),
+        )
+        for i in range(count)
+    ]
+
+
+async def _time_per_request(requests: list, handler) -> list[float]:
+    """Time each call of handler(request) in microseconds."""
+    samples = []
+    for request in requests:
+        start = time.perf_counter()
+        await handler(request)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+async def _bench(name: str, limiter: RateLimiter, requests: list, baseline_us: float) -> None:
+    rate_limiter._rate_limiter = limiter
+
+    async def handler(request):
+        return await rate_limit_middleware(request, _call_next)
+
+    # Warm up script loading / connection pool
+    await _time_per_request(requests[:100], handler)
+    samples = await _time_per_request(requests, handler)
+    samples.sort()
+    mean = statistics.fmean(samples) - baseline_us
+    p50 = samples[len(samples) // 2] - baseline_us
+    p99 = samples[int(len(samples) * 0.99)] - baseline_us
+    print(f"{name:<22} mean {mean:8.1f}us   p50 {p50:8.1f}us   p99 {p99:8.1f}us")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    requests = _make_requests(args.requests, args.clients)
+    # Limit high enough that every request is admitted and fully processed
+    limit = args.requests
+
+    baseline = await _time_per_request(requests, _call_next)
+    baseline_us = statistics.fmean(baseline)
+    print(f"{args.requests} requests over {args.clients} clients "
+          f"(baseline handler {baseline_us:.1f}us, subtracted)\n")
+
+    await _bench("in-memory", RateLimiter(limit, redis_client=None), requests, baseline_us)
+
+    try:
+        from fakeredis import FakeAsyncRedis
+        fake = FakeAsyncRedis(decode_responses=True)
+        await _bench("fakeredis (lua)", RateLimiter(limit, redis_client=fake), requests, baseline_us)
+    except Exception as e:
+        print(f"fakeredis (lua)        skipped: {e}")
+
+    if args.redis_url:
+        import redis.asyncio as aioredis
+        client = aioredis.from_url(args.redis_url, decode_responses=True)
+        try:
+            await client.ping()
+            await _bench("redis (lua)", RateLimiter(limit, redis_client=client), requests, baseline_us)
+        except Exception as e:
+            print(f"redis (lua)            skipped: {e}")
+        finally:
+            await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Benchmark service discovery text search: LIKE scan vs full-text index.
+
+Seeds a services table (100k rows by default) and times the same queries
+through the previous ``name/description LIKE '%query%'`` filter and through
+apply_text_search (FTS5 on SQLite, tsvector + GIN on Postgres).
+
+Usage:
+    python scripts/benchmark_service_search.py [--rows 100000] [--iterations 20]
+        [--database-url postgresql+asyncpg://...]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from uuid import uuid4
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, insert, or_, select  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from src.core.database import Base  # noqa: E402
+from src.models.services import Service  # noqa: E402
+from src.services.service_search import apply_text_search  # noqa: E402
+
+WORDS = [
+    "market", "data", "price", "oracle", "swap", "router", "bridge", "wallet",
+    "analytics", "sentiment", "weather", "image", "translation", "storage",
+    "compute", "inference", "payments", "settlement", "indexer", "gateway",
+]
+QUERIES = ["price oracle", "swap", "settlement gateway", "sentiment analytics", "nomatch"]
+
+
+def _rows(count: int) -> list[dict]:
+    rng = random.Random(42)
+    return [
+        {
+            "id": uuid4(),
+            "name": " ".join(rng.sample(WORDS, 3)).title(),
+            "description": " ".join(rng.choices(WORDS, k=20)),
+            "endpoint": f"https://provider-{i % 97}.example.com/v1/{i}",
+            "pricing_model": "pay-per-call",
+            "price_amount": round(rng.uniform(0.001, 1.0), 4),
+            "price_token": "USDC",
+            "mcp_compatible": i % 2 == 0,
+            "reputation_score": round(rng.uniform(0, 5), 2),
+            "total_calls": rng.randint(0, 100000),
+        }
+        for i in range(count)
+    ]
+
+
+def _like(query: str):
+    return (
+        select(Service)
+        .where(or_(Service.name.contains(query), Service.description.contains(query)))
+        .order_by(Service.reputation_score.desc())
+        .limit(20)
+    )
+
+
+async def _time_ms(conn, stmt, iterations: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        rows = (await conn.execute(stmt)).all()
+    return (time.perf_counter() - start) / iterations * 1000, len(rows)
+
+
+async def run(database_url: str, rows: int, iterations: int) -> None:
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[Service.__table__])
+            await conn.execute(delete(Service))
+            data = _rows(rows)
+            for start in range(0, rows, 5000):
+                await conn.execute(insert(Service), data[start:start + 5000])
+        print(f"seeded {rows} services on {engine.dialect.name}\n")
+
+        print(f"{'query':<22} {'like ms':>9} {'fts ms':>9} {'like rows':>10} {'fts rows':>9}")
+        async with engine.connect() as conn:
+            for query in QUERIES:
+                like_ms, like_rows = await _time_ms(conn, _like(query), iterations)
+                fts_stmt = apply_text_search(select(Service), query, engine.dialect.name).limit(20)
+                fts_ms, fts_rows = await _time_ms(conn, fts_stmt, iterations)
+                print(f"{query:<22} {like_ms:>9.2f} {fts_ms:>9.2f} {like_rows:>10} {fts_rows:>9}")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--database-url", default=None, help="defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    if args.database_url:
+        asyncio.run(run(args.database_url, args.rows, args.iterations))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'services.db')}"
+        asyncio.run(run(url, args.rows, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
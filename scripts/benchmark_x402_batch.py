@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Benchmark x402 payment throughput, sequential vs batched.
+
+Starts scripts/mock_x402_service.py in-process (service and facilitator on
+one port, with simulated latency) and pays it N times:
+
+- sequentially, one X402PaymentService.execute_payment call after another
+- with X402PaymentService.execute_payments_batch
+
+Usage:
+    python scripts/benchmark_x402_batch.py [--payments 50] [--latency-ms 20]
+        [--concurrency 32] [--per-host 8]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--payments", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--per-host", type=int, default=8)
+    args = parser.parse_args()
+
+    # The mock reads its latency at import time
+    os.environ["MOCK_LATENCY_MS"] = str(args.latency_ms)
+
+    import uvicorn
+    from eth_account import Account
+
+    from scripts.mock_x402_service import app
+    from src.core.config import settings
+    from src.core.http_client import close_http_clients
+    from src.services.x402_service import X402PaymentService
+    from src.x402 import signature
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    base_url = f"http://127.0.0.1:{port}"
+    settings.debug = False
+    signature._generator = signature.EIP712SignatureGenerator(private_key=Account.create().key.hex())
+    service = X402PaymentService()
+    service.facilitator_url = f"{base_url}/facilitator"
+    payments = [
+        {"service_url": f"{base_url}/", "amount": 0.10, "token": "USDC"}
+        for _ in range(args.payments)
+    ]
+
+    print(f"{args.payments} payments, {args.latency_ms:.0f}ms simulated latency per request\n")
+    try:
+        # Warm up connections and signer
+        await service.execute_payment(**payments[0])
+
+        start = time.perf_counter()
+        sequential_ok = 0
+        for payment in payments:
+            result = await service.execute_payment(**payment)
+            sequential_ok += result["success"]
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_ok = 0
+        async for _, result in service.execute_payments_batch(
+            payments, max_concurrency=args.concurrency, max_per_host=args.per_host
+        ):
+            batch_ok += result["success"]
+        batched = time.perf_counter() - start
+
+        print(f"{'sequential':<12} {sequential:7.2f}s  {args.payments / sequential:8.1f} payments/s  "
+              f"({sequential_ok}/{args.payments} ok)")
+        print(f"{'batch':<12} {batched:7.2f}s  {args.payments / batched:8.1f} payments/s  "
+              f"({batch_ok}/{args.payments} ok)")
+        print(f"\nspeedup {sequential / batched:.1f}x")
+    finally:
+        await close_http_clients()
+        server.should_exit = True
+        await server_task
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,15 +1,36 @@
 #!/usr/bin/env python
 """Mock service that returns HTTP 402 for x402 payment testing."""
+import asyncio
+import os
+import uuid
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 app = FastAPI(title="Mock x402 Service")
 
+# Simulated per-request latency of the service and facilitator
+LATENCY_SECONDS = float(os.getenv("MOCK_LATENCY_MS", "0")) / 1000
+
+
+def _settle() -> dict:
+    """Build a facilitator settlement response for one payment."""
+    payment_id = str(uuid.uuid4())
+    return {
+        "paymentId": payment_id,
+        "txHash": "0x" + uuid.uuid4().hex * 2,
+        "paymentProof": f"proof-{payment_id}",
+    }
+
 
 @app.get("/")
-async def root():
-    """Root endpoint that returns HTTP 402 with payment required header."""
+async def root(request: Request):
+    """Root endpoint that returns HTTP 402 until a Payment-Proof header is sent."""
+    await asyncio.sleep(LATENCY_SECONDS)
+    if request.headers.get("Payment-Proof"):
+        return {"message": "Payment successful", "data": {"access": "granted"}}
+
     headers = {
         "Payment-Required": "x402; amount=0.10; token=USDC",
         "Content-Type": "application/json"
@@ -33,6 +54,20 @@ async def paid_endpoint():
     return {"message": "Payment successful", "data": {"access": "granted"}}
 
 
+@app.post("/facilitator/submit-payment")
+async def submit_payment(_payment: dict):
+    """Mock facilitator endpoint that settles one payment."""
+    await asyncio.sleep(LATENCY_SECONDS)
+    return _settle()
+
+
+@app.post("/facilitator/submit-payments")
+async def submit_payments(body: dict):
+    """Mock facilitator endpoint that settles many payments in one request."""
+    await asyncio.sleep(LATENCY_SECONDS)
+    return {"results": [_settle() for _ in body.get("payments", [])]}
+
+
 if __name__ == "__main__":
     print("Starting mock x402 service on port 8001...")
     uvicorn.run(app, host="0.0.0.0", port=8001)
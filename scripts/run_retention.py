@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+Apply data retention policies in chunked batches.
+
+Expires stale approval requests, then deletes old execution logs (with their
+tool calls), decided approval requests and inactive sessions (with all their
+rows), using the ages in settings. Each chunk of RETENTION_BATCH_SIZE rows is
+its own transaction, with RETENTION_THROTTLE_MS between chunks. Rows are
+appended to JSONL files first when RETENTION_ARCHIVE_DIR is set.
+
+Usage:
+    python scripts/run_retention.py [--dry-run] [--batch-size 1000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.config import settings  # noqa: E402
+from src.core.database import background_session, close_db  # noqa: E402
+from src.services.retention import RetentionEngine, default_archiver, default_policies  # noqa: E402
+
+
+async def run(dry_run: bool, batch_size: int) -> int:
+    try:
+        async with background_session() as db:
+            engine = RetentionEngine(db, batch_size=batch_size, archiver=default_archiver())
+            if dry_run:
+                for policy in default_policies():
+                    print(f"{policy.name}: {await engine.count(policy)} rows")
+                return 0
+
+            failed = False
+            for result in await engine.run_all(default_policies()):
+                print(
+                    f"{result.policy}: {result.rows} rows in {result.chunks} chunks "
+                    f"({result.dependent_rows} dependent, {result.archived} archived)"
+                )
+                for error in result.errors:
+                    failed = True
+                    print(f"  error: {error}")
+            return 1 if failed else 0
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dry-run", action="store_true", help="Only count rows each policy would affect")
+    parser.add_argument("--batch-size", type=int, default=settings.retention_batch_size)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.dry_run, args.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ import logging
 from typing import Any
 from uuid import UUID
 
-from src.agents.command_parser import CommandParser, ParsedCommand
+from src.agents.command_parser import ParsedCommand, command_parser
 from src.tools.simple_tools import get_all_tools
 
 logger = logging.getLogger(__name__)
@@ -34,7 +34,7 @@ class AgentExecutor:
             session_id: Session ID for this execution
         """
         self.session_id = session_id
-        self.parser = CommandParser()
+        self.parser = command_parser
         self.tools = get_all_tools()  # Already returns a dict
         logger.info(f"AgentExecutor initialized for session {session_id}")
         logger.info(f"Available tools: {list(self.tools.keys())}")
@@ -6,6 +6,9 @@ This module provides comprehensive agent execution with:
 - write_todos plan generation for complex operations
 - Budget limit enforcement
 - Tool call tracking
+- Multi-step commands run as a dependency DAG (see src.agents.planner)
+- Write-behind recording of logs, tool calls and memory (see
+  src.services.execution_recorder)
 """
 
 import asyncio
@@ -16,17 +19,26 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.agents.command_parser import CommandParser, ParsedCommand
+from src.agents.command_parser import ParsedCommand, command_parser
+from src.agents.planner import (
+    REQUIRED_PARAMETERS,
+    CommandPlanner,
+    ExecutionPlan,
+    PlanExecutor,
+    PlanStep,
+)
 from src.core.config import settings
+from src.core.memory import MemorySummary, load_memory_window, recent_turns_cache
 from src.core.security import ToolAllowlistError, get_tool_allowlist
 from src.models.agent_sessions import AgentMemory
 from src.models.execution_logs import ExecutionLog
 from src.services.alerting_service import AlertType, send_error_alert
 from src.services.approval_service import ApprovalService
+from src.services.execution_recorder import ExecutionRecorder, execution_recorder
 from src.services.metrics_service import metrics_collector
+from src.services.tool_usage import record_tool_calls
 from src.services.x402_service import X402PaymentService
 from src.tools.simple_tools import get_all_tools
 
@@ -47,6 +59,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Commands that move funds; their records are written before responding
+# when execution_log_durability is "payments"
+DURABLE_INTENTS = ("payment", "swap", "perpetual_trade")
+
+# Commands whose USD amount counts against budget_limit_usd
+BUDGETED_INTENTS = ("payment", "perpetual_trade")
+
 
 class AgentExecutorEnhanced:
     """
@@ -60,7 +79,13 @@ class AgentExecutorEnhanced:
     5. Tracks execution time and cost
     """
 
-    def __init__(self, session_id: UUID, db: AsyncSession, use_allowlist: bool = True):
+    def __init__(
+        self,
+        session_id: UUID,
+        db: AsyncSession,
+        use_allowlist: bool = True,
+        recorder: ExecutionRecorder | None = None,
+    ):
         """
         Initialize the enhanced agent executor.
 
@@ -68,16 +93,24 @@ class AgentExecutorEnhanced:
             session_id: Session ID for this execution
             db: Database session for logging
             use_allowlist: Whether to enforce tool allowlist security
+            recorder: Write-behind recorder for logs, tool calls and memory.
+                Defaults to the global recorder when it is running; otherwise
+                records are written to ``db`` inline.
         """
         self.session_id = session_id
         self.db = db
-        self.parser = CommandParser()
+        self.parser = command_parser
+        self.planner = CommandPlanner(self.parser)
         self.tools = get_all_tools()
         self.tool_calls: list[dict[str, Any]] = []
         self.current_execution_log_id: UUID | None = None
         self.memory: list[dict[str, Any]] = []
+        self.memory_summary: MemorySummary | None = None
         self.use_allowlist = use_allowlist
         self.allowlist = get_tool_allowlist() if use_allowlist else None
+        if recorder is None and execution_recorder.running:
+            recorder = execution_recorder
+        self.recorder = recorder
 
         logger.info(f"AgentExecutorEnhanced initialized for session {session_id}")
         logger.info(f"Available tools: {list(self.tools.keys())}")
@@ -86,30 +119,22 @@ class AgentExecutorEnhanced:
 
     async def load_memory(self) -> None:
         """
-        Load conversation memory from database for this session.
+        Load recent conversation memory for this session.
+
+        Only the last ``settings.agent_memory_window`` entries are loaded,
+        and repeat loads for a session are served from the process-wide
+        recent-turns cache without querying the database.
         """
         try:
-            result = await self.db.execute(
-                select(AgentMemory)
-                .where(AgentMemory.session_id == self.session_id)
-                .order_by(AgentMemory.timestamp)
-            )
-            memory_records = result.scalars().all()
-
-            self.memory = [
-                {
-                    "type": record.message_type,
-                    "content": record.content,
-                    "timestamp": record.timestamp.isoformat(),
-                    "metadata": getattr(record, 'extra_data', {}) or {},
-                }
-                for record in memory_records
-            ]
+            session_window = await load_memory_window(self.db, self.session_id)
+            self.memory = list(session_window.entries)
+            self.memory_summary = session_window.summary
 
             logger.info(f"Loaded {len(self.memory)} memory entries for session {self.session_id}")
         except Exception as e:
             logger.warning(f"Failed to load memory: {e}")
             self.memory = []
+            self.memory_summary = None
 
     async def save_memory(
         self,
@@ -126,29 +151,37 @@ class AgentExecutorEnhanced:
             metadata: Optional additional metadata
         """
         try:
+            # Client-side timestamp so entries saved in one flush keep their order
+            timestamp = datetime.utcnow()
             # Use extra_data attribute which maps to metadata column
             memory_entry = AgentMemory(
                 id=uuid4(),
                 session_id=self.session_id,
                 message_type=message_type,
                 content=content,
+                timestamp=timestamp,
                 extra_data=metadata or {},
             )
-            self.db.add(memory_entry)
-            # Don't commit immediately - let the caller decide when to commit for better performance
-            # await self.db.commit()
+            if self.recorder is not None:
+                await self.recorder.memory_saved(memory_entry)
+            else:
+                self.db.add(memory_entry)
+                # Don't commit immediately - let the caller decide when to commit for better performance
 
-            # Also update in-memory cache
-            self.memory.append({
+            # Also update the executor's and the process-wide recent memory
+            entry = {
                 "type": message_type,
                 "content": content,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp.isoformat(),
                 "metadata": metadata or {},
-            })
+            }
+            self.memory.append(entry)
+            recent_turns_cache.append(self.session_id, entry)
 
             logger.debug(f"Saved memory entry: {message_type}")
         except Exception as e:
             logger.error(f"Failed to save memory: {e}")
+            recent_turns_cache.invalidate(self.session_id)
             await self.db.rollback()
 
     def get_memory_context(self, max_messages: int = 10) -> str:
@@ -167,6 +200,10 @@ class AgentExecutorEnhanced:
         recent = self.memory[-max_messages:]
         context_parts = []
 
+        summary = self.memory_summary.render() if self.memory_summary else ""
+        if summary:
+            context_parts.append(f"System: {summary}")
+
         for msg in recent:
             role = "User" if msg["type"] == "human" else "Assistant" if msg["type"] == "ai" else "System"
             context_parts.append(f"{role}: {msg['content']}")
@@ -246,9 +283,16 @@ class AgentExecutorEnhanced:
             duration_ms=0,
             status="running",
         )
-        self.db.add(execution_log)
-        await self.db.commit()
+        if self.recorder is not None:
+            await self.recorder.log_started(execution_log)
+        else:
+            self.db.add(execution_log)
+            await self.db.commit()
         self.current_execution_log_id = execution_log.id
+        # Tool calls made by this command (the executor may run several)
+        first_tool_call = len(self.tool_calls)
+        parsed = None
+        intents: list[str] = []
 
         try:
             # Step 1: Parse the command
@@ -258,9 +302,16 @@ class AgentExecutorEnhanced:
                 f"(confidence: {parsed.confidence:.2f})"
             )
 
+            # Multi-step commands become a dependency DAG of intents
+            step_plan = None
+            if self.planner.should_plan(command, parsed.intent):
+                step_plan = self.planner.create_plan(command)
+            intents = [step.action_type for step in step_plan.steps] if step_plan else [parsed.intent]
+
             # Step 2: Validate intent against allowlist
             try:
-                self._validate_intent_allowed(parsed.intent)
+                for intent in intents:
+                    self._validate_intent_allowed(intent)
             except ToolAllowlistError as e:
                 # Send security alert for allowlist violation
                 if settings.alert_enabled:
@@ -284,7 +335,8 @@ class AgentExecutorEnhanced:
                 execution_log.tool_calls = self.tool_calls
                 execution_log.duration_ms = duration_ms
                 execution_log.status = "blocked"
-                await self.db.commit()
+                await self._finish_execution_log(execution_log, first_tool_call)
+                await self._commit_records(intents)
 
                 return {
                     "success": False,
@@ -296,7 +348,7 @@ class AgentExecutorEnhanced:
                 }
 
             # Step 3: Generate plan for complex operations
-            plan = self._generate_execution_plan(parsed, command)
+            plan = step_plan.to_dict() if step_plan else self._generate_execution_plan(parsed, command)
             execution_log.plan = plan
 
             # Step 4: Execute based on intent with timeout enforcement
@@ -309,42 +361,14 @@ class AgentExecutorEnhanced:
             try:
                 # Execute with timeout
                 async def execute_with_timeout() -> dict[str, Any]:
-                    """Execute the parsed command with appropriate handler.
+                    """Execute the plan or the parsed command's intent handler.
 
                     Returns:
                         dict[str, Any]: Execution result with success status and data
                     """
-                    if parsed.intent == "payment":
-                        return await self._execute_payment_with_logging(
-                            parsed, budget_limit_usd
-                        )
-                    elif parsed.intent == "swap":
-                        return await self._execute_swap_with_logging(
-                            parsed, budget_limit_usd
-                        )
-                    elif parsed.intent == "perpetual_trade":
-                        return await self._execute_perpetual_trade_with_logging(
-                            parsed, budget_limit_usd
-                        )
-                    elif parsed.intent == "balance_check":
-                        return await self._execute_balance_check_with_logging(parsed)
-                    elif parsed.intent == "service_discovery":
-                        return await self._execute_service_discovery_with_logging(parsed)
-                    else:
-                        # Unknown intent - return helpful error
-                        return {
-                            "success": False,
-                            "error": "Could not understand command intent. Please rephrase.",
-                            "suggestions": [
-                                "Pay 0.10 USDC to API service",
-                                "Check my wallet balance",
-                                "Swap 10 CRO for USDC",
-                                "Open a 100 USDC long position on BTC with 10x leverage",
-                                "Find available services"
-                            ],
-                            "parsed_intent": parsed.intent,
-                            "confidence": parsed.confidence
-                        }
+                    if step_plan is not None:
+                        return await self._execute_step_plan(step_plan, budget_limit_usd)
+                    return await self._execute_intent(parsed, budget_limit_usd)
 
                 result = await asyncio.wait_for(
                     execute_with_timeout(),
@@ -370,7 +394,7 @@ class AgentExecutorEnhanced:
             execution_log.duration_ms = duration_ms
             execution_log.total_cost = result.get("total_cost_usd", 0.0)
             execution_log.status = "completed" if result.get("success") else "failed"
-            await self.db.commit()
+            await self._finish_execution_log(execution_log, first_tool_call)
 
             # Store conversation in memory for persistence across commands
             # Save user message
@@ -395,7 +419,7 @@ class AgentExecutorEnhanced:
             )
 
             # Commit all memory operations together for better performance
-            await self.db.commit()
+            await self._commit_records(intents)
 
             # Add metadata to result
             result["session_id"] = str(self.session_id)
@@ -409,8 +433,23 @@ class AgentExecutorEnhanced:
 
             return result
 
+        except asyncio.CancelledError:
+            logger.info(f"Command execution cancelled for session {self.session_id}")
+            recent_turns_cache.invalidate(self.session_id)
+            execution_log.result = {"success": False, "error": "Execution cancelled", "cancelled": True}
+            execution_log.tool_calls = self.tool_calls
+            execution_log.duration_ms = int((time.time() - start_time) * 1000)
+            execution_log.status = "cancelled"
+            try:
+                await self._finish_execution_log(execution_log, first_tool_call)
+            except Exception as e:
+                logger.error(f"Failed to record cancellation of {execution_log.id}: {e}")
+            raise
+
         except Exception as e:
             logger.error(f"Command execution failed: {e}", exc_info=True)
+            # Memory saved during this command may not have been committed
+            recent_turns_cache.invalidate(self.session_id)
 
             # Update execution log with error
             duration_ms = int((time.time() - start_time) * 1000)
@@ -421,7 +460,8 @@ class AgentExecutorEnhanced:
             execution_log.tool_calls = self.tool_calls
             execution_log.duration_ms = duration_ms
             execution_log.status = "failed"
-            await self.db.commit()
+            await self._finish_execution_log(execution_log, first_tool_call)
+            await self._commit_records(intents)
 
             return {
                 "success": False,
@@ -431,6 +471,120 @@ class AgentExecutorEnhanced:
                 "execution_log_id": str(execution_log.id),
             }
 
+    async def _execute_intent(
+        self,
+        parsed: ParsedCommand,
+        budget_limit_usd: float | None
+    ) -> dict[str, Any]:
+        """Run the handler for a parsed intent."""
+        if parsed.intent == "payment":
+            return await self._execute_payment_with_logging(parsed, budget_limit_usd)
+        elif parsed.intent == "swap":
+            return await self._execute_swap_with_logging(parsed, budget_limit_usd)
+        elif parsed.intent == "perpetual_trade":
+            return await self._execute_perpetual_trade_with_logging(parsed, budget_limit_usd)
+        elif parsed.intent == "balance_check":
+            return await self._execute_balance_check_with_logging(parsed)
+        elif parsed.intent == "service_discovery":
+            return await self._execute_service_discovery_with_logging(parsed)
+
+        # Unknown intent - return helpful error
+        return {
+            "success": False,
+            "error": "Could not understand command intent. Please rephrase.",
+            "suggestions": [
+                "Pay 0.10 USDC to API service",
+                "Check my wallet balance",
+                "Swap 10 CRO for USDC",
+                "Open a 100 USDC long position on BTC with 10x leverage",
+                "Find available services"
+            ],
+            "parsed_intent": parsed.intent,
+            "confidence": parsed.confidence
+        }
+
+    async def _execute_step_plan(
+        self,
+        plan: ExecutionPlan,
+        budget_limit_usd: float | None
+    ) -> dict[str, Any]:
+        """
+        Execute a multi-step plan, running independent steps concurrently.
+
+        Args:
+            plan: Plan from ``CommandPlanner.create_plan``
+            budget_limit_usd: Optional budget limit for the plan's payments and
+                trades combined
+
+        Returns:
+            Combined result with each step's status and result
+        """
+        # Each step only checks its own amount, so check the plan's total up front
+        planned_spend = sum(
+            step.parameters.get("amount", 0.0)
+            for step in plan.steps
+            if step.action_type in BUDGETED_INTENTS
+        )
+        if budget_limit_usd and planned_spend > budget_limit_usd:
+            return {
+                "success": False,
+                "action": "plan",
+                "error": (
+                    f"Plan amounts total ${planned_spend}, exceeding budget limit "
+                    f"${budget_limit_usd}"
+                ),
+                "suggestion": "Increase budget limit or reduce the amounts in the plan",
+                "total_cost_usd": 0.0,
+            }
+
+        async def run_step(step: PlanStep, inputs: dict[Any, Any]) -> dict[str, Any]:
+            # Dependency results reach the step as in /agent/execute-plan
+            parameters = {**step.parameters, "dependencies": inputs} if inputs else step.parameters
+            parsed = ParsedCommand(
+                intent=step.action_type,
+                action=step.action_type,
+                parameters=parameters,
+                confidence=1.0,
+                raw_command=step.description,
+            )
+            return await self._execute_intent(parsed, budget_limit_usd)
+
+        executor = PlanExecutor(
+            handlers=dict.fromkeys(REQUIRED_PARAMETERS, run_step),
+            session_id=self.session_id,
+        )
+        await executor.execute(plan)
+
+        result: dict[str, Any] = {
+            "success": plan.status == "completed",
+            "action": "plan",
+            "steps": [
+                {
+                    "id": step.step_id,
+                    "description": step.description,
+                    "intent": step.action_type,
+                    "depends_on": step.dependencies,
+                    "status": step.status,
+                    "result": step.result,
+                    "error": step.error,
+                    "duration_ms": step.duration_ms,
+                }
+                for step in plan.steps
+            ],
+            "total_cost_usd": sum(
+                step.result.get("total_cost_usd", 0.0)
+                for step in plan.steps
+                if step.status == "completed" and isinstance(step.result, dict)
+            ),
+        }
+        # Surface a pending approval so callers can prompt for it
+        for step in plan.steps:
+            if isinstance(step.result, dict) and step.result.get("requires_approval"):
+                for key in ("requires_approval", "approval_id", "amount", "token", "message"):
+                    result[key] = step.result.get(key)
+                break
+        return result
+
     def _generate_execution_plan(
         self,
         parsed: ParsedCommand,
@@ -554,11 +708,69 @@ class AgentExecutorEnhanced:
 
         return None
 
+    async def _finish_execution_log(self, execution_log: ExecutionLog, first_tool_call: int) -> None:
+        """Write the log's final state and this command's tool calls."""
+        if self.recorder is None:
+            await self._record_tool_calls(execution_log, first_tool_call)
+            await self.db.commit()
+            return
+
+        await self.recorder.log_finished(execution_log.id, {
+            "plan": execution_log.plan,
+            "result": execution_log.result,
+            # Copy: later commands on this executor keep appending to the list
+            "tool_calls": list(execution_log.tool_calls or []),
+            "duration_ms": execution_log.duration_ms,
+            "total_cost": execution_log.total_cost,
+            "status": execution_log.status,
+        })
+        await self.recorder.tool_calls_made(
+            self.session_id, execution_log.id, self.tool_calls[first_tool_call:]
+        )
+
+    async def _commit_records(self, intents: list[str]) -> None:
+        """
+        Commit memory inline, or with the recorder wait for it per durability setting.
+
+        Args:
+            intents: Intents the command ran (empty if it failed before parsing)
+        """
+        if self.recorder is None:
+            await self.db.commit()
+            return
+
+        # Subagents may have staged rows on the request session
+        if self.db.new or self.db.dirty or self.db.deleted:
+            await self.db.commit()
+
+        durability = settings.execution_log_durability
+        durable = durability == "sync" or (
+            durability == "payments" and any(intent in DURABLE_INTENTS for intent in intents)
+        )
+        if durable and not await self.recorder.flush():
+            logger.error(f"Execution records for session {self.session_id} were not all written")
+
+    async def _record_tool_calls(self, execution_log: ExecutionLog, first_tool_call: int) -> None:
+        """Store this command's tool calls and session counters with the log update."""
+        try:
+            # Savepoint: a failure here must not abort the log update's transaction
+            async with self.db.begin_nested():
+                await record_tool_calls(
+                    self.db,
+                    self.session_id,
+                    execution_log.id,
+                    self.tool_calls[first_tool_call:],
+                )
+        except Exception as e:
+            # Usage accounting must not fail the command
+            logger.warning(f"Failed to record tool calls for {execution_log.id}: {e}")
+
     async def _log_tool_call(
         self,
         tool_name: str,
         tool_args: dict[str, Any],
-        tool_result: Any
+        tool_result: Any,
+        duration_seconds: float | None = None,
     ) -> None:
         """
         Log a tool call to the execution log.
@@ -567,14 +779,20 @@ class AgentExecutorEnhanced:
             tool_name: Name of the tool
             tool_args: Arguments passed to the tool
             tool_result: Result returned by the tool
+            duration_seconds: How long the call took (None for bookkeeping entries)
         """
         tool_call = {
             "tool_name": tool_name,
             "tool_args": tool_args,
             "result": tool_result,
+            "duration_ms": int(duration_seconds * 1000) if duration_seconds is not None else None,
             "timestamp": datetime.utcnow().isoformat(),
         }
         self.tool_calls.append(tool_call)
+        success = tool_result.get("success", True) if isinstance(tool_result, dict) else True
+        metrics_collector.record_tool_call(
+            tool_name, success=success, duration_seconds=duration_seconds
+        )
         logger.info(f"Tool call logged: {tool_name}")
 
     async def _execute_payment_with_logging(
@@ -634,16 +852,19 @@ class AgentExecutorEnhanced:
             {"status": "executing"}
         )
 
+        started = time.perf_counter()
         service_url = self._resolve_service_endpoint(params.get("recipient", "api"))
 
         await self._log_tool_call(
             "resolve_service_endpoint",
             {"recipient": params.get("recipient", "api")},
-            {"service_url": service_url, "status": "completed"}
+            {"service_url": service_url, "status": "completed"},
+            time.perf_counter() - started,
         )
 
         # Step 4: Execute x402 payment using X402PaymentService
         x402_service = X402PaymentService()
+        started = time.perf_counter()
         payment_result = await x402_service.execute_payment(
             service_url=service_url,
             amount=params["amount"],
@@ -658,7 +879,8 @@ class AgentExecutorEnhanced:
                 "amount": params["amount"],
                 "token": params.get("token", "USDC")
             },
-            payment_result
+            payment_result,
+            time.perf_counter() - started,
         )
 
         # Return result with signature info if available
@@ -686,6 +908,7 @@ class AgentExecutorEnhanced:
             )
 
             # Execute swap via subagent
+            started = time.perf_counter()
             swap_result = await vvs_subagent.execute_swap(
                 from_token=params["from_token"],
                 to_token=params["to_token"],
@@ -699,11 +922,13 @@ class AgentExecutorEnhanced:
                     "to_token": params["to_token"],
                     "amount": params["amount"]
                 },
-                swap_result
+                swap_result,
+                time.perf_counter() - started,
             )
         else:
             # Fallback to simple swap tool
             tool = self.tools["swap_tokens"]
+            started = time.perf_counter()
             swap_result = tool.run(
                 from_token=params["from_token"],
                 to_token=params["to_token"],
@@ -717,7 +942,8 @@ class AgentExecutorEnhanced:
                     "to_token": params["to_token"],
                     "amount": params["amount"]
                 },
-                swap_result
+                swap_result,
+                time.perf_counter() - started,
             )
 
         return {
@@ -767,6 +993,7 @@ class AgentExecutorEnhanced:
             )
 
             # Execute perpetual trade via subagent
+            started = time.perf_counter()
             trade_result = await moonlander_subagent.execute_perpetual_trade(
                 direction=params.get("direction", "long"),
                 symbol=params.get("symbol", "BTC"),
@@ -782,11 +1009,13 @@ class AgentExecutorEnhanced:
                     "amount": params["amount"],
                     "leverage": params.get("leverage", 10.0),
                 },
-                trade_result
+                trade_result,
+                time.perf_counter() - started,
             )
 
             # Step 4: Set risk management orders if trade was successful
             if trade_result.get("success"):
+                started = time.perf_counter()
                 risk_result = await moonlander_subagent.set_risk_management(
                     symbol=params.get("symbol", "BTC"),
                     stop_loss=trade_result["trade_details"]["liquidation_price"] * 0.95,  # 5% from liquidation
@@ -800,7 +1029,8 @@ class AgentExecutorEnhanced:
                         "stop_loss": trade_result["trade_details"]["liquidation_price"] * 0.95,
                         "take_profit": trade_result["trade_details"]["entry_price"] * 1.1,
                     },
-                    risk_result
+                    risk_result,
+                    time.perf_counter() - started,
                 )
 
                 # Combine results
@@ -819,6 +1049,7 @@ class AgentExecutorEnhanced:
             # Fallback to simple tool if subagent not available
             tool = self.tools.get("swap_tokens")  # Reuse swap tool as fallback
             if tool:
+                started = time.perf_counter()
                 trade_result = tool.run(
                     from_token=params.get("token", "USDC"),
                     to_token=params.get("symbol", "BTC"),
@@ -832,7 +1063,8 @@ class AgentExecutorEnhanced:
                         "symbol": params.get("symbol", "BTC"),
                         "amount": params["amount"],
                     },
-                    trade_result
+                    trade_result,
+                    time.perf_counter() - started,
                 )
 
                 return {
@@ -856,6 +1088,7 @@ class AgentExecutorEnhanced:
 
         # Check balance
         tool = self.tools["check_balance"]
+        started = time.perf_counter()
         balance_result = tool.run(
             tokens=params.get("tokens", ["CRO", "USDC"])
         )
@@ -863,7 +1096,8 @@ class AgentExecutorEnhanced:
         await self._log_tool_call(
             "check_balance",
             {"tokens": params.get("tokens", ["CRO", "USDC"])},
-            balance_result
+            balance_result,
+            time.perf_counter() - started,
         )
 
         return {
@@ -882,6 +1116,7 @@ class AgentExecutorEnhanced:
 
         # Discover services
         tool = self.tools["discover_services"]
+        started = time.perf_counter()
         discovery_result = tool.run(
             category=params.get("category"),
             mcp_compatible=True
@@ -890,7 +1125,8 @@ class AgentExecutorEnhanced:
         await self._log_tool_call(
             "discover_services",
             {"category": params.get("category"), "mcp_compatible": True},
-            discovery_result
+            discovery_result,
+            time.perf_counter() - started,
         )
 
         return {
@@ -972,6 +1208,8 @@ async def execute_agent_command_enhanced(
     # Record metrics
     duration_seconds = time.time() - start_time
     success = result.get("success", False)
-    metrics_collector.record_agent_execution(duration_seconds, success=success)
+    metrics_collector.record_agent_execution(
+        duration_seconds, success=success, intent=result.get("parsed_intent")
+    )
 
     return result
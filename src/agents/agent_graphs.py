@@ -0,0 +1,207 @@
+"""
+Process-wide registry of compiled deepagents graphs.
+
+``create_deep_agent`` assembles the middleware stack, initializes the chat
+model client and compiles a LangGraph graph. Every agent used to pay that
+per session, and every subagent per swap, trade or bet, on the request
+path. A compiled graph holds no conversation state: messages are passed
+to each ``ainvoke`` and no checkpointer is configured. One graph can
+therefore serve every session with the same configuration:
+
+- graphs are keyed by model, tool set, a hash of the system prompt and any
+  other construction options, built once and kept in a bounded LRU
+- per-session state travels at invoke time in the run config
+  (``session_config``): the session ID as ``thread_id``, plus anything a
+  backend factory needs, such as the session's workspace directory
+- ``warm_agent_graphs`` builds the main agent and subagent graphs at
+  startup, so subagents spawned per request start from a warm graph
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from src.core.config import settings
+from src.services.metrics_service import metrics_collector
+from src.utils.llm import get_model_string
+
+logger = logging.getLogger(__name__)
+
+# Try to import deepagents
+try:
+    from deepagents import create_deep_agent
+    DEEPAGENTS_AVAILABLE = True
+except ImportError:
+    DEEPAGENTS_AVAILABLE = False
+    create_deep_agent = None  # type: ignore
+
+GraphKey = tuple[str, tuple[str, ...], str, tuple[tuple[str, Any], ...]]
+
+
+def tool_key(tool: Any) -> str:
+    """
+    Identify a tool by name and implementation.
+
+    Tool instances created per session (e.g. ``get_market_data_tools()``)
+    share a key, so their sessions share a graph.
+    """
+    name = getattr(tool, "name", None) or getattr(tool, "__name__", repr(tool))
+    func = getattr(tool, "func", None) or getattr(tool, "coroutine", None) or tool
+    module = getattr(func, "__module__", None) or type(tool).__module__
+    qualname = getattr(func, "__qualname__", None) or type(tool).__qualname__
+    return f"{name}={module}.{qualname}"
+
+
+def session_config(session_id: Any, **configurable: Any) -> dict[str, Any]:
+    """
+    Run config carrying a session's state into a shared graph.
+
+    Args:
+        session_id: Session the invocation belongs to (used as ``thread_id``)
+        configurable: Further per-session values, read by backend factories
+
+    Returns:
+        Config for ``graph.ainvoke(input, config=...)``
+    """
+    return {"configurable": {"thread_id": str(session_id), **configurable}}
+
+
+class AgentGraphRegistry:
+    """Build each agent graph configuration once and share it across sessions."""
+
+    def __init__(
+        self,
+        max_graphs: int = settings.agent_graph_registry_size,
+        factory: Callable[..., Any] | None = None,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            max_graphs: Graphs kept; the least recently used is dropped beyond this
+            factory: Graph constructor (defaults to ``create_deep_agent``)
+        """
+        self.max_graphs = max_graphs
+        self.factory = factory or create_deep_agent
+        self._graphs: OrderedDict[GraphKey, Any] = OrderedDict()
+        # Held while building, so concurrent first requests build a graph once
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+
+    @property
+    def available(self) -> bool:
+        """Whether graphs can be built (deepagents is installed)."""
+        return self.factory is not None
+
+    @staticmethod
+    def key(model: str, tools: Sequence[Any], system_prompt: str, **options: Any) -> GraphKey:
+        """Registry key of a graph configuration; options must be hashable."""
+        prompt_hash = hashlib.sha256(system_prompt.encode()).hexdigest()[:16]
+        return (
+            model,
+            tuple(tool_key(tool) for tool in tools),
+            prompt_hash,
+            tuple(sorted(options.items())),
+        )
+
+    def get(self, model: str, tools: Sequence[Any], system_prompt: str, **options: Any) -> Any:
+        """
+        Get the compiled graph for a configuration, building it on first use.
+
+        Args:
+            model: Model string for create_deep_agent
+            tools: Tools for the agent
+            system_prompt: Agent system prompt
+            options: Other create_deep_agent arguments (e.g. a backend factory)
+
+        Returns:
+            Compiled graph, or None if deepagents is not available
+        """
+        if self.factory is None:
+            return None
+        key = self.key(model, tools, system_prompt, **options)
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._graphs.move_to_end(key)
+                self.hits += 1
+                metrics_collector.record_agent_graph("hit")
+                return graph
+
+            started = time.perf_counter()
+            graph = self.factory(
+                model=model, tools=list(tools), system_prompt=system_prompt, **options
+            )
+            elapsed = time.perf_counter() - started
+            self.builds += 1
+            self._graphs[key] = graph
+            while len(self._graphs) > self.max_graphs:
+                self._graphs.popitem(last=False)
+
+        metrics_collector.record_agent_graph("build", elapsed)
+        logger.info(
+            f"Built agent graph for {model} with {len(tools)} tools in {elapsed * 1000:.0f} ms"
+        )
+        return graph
+
+    def clear(self) -> None:
+        """Drop every graph."""
+        with self._lock:
+            self._graphs.clear()
+
+    def __len__(self) -> int:
+        return len(self._graphs)
+
+
+def agent_graph_specs() -> list[tuple[str, list[Any], str]]:
+    """Name, tools and system prompt of the main agent and each subagent."""
+    # Imported lazily: the agent modules get their graphs from this module
+    from src.agents.delphi_predictor_subagent import DELPHI_PREDICTOR_SYSTEM_PROMPT, DELPHI_TOOLS
+    from src.agents.main_agent import PAYGENT_SYSTEM_PROMPT
+    from src.agents.moonlander_trader_subagent import (
+        MOONLANDER_TOOLS,
+        MOONLANDER_TRADER_SYSTEM_PROMPT,
+    )
+    from src.agents.vvs_trader_subagent import VVS_TRADER_SYSTEM_PROMPT, VVS_TRADER_TOOLS
+    from src.tools.market_data_tools import get_market_data_tools
+
+    return [
+        ("paygent", get_market_data_tools(), PAYGENT_SYSTEM_PROMPT),
+        ("vvs_trader", list(VVS_TRADER_TOOLS), VVS_TRADER_SYSTEM_PROMPT),
+        ("moonlander_trader", list(MOONLANDER_TOOLS), MOONLANDER_TRADER_SYSTEM_PROMPT),
+        ("delphi_predictor", list(DELPHI_TOOLS), DELPHI_PREDICTOR_SYSTEM_PROMPT),
+    ]
+
+
+def warm_agent_graphs(llm_model: str = settings.default_model) -> int:
+    """
+    Build the main agent and subagent graphs ahead of the first request.
+
+    Args:
+        llm_model: Model the agents are created with
+
+    Returns:
+        Number of graphs ready in the registry
+    """
+    if not agent_graphs.available:
+        logger.info("DeepAgents not available, agent graph warm-up skipped")
+        return 0
+
+    model = get_model_string(llm_model)
+    ready = 0
+    for name, tools, prompt in agent_graph_specs():
+        try:
+            agent_graphs.get(model, tools, prompt)
+            ready += 1
+        except Exception as e:
+            logger.warning(f"Could not warm {name} agent graph: {e}")
+    return ready
+
+
+# Process-wide registry shared by all agents and subagents
+agent_graphs = AgentGraphRegistry()
@@ -3,14 +3,28 @@ Natural language command parser for Paygent agent.
 
 This module provides sophisticated parsing of natural language payment commands
 using pattern matching and intent recognition.
+
+Parsing is on the path of every command, so the parser avoids repeated work:
+
+- an intent's patterns are only tried when the command contains one of the
+  intent's trigger verbs, and the keyword fallback checks each keyword once.
+  Patterns are still tried in their original order, so results do not change.
+- parsed commands are kept in a bounded LRU keyed by the stripped command
+- ``command_parser`` is a process-wide instance, so patterns are compiled
+  and the cache is shared once per process rather than per request
 """
 
+import copy
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from re import Match
 from typing import Any
 
+from src.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,18 +92,45 @@ class CommandParser:
         "service_discovery": ["find", "search", "discover", "list services", "available"],
     }
 
-    def __init__(self) -> None:
-        """Initialize the command parser."""
+    # Words without which an intent's patterns cannot match: every pattern
+    # of the intent starts with one of them
+    PATTERN_TRIGGERS = {
+        "payment": ["pay", "transfer", "send"],
+        "swap": ["swap", "exchange", "trade"],
+        "perpetual_trade": ["open", "long", "short"],
+        "balance_check": ["check", "show", "get", "what", "how"],
+        "service_discovery": ["find", "search", "discover", "list", "what"],
+    }
+
+    def __init__(self, cache_size: int = settings.command_parse_cache_size) -> None:
+        """
+        Initialize the command parser.
+
+        Args:
+            cache_size: Parsed commands kept in the LRU (0 disables caching)
+        """
         self._compile_patterns()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, ParsedCommand] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def _compile_patterns(self) -> None:
-        """Compile regex patterns for efficiency."""
+        """Compile regex patterns and the trigger and keyword sets."""
         self.compiled_patterns: dict[str, list[re.Pattern[str]]] = {}
         for intent, patterns in self.PATTERNS.items():
             self.compiled_patterns[intent] = [
                 re.compile(pattern, re.IGNORECASE)
                 for pattern in patterns
             ]
+        self._triggers = {
+            intent: tuple(words) for intent, words in self.PATTERN_TRIGGERS.items()
+        }
+        self._keywords = {
+            intent: frozenset(words) for intent, words in self.INTENT_KEYWORDS.items()
+        }
+        self._keyword_words = frozenset().union(*self._keywords.values())
 
     def parse(self, command: str) -> ParsedCommand:
         """
@@ -102,21 +143,53 @@ class CommandParser:
             ParsedCommand with detected intent and parameters
         """
         command = command.strip()
-        logger.info(f"Parsing command: {command}")
+        if self.cache_size <= 0:
+            return self._parse(command)
+
+        with self._cache_lock:
+            cached = self._cache.get(command)
+            if cached is not None:
+                self._cache.move_to_end(command)
+                self.cache_hits += 1
+        if cached is None:
+            cached = self._parse(command)
+            with self._cache_lock:
+                self.cache_misses += 1
+                self._cache[command] = cached
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        # Callers get their own parameters; the cached entry stays unchanged
+        parsed = copy.copy(cached)
+        parsed.parameters = dict(cached.parameters)
+        return parsed
+
+    def clear_cache(self) -> None:
+        """Drop all cached parse results."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _parse(self, command: str) -> ParsedCommand:
+        """Parse a stripped command without the cache."""
+        command_lower = command.lower()
+        # Unicode case folding ("ſwap") can match patterns without their
+        # lowercase trigger, so only ASCII commands skip intents
+        prefilter = command.isascii()
 
         # Try pattern matching first (most accurate)
         for intent, patterns in self.compiled_patterns.items():
+            if prefilter and not any(word in command_lower for word in self._triggers[intent]):
+                continue
             for pattern in patterns:
                 match = pattern.search(command)
                 if match:
                     parsed = self._extract_parameters_from_match(
                         intent, match, command
                     )
-                    logger.info(f"Pattern matched: intent={intent}, confidence={parsed.confidence}")
+                    logger.debug(f"Pattern matched: intent={intent}, confidence={parsed.confidence}")
                     return parsed
 
         # Fallback to keyword matching
-        return self._parse_by_keywords(command)
+        return self._parse_by_keywords(command, command_lower)
 
     def _extract_parameters_from_match(
         self, intent: str, match: Match[str], raw_command: str
@@ -304,19 +377,18 @@ class CommandParser:
             raw_command=raw_command,
         )
 
-    def _parse_by_keywords(self, command: str) -> ParsedCommand:
+    def _parse_by_keywords(self, command: str, command_lower: str | None = None) -> ParsedCommand:
         """
         Parse command using keyword matching (fallback).
 
         Scores each intent based on keyword matches in the command.
         """
-        command_lower = command.lower()
+        command_lower = command_lower or command.lower()
+        found = {word for word in self._keyword_words if word in command_lower}
         scores: dict[str, float] = {}
 
-        for intent, keywords in self.INTENT_KEYWORDS.items():
-            score = sum(
-                1 for keyword in keywords if keyword in command_lower
-            )
+        for intent, keywords in self._keywords.items():
+            score = len(keywords & found)
             if score > 0:
                 scores[intent] = score / len(keywords)
 
@@ -333,7 +405,7 @@ class CommandParser:
         best_intent = max(scores, key=lambda k: scores[k])
         confidence = min(scores[best_intent] * 0.7, 0.7)  # Max 0.7 for keyword matching
 
-        logger.info(f"Keyword matched: intent={best_intent}, confidence={confidence}")
+        logger.debug(f"Keyword matched: intent={best_intent}, confidence={confidence}")
 
         # Extract basic parameters
         parameters = self._extract_basic_parameters(command, best_intent)
@@ -404,6 +476,10 @@ class CommandParser:
         return parameters
 
 
+# Process-wide parser: patterns compiled once, parse cache shared by all callers
+command_parser = CommandParser()
+
+
 def parse_command(command: str) -> ParsedCommand:
     """
     Convenience function to parse a command.
@@ -414,13 +490,12 @@ def parse_command(command: str) -> ParsedCommand:
     Returns:
         ParsedCommand object
     """
-    parser = CommandParser()
-    return parser.parse(command)
+    return command_parser.parse(command)
 
 
 def test_parser() -> None:
     """Test the command parser with sample commands."""
-    parser = CommandParser()
+    parser = command_parser
 
     test_commands = [
         "Pay 0.10 USDC to API service",
@@ -11,12 +11,19 @@ import os
 from pathlib import Path
 from typing import Any
 
-from deepagents import create_deep_agent
 from deepagents.backends import FilesystemBackend
 
+from src.agents.agent_graphs import agent_graphs, session_config
+from src.agents.llm_cache import cache_scope, llm_response_cache
+
 logger = logging.getLogger(__name__)
 
 
+def workspace_backend(runtime: Any) -> FilesystemBackend:
+    """Filesystem backend rooted at the workspace of the session invoking the graph."""
+    return FilesystemBackend(str(runtime.config["configurable"]["workspace_dir"]))
+
+
 class DeepAgentsExecutor:
     """
     DeepAgents executor with Claude Sonnet 4 integration.
@@ -82,9 +89,6 @@ Important guidelines:
         self.workspace_dir = Path(workspace_dir)
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
 
-        # Setup filesystem backend for agent state
-        self.backend = FilesystemBackend(str(self.workspace_dir))
-
         logger.info(
             f"DeepAgentsExecutor initialized for session {session_id} "
             f"with workspace: {self.workspace_dir}"
@@ -98,27 +102,26 @@ Important guidelines:
 
     def _create_agent(self):
         """
-        Create and configure the deepagents Agent using create_deep_agent.
+        Get the configured deepagents Agent from the shared graph registry.
+
+        The graph is shared by every session with the same tools; the
+        filesystem backend finds this session's workspace in the run config.
 
         Returns:
             Configured Agent instance
         """
-        # Build agent kwargs
-        agent_kwargs: dict[str, Any] = {
-            "model": "anthropic:claude-sonnet-4-20250514",
-            "tools": self._tools,
-            "system_prompt": self.SYSTEM_PROMPT,
-            "backend": self.backend,  # Pass filesystem backend for state persistence
-        }
+        # Filesystem backend for state persistence, resolved per invocation
+        options: dict[str, Any] = {"backend": workspace_backend}
 
         # Add base_url if configured (for alternative LLM providers)
         if self.base_url:
-            agent_kwargs["base_url"] = self.base_url
+            options["base_url"] = self.base_url
 
-        # Create agent with Claude Sonnet 4 using the approved API
-        agent = create_deep_agent(**agent_kwargs)
+        agent = agent_graphs.get(
+            "anthropic:claude-sonnet-4-20250514", self._tools, self.SYSTEM_PROMPT, **options
+        )
 
-        logger.info(f"DeepAgent created with Claude Sonnet 4 for session {self.session_id}")
+        logger.debug(f"Using Claude Sonnet 4 agent graph for session {self.session_id}")
         return agent
 
     @property
@@ -136,7 +139,7 @@ Important guidelines:
             tool_func: Tool function decorated with @tool
         """
         self._tools.append(tool_func)
-        # Reset agent so it gets recreated with new tools
+        # Reset agent so it is looked up again with the new tool set
         self._agent = None
         logger.info(f"Registered tool: {getattr(tool_func, 'name', tool_func.__name__)}")
 
@@ -166,8 +169,18 @@ Important guidelines:
                     self.register_tool(t)
                 logger.info(f"Registered {len(tools)} tools with deepagent")
 
-            # Execute command through deepagents using invoke
-            result = await self.agent.ainvoke({"messages": [{"role": "user", "content": command}]})
+            # Execute command through deepagents; read-only questions may be answered from cache
+            invocation = await llm_response_cache.ainvoke(
+                self.agent,
+                command,
+                scope=cache_scope(
+                    "anthropic:claude-sonnet-4-20250514",
+                    self.SYSTEM_PROMPT,
+                    self._tools,
+                    self.base_url or "",
+                ),
+                config=session_config(self.session_id, workspace_dir=str(self.workspace_dir)),
+            )
 
             logger.info(
                 f"Deepagents execution completed for session {self.session_id}"
@@ -177,8 +190,9 @@ Important guidelines:
                 "success": True,
                 "session_id": self.session_id,
                 "command": command,
-                "result": result,
+                "result": invocation.result,
                 "framework": "deepagents",
+                "cache": invocation.cache,
                 "model": "anthropic:claude-sonnet-4-20250514",
                 "workspace": str(self.workspace_dir),
             }
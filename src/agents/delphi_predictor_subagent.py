@@ -14,20 +14,12 @@ from uuid import UUID
 from langchain_core.tools import tool
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agents.agent_graphs import DEEPAGENTS_AVAILABLE, agent_graphs, session_config
 from src.connectors.delphi import DelphiConnector
 from src.utils.llm import get_model_string
 
 logger = logging.getLogger(__name__)
 
-# Try to import deepagents
-try:
-    from deepagents import create_deep_agent
-    DEEPAGENTS_AVAILABLE = True
-except ImportError:
-    DEEPAGENTS_AVAILABLE = False
-    create_deep_agent = None  # type: ignore
-
-
 # Delphi Predictor System Prompt
 DELPHI_PREDICTOR_SYSTEM_PROMPT = """You are Delphi Predictor, a specialized subagent for prediction market operations on Delphi.
 
@@ -260,6 +252,16 @@ def get_market_outcomes(market_id: str) -> dict[str, Any]:
         }
 
 
+# Tools of every Delphi predictor subagent; sessions share one compiled graph
+DELPHI_TOOLS = [
+    get_delphi_markets,
+    place_prediction_bet,
+    claim_prediction_winnings,
+    get_prediction_bet,
+    get_market_outcomes,
+]
+
+
 class DelphiPredictorSubagent:
     """
     Delphi Prediction Market Subagent.
@@ -294,13 +296,7 @@ class DelphiPredictorSubagent:
         self.delphi_connector = get_delphi_connector()
 
         # Initialize tools
-        self.tools = [
-            get_delphi_markets,
-            place_prediction_bet,
-            claim_prediction_winnings,
-            get_prediction_bet,
-            get_market_outcomes,
-        ]
+        self.tools = list(DELPHI_TOOLS)
 
         # Create agent lazily
         self._agent = None
@@ -311,17 +307,14 @@ class DelphiPredictorSubagent:
         )
 
     def _create_agent(self):
-        """Create the Delphi predictor agent using create_deep_agent."""
+        """Create the Delphi predictor agent from the shared graph registry."""
         if not self.available:
             logger.warning("DeepAgents not available, agent creation skipped")
             return None
 
-        agent = create_deep_agent(
-            model=get_model_string(self.llm_model),
-            tools=self.tools,
-            system_prompt=DELPHI_PREDICTOR_SYSTEM_PROMPT,
+        return agent_graphs.get(
+            get_model_string(self.llm_model), self.tools, DELPHI_PREDICTOR_SYSTEM_PROMPT
         )
-        return agent
 
     @property
     def agent(self):
@@ -389,7 +382,7 @@ class DelphiPredictorSubagent:
 
                 result = await self.agent.ainvoke({
                     "messages": [{"role": "user", "content": bet_command}]
-                })
+                }, config=session_config(self.session_id))
 
                 bet_result = self._process_agent_result(result, market_id, outcome, amount, odds)
             else:
@@ -436,7 +429,7 @@ class DelphiPredictorSubagent:
             if self.available and self.agent:
                 result = await self.agent.ainvoke({
                     "messages": [{"role": "user", "content": f"Claim winnings from bet {bet_id}"}]
-                })
+                }, config=session_config(self.session_id))
 
                 claim_result = self._process_claim_result(result, bet_id)
             else:
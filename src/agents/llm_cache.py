@@ -0,0 +1,389 @@
+"""
+Response cache for deepagents LLM invocations.
+
+Read-only questions ("what services are available", "get prices for BTC,
+ETH, and CRO") are asked over and over, and every one used to cost a full
+``agent.ainvoke``: several LLM round trips and their tokens. The agents
+send ``ainvoke`` only the user's command, so for a given agent (model,
+system prompt, tools) the answer depends on the command alone and can be
+reused:
+
+- exact and normalized keys: commands are normalized (case, punctuation,
+  whitespace, politeness filler) before keying, so "Get prices for BTC,
+  ETH, and CRO" and "get prices for btc eth and cro please" share an
+  entry. A hit reports whether the stored command matched exactly.
+- semantic lookup (optional): with an embedder configured, a miss is
+  embedded and compared against a local vector index of cached questions.
+  The closest one above ``similarity_threshold`` is served. Candidates are
+  bucketed by the numbers and token symbols in the command, so "price of
+  BTC" can never be answered with the ETH price.
+- TTLs follow the tools the answer used: an answer built from price
+  lookups expires with the price TTL, while an answer that used no tools
+  keeps the default TTL. Answers that used any tool not known to be
+  read-only (payments, swaps, file access, subagents) are not stored.
+- money never goes through the cache: commands that parse to a payment,
+  swap or trade intent, or mention a money-moving verb, bypass it entirely.
+
+Concurrent misses for the same key share one invocation. Hits, misses and
+bypasses, plus the tokens and seconds saved, are reported through the
+metrics collector. Cached results are shared between callers and must be
+treated as read-only.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from src.agents.command_parser import command_parser
+from src.core.config import settings
+from src.core.single_flight import SingleFlight
+from src.services.metrics_service import metrics_collector
+
+logger = logging.getLogger(__name__)
+
+# Embeds a normalized command for similarity lookup
+Embedder = Callable[[str], Awaitable[Sequence[float]]]
+
+# Read-only tools and how long answers that used them stay valid
+READ_ONLY_TOOL_TTL_SECONDS = {
+    "get_crypto_price": 15,
+    "get_crypto_prices": 15,
+    "get_market_status": 60,
+    "discover_services": 300,
+}
+
+# Agent bookkeeping tools that do not affect how long an answer is valid
+NEUTRAL_TOOLS = frozenset({"write_todos"})
+
+# Parsed intents that move money
+MONEY_INTENTS = frozenset({"payment", "swap", "perpetual_trade"})
+
+# Verbs that may move money even when the parser does not recognise the command
+MONEY_WORDS = re.compile(
+    r"\b(?:pay|paid|send|transfer|swap|exchange|trade|buy|sell|bet|stake|unstake|deposit|"
+    r"withdraw|approve|bridge|mint|burn|open|close|long|short|leverage|subscribe|bid)\w*",
+    re.IGNORECASE,
+)
+
+_FILLER = re.compile(
+    r"\b(?:please|pls|kindly|thanks|thank you|can you|could you|would you|hey|hi)\b"
+)
+_PUNCTUATION = re.compile(r"[^\w\s./$%-]|(?<!\d)\.|\.(?!\d)")
+_WHITESPACE = re.compile(r"\s+")
+_NUMBERS = re.compile(r"\d+(?:\.\d+)?")
+_SYMBOLS = re.compile(r"\b[A-Z]{2,6}\b")
+KNOWN_SYMBOLS = frozenset({"cro", "usdc", "usdt", "eth", "btc", "wbtc", "bnb"})
+
+
+def normalize_prompt(command: str) -> str:
+    """
+    Normalize a command for cache keys.
+
+    Case, punctuation (except in numbers and pairs like BTC/USDC),
+    politeness filler and repeated whitespace are removed.
+    """
+    text = _FILLER.sub(" ", command.casefold())
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def prompt_entities(command: str) -> frozenset[str]:
+    """Numbers and token symbols in a command; semantic hits must match them exactly."""
+    entities = set(_NUMBERS.findall(command))
+    entities.update(symbol.lower() for symbol in _SYMBOLS.findall(command))
+    entities.update(word for word in normalize_prompt(command).split() if word in KNOWN_SYMBOLS)
+    return frozenset(entities)
+
+
+def cache_scope(model: str, system_prompt: str, tools: Iterable[Any], *extra: str) -> str:
+    """
+    Identify an agent configuration; answers are only shared within one.
+
+    Args:
+        model: Model string the agent was created with
+        system_prompt: Agent system prompt
+        tools: Tools given to the agent
+        extra: Anything else that changes answers (e.g. a custom base URL)
+    """
+    names = sorted(getattr(tool, "name", getattr(tool, "__name__", repr(tool))) for tool in tools)
+    material = "\0".join([model, system_prompt, ",".join(names), *extra])
+    return hashlib.sha256(material.encode()).hexdigest()[:16]
+
+
+def _message_field(message: Any, name: str) -> Any:
+    return message.get(name) if isinstance(message, dict) else getattr(message, name, None)
+
+
+def tools_used(result: Any) -> set[str]:
+    """Names of the tools an agent called while producing ``result``."""
+    names: set[str] = set()
+    messages = result.get("messages", []) if isinstance(result, dict) else []
+    for message in messages:
+        for call in _message_field(message, "tool_calls") or []:
+            name = call.get("name") if isinstance(call, dict) else getattr(call, "name", None)
+            if name:
+                names.add(name)
+        if _message_field(message, "type") == "tool" or _message_field(message, "role") == "tool":
+            name = _message_field(message, "name")
+            if name:
+                names.add(name)
+    return names
+
+
+def tokens_used(result: Any) -> int:
+    """Total tokens reported in the usage metadata of a result's messages."""
+    total = 0
+    messages = result.get("messages", []) if isinstance(result, dict) else []
+    for message in messages:
+        usage = _message_field(message, "usage_metadata")
+        if isinstance(usage, dict):
+            total += usage.get("total_tokens") or (
+                (usage.get("input_tokens") or 0) + (usage.get("output_tokens") or 0)
+            )
+    return total
+
+
+def _unit(vector: Sequence[float]) -> tuple[float, ...]:
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return tuple(value / norm for value in vector)
+
+
+@dataclass
+class CachedInvocation:
+    """An agent result and how the cache produced it."""
+
+    result: Any
+    cache: str  # exact, normalized, semantic, miss, uncacheable, bypass
+
+
+@dataclass
+class _Entry:
+    result: Any
+    command: str
+    expires_at: float
+    tokens: int
+    latency_seconds: float
+    bucket: tuple[str, frozenset[str]]
+
+
+class LLMResponseCache:
+    """In-process cache of agent answers to read-only commands."""
+
+    def __init__(
+        self,
+        max_entries: int = settings.llm_cache_max_entries,
+        default_ttl_seconds: float = settings.llm_cache_default_ttl_seconds,
+        similarity_threshold: float = settings.llm_cache_similarity_threshold,
+        embedder: Embedder | None = None,
+        enabled: bool = settings.llm_cache_enabled,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached answers; least recently used are evicted
+            default_ttl_seconds: TTL of answers that used no tools (upper bound for all)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            embedder: Embeds normalized commands (None disables semantic lookup)
+            enabled: Whether to cache at all (False: every call invokes the agent)
+        """
+        self.max_entries = max_entries
+        self.default_ttl_seconds = default_ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.embedder = embedder
+        self.enabled = enabled
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # Semantic index: (scope, entities) -> cache key -> unit vector
+        self._vectors: dict[tuple[str, frozenset[str]], dict[str, tuple[float, ...]]] = {}
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+
+    def bypass_reason(self, command: str) -> str | None:
+        """Why a command must not be answered from (or stored in) the cache, if it must not."""
+        intent = command_parser.parse(command).intent
+        if intent in MONEY_INTENTS:
+            return f"{intent} intent"
+        match = MONEY_WORDS.search(command)
+        if match:
+            return f"money-moving verb '{match.group()}'"
+        return None
+
+    def ttl_for(self, tools: Iterable[str]) -> float | None:
+        """TTL for an answer that used ``tools``, or None if it must not be cached."""
+        ttl = self.default_ttl_seconds
+        for tool in tools:
+            if tool in NEUTRAL_TOOLS:
+                continue
+            if tool not in READ_ONLY_TOOL_TTL_SECONDS:
+                return None
+            ttl = min(ttl, READ_ONLY_TOOL_TTL_SECONDS[tool])
+        return ttl if ttl > 0 else None
+
+    @staticmethod
+    def _key(scope: str, normalized: str) -> str:
+        return hashlib.sha256(f"{scope}\0{normalized}".encode()).hexdigest()
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            vectors = self._vectors.get(entry.bucket)
+            if vectors is not None:
+                vectors.pop(key, None)
+                if not vectors:
+                    del self._vectors[entry.bucket]
+
+    def _get(self, key: str) -> _Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _nearest(
+        self, bucket: tuple[str, frozenset[str]], vector: tuple[float, ...]
+    ) -> _Entry | None:
+        with self._lock:
+            candidates = list(self._vectors.get(bucket, {}).items())
+        best_key, best_score = None, self.similarity_threshold
+        for key, cached in candidates:
+            score = sum(a * b for a, b in zip(vector, cached, strict=False))
+            if score >= best_score:
+                best_key, best_score = key, score
+        return self._get(best_key) if best_key is not None else None
+
+    def _store(
+        self,
+        key: str,
+        entry: _Entry,
+        vector: tuple[float, ...] | None,
+    ) -> None:
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = entry
+            if vector is not None:
+                self._vectors.setdefault(entry.bucket, {})[key] = vector
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    async def _embed(self, normalized: str) -> tuple[float, ...] | None:
+        try:
+            return _unit(await self.embedder(normalized))
+        except Exception as e:
+            logger.warning(f"LLM cache embedding failed, skipping semantic lookup: {e}")
+            return None
+
+    def _hit(self, entry: _Entry, command: str, source: str | None = None) -> CachedInvocation:
+        source = source or ("exact" if entry.command == command else "normalized")
+        metrics_collector.record_llm_cache(source, entry.tokens, entry.latency_seconds)
+        logger.debug(f"LLM cache {source} hit for: {command}")
+        return CachedInvocation(entry.result, source)
+
+    async def ainvoke(
+        self,
+        agent: Any,
+        command: str,
+        scope: str,
+        config: dict[str, Any] | None = None,
+    ) -> CachedInvocation:
+        """
+        Answer a command from the cache, or invoke the agent and cache its answer.
+
+        Args:
+            agent: Agent with ``ainvoke`` (deepagents graph)
+            command: User command, sent as the only message
+            scope: Agent configuration (see ``cache_scope``)
+            config: Run config for the agent (see ``session_config``)
+
+        Returns:
+            CachedInvocation with the agent result and the cache outcome
+        """
+        command = command.strip()
+        payload = {"messages": [{"role": "user", "content": command}]}
+        if not self.enabled:
+            return CachedInvocation(await agent.ainvoke(payload, config=config), "bypass")
+
+        reason = self.bypass_reason(command)
+        if reason is not None:
+            logger.debug(f"LLM cache bypassed ({reason}): {command}")
+            metrics_collector.record_llm_cache("bypass")
+            return CachedInvocation(await agent.ainvoke(payload, config=config), "bypass")
+
+        normalized = normalize_prompt(command)
+        key = self._key(scope, normalized)
+        entry = self._get(key)
+        if entry is not None:
+            return self._hit(entry, command)
+
+        bucket = (scope, prompt_entities(command))
+        vector = await self._embed(normalized) if self.embedder is not None else None
+        if vector is not None:
+            entry = self._nearest(bucket, vector)
+            if entry is not None:
+                return self._hit(entry, command, "semantic")
+
+        async def invoke_and_store() -> CachedInvocation:
+            started = time.perf_counter()
+            result = await agent.ainvoke(payload, config=config)
+            latency = time.perf_counter() - started
+            # A result whose messages cannot be inspected may have used any tool
+            ttl = self.ttl_for(tools_used(result)) if isinstance(result, dict) else None
+            if ttl is None:
+                metrics_collector.record_llm_cache("uncacheable")
+                return CachedInvocation(result, "uncacheable")
+            self._store(key, _Entry(
+                result=result,
+                command=command,
+                expires_at=time.monotonic() + ttl,
+                tokens=tokens_used(result),
+                latency_seconds=latency,
+                bucket=bucket,
+            ), vector)
+            metrics_collector.record_llm_cache("miss")
+            return CachedInvocation(result, "miss")
+
+        return await self._flights.do(key, invoke_and_store)
+
+    def clear(self) -> None:
+        """Drop every cached answer."""
+        with self._lock:
+            self._entries.clear()
+            self._vectors.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def default_embedder() -> Embedder | None:
+    """OpenAI embeddings for semantic lookup, if enabled and available."""
+    if not settings.llm_cache_semantic_enabled:
+        return None
+    try:
+        from langchain_openai import OpenAIEmbeddings
+    except ImportError:
+        logger.warning("LLM cache semantic lookup needs langchain-openai; using exact keys only")
+        return None
+    try:
+        embeddings = OpenAIEmbeddings(
+            model=settings.llm_cache_embedding_model,
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url,
+        )
+    except Exception as e:
+        logger.warning(f"LLM cache embeddings unavailable, using exact keys only: {e}")
+        return None
+    return embeddings.aembed_query
+
+
+# Process-wide cache shared by all agents; scopes keep configurations apart
+llm_response_cache = LLMResponseCache(embedder=default_embedder())
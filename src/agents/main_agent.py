@@ -12,6 +12,8 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agents.agent_graphs import DEEPAGENTS_AVAILABLE, agent_graphs, session_config
+from src.agents.llm_cache import cache_scope, llm_response_cache
 from src.agents.vvs_trader_subagent import VVSTraderSubagent
 from src.services.session_service import SessionService
 from src.tools.market_data_tools import get_market_data_tools
@@ -19,15 +21,6 @@ from src.utils.llm import get_model_string
 
 logger = logging.getLogger(__name__)
 
-# Try to import deepagents
-try:
-    from deepagents import create_deep_agent
-    DEEPAGENTS_AVAILABLE = True
-except ImportError:
-    DEEPAGENTS_AVAILABLE = False
-    create_deep_agent = None  # type: ignore
-
-
 # System prompt for Paygent agent
 PAYGENT_SYSTEM_PROMPT = """You are Paygent, an AI-powered payment orchestration agent for the Cronos blockchain.
 
@@ -101,7 +94,7 @@ class PaygentAgent:
 
     def _create_agent(self):
         """
-        Create the AI agent using create_deep_agent.
+        Get the AI agent's compiled graph from the shared registry.
 
         Returns:
             Agent instance or None if not available
@@ -110,13 +103,11 @@ class PaygentAgent:
             logger.warning("DeepAgents not available, agent creation skipped")
             return None
 
-        agent = create_deep_agent(
-            model=get_model_string(self.llm_model),
-            tools=self.tools,
-            system_prompt=PAYGENT_SYSTEM_PROMPT,
+        agent = agent_graphs.get(
+            get_model_string(self.llm_model), self.tools, PAYGENT_SYSTEM_PROMPT
         )
 
-        logger.info(f"Created deepagents agent for session {self.session_id}")
+        logger.debug(f"Using deepagents agent graph for session {self.session_id}")
         return agent
 
     @property
@@ -129,7 +120,7 @@ class PaygentAgent:
     async def add_tool(self, tool_func) -> None:
         """Add a tool to the agent."""
         self.tools.append(tool_func)
-        # Reset agent so it gets recreated with new tools
+        # Reset agent so it is looked up again with the new tool set
         self._agent = None
 
     async def execute_command(
@@ -153,14 +144,19 @@ class PaygentAgent:
                 logger.info(f"Spawning VVS trader subagent for swap command: {command}")
                 return await self._execute_with_vvs_subagent(command, budget_limit_usd)
 
-            # Use deepagents agent if available
+            # Use deepagents agent if available; read-only questions may be answered from cache
             if self.available and self.agent:
-                result = await self.agent.ainvoke({
-                    "messages": [{"role": "user", "content": command}]
-                })
+                invocation = await llm_response_cache.ainvoke(
+                    self.agent,
+                    command,
+                    scope=cache_scope(
+                        get_model_string(self.llm_model), PAYGENT_SYSTEM_PROMPT, self.tools
+                    ),
+                    config=session_config(self.session_id),
+                )
 
                 # Extract result from agent response
-                output = self._extract_result(result)
+                output = self._extract_result(invocation.result)
 
                 # Update session
                 await self.session_service.update_session_last_active(self.session_id)
@@ -170,6 +166,7 @@ class PaygentAgent:
                     "result": output,
                     "session_id": str(self.session_id),
                     "framework": "deepagents",
+                    "cache": invocation.cache,
                     "total_cost_usd": 0.0,
                 }
             else:
@@ -13,19 +13,11 @@ from uuid import UUID
 from langchain_core.tools import tool
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agents.agent_graphs import DEEPAGENTS_AVAILABLE, agent_graphs, session_config
 from src.utils.llm import get_model_string
 
 logger = logging.getLogger(__name__)
 
-# Try to import deepagents
-try:
-    from deepagents import create_deep_agent
-    DEEPAGENTS_AVAILABLE = True
-except ImportError:
-    DEEPAGENTS_AVAILABLE = False
-    create_deep_agent = None  # type: ignore
-
-
 # Moonlander Trading System Prompt
 MOONLANDER_TRADER_SYSTEM_PROMPT = """You are Moonlander Trader, a specialized subagent for Moonlander perpetual trading on Cronos.
 
@@ -213,6 +205,16 @@ def get_funding_rate(symbol: str) -> dict[str, Any]:
     }
 
 
+# Tools of every Moonlander trader subagent; sessions share one compiled graph
+MOONLANDER_TOOLS = [
+    open_position,
+    close_position,
+    set_stop_loss,
+    set_take_profit,
+    get_funding_rate,
+]
+
+
 class MoonlanderTraderSubagent:
     """
     Moonlander Perpetual Trading Subagent.
@@ -244,13 +246,7 @@ class MoonlanderTraderSubagent:
         self.available = DEEPAGENTS_AVAILABLE
 
         # Initialize tools
-        self.tools = [
-            open_position,
-            close_position,
-            set_stop_loss,
-            set_take_profit,
-            get_funding_rate,
-        ]
+        self.tools = list(MOONLANDER_TOOLS)
 
         # Create agent lazily
         self._agent = None
@@ -262,17 +258,14 @@ class MoonlanderTraderSubagent:
         )
 
     def _create_agent(self):
-        """Create the Moonlander trader agent using create_deep_agent."""
+        """Create the Moonlander trader agent from the shared graph registry."""
         if not self.available:
             logger.warning("DeepAgents not available, agent creation skipped")
             return None
 
-        agent = create_deep_agent(
-            model=get_model_string(self.llm_model),
-            tools=self.tools,
-            system_prompt=MOONLANDER_TRADER_SYSTEM_PROMPT,
+        return agent_graphs.get(
+            get_model_string(self.llm_model), self.tools, MOONLANDER_TRADER_SYSTEM_PROMPT
         )
-        return agent
 
     @property
     def agent(self):
@@ -338,7 +331,7 @@ class MoonlanderTraderSubagent:
 
                 result = await self.agent.ainvoke({
                     "messages": [{"role": "user", "content": trade_command}]
-                })
+                }, config=session_config(self.session_id))
 
                 trade_result = self._process_agent_result(result, direction, symbol, amount, leverage)
             else:
@@ -394,7 +387,7 @@ class MoonlanderTraderSubagent:
 
                 result = await self.agent.ainvoke({
                     "messages": [{"role": "user", "content": close_command}]
-                })
+                }, config=session_config(self.session_id))
 
                 close_result = self._process_close_result(result, symbol)
             else:
@@ -0,0 +1,474 @@
+"""
+Command planning and dependency-DAG plan execution.
+
+Multi-step commands ("check my balance and discover services, then pay
+0.10 USDC to the market data API") are split into steps that form a
+dependency DAG rather than a sequence:
+
+- read-only steps (balance checks, quotes, service discovery) depend only
+  on the state-changing step before them, so consecutive reads run
+  concurrently
+- state-changing steps (payments, swaps, trades) depend on every step
+  before them, so side effects keep the order the user gave and can use
+  the earlier results
+
+``PlanExecutor`` starts each step as soon as its dependencies have
+completed, passes it their results, and bounds how many steps of one
+session run at once. A failed step skips its dependents while independent
+branches carry on, so a plan takes as long as its critical path.
+Cancelling the coroutine running the plan (e.g. a WebSocket cancel)
+cancels the steps in flight and marks the rest cancelled.
+"""
+
+import asyncio
+import logging
+import re
+import weakref
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+
+from src.agents.command_parser import CommandParser, command_parser
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Words that make a command a sequence of steps
+SEQUENTIAL_KEYWORDS = re.compile(r"\b(?:then|after that|next|first|finally|afterwards)\b", re.IGNORECASE)
+BUDGET_KEYWORDS = re.compile(r"\b(?:budget|limit)\b", re.IGNORECASE)
+PAY_KEYWORDS = re.compile(r"\b(?:pay|access|subscribe)\b", re.IGNORECASE)
+ARBITRAGE_KEYWORDS = re.compile(r"\barbitrage\b", re.IGNORECASE)
+
+# Clause boundaries when splitting a command into steps
+STEP_SEPARATORS = re.compile(
+    r"\s*(?:[,;]\s*)?\b(?:and then|after that|afterwards|then|next|finally|and)\b\s*|\s*[;,]\s*",
+    re.IGNORECASE,
+)
+
+# Intents that only read state; they may run concurrently with each other
+READ_ONLY_INTENTS = frozenset({"balance_check", "service_discovery"})
+
+# Parameters a step needs before it can be planned
+REQUIRED_PARAMETERS = {
+    "payment": ("amount",),
+    "swap": ("from_token", "to_token", "amount"),
+    "perpetual_trade": ("amount",),
+    "balance_check": (),
+    "service_discovery": (),
+}
+
+# Rough seconds per step type, for a plan's duration estimate
+STEP_DURATION_SECONDS = {
+    "payment": 10,
+    "swap": 15,
+    "perpetual_trade": 15,
+    "balance_check": 2,
+    "service_discovery": 3,
+}
+
+# Step handler: (step, results of its dependencies by step ID) -> step result
+StepHandler = Callable[["PlanStep", dict[Any, Any]], Awaitable[Any]]
+
+
+class PlanError(ValueError):
+    """Raised when a plan's dependencies are unknown or cyclic."""
+
+
+@dataclass
+class PlanStep:
+    """One step of an execution plan."""
+
+    step_id: int | str
+    description: str
+    action_type: str
+    parameters: dict[str, Any] = field(default_factory=dict)
+    dependencies: list[int | str] = field(default_factory=list)
+    requires_approval: bool = False
+    expected_outcome: str = ""
+    status: str = "pending"  # pending, in_progress, completed, failed, skipped, cancelled
+    result: Any = None
+    error: str | None = None
+    duration_ms: int | None = None
+
+
+@dataclass
+class ExecutionPlan:
+    """A command broken into steps with dependencies between them."""
+
+    plan_id: str
+    command: str
+    steps: list[PlanStep]
+    estimated_cost_usd: float = 0.0
+    estimated_duration_seconds: int = 0
+    requires_human_approval: bool = False
+    status: str = "created"  # created, approved, running, completed, failed, cancelled
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+    def validate(self) -> None:
+        """
+        Check that dependencies refer to steps of this plan and form a DAG.
+
+        Raises:
+            PlanError: On duplicate IDs, unknown dependencies or a cycle
+        """
+        ids = [step.step_id for step in self.steps]
+        if len(set(ids)) != len(ids):
+            raise PlanError(f"Plan {self.plan_id} has duplicate step IDs")
+        known = set(ids)
+        for step in self.steps:
+            unknown = [dep for dep in step.dependencies if dep not in known]
+            if unknown:
+                raise PlanError(f"Step {step.step_id} depends on unknown steps {unknown}")
+
+        # Kahn's algorithm: every step must become ready
+        pending = {step.step_id: set(step.dependencies) for step in self.steps}
+        ready = [step_id for step_id, deps in pending.items() if not deps]
+        resolved = 0
+        while ready:
+            done = ready.pop()
+            resolved += 1
+            for step_id, deps in pending.items():
+                if done in deps:
+                    deps.discard(done)
+                    if not deps:
+                        ready.append(step_id)
+        if resolved != len(self.steps):
+            raise PlanError(f"Plan {self.plan_id} has a dependency cycle")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Render as a write_todos plan, with each step's dependencies."""
+        return {
+            "approach": f"Execute {len(self.steps)} steps as a dependency graph",
+            "steps": [
+                {
+                    "id": step.step_id,
+                    "description": step.description,
+                    "outcome": step.expected_outcome,
+                    "status": step.status,
+                    "depends_on": list(step.dependencies),
+                }
+                for step in self.steps
+            ],
+            "total_steps": len(self.steps),
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+class CommandPlanner:
+    """Decide which commands need a plan and build dependency DAGs for them."""
+
+    def __init__(self, parser: CommandParser | None = None):
+        self.parser = parser or command_parser
+        self.plans: dict[str, ExecutionPlan] = {}
+
+    def should_plan(self, command: str, intent: str) -> bool:
+        """
+        Whether a command has several steps.
+
+        Args:
+            command: Natural language command
+            intent: Intent parsed from the whole command
+
+        Returns:
+            True for sequenced commands, budget-constrained payments and
+            discovery followed by payment
+        """
+        if not command:
+            return False
+        if SEQUENTIAL_KEYWORDS.search(command):
+            return True
+        if intent == "payment" and BUDGET_KEYWORDS.search(command):
+            return True
+        return intent == "service_discovery" and bool(PAY_KEYWORDS.search(command))
+
+    def create_plan(
+        self,
+        command: str,
+        intent: str | None = None,
+        parameters: dict[str, Any] | None = None,
+    ) -> ExecutionPlan | None:
+        """
+        Split a command into steps and derive their dependencies.
+
+        Without an intent only complete plans are built, so every step can
+        run as parsed. With the intent parsed from the whole command, clauses
+        missing parameters become steps that need approval, and single-clause
+        budget-constrained payments and arbitrage get a template plan.
+
+        Args:
+            command: Natural language command
+            intent: Intent parsed from the whole command
+            parameters: Parameters parsed from the whole command, used for
+                template steps
+
+        Returns:
+            ExecutionPlan with two or more steps, or None when the command
+            cannot be planned
+        """
+        if not command.strip():
+            return None
+        steps = self._clause_steps(command, allow_incomplete=intent is not None)
+        if steps is None and intent is not None:
+            steps = self._template_steps(command, intent, parameters or {})
+        if steps is None:
+            return None
+
+        plan = ExecutionPlan(
+            plan_id=str(uuid4()),
+            command=command,
+            steps=steps,
+            estimated_duration_seconds=_critical_path_seconds(steps),
+            requires_human_approval=any(step.requires_approval for step in steps),
+        )
+        self.plans[plan.plan_id] = plan
+        return plan
+
+    def _clause_steps(self, command: str, allow_incomplete: bool) -> list[PlanStep] | None:
+        """One step per clause, or None unless there are two or more usable clauses."""
+        clauses = [
+            clause.strip(" .")
+            for clause in STEP_SEPARATORS.split(command)
+            if clause and clause.strip(" .")
+        ]
+        if len(clauses) < 2:
+            return None
+
+        steps: list[PlanStep] = []
+        last_write: int | None = None
+        for step_id, clause in enumerate(clauses, start=1):
+            parsed = self.parser.parse(clause)
+            required = REQUIRED_PARAMETERS.get(parsed.intent)
+            if required is None:
+                return None
+            incomplete = any(name not in parsed.parameters for name in required)
+            if incomplete and not allow_incomplete:
+                return None
+
+            if parsed.intent in READ_ONLY_INTENTS:
+                dependencies = [last_write] if last_write is not None else []
+            else:
+                dependencies = [step.step_id for step in steps]
+                last_write = step_id
+            steps.append(PlanStep(
+                step_id=step_id,
+                description=clause,
+                action_type=parsed.intent,
+                parameters=dict(parsed.parameters),
+                dependencies=dependencies,
+                requires_approval=incomplete,
+                expected_outcome=f"{parsed.intent.replace('_', ' ')} completed",
+            ))
+        return steps
+
+    def _template_steps(
+        self, command: str, intent: str, parameters: dict[str, Any]
+    ) -> list[PlanStep] | None:
+        """Steps for single-clause commands that still need several actions."""
+        if intent == "swap" and ARBITRAGE_KEYWORDS.search(command):
+            return [
+                PlanStep(
+                    step_id=1,
+                    description="Check balances for the arbitrage",
+                    action_type="balance_check",
+                    expected_outcome="balances known",
+                ),
+                PlanStep(
+                    step_id=2,
+                    description="Buy on the cheaper exchange",
+                    action_type="swap",
+                    parameters=dict(parameters),
+                    dependencies=[1],
+                    requires_approval=True,
+                    expected_outcome="tokens bought",
+                ),
+                PlanStep(
+                    step_id=3,
+                    description="Sell on the more expensive exchange",
+                    action_type="swap",
+                    parameters=dict(parameters),
+                    dependencies=[2],
+                    requires_approval=True,
+                    expected_outcome="tokens sold",
+                ),
+            ]
+        if intent == "payment" and BUDGET_KEYWORDS.search(command):
+            return [
+                PlanStep(
+                    step_id=1,
+                    description="Check balance against the budget",
+                    action_type="balance_check",
+                    expected_outcome="budget headroom known",
+                ),
+                PlanStep(
+                    step_id=2,
+                    description=command,
+                    action_type="payment",
+                    parameters=dict(parameters),
+                    dependencies=[1],
+                    requires_approval=True,
+                    expected_outcome="payment completed",
+                ),
+                PlanStep(
+                    step_id=3,
+                    description="Confirm the remaining budget",
+                    action_type="balance_check",
+                    dependencies=[2],
+                    expected_outcome="remaining budget known",
+                ),
+            ]
+        return None
+
+
+def _critical_path_seconds(steps: list[PlanStep]) -> int:
+    """Estimated seconds along the longest dependency chain (steps follow their dependencies)."""
+    finish: dict[Any, int] = {}
+    for step in steps:
+        start = max((finish[dep] for dep in step.dependencies), default=0)
+        finish[step.step_id] = start + STEP_DURATION_SECONDS.get(step.action_type, 5)
+    return max(finish.values(), default=0)
+
+
+# Per-session step limiters, dropped once no executor holds them
+_session_limiters: "weakref.WeakValueDictionary[Any, asyncio.Semaphore]" = weakref.WeakValueDictionary()
+
+
+def session_limiter(session_id: Any, max_concurrency: int) -> asyncio.Semaphore:
+    """Semaphore bounding concurrent plan steps across all plans of a session."""
+    limiter = _session_limiters.get(session_id)
+    if limiter is None:
+        limiter = asyncio.Semaphore(max_concurrency)
+        _session_limiters[session_id] = limiter
+    return limiter
+
+
+def _step_failed(result: Any) -> bool:
+    return isinstance(result, dict) and result.get("success") is False
+
+
+class PlanExecutor:
+    """Run a plan's steps as their dependencies complete, under a per-session cap."""
+
+    def __init__(
+        self,
+        handlers: Mapping[str, StepHandler],
+        session_id: Any = None,
+        max_concurrency: int = settings.plan_max_concurrency,
+        on_step: Callable[[PlanStep], Awaitable[None]] | None = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            handlers: Handler per step ``action_type``
+            session_id: Session whose concurrency cap applies (None: this plan only)
+            max_concurrency: Steps of the session allowed to run at once
+            on_step: Called when a step starts and when it finishes
+        """
+        self.handlers = handlers
+        self.limiter = (
+            session_limiter(session_id, max_concurrency)
+            if session_id is not None
+            else asyncio.Semaphore(max_concurrency)
+        )
+        self.on_step = on_step
+
+    async def _notify(self, step: PlanStep) -> None:
+        if self.on_step is not None:
+            try:
+                await self.on_step(step)
+            except Exception as e:
+                logger.warning(f"Plan step callback failed for step {step.step_id}: {e}")
+
+    async def _run_step(self, step: PlanStep, inputs: dict[Any, Any]) -> Any:
+        handler = self.handlers.get(step.action_type)
+        if handler is None:
+            raise PlanError(f"No handler for step type '{step.action_type}'")
+        async with self.limiter:
+            step.status = "in_progress"
+            await self._notify(step)
+            started = asyncio.get_running_loop().time()
+            try:
+                return await handler(step, inputs)
+            finally:
+                step.duration_ms = int((asyncio.get_running_loop().time() - started) * 1000)
+
+    def _skip_dependents(self, failed_id: Any, steps: dict[Any, PlanStep], dependents: dict) -> None:
+        for dependent_id in dependents[failed_id]:
+            dependent = steps[dependent_id]
+            if dependent.status == "pending":
+                dependent.status = "skipped"
+                dependent.error = f"Dependency {failed_id} did not complete"
+                self._skip_dependents(dependent_id, steps, dependents)
+
+    async def execute(self, plan: ExecutionPlan) -> dict[Any, Any]:
+        """
+        Run a plan to completion.
+
+        Args:
+            plan: Plan to run; step statuses, results and errors are updated in place
+
+        Returns:
+            Results of completed steps by step ID
+
+        Raises:
+            PlanError: If the plan is not a valid DAG
+            asyncio.CancelledError: If cancelled; running steps are cancelled first
+        """
+        plan.validate()
+        steps = {step.step_id: step for step in plan.steps}
+        waiting_on = {step.step_id: set(step.dependencies) for step in plan.steps}
+        dependents: dict[Any, list[Any]] = defaultdict(list)
+        for step in plan.steps:
+            for dependency in step.dependencies:
+                dependents[dependency].append(step.step_id)
+
+        results: dict[Any, Any] = {}
+        running: dict[asyncio.Task, Any] = {}
+
+        def start_ready() -> None:
+            for step_id, deps in waiting_on.items():
+                step = steps[step_id]
+                if step.status == "pending" and not deps and step_id not in running.values():
+                    inputs = {dep: results[dep] for dep in step.dependencies}
+                    running[asyncio.create_task(self._run_step(step, inputs))] = step_id
+
+        plan.status = "running"
+        start_ready()
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = steps[running.pop(task)]
+                    error = task.exception()
+                    if error is not None:
+                        step.status, step.error = "failed", str(error)
+                        logger.warning(f"Plan {plan.plan_id} step {step.step_id} failed: {error}")
+                    else:
+                        step.result = task.result()
+                        if _step_failed(step.result):
+                            step.status = "failed"
+                            step.error = step.result.get("error")
+                        else:
+                            step.status = "completed"
+                            results[step.step_id] = step.result
+                            for dependent_id in dependents[step.step_id]:
+                                waiting_on[dependent_id].discard(step.step_id)
+                    if step.status == "failed":
+                        self._skip_dependents(step.step_id, steps, dependents)
+                    await self._notify(step)
+                start_ready()
+        except asyncio.CancelledError:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            for step in plan.steps:
+                if step.status in ("pending", "in_progress"):
+                    step.status = "cancelled"
+            plan.status = "cancelled"
+            raise
+
+        plan.status = "completed" if all(step.status == "completed" for step in plan.steps) else "failed"
+        return results
@@ -179,15 +179,15 @@ class DiscoverServicesTool(BaseTool):
                 "success": True,
                 "services": [
                     {
-                        "id": str(service.id),
-                        "name": service.name,
-                        "description": service.description,
-                        "endpoint": service.endpoint,
-                        "pricing_model": service.pricing_model,
-                        "price_amount": float(service.price_amount),
-                        "price_token": service.price_token,
-                        "mcp_compatible": service.mcp_compatible,
-                        "reputation_score": float(service.reputation_score),
+                        "id": service["id"],
+                        "name": service["name"],
+                        "description": service["description"],
+                        "endpoint": service["endpoint"],
+                        "pricing_model": service["pricing_model"],
+                        "price_amount": service["price_amount"],
+                        "price_token": service["price_token"],
+                        "mcp_compatible": service["mcp_compatible"],
+                        "reputation_score": service["reputation_score"],
                     }
                     for service in services
                 ],
@@ -12,19 +12,11 @@ from uuid import UUID
 from langchain_core.tools import tool
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.agents.agent_graphs import DEEPAGENTS_AVAILABLE, agent_graphs, session_config
 from src.utils.llm import get_model_string
 
 logger = logging.getLogger(__name__)
 
-# Try to import deepagents
-try:
-    from deepagents import create_deep_agent
-    DEEPAGENTS_AVAILABLE = True
-except ImportError:
-    DEEPAGENTS_AVAILABLE = False
-    create_deep_agent = None  # type: ignore
-
-
 # VVS Trading System Prompt
 VVS_TRADER_SYSTEM_PROMPT = """You are VVS Trader, a specialized subagent for VVS Finance token swaps on Cronos.
 
@@ -96,6 +88,10 @@ def swap_tokens(
     }
 
 
+# Tools of every VVS trader subagent; sessions share one compiled graph
+VVS_TRADER_TOOLS = [swap_tokens]
+
+
 class VVSTraderSubagent:
     """
     VVS Finance Trader Subagent.
@@ -127,7 +123,7 @@ class VVSTraderSubagent:
         self.available = DEEPAGENTS_AVAILABLE
 
         # Initialize tools
-        self.tools = [swap_tokens]
+        self.tools = list(VVS_TRADER_TOOLS)
 
         # Create agent lazily
         self._agent = None
@@ -139,17 +135,14 @@ class VVSTraderSubagent:
         )
 
     def _create_agent(self):
-        """Create the VVS trader agent using create_deep_agent."""
+        """Create the VVS trader agent from the shared graph registry."""
         if not self.available:
             logger.warning("DeepAgents not available, agent creation skipped")
             return None
 
-        agent = create_deep_agent(
-            model=get_model_string(self.llm_model),
-            tools=self.tools,
-            system_prompt=VVS_TRADER_SYSTEM_PROMPT,
+        return agent_graphs.get(
+            get_model_string(self.llm_model), self.tools, VVS_TRADER_SYSTEM_PROMPT
         )
-        return agent
 
     @property
     def agent(self):
@@ -215,7 +208,7 @@ class VVSTraderSubagent:
 
                 result = await self.agent.ainvoke({
                     "messages": [{"role": "user", "content": swap_command}]
-                })
+                }, config=session_config(self.session_id))
 
                 # Extract swap details from agent result
                 swap_result = self._process_agent_result(result, from_token, to_token, amount)
@@ -17,7 +17,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.agents.agent_executor_enhanced import AgentExecutorEnhanced, execute_agent_command_enhanced
-from src.agents.command_parser import CommandParser
+from src.agents.command_parser import command_parser
+from src.agents.planner import ExecutionPlan, PlanError, PlanExecutor, PlanStep
 from src.core.database import get_db
 from src.core.errors import validate_command_input
 from src.models.agent_sessions import AgentSession
@@ -224,8 +225,7 @@ async def execute_command_stream(
             await asyncio.sleep(0.1)
 
             # Event 2: Parse command
-            parser = CommandParser()
-            parsed = parser.parse(request.command)
+            parsed = command_parser.parse(request.command)
 
             # Event 3: Tool call based on intent
             if parsed.intent == "payment":
@@ -479,22 +479,7 @@ async def execute_step(
         print(f"Executing step {step_id}: {step_name} with args: {args}")
 
         # Execute step based on type
-        if step_name == "parse-payment":
-            result = await _execute_parse_payment_step(args)
-        elif step_name == "check-balance":
-            result = await _execute_check_balance_step(args)
-        elif step_name == "execute-payment":
-            result = await _execute_payment_step(args, db)
-        elif step_name == "parse-swap":
-            result = await _execute_parse_swap_step(args)
-        elif step_name == "get-quote":
-            result = await _execute_get_quote_step(args)
-        elif step_name == "execute-swap":
-            result = await _execute_swap_step(args, db)
-        elif step_name == "parse-command":
-            result = await _execute_parse_command_step(args)
-        else:
-            raise ValueError(f"Unknown step type: {step_name}")
+        result = await _run_workflow_step(step_name, args, db)
 
         execution_time = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
@@ -520,11 +505,8 @@ async def execute_step(
 
 async def _execute_parse_payment_step(args: dict) -> dict:
     """Execute payment parsing step."""
-    from src.agents.command_parser import CommandParser
-
     command = args.get("command", "")
-    parser = CommandParser()
-    parsed = parser.parse(command)
+    parsed = command_parser.parse(command)
 
     return {
         "intent": parsed.intent,
@@ -555,8 +537,7 @@ async def _execute_payment_step(args: dict, db: AsyncSession) -> dict:
     executor = AgentExecutorEnhanced(session_id=uuid4(), db=db)
 
     command = args.get("command", "")
-    parser = CommandParser()
-    parsed = parser.parse(command)
+    parsed = command_parser.parse(command)
 
     service_url = executor._resolve_service_endpoint(parsed.parameters.get('recipient', 'api'))
 
@@ -575,11 +556,8 @@ async def _execute_payment_step(args: dict, db: AsyncSession) -> dict:
 
 async def _execute_parse_swap_step(args: dict) -> dict:
     """Execute swap parsing step."""
-    from src.agents.command_parser import CommandParser
-
     command = args.get("command", "")
-    parser = CommandParser()
-    parsed = parser.parse(command)
+    parsed = command_parser.parse(command)
 
     return {
         "intent": parsed.intent,
@@ -590,13 +568,13 @@ async def _execute_parse_swap_step(args: dict) -> dict:
 
 async def _execute_get_quote_step(args: dict) -> dict:
     """Execute price quote step."""
-    from src.connectors.vvs import VVSConnector
+    from src.connectors.vvs import VVSFinanceConnector
 
-    connector = VVSConnector()
-    result = await connector.get_quote(
+    connector = VVSFinanceConnector()
+    result = await connector.get_quote_async(
         from_token=args.get("from_token", "CRO"),
         to_token=args.get("to_token", "USDC"),
-        amount=args.get("amount", "10")
+        amount=float(args.get("amount", "10"))
     )
 
     return {
@@ -625,11 +603,8 @@ async def _execute_swap_step(args: dict, db: AsyncSession) -> dict:
 
 async def _execute_parse_command_step(args: dict) -> dict:
     """Execute general command parsing step."""
-    from src.agents.command_parser import CommandParser
-
     command = args.get("command", "")
-    parser = CommandParser()
-    parsed = parser.parse(command)
+    parsed = command_parser.parse(command)
 
     return {
         "intent": parsed.intent,
@@ -637,3 +612,133 @@ async def _execute_parse_command_step(args: dict) -> dict:
         "confidence": parsed.confidence,
         "requires_approval": parsed.requires_approval
     }
+
+
+# Workflow step handlers by step name, and whether they use the database session
+WORKFLOW_STEPS = {
+    "parse-payment": (_execute_parse_payment_step, False),
+    "check-balance": (_execute_check_balance_step, False),
+    "execute-payment": (_execute_payment_step, True),
+    "parse-swap": (_execute_parse_swap_step, False),
+    "get-quote": (_execute_get_quote_step, False),
+    "execute-swap": (_execute_swap_step, True),
+    "parse-command": (_execute_parse_command_step, False),
+}
+
+
+async def _run_workflow_step(step_name: str, args: dict, db: AsyncSession) -> dict:
+    """Run a workflow step by name."""
+    if step_name not in WORKFLOW_STEPS:
+        raise ValueError(f"Unknown step type: {step_name}")
+    handler, uses_db = WORKFLOW_STEPS[step_name]
+    return await (handler(args, db) if uses_db else handler(args))
+
+
+class PlanStepRequest(ExecuteStepRequest):
+    """A workflow step with the steps it depends on."""
+
+    dependsOn: list[str] = Field(
+        default=[],
+        description="Step IDs that must complete first; their results are passed as args['dependencies']",
+    )
+
+
+class ExecutePlanRequest(BaseModel):
+    """Request body for executing a workflow plan as a dependency graph."""
+
+    steps: list[PlanStepRequest] = Field(..., min_length=1, description="Steps of the plan")
+    sessionId: UUID | None = Field(
+        default=None, description="Session whose concurrency limit applies"
+    )
+
+
+class ExecutePlanResponse(BaseModel):
+    """Response from executing a workflow plan."""
+
+    success: bool
+    steps: list[ExecuteStepResponse]
+    executionTimeMs: int
+
+
+@router.post(
+    "/execute-plan",
+    response_model=ExecutePlanResponse,
+    summary="Execute workflow steps as a dependency graph",
+    description="Execute several workflow steps in one call. Steps whose dependencies have completed run concurrently; a failed step skips the steps that depend on it.",
+)
+async def execute_plan(
+    request: ExecutePlanRequest,
+    db: AsyncSession = Depends(get_db),
+) -> ExecutePlanResponse:
+    """
+    Execute workflow steps as a dependency DAG.
+
+    Independent steps (e.g. check-balance and get-quote) run concurrently, so
+    the plan takes as long as its longest dependency chain. Steps that use
+    the database session run one at a time.
+
+    Args:
+        request: Steps with their dependencies
+        db: Database session dependency
+
+    Returns:
+        ExecutePlanResponse with each step's outcome
+    """
+    start_time = datetime.utcnow()
+    unknown = sorted({step.stepName for step in request.steps} - WORKFLOW_STEPS.keys())
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown step types: {', '.join(unknown)}",
+        )
+
+    plan = ExecutionPlan(
+        plan_id=str(uuid4()),
+        command="workflow",
+        steps=[
+            PlanStep(
+                step_id=step.stepId,
+                description=step.stepName,
+                action_type=step.stepName,
+                parameters=step.args,
+                dependencies=step.dependsOn,
+            )
+            for step in request.steps
+        ],
+    )
+    try:
+        plan.validate()
+    except PlanError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # One AsyncSession cannot run concurrent statements
+    db_lock = asyncio.Lock()
+
+    async def run_step(step: PlanStep, inputs: dict) -> dict:
+        args = {**step.parameters, "dependencies": inputs} if inputs else step.parameters
+        if WORKFLOW_STEPS[step.action_type][1]:
+            async with db_lock:
+                return await _run_workflow_step(step.action_type, args, db)
+        return await _run_workflow_step(step.action_type, args, db)
+
+    executor = PlanExecutor(
+        handlers=dict.fromkeys(WORKFLOW_STEPS, run_step),
+        session_id=request.sessionId,
+    )
+    await executor.execute(plan)
+
+    return ExecutePlanResponse(
+        success=plan.status == "completed",
+        steps=[
+            ExecuteStepResponse(
+                success=step.status == "completed",
+                stepId=step.step_id,
+                stepName=step.action_type,
+                result=step.result if isinstance(step.result, dict) else None,
+                error=step.error,
+                executionTimeMs=step.duration_ms,
+            )
+            for step in plan.steps
+        ],
+        executionTimeMs=int((datetime.utcnow() - start_time).total_seconds() * 1000),
+    )
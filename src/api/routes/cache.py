@@ -13,6 +13,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from src.core.cache import cache_client, vercel_cache_client
+from src.core.near_cache import near_cache
 
 router = APIRouter()
 
@@ -245,8 +246,8 @@ async def get_cache_metrics() -> CacheMetricsResponse:
         return CacheMetricsResponse(
             backend="redis",
             connected=True,
-            metrics={"status": "available"},
-            info={"client": "standard_redis"},
+            metrics=near_cache.get_metrics(),
+            info={"client": "standard_redis", **near_cache.get_info()},
         )
 
     # No cache available
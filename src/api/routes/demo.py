@@ -286,7 +286,7 @@ async def execute_vvs_quote_live(params: dict, explorer_url: str):
     # Execute real quote
     try:
         connector = VVSFinanceConnector(use_testnet=True)
-        quote_result = connector.get_quote(
+        quote_result = await connector.get_quote_async(
             from_token=from_token,
             to_token=to_token,
             amount=amount,
@@ -653,7 +653,7 @@ Note: HITL approval would be required in production for amounts > $50."""
     
     try:
         connector = VVSFinanceConnector(use_testnet=True)
-        quote_result = connector.get_quote(
+        quote_result = await connector.get_quote_async(
             from_token=from_token,
             to_token=to_token,
             amount=amount,
@@ -1185,7 +1185,7 @@ I will query real on-chain contracts to compare DeFi opportunities."""
 
         # Get real VVS quote
         connector = VVSFinanceConnector(use_testnet=True)
-        usdc_cro_quote = connector.get_quote(
+        usdc_cro_quote = await connector.get_quote_async(
             from_token="USDC",
             to_token="CRO",
             amount=float(investment_amount),
@@ -13,9 +13,11 @@ from pydantic import BaseModel, Field
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_db, get_reporting_db
+from src.core.pagination import InvalidCursorError, apply_keyset, count_rows, split_page
 from src.models.agent_sessions import AgentSession
 from src.models.execution_logs import ExecutionLog as ExecutionLogModel
+from src.services.tool_usage import get_session_tool_usage
 
 router = APIRouter()
 
@@ -49,8 +51,9 @@ class LogListResponse(BaseModel):
     """Response for listing execution logs."""
 
     logs: list[ExecutionLog]
-    total: int
-    offset: int
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page")
+    total: int | None = None
+    total_is_estimate: bool = False
     limit: int
 
 
@@ -80,17 +83,20 @@ async def get_logs(
     status_filter: str | None = Query(default=None, alias="status", description="Filter by status"),
     start_date: datetime | None = Query(default=None),
     end_date: datetime | None = Query(default=None),
-    offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
     limit: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    total: str = Query(default="none", pattern="^(none|estimate|exact)$", description="Include a total count"),
+    db: AsyncSession = Depends(get_reporting_db),
 ) -> LogListResponse:
     """
-    Get execution logs with filtering.
+    Get execution logs with filtering, newest first.
 
     Supports filtering by:
     - session_id: Specific session
     - status: Execution status
     - start_date/end_date: Date range
+
+    Pages are fetched with ``cursor``; the total count is only computed on request.
     """
     # Build query
     query = select(ExecutionLogModel)
@@ -105,18 +111,15 @@ async def get_logs(
     if end_date:
         query = query.where(ExecutionLogModel.created_at <= end_date)
 
-    # Order by most recent first
-    query = query.order_by(ExecutionLogModel.created_at.desc())
+    count, is_estimate = await count_rows(db, query, total)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Apply pagination
-    query = query.offset(offset).limit(limit)
+    # Most recent first, starting after the cursor
+    try:
+        query = apply_keyset(query, ExecutionLogModel.created_at, ExecutionLogModel.id, cursor, limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     result = await db.execute(query)
-    logs = result.scalars().all()
+    logs, next_cursor = split_page(result.scalars().all(), limit)
 
     # Convert to response format
     log_list = []
@@ -151,8 +154,9 @@ async def get_logs(
 
     return LogListResponse(
         logs=log_list,
-        total=total,
-        offset=offset,
+        next_cursor=next_cursor,
+        total=count,
+        total_is_estimate=is_estimate,
         limit=limit,
     )
 
@@ -212,7 +216,7 @@ async def get_log(
 )
 async def get_session_summary(
     session_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_reporting_db),
 ) -> SessionSummary:
     """
     Get summary statistics for a session.
@@ -235,15 +239,19 @@ async def get_session_summary(
             detail=f"Session {session_id} not found",
         )
 
-    # Get all logs for this session
-    logs_result = await db.execute(
-        select(ExecutionLogModel)
-        .where(ExecutionLogModel.session_id == session_id)
-        .order_by(ExecutionLogModel.created_at.asc())
-    )
-    logs = logs_result.scalars().all()
-
-    if not logs:
+    # Aggregate in SQL rather than loading the session's history
+    totals = (await db.execute(
+        select(
+            func.count(ExecutionLogModel.id),
+            func.count(ExecutionLogModel.id).filter(ExecutionLogModel.status == "completed"),
+            func.count(ExecutionLogModel.id).filter(ExecutionLogModel.status == "failed"),
+            func.coalesce(func.sum(ExecutionLogModel.total_cost), 0.0),
+            func.coalesce(func.sum(ExecutionLogModel.duration_ms), 0),
+        ).where(ExecutionLogModel.session_id == session_id)
+    )).one()
+    total_commands, successful_commands, failed_commands, total_cost_usd, total_duration_ms = totals
+
+    if not total_commands:
         # Return empty summary for session with no logs
         return SessionSummary(
             session_id=session_id,
@@ -258,31 +266,19 @@ async def get_session_summary(
             last_activity=session.last_active.isoformat(),
         )
 
-    # Calculate statistics
-    total_commands = len(logs)
-    successful_commands = sum(1 for log in logs if log.status == "completed")
-    failed_commands = sum(1 for log in logs if log.status == "failed")
-    total_cost_usd = sum(float(log.total_cost or 0) for log in logs)
-    total_duration_ms = sum(log.duration_ms or 0 for log in logs)
-    success_rate = successful_commands / total_commands if total_commands > 0 else 0.0
-
-    # Find most used tools
-    tool_usage = {}
-    for log in logs:
-        if log.tool_calls:
-            for tool_call in log.tool_calls:
-                tool_name = tool_call.get("tool_name", "unknown")
-                tool_usage[tool_name] = tool_usage.get(tool_name, 0) + 1
+    success_rate = successful_commands / total_commands
 
-    most_used_tools = sorted(tool_usage.keys(), key=lambda x: tool_usage[x], reverse=True)[:5]
+    # Find most used tools from the per-session counters
+    tool_usage = await get_session_tool_usage(db, session_id)
+    most_used_tools = [usage["tool_name"] for usage in tool_usage[:5]]
 
     return SessionSummary(
         session_id=session_id,
         total_commands=total_commands,
         successful_commands=successful_commands,
         failed_commands=failed_commands,
-        total_cost_usd=total_cost_usd,
-        total_duration_ms=total_duration_ms,
+        total_cost_usd=float(total_cost_usd),
+        total_duration_ms=int(total_duration_ms),
         success_rate=success_rate,
         most_used_tools=most_used_tools,
         created_at=session.created_at.isoformat(),
@@ -5,13 +5,33 @@ This module provides a Prometheus-compatible metrics endpoint
 for monitoring and observability.
 """
 
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter, Response
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from src.services.metrics_service import metrics_collector
 
 router = APIRouter()
 
+# Rendered chunks are coalesced into writes of roughly this size
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+async def _stream_metrics() -> AsyncIterator[str]:
+    """Stream rendered metrics in bounded chunks on the event loop."""
+    buffer: list[str] = []
+    size = 0
+    for chunk in metrics_collector.iter_prometheus_metrics():
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= STREAM_CHUNK_BYTES:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
 
 @router.get(
     "/metrics",
@@ -35,6 +55,12 @@ async def get_metrics() -> Response:
     - WebSocket connection metrics
     - Session metrics
     - Cache performance metrics
+    - Per-route request latency histograms and status counters
+    - Per-intent agent and per-tool call histograms
+
+    The body is streamed as it is rendered rather than built up front.
     """
-    metrics_text = metrics_collector.get_prometheus_metrics()
-    return PlainTextResponse(metrics_text)
+    return StreamingResponse(
+        _stream_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -10,11 +10,13 @@ from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
-from src.core.database import get_db
+from src.core.database import background_session, get_db, get_reporting_db
+from src.core.pagination import InvalidCursorError
 from src.services.payment_service import PaymentService
 from src.services.service_registry import ServiceRegistryService
 from src.services.subscription_service import SubscriptionService
@@ -60,8 +62,9 @@ class PaymentListResponse(BaseModel):
     """Response for listing payments."""
 
     payments: list[PaymentInfo]
-    total: int
-    offset: int
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page")
+    total: int | None = None
+    total_is_estimate: bool = False
     limit: int
 
 
@@ -114,30 +117,37 @@ class ExecuteX402Response(BaseModel):
     description="Get payment history with optional filtering.",
 )
 async def get_payment_history(
-    status: str | None = Query(
-        default=None, description="Filter by status (pending, confirmed, failed)"
+    status_filter: str | None = Query(
+        default=None, alias="status", description="Filter by status (pending, confirmed, failed)"
     ),
     start_date: datetime | None = Query(default=None, description="Start date filter"),
     end_date: datetime | None = Query(default=None, description="End date filter"),
-    offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
     limit: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    total: str = Query(default="none", pattern="^(none|estimate|exact)$", description="Include a total count"),
+    db: AsyncSession = Depends(get_reporting_db),
 ) -> PaymentListResponse:
     """
-    Get payment history with filtering options.
+    Get payment history with filtering options, newest first.
 
     Supports filtering by:
     - status: Payment status
     - start_date/end_date: Date range
+
+    Pages are fetched with ``cursor``; the total count is only computed on request.
     """
     payment_service = PaymentService(db)
-    result = await payment_service.get_payment_history(
-        status=status,
-        start_date=start_date,
-        end_date=end_date,
-        offset=offset,
-        limit=limit,
-    )
+    try:
+        result = await payment_service.get_payment_history(
+            status=status_filter,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+            limit=limit,
+            total=total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     if not result["success"]:
         raise HTTPException(
@@ -152,8 +162,9 @@ async def get_payment_history(
 
     return PaymentListResponse(
         payments=payments,
+        next_cursor=result["next_cursor"],
         total=result["total"],
-        offset=result["offset"],
+        total_is_estimate=result["total_is_estimate"],
         limit=result["limit"],
     )
 
@@ -165,7 +176,7 @@ async def get_payment_history(
     description="Get aggregate statistics about payments.",
 )
 async def get_payment_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_reporting_db),
 ) -> PaymentStats:
     """Get aggregate payment statistics."""
     payment_service = PaymentService(db)
@@ -252,6 +263,8 @@ async def execute_x402_payment(
             payment_status = result.get("status", "confirmed")
             tx_hash = result.get("tx_hash")
         else:
+            # A settled payment whose proof was rejected keeps its tx_hash for reconciliation
+            tx_hash = result.get("tx_hash")
             error_message = result.get("message", "x402 payment execution failed")
     except Exception as e:
         error_message = str(e)
@@ -304,6 +317,136 @@ async def execute_x402_payment(
         )
 
 
+class ExecuteX402BatchRequest(BaseModel):
+    """Request body for executing many x402 payments concurrently."""
+
+    payments: list[ExecuteX402Request] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.x402_batch_max_payments,
+        description="Payments to execute",
+    )
+    max_concurrency: int | None = Field(
+        default=None, ge=1, le=settings.x402_batch_max_concurrency,
+        description="Maximum service requests in flight",
+    )
+    max_per_host: int | None = Field(
+        default=None, ge=1, le=settings.x402_batch_max_concurrency,
+        description="Maximum service requests in flight per host",
+    )
+
+
+class ExecuteX402BatchResult(BaseModel):
+    """One settled payment of an x402 batch, streamed as an NDJSON line."""
+
+    index: int = Field(..., description="Position of the payment in the request")
+    service_url: str
+    success: bool
+    payment_id: UUID | None = None
+    tx_hash: str | None = None
+    status: str
+    error: str | None = None
+    message: str | None = None
+
+
+@router.post(
+    "/x402/batch",
+    status_code=status.HTTP_200_OK,
+    summary="Execute x402 payments in batch",
+    description=(
+        "Execute many x402 payment flows concurrently. Results stream back as "
+        "newline-delimited JSON, one ExecuteX402BatchResult per payment, in "
+        "the order payments settle."
+    ),
+    response_class=StreamingResponse,
+)
+async def execute_x402_payment_batch(
+    request: ExecuteX402BatchRequest,
+) -> StreamingResponse:
+    """
+    Execute many x402 payment flows concurrently.
+
+    Payments that reach EIP-712 signing or facilitator submission together
+    are signed in one pass and submitted in one facilitator request. A
+    payment record is created for every payment as it settles, including
+    payments already submitted when the client disconnects, and successful
+    payments update their service's reputation.
+    """
+    x402_service = X402PaymentService()
+    payments = [
+        {
+            "service_url": payment.service_url,
+            "amount": payment.amount,
+            "token": payment.token,
+        }
+        for payment in request.payments
+    ]
+
+    async def record_payment(
+        db: AsyncSession, index: int, result: dict
+    ) -> tuple[str, UUID | None]:
+        payment = request.payments[index]
+        payment_status = result.get("status", "confirmed") if result["success"] else "failed"
+        try:
+            record = await PaymentService(db).create_payment(
+                agent_wallet=settings.default_wallet_address,
+                recipient=payment.service_url,
+                amount=payment.amount,
+                token=payment.token,
+                service_id=payment.service_id,
+                tx_hash=result.get("tx_hash"),
+                status=payment_status,
+            )
+        except Exception as e:
+            logger.error(f"Failed to create payment record for batch item {index}: {e}")
+            return payment_status, None
+
+        if result["success"] and payment.service_id:
+            try:
+                # Same default rating as single x402 payments
+                await ServiceRegistryService(db).update_service_reputation(
+                    str(payment.service_id), 4.5
+                )
+            except Exception as e:
+                logger.warning(f"Failed to update service reputation: {e}")
+        return payment_status, record.id
+
+    async def record_abandoned(index: int, result: dict) -> None:
+        # The client went away after this payment was submitted
+        async with background_session() as background_db:
+            await record_payment(background_db, index, result)
+
+    async def result_stream():
+        # The request session is closed once the response starts streaming
+        async with background_session() as db:
+            async for index, result in x402_service.execute_payments_batch(
+                payments,
+                max_concurrency=request.max_concurrency,
+                max_per_host=request.max_per_host,
+                on_abandoned=record_abandoned,
+            ):
+                payment = request.payments[index]
+                payment_status, payment_id = await record_payment(db, index, result)
+
+                line = ExecuteX402BatchResult(
+                    index=index,
+                    service_url=payment.service_url,
+                    success=result["success"],
+                    payment_id=payment_id,
+                    tx_hash=result.get("tx_hash"),
+                    status=payment_status,
+                    error=None if result["success"] else str(result.get("error")),
+                    message=result.get("message"),
+                )
+                yield line.model_dump_json() + "\n"
+
+    return StreamingResponse(
+        result_stream(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 class ExecuteApprovedPaymentRequest(BaseModel):
     """Request to execute a payment that has been approved."""
 
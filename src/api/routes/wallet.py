@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
 from src.core.database import get_db
+from src.core.pagination import InvalidCursorError
 from src.models.payments import Payment
 from src.services.wallet_service import WalletService
 
@@ -92,8 +93,9 @@ class TransactionListResponse(BaseModel):
     """Response for listing transactions."""
 
     transactions: list[TransactionInfo]
-    total: int
-    offset: int
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page")
+    total: int | None = None
+    total_is_estimate: bool = False
     limit: int
 
 
@@ -284,16 +286,21 @@ async def transfer_tokens(
     description="Get wallet transaction history.",
 )
 async def get_transaction_history(
-    offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="next_cursor from the previous page"),
     limit: int = Query(default=20, ge=1, le=100),
+    total: str = Query(default="none", pattern="^(none|estimate|exact)$", description="Include a total count"),
     db: AsyncSession = Depends(get_db),
 ) -> TransactionListResponse:
-    """Get wallet transaction history with pagination."""
+    """Get wallet transaction history, newest first, with cursor pagination."""
     wallet_service = WalletService(db)
-    result = await wallet_service.get_transaction_history(
-        offset=offset,
-        limit=limit,
-    )
+    try:
+        result = await wallet_service.get_transaction_history(
+            cursor=cursor,
+            limit=limit,
+            total=total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     if not result["success"]:
         raise HTTPException(
@@ -307,8 +314,9 @@ async def get_transaction_history(
 
     return TransactionListResponse(
         transactions=transactions,
+        next_cursor=result["next_cursor"],
         total=result["total"],
-        offset=result["offset"],
+        total_is_estimate=result["total_is_estimate"],
         limit=result["limit"],
     )
 
@@ -55,7 +55,10 @@ class ConnectionManager:
     def __init__(self):
         self.active_connections: dict[str, WebSocket] = {}
         self.user_sessions: dict[str, str] = {}  # user_id -> session_id
-        self.execution_tasks: dict[str, asyncio.Task] = {}  # session_id -> task
+        # session_id -> running task, then queued ones
+        self.execution_tasks: dict[str, list[asyncio.Task]] = {}
+        self.executions: dict[str, asyncio.Task] = {}  # execution_id -> task
+        self.execution_ids: dict[asyncio.Task, str] = {}  # task -> execution_id
 
     async def connect(self, websocket: WebSocket, session_id: str, user_id: str) -> None:
         """Connect a new WebSocket client.
@@ -83,12 +86,9 @@ class ConnectionManager:
             del self.active_connections[session_id]
         if user_id in self.user_sessions:
             del self.user_sessions[user_id]
-        # Cancel any active execution task
-        if session_id in self.execution_tasks:
-            task = self.execution_tasks[session_id]
-            if not task.done():
-                task.cancel()
-            del self.execution_tasks[session_id]
+        # Cancel the running execution and any queued behind it
+        for task in self.execution_tasks.pop(session_id, []):
+            task.cancel()
         logger.info(f"WebSocket disconnected for session {session_id}, user {user_id}")
 
     async def send_personal_message(self, message: dict[str, Any] | BaseModel, session_id: str) -> None:
@@ -149,17 +149,71 @@ class ConnectionManager:
         return None
 
     def register_execution_task(self, session_id: str, task: asyncio.Task) -> None:
-        """Register an active execution task for a session.
+        """Register an execution task for a session.
+
+        A session's executions run one after another, so its tasks are kept
+        in order: the running one first, then queued ones. Finished tasks
+        are removed.
 
         Args:
             session_id: Session identifier
             task: Asyncio task to register
         """
-        self.execution_tasks[session_id] = task
+        self.execution_tasks.setdefault(session_id, []).append(task)
+        task.add_done_callback(lambda done: self._forget_execution_task(session_id, done))
+
+    def bind_execution(self, execution_id: str, task: asyncio.Task) -> None:
+        """Associate an execution ID with the task running it.
+
+        Args:
+            execution_id: Execution identifier sent to the client
+            task: Registered execution task
+        """
+        self.executions[execution_id] = task
+        self.execution_ids[task] = execution_id
+
+    def _forget_execution_task(self, session_id: str, task: asyncio.Task) -> None:
+        tasks = self.execution_tasks.get(session_id)
+        if tasks and task in tasks:
+            tasks.remove(task)
+            if not tasks:
+                del self.execution_tasks[session_id]
+        execution_id = self.execution_ids.pop(task, None)
+        if execution_id is not None:
+            self.executions.pop(execution_id, None)
 
     def get_execution_task(self, session_id: str) -> asyncio.Task | None:
-        """Get the active execution task for a session."""
-        return self.execution_tasks.get(session_id)
+        """Get the running execution task for a session."""
+        tasks = self.execution_tasks.get(session_id)
+        return tasks[0] if tasks else None
+
+    def get_execution_tasks(self, session_id: str) -> list[asyncio.Task]:
+        """Get the running and queued execution tasks for a session."""
+        return list(self.execution_tasks.get(session_id, []))
+
+    def cancel_execution(self, session_id: str, execution_id: str) -> bool:
+        """Cancel the execution a cancel message names.
+
+        An execution ID is assigned when the execution starts. An unknown ID
+        therefore cancels the running execution only while it has not yet
+        announced its ID; queued executions are never cancelled by it.
+
+        Args:
+            session_id: Session identifier
+            execution_id: Execution identifier from the cancel message
+
+        Returns:
+            True if a task was cancelled
+        """
+        tasks = self.execution_tasks.get(session_id, [])
+        task = self.executions.get(execution_id)
+        if task not in tasks:
+            running = tasks[0] if tasks else None
+            task = running if running is not None and running not in self.execution_ids else None
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
 
 
 manager = ConnectionManager()
@@ -304,7 +358,8 @@ async def handle_websocket_message(
     message_type = message.type
 
     if message_type == "execute":
-        await handle_execute_message(message, session_id, user_id, db)
+        # Runs in the background so the receive loop can take a cancel message
+        start_execution_task(message, session_id, user_id)
     elif message_type == "approve":
         await handle_approve_message(message, session_id, user_id, db)
     elif message_type == "reject":
@@ -324,6 +379,41 @@ async def handle_websocket_message(
         )
 
 
+def start_execution_task(message: WebSocketMessage, session_id: str, user_id: str) -> asyncio.Task:
+    """Run an execute message as the session's cancellable execution task.
+
+    Executions of a session still run one after another.
+
+    Args:
+        message: WebSocket message containing execute command
+        session_id: Session identifier
+        user_id: User identifier
+
+    Returns:
+        The registered execution task
+    """
+    queued = manager.get_execution_tasks(session_id)
+    previous = queued[-1] if queued else None
+
+    async def run() -> None:
+        if previous is not None and not previous.done():
+            await asyncio.wait([previous])
+        # The receive loop's session ends with the message; use one for the whole execution
+        db_sessions = get_db()
+        db = await anext(db_sessions)
+        try:
+            await handle_execute_message(message, session_id, user_id, db)
+        except asyncio.CancelledError:
+            logger.info(f"Execution cancelled for session {session_id}")
+            raise
+        finally:
+            await db_sessions.aclose()
+
+    task = asyncio.create_task(run())
+    manager.register_execution_task(session_id, task)
+    return task
+
+
 async def handle_execute_message(
     message: WebSocketMessage,
     session_id: str,
@@ -348,6 +438,10 @@ async def handle_execute_message(
         plan=execute_msg.plan
     )
     execution_id = execution_log.id if execution_log else uuid4()
+    task = asyncio.current_task()
+    if task is not None:
+        # Lets a cancel message for this execution_id reach this task
+        manager.bind_execution(str(execution_id), task)
 
     # Send thinking event
     await manager.send_personal_message(
@@ -355,6 +449,7 @@ async def handle_execute_message(
             type="thinking",
             data={
                 "session_id": session_id,
+                "execution_id": str(execution_id),
                 "command": execute_msg.command,
                 "timestamp": execution_log.created_at.isoformat() if execution_log else None
             }
@@ -641,15 +736,12 @@ async def handle_cancel_message(
     cancel_msg = CancelMessage.parse_obj(message.data)
 
     try:
-        # Get the active execution task
-        task = manager.get_execution_task(session_id)
-
-        if task and not task.done():
-            # Cancel the task
-            task.cancel()
+        if manager.cancel_execution(session_id, str(cancel_msg.execution_id)):
             logger.info(f"Cancelled execution {cancel_msg.execution_id} for session {session_id}")
         else:
-            logger.info(f"No active execution to cancel for session {session_id}")
+            logger.info(
+                f"No active execution {cancel_msg.execution_id} to cancel for session {session_id}"
+            )
 
         # Send cancellation event
         await manager.send_personal_message(
@@ -11,6 +11,7 @@ The connector supports both mock mode for development/testing and testnet mode
 for real on-chain interactions with the DelphiAdapter contract.
 """
 
+import asyncio
 import json
 import logging
 import random
@@ -18,6 +19,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from src.connectors.rpc import get_rpc_client
+
 logger = logging.getLogger(__name__)
 
 # Testnet deployment configuration
@@ -88,6 +91,21 @@ class DelphiConnector:
         },
     ]
 
+    # ABI for MockDelphi adapter contract (view and write functions used here)
+    ADAPTER_ABI = [
+        {"inputs": [], "name": "owner", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [], "name": "defaultFee", "outputs": [{"type": "uint256"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [], "name": "bettingToken", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [], "name": "feeCollector", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [], "name": "getAllMarkets", "outputs": [{"type": "bytes32[]"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [{"name": "bettor", "type": "address"}], "name": "getBettorBets", "outputs": [{"type": "bytes32[]"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [{"name": "marketId", "type": "bytes32"}], "name": "getMarket", "outputs": [{"name": "question", "type": "string"}, {"name": "category", "type": "string"}, {"name": "outcomes", "type": "string[]"}, {"name": "endTime", "type": "uint256"}, {"name": "totalVolume", "type": "uint256"}, {"name": "minBet", "type": "uint256"}, {"name": "maxBet", "type": "uint256"}, {"name": "isActive", "type": "bool"}, {"name": "isResolved", "type": "bool"}, {"name": "winningOutcome", "type": "uint256"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [{"name": "marketId", "type": "bytes32"}], "name": "getOdds", "outputs": [{"type": "uint256[]"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [{"name": "marketId", "type": "bytes32"}, {"name": "outcomeIndex", "type": "uint256"}, {"name": "amount", "type": "uint256"}], "name": "placeBet", "outputs": [{"name": "betId", "type": "bytes32"}], "stateMutability": "nonpayable", "type": "function"},
+        {"inputs": [{"name": "betId", "type": "bytes32"}], "name": "claimWinnings", "outputs": [{"name": "payout", "type": "uint256"}], "stateMutability": "nonpayable", "type": "function"},
+        {"inputs": [{"name": "betId", "type": "bytes32"}], "name": "getBet", "outputs": [{"name": "marketId", "type": "bytes32"}, {"name": "bettor", "type": "address"}, {"name": "outcomeIndex", "type": "uint256"}, {"name": "amount", "type": "uint256"}, {"name": "timestamp", "type": "uint256"}, {"name": "claimed", "type": "bool"}], "stateMutability": "view", "type": "function"},
+    ]
+
     def __init__(self, use_mock: bool = True, use_testnet: bool = False) -> None:
         """
         Initialize the Delphi connector.
@@ -133,23 +151,9 @@ class DelphiConnector:
         """Get contract instance for testnet interactions."""
         if self._contract is None and self._adapter_address and self._get_web3():
             from web3 import Web3
-            # ABI for MockDelphi contract
-            abi = [
-                {"inputs": [], "name": "owner", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [], "name": "defaultFee", "outputs": [{"type": "uint256"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [], "name": "bettingToken", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [], "name": "feeCollector", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [], "name": "getAllMarkets", "outputs": [{"type": "bytes32[]"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [{"name": "bettor", "type": "address"}], "name": "getBettorBets", "outputs": [{"type": "bytes32[]"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [{"name": "marketId", "type": "bytes32"}], "name": "getMarket", "outputs": [{"name": "question", "type": "string"}, {"name": "category", "type": "string"}, {"name": "outcomes", "type": "string[]"}, {"name": "endTime", "type": "uint256"}, {"name": "totalVolume", "type": "uint256"}, {"name": "minBet", "type": "uint256"}, {"name": "maxBet", "type": "uint256"}, {"name": "isActive", "type": "bool"}, {"name": "isResolved", "type": "bool"}, {"name": "winningOutcome", "type": "uint256"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [{"name": "marketId", "type": "bytes32"}], "name": "getOdds", "outputs": [{"type": "uint256[]"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [{"name": "marketId", "type": "bytes32"}, {"name": "outcomeIndex", "type": "uint256"}, {"name": "amount", "type": "uint256"}], "name": "placeBet", "outputs": [{"name": "betId", "type": "bytes32"}], "stateMutability": "nonpayable", "type": "function"},
-                {"inputs": [{"name": "betId", "type": "bytes32"}], "name": "claimWinnings", "outputs": [{"name": "payout", "type": "uint256"}], "stateMutability": "nonpayable", "type": "function"},
-                {"inputs": [{"name": "betId", "type": "bytes32"}], "name": "getBet", "outputs": [{"name": "marketId", "type": "bytes32"}, {"name": "bettor", "type": "address"}, {"name": "outcomeIndex", "type": "uint256"}, {"name": "amount", "type": "uint256"}, {"name": "timestamp", "type": "uint256"}, {"name": "claimed", "type": "bool"}], "stateMutability": "view", "type": "function"},
-            ]
             self._contract = self._web3.eth.contract(
                 address=Web3.to_checksum_address(self._adapter_address),
-                abi=abi
+                abi=self.ADAPTER_ABI
             )
         return self._contract
 
@@ -177,6 +181,40 @@ class DelphiConnector:
             logger.warning(f"Failed to get contract info: {e}")
             return {"source": "mock", "error": str(e)}
 
+    async def get_contract_info_async(self) -> dict[str, Any]:
+        """
+        Get on-chain contract information without blocking the event loop.
+
+        Reads go through the shared async RPC client and are issued concurrently.
+        """
+        if self.use_mock or not self.use_testnet or not self._adapter_address:
+            return {"source": "mock", "message": "Using mock data"}
+
+        try:
+            contract = await get_rpc_client(CRONOS_TESTNET_RPC).contract(
+                self._adapter_address, self.ADAPTER_ABI
+            )
+            fns = contract.functions
+            all_markets, owner, default_fee, betting_token, fee_collector = await asyncio.gather(
+                fns.getAllMarkets().call(),
+                fns.owner().call(),
+                fns.defaultFee().call(),
+                fns.bettingToken().call(),
+                fns.feeCollector().call(),
+            )
+            return {
+                "source": "on-chain",
+                "adapter_address": self._adapter_address,
+                "owner": owner,
+                "default_fee": default_fee,
+                "betting_token": betting_token,
+                "fee_collector": fee_collector,
+                "total_markets": len(all_markets),
+            }
+        except Exception as e:
+            logger.warning(f"Failed to get contract info: {e}")
+            return {"source": "mock", "error": str(e)}
+
     def get_markets(
         self,
         category: str | None = None,
@@ -12,6 +12,7 @@ The connector supports both mock mode for development/testing and testnet mode
 for real on-chain interactions with the MoonlanderAdapter contract.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -21,6 +22,8 @@ from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+from src.connectors.rpc import get_rpc_client
+
 logger = logging.getLogger(__name__)
 
 # Testnet deployment configuration
@@ -60,6 +63,21 @@ class MoonlanderConnector:
         "CRO": 0.075,
     }
 
+    # ABI for MockMoonlander adapter contract (view and write functions used here)
+    ADAPTER_ABI = [
+        {"inputs": [], "name": "owner", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [], "name": "collateralToken", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [], "name": "positionCounter", "outputs": [{"type": "uint256"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [{"name": "market", "type": "string"}], "name": "getPrice", "outputs": [{"type": "uint256"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [{"name": "market", "type": "string"}], "name": "getFundingRate", "outputs": [{"name": "rate", "type": "uint256"}, {"name": "nextFundingTime", "type": "uint256"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [{"name": "trader", "type": "address"}], "name": "getTraderPositions", "outputs": [{"type": "uint256[]"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [{"name": "positionId", "type": "uint256"}], "name": "getPosition", "outputs": [{"name": "trader", "type": "address"}, {"name": "market", "type": "string"}, {"name": "isLong", "type": "bool"}, {"name": "size", "type": "uint256"}, {"name": "collateral", "type": "uint256"}, {"name": "entryPrice", "type": "uint256"}, {"name": "leverage", "type": "uint256"}, {"name": "stopLoss", "type": "uint256"}, {"name": "takeProfit", "type": "uint256"}, {"name": "isOpen", "type": "bool"}, {"name": "unrealizedPnl", "type": "int256"}], "stateMutability": "view", "type": "function"},
+        {"inputs": [{"name": "market", "type": "string"}, {"name": "isLong", "type": "bool"}, {"name": "collateral", "type": "uint256"}, {"name": "leverage", "type": "uint256"}], "name": "openPosition", "outputs": [{"name": "positionId", "type": "uint256"}], "stateMutability": "nonpayable", "type": "function"},
+        {"inputs": [{"name": "positionId", "type": "uint256"}], "name": "closePosition", "outputs": [{"name": "pnl", "type": "int256"}], "stateMutability": "nonpayable", "type": "function"},
+        {"inputs": [{"name": "positionId", "type": "uint256"}, {"name": "stopLoss", "type": "uint256"}], "name": "setStopLoss", "outputs": [], "stateMutability": "nonpayable", "type": "function"},
+        {"inputs": [{"name": "positionId", "type": "uint256"}, {"name": "takeProfit", "type": "uint256"}], "name": "setTakeProfit", "outputs": [], "stateMutability": "nonpayable", "type": "function"},
+    ]
+
     def __init__(self, use_mock: bool = True, use_testnet: bool = False) -> None:
         """
         Initialize the Moonlander connector.
@@ -105,23 +123,9 @@ class MoonlanderConnector:
         """Get contract instance for testnet interactions."""
         if self._contract is None and self._adapter_address and self._get_web3():
             from web3 import Web3
-            # ABI for MockMoonlander contract
-            abi = [
-                {"inputs": [], "name": "owner", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [], "name": "collateralToken", "outputs": [{"type": "address"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [], "name": "positionCounter", "outputs": [{"type": "uint256"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [{"name": "market", "type": "string"}], "name": "getPrice", "outputs": [{"type": "uint256"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [{"name": "market", "type": "string"}], "name": "getFundingRate", "outputs": [{"name": "rate", "type": "uint256"}, {"name": "nextFundingTime", "type": "uint256"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [{"name": "trader", "type": "address"}], "name": "getTraderPositions", "outputs": [{"type": "uint256[]"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [{"name": "positionId", "type": "uint256"}], "name": "getPosition", "outputs": [{"name": "trader", "type": "address"}, {"name": "market", "type": "string"}, {"name": "isLong", "type": "bool"}, {"name": "size", "type": "uint256"}, {"name": "collateral", "type": "uint256"}, {"name": "entryPrice", "type": "uint256"}, {"name": "leverage", "type": "uint256"}, {"name": "stopLoss", "type": "uint256"}, {"name": "takeProfit", "type": "uint256"}, {"name": "isOpen", "type": "bool"}, {"name": "unrealizedPnl", "type": "int256"}], "stateMutability": "view", "type": "function"},
-                {"inputs": [{"name": "market", "type": "string"}, {"name": "isLong", "type": "bool"}, {"name": "collateral", "type": "uint256"}, {"name": "leverage", "type": "uint256"}], "name": "openPosition", "outputs": [{"name": "positionId", "type": "uint256"}], "stateMutability": "nonpayable", "type": "function"},
-                {"inputs": [{"name": "positionId", "type": "uint256"}], "name": "closePosition", "outputs": [{"name": "pnl", "type": "int256"}], "stateMutability": "nonpayable", "type": "function"},
-                {"inputs": [{"name": "positionId", "type": "uint256"}, {"name": "stopLoss", "type": "uint256"}], "name": "setStopLoss", "outputs": [], "stateMutability": "nonpayable", "type": "function"},
-                {"inputs": [{"name": "positionId", "type": "uint256"}, {"name": "takeProfit", "type": "uint256"}], "name": "setTakeProfit", "outputs": [], "stateMutability": "nonpayable", "type": "function"},
-            ]
             self._contract = self._web3.eth.contract(
                 address=Web3.to_checksum_address(self._adapter_address),
-                abi=abi
+                abi=self.ADAPTER_ABI
             )
         return self._contract
 
@@ -148,6 +152,40 @@ class MoonlanderConnector:
             logger.warning(f"Failed to get contract info: {e}")
             return {"source": "mock", "error": str(e)}
 
+    async def get_contract_info_async(self) -> dict[str, Any]:
+        """
+        Get on-chain contract information without blocking the event loop.
+
+        Reads go through the shared async RPC client and are issued concurrently.
+        """
+        if self.use_mock or not self.use_testnet or not self._adapter_address:
+            return {"source": "mock", "message": "Using mock data"}
+
+        try:
+            contract = await get_rpc_client(CRONOS_TESTNET_RPC).contract(
+                self._adapter_address, self.ADAPTER_ABI
+            )
+            fns = contract.functions
+            owner, collateral_token, position_counter, btc_price, eth_price = await asyncio.gather(
+                fns.owner().call(),
+                fns.collateralToken().call(),
+                fns.positionCounter().call(),
+                fns.getPrice("BTC-USDC").call(),
+                fns.getPrice("ETH-USDC").call(),
+            )
+            return {
+                "source": "on-chain",
+                "adapter_address": self._adapter_address,
+                "owner": owner,
+                "collateral_token": collateral_token,
+                "position_counter": position_counter,
+                "btc_price": btc_price,
+                "eth_price": eth_price,
+            }
+        except Exception as e:
+            logger.warning(f"Failed to get contract info: {e}")
+            return {"source": "mock", "error": str(e)}
+
     def get_markets(self) -> list[dict[str, Any]]:
         """
         Get list of available perpetual markets.
@@ -0,0 +1,316 @@
+"""
+Batched on-chain reads and token metadata caching.
+
+This module aggregates many ``eth_call`` reads into a single round trip,
+either through a Multicall3 ``aggregate3`` call (when a Multicall3 address
+is configured) or as one JSON-RPC batch request. Token decimals and symbols
+never change for a deployed contract, so they are cached permanently per
+chain and only fetched the first time a token is seen:
+
+    reader = BatchReader(get_rpc_client())
+    result = await reader.get_balances(wallet_address, [usdc, usdt])
+    usdc_balance = result.tokens[usdc]  # TokenBalance(balance_wei, metadata)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+
+from src.connectors.rpc import AsyncRPCClient, RPCError
+from src.core.constants import RPC_BATCH_MAX_CALLS
+
+logger = logging.getLogger(__name__)
+
+# Canonical Multicall3 deployment (same address on Cronos mainnet and testnet)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector("balanceOf(address)")
+DECIMALS_SELECTOR = function_signature_to_4byte_selector("decimals()")
+SYMBOL_SELECTOR = function_signature_to_4byte_selector("symbol()")
+AGGREGATE3_SELECTOR = function_signature_to_4byte_selector(
+    "aggregate3((address,bool,bytes)[])"
+)
+GET_ETH_BALANCE_SELECTOR = function_signature_to_4byte_selector("getEthBalance(address)")
+
+
+@dataclass(frozen=True)
+class Call:
+    """A single read-only contract call."""
+
+    target: str
+    data: bytes
+
+
+@dataclass(frozen=True)
+class TokenMetadata:
+    """Immutable ERC20 token metadata."""
+
+    address: str
+    decimals: int
+    symbol: str | None
+
+
+@dataclass(frozen=True)
+class TokenBalance:
+    """ERC20 balance together with its token metadata."""
+
+    balance_wei: int
+    metadata: TokenMetadata
+
+    @property
+    def balance(self) -> float:
+        """Balance in whole token units."""
+        return self.balance_wei / (10 ** self.metadata.decimals)
+
+
+@dataclass
+class BalanceSnapshot:
+    """Native and ERC20 balances of one wallet, read in a single batch."""
+
+    native_wei: int | None = None
+    tokens: dict[str, TokenBalance] = field(default_factory=dict)
+
+
+def balance_of_call(token: str, owner: str) -> Call:
+    """Build an ERC20 ``balanceOf(owner)`` call."""
+    return Call(token, BALANCE_OF_SELECTOR + encode(["address"], [owner]))
+
+
+def decimals_call(token: str) -> Call:
+    """Build an ERC20 ``decimals()`` call."""
+    return Call(token, DECIMALS_SELECTOR)
+
+
+def symbol_call(token: str) -> Call:
+    """Build an ERC20 ``symbol()`` call."""
+    return Call(token, SYMBOL_SELECTOR)
+
+
+def decode_uint(data: bytes) -> int:
+    """Decode a single uint return value."""
+    return decode(["uint256"], data)[0]
+
+
+def decode_symbol(data: bytes) -> str | None:
+    """
+    Decode an ERC20 symbol.
+
+    Handles both the standard ``string`` return type and the legacy
+    ``bytes32`` variant used by some older tokens.
+    """
+    try:
+        return decode(["string"], data)[0]
+    except Exception:
+        pass
+    if len(data) == 32:
+        return data.rstrip(b"\x00").decode("utf-8", errors="ignore") or None
+    return None
+
+
+class TokenMetadataCache:
+    """Process-wide cache of token metadata keyed by (chain_id, address)."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[int, str], TokenMetadata] = {}
+
+    def get(self, chain_id: int, address: str) -> TokenMetadata | None:
+        """Get cached metadata for a token, if known."""
+        return self._entries.get((chain_id, address.lower()))
+
+    def put(self, chain_id: int, metadata: TokenMetadata) -> None:
+        """Store metadata for a token."""
+        self._entries[(chain_id, metadata.address.lower())] = metadata
+
+    def clear(self) -> None:
+        """Drop all cached metadata."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global token metadata cache
+token_metadata_cache = TokenMetadataCache()
+
+
+class BatchReader:
+    """Aggregates contract reads into as few RPC round trips as possible."""
+
+    def __init__(
+        self,
+        rpc: AsyncRPCClient,
+        multicall_address: str | None = None,
+        max_calls_per_batch: int = RPC_BATCH_MAX_CALLS,
+        metadata_cache: TokenMetadataCache | None = None,
+    ):
+        """
+        Initialize the batch reader.
+
+        Args:
+            rpc: RPC client for the target chain
+            multicall_address: Multicall3 contract address; when unset, reads
+                are sent as JSON-RPC batch requests instead
+            max_calls_per_batch: Maximum calls per round trip; larger sets are
+                split into chunks that are sent concurrently
+            metadata_cache: Token metadata cache (defaults to the global one)
+        """
+        self.rpc = rpc
+        self.multicall_address = (
+            to_checksum_address(multicall_address) if multicall_address else None
+        )
+        self.max_calls_per_batch = max(1, max_calls_per_batch)
+        self.metadata_cache = metadata_cache if metadata_cache is not None else token_metadata_cache
+
+    async def call_many(
+        self,
+        calls: list[Call],
+        native_balance_of: str | None = None,
+    ) -> tuple[int | None, list[bytes | None]]:
+        """
+        Execute many read-only calls, optionally with a native balance read.
+
+        Args:
+            calls: Contract calls to execute
+            native_balance_of: Address whose native balance is read in the
+                same round trip
+
+        Returns:
+            tuple: (native balance in wei or None, return data per call with
+                None for calls that reverted)
+        """
+        requests: list[Call | str] = list(calls)
+        if native_balance_of:
+            requests.insert(0, to_checksum_address(native_balance_of))
+
+        chunks = [
+            requests[start:start + self.max_calls_per_batch]
+            for start in range(0, len(requests), self.max_calls_per_batch)
+        ]
+        execute = self._execute_multicall if self.multicall_address else self._execute_batch
+        chunk_results = await asyncio.gather(*(execute(chunk) for chunk in chunks))
+        results = [result for chunk in chunk_results for result in chunk]
+
+        native_wei = None
+        if native_balance_of:
+            native_wei = results.pop(0)
+            if native_wei is None:
+                raise RPCError(-32603, f"Native balance read failed for {native_balance_of}")
+        return native_wei, results
+
+    async def _execute_batch(self, requests: list[Call | str]) -> list[int | bytes | None]:
+        """Execute one chunk as a JSON-RPC batch request."""
+        rpc_requests: list[tuple[str, list]] = []
+        for request in requests:
+            if isinstance(request, str):
+                rpc_requests.append(("eth_getBalance", [request, "latest"]))
+            else:
+                rpc_requests.append((
+                    "eth_call",
+                    [{"to": to_checksum_address(request.target), "data": "0x" + request.data.hex()}, "latest"],
+                ))
+
+        raw_results = await self.rpc.batch_request(rpc_requests)
+
+        results: list[int | bytes | None] = []
+        for request, raw in zip(requests, raw_results, strict=True):
+            if isinstance(raw, RPCError) or raw is None:
+                results.append(None)
+            elif isinstance(request, str):
+                results.append(int(raw, 16))
+            else:
+                results.append(bytes.fromhex(raw[2:]))
+        return results
+
+    async def _execute_multicall(self, requests: list[Call | str]) -> list[int | bytes | None]:
+        """Execute one chunk as a single Multicall3 ``aggregate3`` call."""
+        encoded_calls = []
+        for request in requests:
+            if isinstance(request, str):
+                # Multicall3 exposes native balances as a view function
+                data = GET_ETH_BALANCE_SELECTOR + encode(["address"], [request])
+                encoded_calls.append((self.multicall_address, True, data))
+            else:
+                encoded_calls.append((to_checksum_address(request.target), True, request.data))
+
+        call_data = AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [encoded_calls])
+        (raw,) = await self.rpc.batch_request([
+            ("eth_call", [{"to": self.multicall_address, "data": "0x" + call_data.hex()}, "latest"]),
+        ])
+        if isinstance(raw, RPCError):
+            raise raw
+
+        (outcomes,) = decode(["(bool,bytes)[]"], bytes.fromhex(raw[2:]))
+        results: list[int | bytes | None] = []
+        for request, (succeeded, data) in zip(requests, outcomes, strict=True):
+            if not succeeded:
+                results.append(None)
+            elif isinstance(request, str):
+                results.append(decode_uint(data))
+            else:
+                results.append(data)
+        return results
+
+    async def get_balances(
+        self,
+        owner: str,
+        token_addresses: list[str],
+        include_native: bool = True,
+    ) -> BalanceSnapshot:
+        """
+        Read native and ERC20 balances of a wallet in one round trip.
+
+        Token decimals and symbols are read in the same batch the first time
+        a token is seen on a chain and served from the cache afterwards.
+
+        Args:
+            owner: Wallet address
+            token_addresses: ERC20 token contract addresses
+            include_native: Whether to read the native token balance too
+
+        Returns:
+            BalanceSnapshot: Balances keyed by the token addresses as given
+
+        Raises:
+            RPCError: If a balance or decimals read fails
+        """
+        owner = to_checksum_address(owner)
+        chain_id = await self.rpc.chain_id()
+        tokens = list(dict.fromkeys(token_addresses))
+
+        calls = [balance_of_call(token, owner) for token in tokens]
+        missing = [token for token in tokens if self.metadata_cache.get(chain_id, token) is None]
+        for token in missing:
+            calls.append(decimals_call(token))
+            calls.append(symbol_call(token))
+
+        native_wei, results = await self.call_many(
+            calls, native_balance_of=owner if include_native else None
+        )
+
+        balance_results = results[:len(tokens)]
+        metadata_results = results[len(tokens):]
+        for index, token in enumerate(missing):
+            decimals_data = metadata_results[2 * index]
+            symbol_data = metadata_results[2 * index + 1]
+            if decimals_data is None:
+                raise RPCError(-32000, f"decimals() failed for token {token}")
+            self.metadata_cache.put(chain_id, TokenMetadata(
+                address=to_checksum_address(token),
+                decimals=decode_uint(decimals_data),
+                symbol=decode_symbol(symbol_data) if symbol_data else None,
+            ))
+        if missing:
+            logger.debug(f"Cached metadata for {len(missing)} tokens on chain {chain_id}")
+
+        snapshot = BalanceSnapshot(native_wei=native_wei)
+        for token, data in zip(tokens, balance_results, strict=True):
+            if data is None:
+                raise RPCError(-32000, f"balanceOf() failed for token {token}")
+            snapshot.tokens[token] = TokenBalance(
+                balance_wei=decode_uint(data),
+                metadata=self.metadata_cache.get(chain_id, token),
+            )
+        return snapshot
@@ -0,0 +1,255 @@
+"""
+Shared non-blocking JSON-RPC access for on-chain reads.
+
+This module provides an AsyncWeb3 client backed by a pooled, keep-alive
+aiohttp session so connectors and services can read chain state without
+blocking the event loop. Clients are process-wide and keyed by RPC URL:
+
+    client = get_rpc_client(settings.cronos_rpc_url)
+    balance_wei = await client.get_balance(wallet_address)
+    token = await client.contract(token_address, ERC20_ABI)
+    decimals = await token.functions.decimals().call()
+
+Several requests can share one HTTP round trip with ``batch_request``.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+import aiohttp
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from src.core.config import settings
+from src.core.constants import (
+    RPC_KEEPALIVE_SECONDS,
+    RPC_MAX_CONNECTIONS,
+    RPC_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RPCError(Exception):
+    """Error returned by a JSON-RPC endpoint for a single request."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+
+
+class AsyncRPCClient:
+    """
+    AsyncWeb3 client with a pooled HTTP session for a single RPC endpoint.
+
+    The underlying aiohttp session is bound to the event loop it was created
+    on, so a fresh session is built if the client is used from a new loop
+    (e.g. between test cases or worker restarts).
+    """
+
+    def __init__(
+        self,
+        rpc_url: str,
+        timeout_seconds: float = RPC_TIMEOUT_SECONDS,
+        max_connections: int = RPC_MAX_CONNECTIONS,
+        keepalive_seconds: float = RPC_KEEPALIVE_SECONDS,
+    ):
+        """
+        Initialize the RPC client.
+
+        Args:
+            rpc_url: JSON-RPC endpoint URL
+            timeout_seconds: Total timeout for a single RPC request
+            max_connections: Maximum concurrent connections to the endpoint
+            keepalive_seconds: How long idle connections are kept open
+        """
+        self.rpc_url = rpc_url
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self.keepalive_seconds = keepalive_seconds
+        self._web3: AsyncWeb3 | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self._chain_id: int | None = None
+
+    def _is_ready(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Check whether the cached session is usable on the given loop."""
+        return (
+            self._web3 is not None
+            and self._loop is loop
+            and self._session is not None
+            and not self._session.closed
+        )
+
+    async def get_web3(self) -> AsyncWeb3:
+        """
+        Get the AsyncWeb3 instance, creating the pooled session on first use.
+
+        Returns:
+            AsyncWeb3: Web3 instance bound to the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._is_ready(loop):
+            return self._web3
+
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        async with self._lock:
+            if not self._is_ready(loop):
+                await self._discard_session()
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=self.max_connections,
+                        keepalive_timeout=self.keepalive_seconds,
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+                    raise_for_status=True,
+                )
+                provider = AsyncHTTPProvider(self.rpc_url)
+                await provider.cache_async_session(self._session)
+                self._web3 = AsyncWeb3(provider)
+                self._loop = loop
+                logger.debug(f"Created pooled RPC session for {self.rpc_url}")
+
+        return self._web3
+
+    async def is_connected(self) -> bool:
+        """Check whether the RPC endpoint is reachable."""
+        try:
+            w3 = await self.get_web3()
+            return await w3.is_connected()
+        except Exception as e:
+            logger.warning(f"RPC connection check failed for {self.rpc_url}: {e}")
+            return False
+
+    async def chain_id(self) -> int:
+        """Get the chain ID reported by the endpoint (cached after first read)."""
+        if self._chain_id is None:
+            w3 = await self.get_web3()
+            self._chain_id = await w3.eth.chain_id
+        return self._chain_id
+
+    async def get_balance(self, address: str) -> int:
+        """
+        Get the native token balance of an address.
+
+        Args:
+            address: Account address (any case)
+
+        Returns:
+            int: Balance in wei
+        """
+        w3 = await self.get_web3()
+        return await w3.eth.get_balance(AsyncWeb3.to_checksum_address(address))
+
+    async def contract(self, address: str, abi: list[dict[str, Any]]) -> Any:
+        """
+        Build an async contract instance.
+
+        Args:
+            address: Contract address (any case)
+            abi: Contract ABI
+
+        Returns:
+            AsyncContract: Contract whose ``functions.*().call()`` are awaitable
+        """
+        w3 = await self.get_web3()
+        return w3.eth.contract(address=AsyncWeb3.to_checksum_address(address), abi=abi)
+
+    async def batch_request(
+        self,
+        requests: list[tuple[str, list[Any]]],
+    ) -> list[Any]:
+        """
+        Send several JSON-RPC requests in a single HTTP round trip.
+
+        Args:
+            requests: (method, params) pairs
+
+        Returns:
+            list: Raw results in request order; a failed request yields an
+                RPCError instance in its slot instead of raising
+
+        Raises:
+            RPCError: If the endpoint rejects the batch as a whole
+        """
+        if not requests:
+            return []
+
+        await self.get_web3()
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for request_id, (method, params) in enumerate(requests)
+        ]
+        async with self._session.post(self.rpc_url, json=payload) as response:
+            body = await response.json(content_type=None)
+
+        if not isinstance(body, list):
+            error = body.get("error") or {}
+            raise RPCError(error.get("code", -32600), error.get("message", "Batch rejected"))
+
+        # Responses may arrive in any order; match them back by id
+        responses = {item.get("id"): item for item in body}
+        results: list[Any] = []
+        for request_id in range(len(requests)):
+            item = responses.get(request_id)
+            if item is None:
+                results.append(RPCError(-32603, "No response for batched request"))
+            elif item.get("error"):
+                error = item["error"]
+                results.append(RPCError(error.get("code", -32603), error.get("message", "")))
+            else:
+                results.append(item.get("result"))
+        return results
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        await self._discard_session()
+        self._web3 = None
+
+    async def _discard_session(self) -> None:
+        """Close the current session if it belongs to a live event loop."""
+        session = self._session
+        self._session = None
+        if session is None or session.closed:
+            return
+        if self._loop is asyncio.get_running_loop():
+            await session.close()
+        # Sessions from a previous (closed) loop cannot be awaited; drop them.
+
+
+# Process-wide clients keyed by RPC URL
+_rpc_clients: dict[str, AsyncRPCClient] = {}
+
+
+def get_rpc_client(rpc_url: str | None = None) -> AsyncRPCClient:
+    """
+    Get the shared RPC client for an endpoint.
+
+    Args:
+        rpc_url: JSON-RPC endpoint URL (defaults to the Cronos RPC URL)
+
+    Returns:
+        AsyncRPCClient: Shared client for the endpoint
+    """
+    url = rpc_url or settings.cronos_rpc_url
+    client = _rpc_clients.get(url)
+    if client is None:
+        client = AsyncRPCClient(url)
+        _rpc_clients[url] = client
+    return client
+
+
+async def close_rpc_clients() -> None:
+    """Close all shared RPC clients."""
+    for client in list(_rpc_clients.values()):
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close RPC client {client.rpc_url}: {e}")
+    _rpc_clients.clear()
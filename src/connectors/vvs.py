@@ -23,8 +23,25 @@ from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+from src.connectors.rpc import get_rpc_client
+from src.core.config import settings
+from src.core.swr_cache import CachedValue, StaleWhileRevalidateCache
+
 logger = logging.getLogger(__name__)
 
+# On-chain quotes, shared by all connector instances
+quote_cache = StaleWhileRevalidateCache(
+    "vvs_quotes",
+    fresh_seconds=settings.quote_cache_fresh_seconds,
+    stale_seconds=settings.quote_cache_stale_seconds,
+    max_entries=settings.market_cache_max_entries,
+)
+
+
+def _with_freshness(cached: CachedValue) -> dict[str, Any]:
+    """Copy a quote and add when it was fetched and how it was served."""
+    return {**cached.value, "as_of": round(cached.as_of, 3), "cache": cached.cache}
+
 
 def _load_testnet_deployment() -> dict[str, Any] | None:
     """Load testnet deployment configuration if available."""
@@ -177,6 +194,10 @@ class VVSFinanceConnector:
             self.TESTNET_ROUTER_ADDRESS if use_testnet else self.ROUTER_ADDRESS
         )
 
+        self.rpc_url = (
+            settings.cronos_testnet_rpc_url if use_testnet else settings.cronos_rpc_url
+        )
+
         logger.info(
             f"VVS Finance connector initialized (mock={use_mock}, testnet={use_testnet}, "
             f"router={self.router_address})"
@@ -188,14 +209,7 @@ class VVSFinanceConnector:
             try:
                 from web3 import Web3
 
-                from src.core.config import settings
-
-                rpc_url = (
-                    settings.cronos_testnet_rpc_url
-                    if self.use_testnet
-                    else settings.cronos_rpc_url
-                )
-                self._web3 = Web3(Web3.HTTPProvider(rpc_url))
+                self._web3 = Web3(Web3.HTTPProvider(self.rpc_url))
 
                 if not self._web3.is_connected():
                     logger.warning("Web3 not connected, falling back to mock mode")
@@ -232,25 +246,111 @@ class VVSFinanceConnector:
         from_token: str,
         to_token: str,
         amount: float,
-        slippage_tolerance: float = 1.0
+        slippage_tolerance: float = 1.0,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """
         Get a price quote for a token swap.
 
         Queries the VVS Router contract for real on-chain prices when available,
-        falling back to mock rates if the RPC is unavailable.
+        falling back to mock rates if the RPC is unavailable. On-chain quotes
+        are cached: fresh for ``quote_cache_fresh_seconds``, then served stale
+        while one background refresh runs, up to ``quote_cache_stale_seconds``.
+
+        Args:
+            from_token: Token to swap from (e.g., 'CRO')
+            to_token: Token to swap to (e.g., 'USDC')
+            amount: Amount of from_token to swap
+            slippage_tolerance: Maximum acceptable slippage percentage
+            use_cache: Serve cached quotes (disable when building a transaction)
+
+        Returns:
+            Dict with quote details including expected output amount, ``source``,
+            ``as_of`` (epoch seconds when fetched) and ``cache`` (live, fresh or stale)
+        """
+        from_token = from_token.upper()
+        to_token = to_token.upper()
+
+        # Try on-chain quote first
+        if not self.use_mock:
+            def fetch() -> dict[str, Any] | None:
+                return self._get_on_chain_quote(from_token, to_token, amount, slippage_tolerance)
+
+            if use_cache:
+                key = self._quote_key(from_token, to_token, amount, slippage_tolerance)
+                cached = quote_cache.get_sync(key, fetch)
+            else:
+                cached = CachedValue(fetch(), time.time(), "live")
+            if cached.value:
+                return _with_freshness(cached)
+
+        return _with_freshness(CachedValue(
+            self._get_mock_quote(from_token, to_token, amount, slippage_tolerance), time.time(), "live"
+        ))
+
+    async def get_quote_async(
+        self,
+        from_token: str,
+        to_token: str,
+        amount: float,
+        slippage_tolerance: float = 1.0,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Get a price quote for a token swap without blocking the event loop.
+
+        Same result as :meth:`get_quote`, but the router call goes through the
+        shared async RPC client. Use this from ``async def`` code paths.
 
         Args:
             from_token: Token to swap from (e.g., 'CRO')
             to_token: Token to swap to (e.g., 'USDC')
             amount: Amount of from_token to swap
             slippage_tolerance: Maximum acceptable slippage percentage
+            use_cache: Serve cached quotes (disable when building a transaction)
 
         Returns:
-            Dict with quote details including expected output amount
+            Dict with quote details, ``source``, ``as_of`` and ``cache``
         """
         from_token = from_token.upper()
         to_token = to_token.upper()
+
+        if not self.use_mock:
+            async def fetch() -> dict[str, Any] | None:
+                return await self._get_on_chain_quote_async(
+                    from_token, to_token, amount, slippage_tolerance
+                )
+
+            if use_cache:
+                key = self._quote_key(from_token, to_token, amount, slippage_tolerance)
+                cached = await quote_cache.get(key, fetch)
+            else:
+                cached = CachedValue(await fetch(), time.time(), "live")
+            if cached.value:
+                return _with_freshness(cached)
+
+        return _with_freshness(CachedValue(
+            self._get_mock_quote(from_token, to_token, amount, slippage_tolerance), time.time(), "live"
+        ))
+
+    def _quote_key(
+        self,
+        from_token: str,
+        to_token: str,
+        amount: float,
+        slippage_tolerance: float,
+    ) -> tuple:
+        """Cache key for an on-chain quote (output depends on amount and router)."""
+        return (self.router_address, from_token, to_token, str(amount), str(slippage_tolerance))
+
+    def _get_mock_quote(
+        self,
+        from_token: str,
+        to_token: str,
+        amount: float,
+        slippage_tolerance: float,
+    ) -> dict[str, Any]:
+        """Build a quote from mock exchange rates."""
         amount_in = Decimal(str(amount))
 
         # Helper to format without trailing zeros
@@ -258,15 +358,6 @@ class VVSFinanceConnector:
             s = f"{d:.10f}".rstrip('0').rstrip('.')
             return s if s else "0"
 
-        # Try on-chain quote first
-        if not self.use_mock:
-            on_chain_result = self._get_on_chain_quote(
-                from_token, to_token, amount, slippage_tolerance
-            )
-            if on_chain_result:
-                return on_chain_result
-
-        # Fallback to mock rates
         logger.info(f"Using mock rates for {from_token} -> {to_token}")
         rate = self.MOCK_RATES.get((from_token, to_token))
         if not rate:
@@ -313,73 +404,135 @@ class VVSFinanceConnector:
             Quote dict or None if on-chain query fails
         """
         try:
-            from web3 import Web3
-
             router = self._get_router_contract()
             if not router:
                 return None
 
-            # Get token addresses
-            from_address = self._get_token_address(from_token)
-            to_address = self._get_token_address(to_token)
-
-            if not from_address or not to_address:
-                logger.warning(f"Unknown token: {from_token} or {to_token}")
+            quote_input = self._prepare_on_chain_quote(from_token, to_token, amount)
+            if not quote_input:
                 return None
-
-            # Convert amount to wei (assuming 18 decimals for simplicity)
-            # TODO: Query actual token decimals
-            decimals = 18 if from_token in ("CRO", "WCRO") else 6
-            amount_wei = int(Decimal(str(amount)) * Decimal(10 ** decimals))
-
-            # Build path
-            path = [
-                Web3.to_checksum_address(from_address),
-                Web3.to_checksum_address(to_address),
-            ]
+            amount_wei, path = quote_input
 
             # Query getAmountsOut
             amounts = router.functions.getAmountsOut(amount_wei, path).call()
-            amount_out_wei = amounts[-1]
-
-            # Convert back from wei
-            out_decimals = 18 if to_token in ("CRO", "WCRO") else 6
-            expected_out = Decimal(amount_out_wei) / Decimal(10 ** out_decimals)
-            amount_in_dec = Decimal(str(amount))
-
-            # Calculate rate
-            rate = expected_out / amount_in_dec if amount_in_dec > 0 else Decimal("0")
+            return self._format_on_chain_quote(
+                from_token, to_token, amount, amounts[-1], path, slippage_tolerance
+            )
 
-            # Apply slippage
-            min_out = expected_out * (Decimal("1") - Decimal(str(slippage_tolerance)) / Decimal("100"))
+        except Exception as e:
+            logger.warning(f"On-chain quote failed: {e}")
+            return None
 
-            # Estimate price impact (simplified)
-            price_impact = Decimal("0.3")  # Base estimate
+    async def _get_on_chain_quote_async(
+        self,
+        from_token: str,
+        to_token: str,
+        amount: float,
+        slippage_tolerance: float,
+    ) -> dict[str, Any] | None:
+        """
+        Get quote from VVS Router contract via the shared async RPC client.
 
-            def fmt(d: Decimal) -> str:
-                s = f"{d:.10f}".rstrip('0').rstrip('.')
-                return s if s else "0"
+        Args:
+            from_token: Token symbol to swap from
+            to_token: Token symbol to swap to
+            amount: Amount of from_token
+            slippage_tolerance: Slippage tolerance percentage
 
-            logger.info(f"On-chain quote: {amount} {from_token} -> {fmt(expected_out)} {to_token}")
+        Returns:
+            Quote dict or None if on-chain query fails
+        """
+        try:
+            quote_input = self._prepare_on_chain_quote(from_token, to_token, amount)
+            if not quote_input:
+                return None
+            amount_wei, path = quote_input
 
-            return {
-                "from_token": from_token,
-                "to_token": to_token,
-                "amount_in": fmt(amount_in_dec),
-                "expected_amount_out": fmt(expected_out),
-                "min_amount_out": fmt(min_out),
-                "exchange_rate": fmt(rate),
-                "price_impact": fmt(price_impact),
-                "slippage_tolerance": slippage_tolerance,
-                "fee": fmt(amount_in_dec * Decimal("0.003")),
-                "source": "on-chain",
-                "path": path,
-            }
+            router = await get_rpc_client(self.rpc_url).contract(
+                self.router_address, self.ROUTER_ABI
+            )
+            amounts = await router.functions.getAmountsOut(amount_wei, path).call()
+            return self._format_on_chain_quote(
+                from_token, to_token, amount, amounts[-1], path, slippage_tolerance
+            )
 
         except Exception as e:
             logger.warning(f"On-chain quote failed: {e}")
             return None
 
+    def _prepare_on_chain_quote(
+        self,
+        from_token: str,
+        to_token: str,
+        amount: float,
+    ) -> tuple[int, list[str]] | None:
+        """Resolve the input amount in wei and the checksummed swap path."""
+        from web3 import Web3
+
+        # Get token addresses
+        from_address = self._get_token_address(from_token)
+        to_address = self._get_token_address(to_token)
+
+        if not from_address or not to_address:
+            logger.warning(f"Unknown token: {from_token} or {to_token}")
+            return None
+
+        # Convert amount to wei (assuming 18 decimals for simplicity)
+        # TODO: Query actual token decimals
+        decimals = 18 if from_token in ("CRO", "WCRO") else 6
+        amount_wei = int(Decimal(str(amount)) * Decimal(10 ** decimals))
+
+        # Build path
+        path = [
+            Web3.to_checksum_address(from_address),
+            Web3.to_checksum_address(to_address),
+        ]
+        return amount_wei, path
+
+    def _format_on_chain_quote(
+        self,
+        from_token: str,
+        to_token: str,
+        amount: float,
+        amount_out_wei: int,
+        path: list[str],
+        slippage_tolerance: float,
+    ) -> dict[str, Any]:
+        """Build the quote response from a router ``getAmountsOut`` result."""
+        # Convert back from wei
+        out_decimals = 18 if to_token in ("CRO", "WCRO") else 6
+        expected_out = Decimal(amount_out_wei) / Decimal(10 ** out_decimals)
+        amount_in_dec = Decimal(str(amount))
+
+        # Calculate rate
+        rate = expected_out / amount_in_dec if amount_in_dec > 0 else Decimal("0")
+
+        # Apply slippage
+        min_out = expected_out * (Decimal("1") - Decimal(str(slippage_tolerance)) / Decimal("100"))
+
+        # Estimate price impact (simplified)
+        price_impact = Decimal("0.3")  # Base estimate
+
+        def fmt(d: Decimal) -> str:
+            s = f"{d:.10f}".rstrip('0').rstrip('.')
+            return s if s else "0"
+
+        logger.info(f"On-chain quote: {amount} {from_token} -> {fmt(expected_out)} {to_token}")
+
+        return {
+            "from_token": from_token,
+            "to_token": to_token,
+            "amount_in": fmt(amount_in_dec),
+            "expected_amount_out": fmt(expected_out),
+            "min_amount_out": fmt(min_out),
+            "exchange_rate": fmt(rate),
+            "price_impact": fmt(price_impact),
+            "slippage_tolerance": slippage_tolerance,
+            "fee": fmt(amount_in_dec * Decimal("0.003")),
+            "source": "on-chain",
+            "path": path,
+        }
+
     def swap(
         self,
         from_token: str,
@@ -412,8 +565,8 @@ class VVSFinanceConnector:
         if deadline is None:
             deadline = 120
 
-        # Get quote first
-        quote = self.get_quote(from_token, to_token, amount, slippage_tolerance)
+        # Get quote first (uncached: min_amount_out goes into the transaction)
+        quote = self.get_quote(from_token, to_token, amount, slippage_tolerance, use_cache=False)
 
         logger.info(
             f"VVS swap: {amount} {from_token} -> {to_token} "
@@ -493,8 +646,8 @@ class VVSFinanceConnector:
             if not w3:
                 return {"success": False, "error": "Web3 not connected"}
 
-            # Get quote first
-            quote = self.get_quote(from_token, to_token, amount, slippage_tolerance)
+            # Get quote first (uncached: min_amount_out goes into the transaction)
+            quote = self.get_quote(from_token, to_token, amount, slippage_tolerance, use_cache=False)
             if quote.get("source") != "on-chain":
                 return {"success": False, "error": "On-chain quote not available"}
 
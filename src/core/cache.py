@@ -25,6 +25,7 @@ except ImportError:
     FAKEREDIS_AVAILABLE = False
     FakeAsyncRedis = None  # type: ignore[assignment]
 
+from src.core.cache_codec import cache_codec
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,8 @@ class CacheMetrics:
     get_count: int
     set_count: int
     delete_count: int
+    tier_hits: dict[str, int]
+    tier_misses: dict[str, int]
 
     def __init__(self) -> None:
         self.hits = 0
@@ -54,6 +57,8 @@ class CacheMetrics:
         self.get_count = 0
         self.set_count = 0
         self.delete_count = 0
+        self.tier_hits = {}
+        self.tier_misses = {}
 
     def record_hit(self) -> None:
         """Record a cache hit."""
@@ -63,6 +68,14 @@ class CacheMetrics:
         """Record a cache miss."""
         self.misses += 1
 
+    def record_tier_hit(self, tier: str) -> None:
+        """Record a hit in one tier of a layered cache (e.g. ``l1``)."""
+        self.tier_hits[tier] = self.tier_hits.get(tier, 0) + 1
+
+    def record_tier_miss(self, tier: str) -> None:
+        """Record a miss in one tier of a layered cache."""
+        self.tier_misses[tier] = self.tier_misses.get(tier, 0) + 1
+
     def record_error(self) -> None:
         """Record a cache error."""
         self.errors += 1
@@ -102,7 +115,7 @@ class CacheMetrics:
         avg_set_time = (self.total_set_time / self.set_count) if self.set_count > 0 else 0
         avg_delete_time = (self.total_delete_time / self.delete_count) if self.delete_count > 0 else 0
 
-        return {
+        metrics: dict[str, int | float] = {
             "hits": self.hits,
             "misses": self.misses,
             "errors": self.errors,
@@ -113,6 +126,19 @@ class CacheMetrics:
             "avg_delete_time_ms": round(avg_delete_time, 2),
         }
 
+        # Per-tier hit ratios, e.g. l1_hits / l1_misses / l1_hit_rate_percent
+        for tier in sorted(self.tier_hits.keys() | self.tier_misses.keys()):
+            tier_hits = self.tier_hits.get(tier, 0)
+            tier_misses = self.tier_misses.get(tier, 0)
+            tier_total = tier_hits + tier_misses
+            metrics[f"{tier}_hits"] = tier_hits
+            metrics[f"{tier}_misses"] = tier_misses
+            metrics[f"{tier}_hit_rate_percent"] = (
+                round(tier_hits / tier_total * 100, 2) if tier_total > 0 else 0
+            )
+
+        return metrics
+
 
 class CacheInterface(ABC):
     """Abstract base class for cache implementations."""
@@ -216,10 +242,10 @@ class CacheClient:
                 # Convert to redis:// for aioredis
                 pass
 
+            # Binary-safe: cached values are encoded by src.core.cache_codec
             self._client = aioredis.from_url(
                 redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
                 socket_connect_timeout=5,
                 socket_timeout=5,
             )
@@ -246,15 +272,21 @@ class CacheClient:
         """Check if Redis is available."""
         return self._available and self._client is not None
 
+    @property
+    def client(self) -> Any | None:
+        """Get the shared async Redis client, or None when unavailable."""
+        return self._client if self.available else None
+
     async def get(self, key: str) -> Any | None:
         """Get value from cache."""
         if not self.available:
             return None
         try:
             value = await self._client.get(key)
-            # Decode bytes to string if needed (for FakeAsyncRedis compatibility)
             if isinstance(value, bytes):
-                value = value.decode('utf-8')
+                # Values written through the cache codec (e.g. compressed) need
+                # it to decode; plain values are returned as strings
+                value = cache_codec.decode(value) if cache_codec.is_encoded(value) else value.decode('utf-8')
             return value
         except Exception as e:
             logger.error(f"Cache get error: {e}")
@@ -305,6 +337,10 @@ async def init_cache() -> None:
     """Initialize Redis cache connection."""
     await cache_client.connect()
 
+    # Subscribe the in-process near cache to cross-worker invalidations
+    from src.core.near_cache import near_cache
+    await near_cache.start()
+
     # Try to initialize Vercel KV cache as well
     try:
         from src.core.vercel_kv import VercelKVCache
@@ -321,6 +357,8 @@ async def init_cache() -> None:
 
 async def close_cache() -> None:
     """Close Redis cache connection."""
+    from src.core.near_cache import near_cache
+    await near_cache.close()
     await cache_client.close()
 
     # Close Vercel KV cache if available
@@ -332,6 +370,9 @@ def cache_result(ttl: int = 300):
     """
     Decorator to cache function results.
 
+    Concurrent misses for the same arguments run the function once (see
+    src.core.single_flight). Results must be JSON serializable.
+
     Args:
         ttl: Time to live in seconds (default: 300 = 5 minutes)
 
@@ -369,14 +410,11 @@ def cache_result(ttl: int = 300):
             key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
             cache_key = ":".join(key_parts)
 
-            # Try to get from cache
-            cached = await cache_client.get(cache_key)
-            if cached:
-                return cached
-
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-            await cache_client.set(cache_key, result, ttl)
-            return result
+            # One recompute per key, refreshed early while hot
+            from src.core.near_cache import near_cache
+            from src.core.single_flight import get_or_compute
+            return await get_or_compute(
+                near_cache, cache_key, lambda: func(*args, **kwargs), ttl
+            )
         return wrapper
     return decorator
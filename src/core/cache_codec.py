@@ -0,0 +1,229 @@
+"""
+Binary codec for cached values.
+
+Values are serialized with orjson (or msgpack) and compressed above a size
+threshold. Each encoded value starts with a three-byte header:
+
+    0xFF | serializer tag | compression tag
+
+0xFF never appears in UTF-8 text, so values written before the codec
+existed (plain JSON or raw strings) are still recognized and decoded the
+old way. The serializer tag also records when a value was a ``str`` or
+``bytes``. A string that looks like JSON (``"42"``) is then returned as a
+string, not parsed into a number.
+"""
+
+import json
+import logging
+import zlib
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ormsgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    ormsgpack = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import lz4.frame as lz4_frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+    lz4_frame = None  # type: ignore[assignment]
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = 0xFF
+
+# Serializer tags
+TAG_STR = ord("s")
+TAG_BYTES = ord("b")
+TAG_JSON = ord("j")
+TAG_ORJSON = ord("o")
+TAG_MSGPACK = ord("m")
+
+# Compression tags
+COMPRESS_NONE = ord("-")
+COMPRESS_ZLIB = ord("z")
+COMPRESS_ZSTD = ord("Z")
+COMPRESS_LZ4 = ord("L")
+
+
+def _compressors() -> dict[int, tuple[Any, Any]]:
+    """Available (compress, decompress) pairs by compression tag."""
+    compressors: dict[int, tuple[Any, Any]] = {
+        COMPRESS_ZLIB: (lambda data: zlib.compress(data, 6), zlib.decompress),
+    }
+    if ZSTD_AVAILABLE:
+        compressor = zstandard.ZstdCompressor(level=3)
+        decompressor = zstandard.ZstdDecompressor()
+        compressors[COMPRESS_ZSTD] = (compressor.compress, decompressor.decompress)
+    if LZ4_AVAILABLE:
+        compressors[COMPRESS_LZ4] = (lz4_frame.compress, lz4_frame.decompress)
+    return compressors
+
+
+COMPRESSION_TAGS = {
+    "zlib": COMPRESS_ZLIB,
+    "zstd": COMPRESS_ZSTD,
+    "lz4": COMPRESS_LZ4,
+}
+
+
+class CacheCodec:
+    """Encode and decode cached values with a self-describing header."""
+
+    def __init__(
+        self,
+        serializer: str = settings.cache_serializer,
+        compression: str = settings.cache_compression,
+        compress_min_bytes: int = settings.cache_compress_min_bytes,
+    ):
+        """
+        Initialize the codec.
+
+        Args:
+            serializer: "orjson", "msgpack" or "json" (falls back to json if
+                the library is not installed)
+            compression: "zstd", "lz4", "zlib", "none", or "auto" (best installed)
+            compress_min_bytes: Only compress payloads at least this large
+        """
+        self.serializer = self._resolve_serializer(serializer)
+        self.compress_min_bytes = compress_min_bytes
+        self._compressors = _compressors()
+        self.compression = self._resolve_compression(compression)
+
+    @staticmethod
+    def _resolve_serializer(serializer: str) -> int:
+        if serializer == "orjson" and ORJSON_AVAILABLE:
+            return TAG_ORJSON
+        if serializer == "msgpack" and MSGPACK_AVAILABLE:
+            return TAG_MSGPACK
+        if serializer not in ("json", "orjson", "msgpack"):
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if serializer != "json":
+            logger.warning(f"{serializer} not installed, caching with json")
+        return TAG_JSON
+
+    def _resolve_compression(self, compression: str) -> int:
+        if compression == "none":
+            return COMPRESS_NONE
+        if compression == "auto":
+            for tag in (COMPRESS_ZSTD, COMPRESS_LZ4, COMPRESS_ZLIB):
+                if tag in self._compressors:
+                    return tag
+        if compression not in COMPRESSION_TAGS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        tag = COMPRESSION_TAGS[compression]
+        if tag not in self._compressors:
+            logger.warning(f"{compression} not installed, compressing cache values with zlib")
+            return COMPRESS_ZLIB
+        return tag
+
+    def _serialize(self, value: Any) -> tuple[int, bytes]:
+        if isinstance(value, str):
+            return TAG_STR, value.encode("utf-8")
+        if isinstance(value, bytes):
+            return TAG_BYTES, value
+        if self.serializer == TAG_ORJSON:
+            return TAG_ORJSON, orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        if self.serializer == TAG_MSGPACK:
+            return TAG_MSGPACK, ormsgpack.packb(value, option=ormsgpack.OPT_NON_STR_KEYS)
+        return TAG_JSON, json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a value for storage.
+
+        Args:
+            value: str, bytes, or any JSON-serializable value
+
+        Returns:
+            Header plus (possibly compressed) payload
+        """
+        tag, payload = self._serialize(value)
+        compression = COMPRESS_NONE
+        if self.compression != COMPRESS_NONE and len(payload) >= self.compress_min_bytes:
+            compressed = self._compressors[self.compression][0](payload)
+            if len(compressed) < len(payload):
+                payload, compression = compressed, self.compression
+        return bytes((MAGIC, tag, compression)) + payload
+
+    def decode(self, data: bytes | str) -> Any:
+        """
+        Decode a stored value, including values written before the codec.
+
+        Args:
+            data: Raw value from Redis
+
+        Returns:
+            The original value
+        """
+        if isinstance(data, str):
+            return self._decode_legacy(data)
+        if not self.is_encoded(data):
+            return self._decode_legacy(data.decode("utf-8"))
+
+        tag, compression, payload = data[1], data[2], data[3:]
+        if compression != COMPRESS_NONE:
+            if compression not in self._compressors:
+                raise ValueError(f"Cache value compressed with unavailable codec {chr(compression)!r}")
+            payload = self._compressors[compression][1](payload)
+
+        if tag == TAG_STR:
+            return payload.decode("utf-8")
+        if tag == TAG_BYTES:
+            return bytes(payload)
+        if tag == TAG_ORJSON:
+            # orjson output is plain JSON, so json can read it if orjson is missing
+            return orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+        if tag == TAG_MSGPACK:
+            if not MSGPACK_AVAILABLE:
+                raise ValueError("Cache value is msgpack but ormsgpack is not installed")
+            return ormsgpack.unpackb(payload)
+        if tag == TAG_JSON:
+            return json.loads(payload)
+        raise ValueError(f"Unknown cache value tag {chr(tag)!r}")
+
+    @staticmethod
+    def is_encoded(data: bytes) -> bool:
+        """Whether raw bytes carry the codec header (not a pre-codec value)."""
+        return len(data) >= 3 and data[0] == MAGIC
+
+    @staticmethod
+    def _decode_legacy(text: str) -> Any:
+        # Pre-codec values: JSON if it parses, the raw string otherwise
+        try:
+            return json.loads(text)
+        except (json.JSONDecodeError, TypeError):
+            return text
+
+    def get_info(self) -> dict[str, Any]:
+        """Get codec configuration."""
+        names = {tag: name for name, tag in COMPRESSION_TAGS.items()}
+        return {
+            "serializer": {TAG_ORJSON: "orjson", TAG_MSGPACK: "msgpack"}.get(self.serializer, "json"),
+            "compression": names.get(self.compression, "none"),
+            "compress_min_bytes": self.compress_min_bytes,
+        }
+
+
+# Global codec
+cache_codec = CacheCodec()
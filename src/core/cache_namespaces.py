@@ -0,0 +1,125 @@
+"""
+Generation-versioned cache namespaces.
+
+Invalidating a group of keys with SCAN + DEL walks the whole keyspace on
+every write. Instead, a cached key can be tagged with one or more
+namespaces (``services``, ``service:{id}``, ...). The current version of
+each namespace is embedded in the Redis key, e.g.
+``services:discover:ab12:v1718000000000.3``. Invalidating a namespace is a
+single INCR of its version counter. Readers then compute new keys and miss,
+and the orphaned entries age out by their TTL.
+
+Version counters are served from the near cache, so tagging a key normally
+costs no extra round trip. Bumps are broadcast over its invalidation
+channel. A missing counter is seeded with the current time in milliseconds
+rather than 0. If Redis evicts a counter, its versions do not go back to
+values that older entries were written under.
+"""
+
+import logging
+import time
+from collections.abc import Sequence
+
+from src.core.near_cache import NearCache, near_cache
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE_KEY_PREFIX = "cache:ns:"
+
+
+class CacheNamespaces:
+    """Namespace version counters used to build and invalidate cache keys."""
+
+    def __init__(self, cache: NearCache = near_cache, prefix: str = NAMESPACE_KEY_PREFIX):
+        """
+        Initialize namespace versioning.
+
+        Args:
+            cache: Near cache holding the version counters
+            prefix: Redis key prefix for version counters
+        """
+        self.cache = cache
+        self.prefix = prefix
+
+    def _counter_key(self, namespace: str) -> str:
+        return f"{self.prefix}{namespace}"
+
+    async def versions(self, namespaces: Sequence[str]) -> list[int] | None:
+        """
+        Get the current version of each namespace.
+
+        Args:
+            namespaces: Namespace names
+
+        Returns:
+            Versions in the same order, or None if Redis is unavailable
+        """
+        client = self.cache.backend.client
+        if client is None:
+            return None
+
+        keys = [self._counter_key(namespace) for namespace in namespaces]
+        try:
+            found = await self.cache.get_many(keys)
+            missing = [key for key in keys if key not in found]
+            if missing:
+                seed = time.time_ns() // 1_000_000
+                async with client.pipeline(transaction=False) as pipe:
+                    for key in missing:
+                        pipe.set(key, seed, nx=True)
+                    await pipe.execute()
+                found.update(await self.cache.get_many(missing))
+            return [int(found[key]) for key in keys]
+        except Exception as e:
+            logger.warning(f"Cache namespace lookup failed for {list(namespaces)}: {e}")
+            return None
+
+    async def key(self, key: str, namespaces: Sequence[str]) -> str | None:
+        """
+        Build the versioned form of a cache key.
+
+        Args:
+            key: Base cache key
+            namespaces: Namespaces the entry belongs to (none: key unchanged)
+
+        Returns:
+            Versioned key, or None if the versions cannot be read (do not cache)
+        """
+        if not namespaces:
+            return key
+        versions = await self.versions(namespaces)
+        if versions is None:
+            return None
+        return f"{key}:v{'.'.join(str(version) for version in versions)}"
+
+    async def invalidate(self, *namespaces: str) -> bool:
+        """
+        Invalidate every entry tagged with any of the namespaces in O(1) each.
+
+        Args:
+            *namespaces: Namespace names
+
+        Returns:
+            True if the versions were bumped
+        """
+        client = self.cache.backend.client
+        if client is None or not namespaces:
+            return False
+
+        keys = [self._counter_key(namespace) for namespace in namespaces]
+        seed = time.time_ns() // 1_000_000
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(key, seed, nx=True)
+                    pipe.incr(key)
+                await pipe.execute()
+            await self.cache.invalidate(keys)
+            return True
+        except Exception as e:
+            logger.warning(f"Cache namespace invalidation failed for {list(namespaces)}: {e}")
+            return False
+
+
+# Global namespace versions
+cache_namespaces = CacheNamespaces()
@@ -12,15 +12,66 @@ from pydantic_settings import BaseSettings
 
 from .constants import (
     AGENT_DEFAULT_BUDGET_USD,
+    AGENT_GRAPH_REGISTRY_SIZE,
     AGENT_MAX_ITERATIONS,
+    AGENT_MEMORY_MAX_SESSIONS,
+    AGENT_MEMORY_WINDOW,
     AGENT_TIMEOUT_SECONDS,
+    APPROVAL_EXPIRY_HOURS,
+    APPROVAL_RETENTION_DAYS,
+    CACHE_COMPRESS_MIN_BYTES,
+    CACHE_LEASE_TTL_MS,
+    CACHE_LEASE_WAIT_SECONDS,
+    CACHE_XFETCH_BETA,
+    COMMAND_PARSE_CACHE_SIZE,
+    DB_BACKGROUND_MAX_OVERFLOW,
+    DB_BACKGROUND_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_REPORTING_MAX_OVERFLOW,
+    DB_REPORTING_POOL_SIZE,
     DEFAULT_APP_PORT,
     DEFAULT_DAILY_LIMIT_USD,
     DEFAULT_RATE_LIMIT_REQUESTS_PER_MINUTE,
+    EXECUTION_LOG_RETENTION_DAYS,
+    EXECUTION_RECORDER_BATCH_SIZE,
+    EXECUTION_RECORDER_FLUSH_INTERVAL_MS,
+    EXECUTION_RECORDER_QUEUE_SIZE,
+    EXECUTION_RECORDER_SHUTDOWN_TIMEOUT_SECONDS,
     HITL_APPROVAL_THRESHOLD_USD,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_MAX_KEEPALIVE_PER_HOST,
+    HTTP_MAX_TRACKED_HOSTS,
+    HTTP_TIMEOUT_SECONDS,
     JWT_EXPIRATION_HOURS,
+    LLM_CACHE_DEFAULT_TTL_SECONDS,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_SIMILARITY_THRESHOLD,
+    MARKET_CACHE_MAX_ENTRIES,
+    NEAR_CACHE_INVALIDATION_CHANNEL,
+    NEAR_CACHE_MAX_ENTRIES,
+    NEAR_CACHE_TTL_SECONDS,
+    PLAN_MAX_CONCURRENCY,
+    PRICE_CACHE_FRESH_SECONDS,
+    PRICE_CACHE_STALE_SECONDS,
+    QUOTE_CACHE_FRESH_SECONDS,
+    QUOTE_CACHE_STALE_SECONDS,
+    RETENTION_BATCH_SIZE,
+    RETENTION_THROTTLE_MS,
+    RPC_BATCH_MAX_CALLS,
+    SERVICE_SEARCH_RELEVANCE_WEIGHT,
+    SESSION_RETENTION_DAYS,
+    X402_BATCH_MAX_CONCURRENCY,
+    X402_BATCH_MAX_PAYMENTS,
+    X402_BATCH_MAX_PER_HOST,
     X402_MAX_RETRIES,
+    X402_REQUIREMENTS_MAX_ENTRIES,
+    X402_REQUIREMENTS_TTL_SECONDS,
     X402_RETRY_DELAY_MS,
+    X402_SIGN_PROCESS_POOL_THRESHOLD,
 )
 
 
@@ -76,6 +127,11 @@ class Settings(BaseSettings):
     cronos_chain_id: int = Field(default=338, description="338 for testnet, 25 for mainnet")
     cronos_testnet_rpc_url: str = "https://evm-t3.cronos.org"
     cronos_testnet_chain_id: int = 338
+    multicall_address: str | None = Field(
+        default=None,
+        description="Multicall3 contract for aggregated reads (unset: JSON-RPC batch requests)"
+    )
+    rpc_batch_max_calls: int = RPC_BATCH_MAX_CALLS
 
     # x402 Configuration
     x402_facilitator_url: str = Field(
@@ -84,6 +140,33 @@ class Settings(BaseSettings):
     )
     x402_max_retries: int = X402_MAX_RETRIES
     x402_retry_delay_ms: int = X402_RETRY_DELAY_MS
+    x402_batch_max_payments: int = X402_BATCH_MAX_PAYMENTS
+    x402_batch_max_concurrency: int = X402_BATCH_MAX_CONCURRENCY
+    x402_batch_max_per_host: int = X402_BATCH_MAX_PER_HOST
+    x402_requirements_ttl_seconds: float = Field(
+        default=X402_REQUIREMENTS_TTL_SECONDS,
+        description="Seconds a service's 402 payment requirement is reused to pay up front (0 disables)"
+    )
+    x402_requirements_max_entries: int = X402_REQUIREMENTS_MAX_ENTRIES
+    x402_sign_process_pool_threshold: int = Field(
+        default=X402_SIGN_PROCESS_POOL_THRESHOLD,
+        description="Signature batches at least this large use a process pool (0 disables)"
+    )
+    x402_sign_process_workers: int | None = Field(
+        default=None,
+        description="Signing process pool size (default: CPU count)"
+    )
+
+    # Shared outbound HTTP client (x402 services, facilitator, MCP, webhooks)
+    http_timeout_seconds: float = HTTP_TIMEOUT_SECONDS
+    http_max_connections_per_host: int = HTTP_MAX_CONNECTIONS_PER_HOST
+    http_max_keepalive_per_host: int = HTTP_MAX_KEEPALIVE_PER_HOST
+    http_keepalive_expiry_seconds: float = HTTP_KEEPALIVE_EXPIRY_SECONDS
+    http_max_tracked_hosts: int = HTTP_MAX_TRACKED_HOSTS
+    http2_enabled: bool = Field(
+        default=True,
+        description="Negotiate HTTP/2 when the h2 package is installed"
+    )
 
     # Wallet Configuration (development only - use HSM in production)
     agent_wallet_private_key: str | None = Field(
@@ -104,6 +187,52 @@ class Settings(BaseSettings):
         default="sqlite:///:memory:",
         description="Database connection URL (PostgreSQL or SQLite)"
     )
+    reporting_database_url: str | None = Field(
+        default=None,
+        description="Optional read replica URL for read-only reporting queries"
+    )
+
+    # Connection pooling (SQLite always uses NullPool)
+    db_pool_mode: str = Field(
+        default="auto",
+        description="Pool mode: 'auto' (pool non-SQLite URLs), 'queue' or 'null'"
+    )
+    db_pool_pre_ping: bool = True
+    db_pool_recycle_seconds: int = DB_POOL_RECYCLE_SECONDS
+    db_pool_timeout_seconds: float = DB_POOL_TIMEOUT_SECONDS
+    # Request traffic (API routes, WebSocket handlers, agent execution)
+    db_pool_size: int = DB_POOL_SIZE
+    db_max_overflow: int = DB_MAX_OVERFLOW
+    # Background jobs (subscription renewal, log cleanup)
+    db_background_pool_size: int = DB_BACKGROUND_POOL_SIZE
+    db_background_max_overflow: int = DB_BACKGROUND_MAX_OVERFLOW
+    # Read-only reporting queries (history, stats, logs)
+    db_reporting_pool_size: int = DB_REPORTING_POOL_SIZE
+    db_reporting_max_overflow: int = DB_REPORTING_MAX_OVERFLOW
+
+    # Data retention (chunked deletes; see src.services.retention)
+    retention_batch_size: int = RETENTION_BATCH_SIZE
+    retention_throttle_ms: int = RETENTION_THROTTLE_MS
+    retention_archive_dir: str | None = Field(
+        default=None,
+        description="write rows to JSONL here before deleting them (disabled if unset)"
+    )
+    execution_log_retention_days: int = EXECUTION_LOG_RETENTION_DAYS
+    approval_expiry_hours: int = APPROVAL_EXPIRY_HOURS
+    approval_retention_days: int = APPROVAL_RETENTION_DAYS
+    session_retention_days: int = SESSION_RETENTION_DAYS
+
+    # Write-behind recording of execution logs, tool calls and memory
+    execution_recorder_enabled: bool = True
+    execution_recorder_queue_size: int = EXECUTION_RECORDER_QUEUE_SIZE
+    execution_recorder_batch_size: int = EXECUTION_RECORDER_BATCH_SIZE
+    execution_recorder_flush_interval_ms: int = EXECUTION_RECORDER_FLUSH_INTERVAL_MS
+    execution_recorder_shutdown_timeout_seconds: float = EXECUTION_RECORDER_SHUTDOWN_TIMEOUT_SECONDS
+    execution_log_durability: str = Field(
+        default="payments",
+        description="Wait for records to be written before responding: "
+        "'async' (never), 'payments' (payment, swap and trade commands) or 'sync' (always)"
+    )
 
     # Redis/KV Configuration
     # Vercel KV (production)
@@ -115,6 +244,39 @@ class Settings(BaseSettings):
         default="redis://localhost:6379",
         description="Redis connection URL (optional, cache disabled if not reachable)"
     )
+    # In-process near cache in front of Redis, invalidated over pub/sub
+    near_cache_enabled: bool = True
+    near_cache_max_entries: int = NEAR_CACHE_MAX_ENTRIES
+    near_cache_ttl_seconds: float = Field(
+        default=NEAR_CACHE_TTL_SECONDS,
+        description="Upper bound on how long a value is served from process memory"
+    )
+    near_cache_channel: str = NEAR_CACHE_INVALIDATION_CHANNEL
+    # Stampede protection: one recompute per key across workers, refreshed early when hot
+    cache_lease_ttl_ms: int = CACHE_LEASE_TTL_MS
+    cache_lease_wait_seconds: float = CACHE_LEASE_WAIT_SECONDS
+    cache_xfetch_beta: float = Field(
+        default=CACHE_XFETCH_BETA,
+        description="XFetch early-refresh aggressiveness (0 disables early refresh)"
+    )
+    # Cached value encoding
+    cache_serializer: str = Field(default="orjson", description="orjson, msgpack or json")
+    cache_compression: str = Field(
+        default="auto",
+        description="zstd, lz4, zlib, none, or auto (best installed)"
+    )
+    cache_compress_min_bytes: int = CACHE_COMPRESS_MIN_BYTES
+    # Market data: served fresh, then stale while one background refresh runs
+    quote_cache_fresh_seconds: float = QUOTE_CACHE_FRESH_SECONDS
+    quote_cache_stale_seconds: float = QUOTE_CACHE_STALE_SECONDS
+    price_cache_fresh_seconds: float = PRICE_CACHE_FRESH_SECONDS
+    price_cache_stale_seconds: float = PRICE_CACHE_STALE_SECONDS
+    market_cache_max_entries: int = MARKET_CACHE_MAX_ENTRIES
+    # Service discovery: rank = weight * text relevance + (1 - weight) * reputation
+    service_search_relevance_weight: float = Field(
+        default=SERVICE_SEARCH_RELEVANCE_WEIGHT,
+        description="share of text relevance (0-1) in discovery ranking"
+    )
 
     # Vercel Blob (production)
     blob_read_write_token: str | None = None
@@ -130,6 +292,29 @@ class Settings(BaseSettings):
     agent_max_iterations: int = AGENT_MAX_ITERATIONS
     agent_timeout_seconds: int = AGENT_TIMEOUT_SECONDS
     agent_default_budget_usd: float = AGENT_DEFAULT_BUDGET_USD
+    # Recent memory entries loaded per session; older ones are summarized
+    agent_memory_window: int = AGENT_MEMORY_WINDOW
+    agent_memory_max_sessions: int = AGENT_MEMORY_MAX_SESSIONS
+    agent_memory_summary_enabled: bool = True
+    # Plan steps of one session allowed to run at once
+    plan_max_concurrency: int = PLAN_MAX_CONCURRENCY
+    # Parsed commands kept in the command parser's LRU (0 disables it)
+    command_parse_cache_size: int = COMMAND_PARSE_CACHE_SIZE
+    # Response cache for read-only agent questions (never for money-moving commands)
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = LLM_CACHE_MAX_ENTRIES
+    llm_cache_default_ttl_seconds: int = Field(
+        default=LLM_CACHE_DEFAULT_TTL_SECONDS,
+        description="TTL of cached agent answers; answers that used tools expire sooner"
+    )
+    # Embedding-similarity lookup for paraphrased questions (needs langchain-openai)
+    llm_cache_semantic_enabled: bool = False
+    llm_cache_similarity_threshold: float = LLM_CACHE_SIMILARITY_THRESHOLD
+    llm_cache_embedding_model: str = "text-embedding-3-small"
+    # Compiled agent graphs shared across sessions, keyed by model, tools and prompt
+    agent_graph_registry_size: int = AGENT_GRAPH_REGISTRY_SIZE
+    # Build the main agent and subagent graphs at startup instead of on first use
+    agent_graph_warm_on_startup: bool = True
     hitl_approval_threshold_usd: float = HITL_APPROVAL_THRESHOLD_USD
 
     # Logging
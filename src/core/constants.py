@@ -22,14 +22,72 @@ MOCK_FACILITATOR_TIMEOUT_SECONDS = 10.0
 X402_RETRY_DELAY_MS = 1000
 X402_RETRY_DELAY_SECONDS = 1.0
 X402_MAX_RETRIES = 3
+X402_BATCH_MAX_PAYMENTS = 100
+X402_BATCH_MAX_CONCURRENCY = 32
+X402_BATCH_MAX_PER_HOST = 4
+X402_REQUIREMENTS_TTL_SECONDS = 300.0
+X402_REQUIREMENTS_MAX_ENTRIES = 1024
+X402_SIGN_PROCESS_POOL_THRESHOLD = 512
+RPC_TIMEOUT_SECONDS = 10.0
+RPC_MAX_CONNECTIONS = 20
+RPC_KEEPALIVE_SECONDS = 30.0
+RPC_BATCH_MAX_CALLS = 100
+HTTP_MAX_CONNECTIONS_PER_HOST = 20
+HTTP_MAX_KEEPALIVE_PER_HOST = 10
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+HTTP_MAX_TRACKED_HOSTS = 256
+
+# Near cache (in-process L1 in front of Redis)
+NEAR_CACHE_MAX_ENTRIES = 2048
+NEAR_CACHE_TTL_SECONDS = 30.0
+NEAR_CACHE_INVALIDATION_CHANNEL = "paygent:cache:invalidate"
+
+# Cache stampede protection (single-flight, Redis lease, XFetch early refresh)
+CACHE_LEASE_TTL_MS = 10000
+CACHE_LEASE_WAIT_SECONDS = 5.0
+CACHE_XFETCH_BETA = 1.0
+
+# Cache value codec
+CACHE_COMPRESS_MIN_BYTES = 1024
+
+# Market data stale-while-revalidate caches
+QUOTE_CACHE_FRESH_SECONDS = 2.0
+QUOTE_CACHE_STALE_SECONDS = 30.0
+PRICE_CACHE_FRESH_SECONDS = 5.0
+PRICE_CACHE_STALE_SECONDS = 60.0
+MARKET_CACHE_MAX_ENTRIES = 1024
+
+# Service discovery ranking (share of text relevance vs reputation)
+SERVICE_SEARCH_RELEVANCE_WEIGHT = 0.7
+
+# Data retention
+RETENTION_BATCH_SIZE = 1000
+RETENTION_THROTTLE_MS = 50
+EXECUTION_LOG_RETENTION_DAYS = 30
+APPROVAL_EXPIRY_HOURS = 24
+APPROVAL_RETENTION_DAYS = 90
+SESSION_RETENTION_DAYS = 90
+
+# Write-behind execution recorder
+EXECUTION_RECORDER_QUEUE_SIZE = 10000
+EXECUTION_RECORDER_BATCH_SIZE = 200
+EXECUTION_RECORDER_FLUSH_INTERVAL_MS = 50
+EXECUTION_RECORDER_SHUTDOWN_TIMEOUT_SECONDS = 30.0
 
 # Database Constants
 DB_POOL_RECYCLE_SECONDS = 300
 DB_POOL_SIZE = 10
 DB_MAX_OVERFLOW = 20
+DB_POOL_TIMEOUT_SECONDS = 30.0
+DB_BACKGROUND_POOL_SIZE = 2
+DB_BACKGROUND_MAX_OVERFLOW = 3
+DB_REPORTING_POOL_SIZE = 3
+DB_REPORTING_MAX_OVERFLOW = 5
 
 # Rate Limiting Constants
 DEFAULT_RATE_LIMIT_REQUESTS_PER_MINUTE = 100
+RATE_LIMIT_WINDOW_SECONDS = 60
+RATE_LIMIT_MAX_TRACKED_KEYS = 10000
 MCP_RATE_LIMIT_DELAY_SECONDS = 0.1
 
 # Pagination Constants
@@ -43,6 +101,14 @@ AGENT_MAX_ITERATIONS = 50
 AGENT_TIMEOUT_SECONDS = 300
 AGENT_DEFAULT_BUDGET_USD = 100.0
 HITL_APPROVAL_THRESHOLD_USD = 10.0
+AGENT_MEMORY_WINDOW = 20
+AGENT_MEMORY_MAX_SESSIONS = 1000
+PLAN_MAX_CONCURRENCY = 4
+COMMAND_PARSE_CACHE_SIZE = 4096
+LLM_CACHE_MAX_ENTRIES = 1024
+LLM_CACHE_DEFAULT_TTL_SECONDS = 300
+LLM_CACHE_SIMILARITY_THRESHOLD = 0.92
+AGENT_GRAPH_REGISTRY_SIZE = 32
 JWT_EXPIRATION_HOURS = 24
 
 # Financial Constants
@@ -6,17 +6,27 @@ management for the Paygent application.
 """
 
 import logging
+import time
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
 
+from sqlalchemy import insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, PoolProxiedConnection
 
 from src.core.config import settings
+from src.services.metrics_service import pool_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -26,38 +36,193 @@ class Base(DeclarativeBase):
     pass
 
 
-# Create async engine
+REQUEST_PROFILE = "request"
+BACKGROUND_PROFILE = "background"
+REPORTING_PROFILE = "reporting"
+
+
+@dataclass(frozen=True)
+class PoolProfile:
+    """Connection pool sizing for one class of database workload."""
+
+    name: str
+    pool_size: int
+    max_overflow: int
+    pool_recycle: int
+    pool_timeout: float
+    pre_ping: bool = True
+
+
+def get_pool_profiles() -> dict[str, PoolProfile]:
+    """
+    Build the pool profiles from settings.
+
+    Request traffic, background jobs and reporting queries get separate pools so
+    a burst of slow reports or a renewal sweep cannot starve API requests.
+
+    Returns:
+        dict[str, PoolProfile]: Pool profiles keyed by profile name
+    """
+    def profile(name: str, pool_size: int, max_overflow: int) -> PoolProfile:
+        return PoolProfile(
+            name=name,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pre_ping=settings.db_pool_pre_ping,
+        )
+
+    return {
+        REQUEST_PROFILE: profile(
+            REQUEST_PROFILE, settings.db_pool_size, settings.db_max_overflow
+        ),
+        BACKGROUND_PROFILE: profile(
+            BACKGROUND_PROFILE,
+            settings.db_background_pool_size,
+            settings.db_background_max_overflow,
+        ),
+        REPORTING_PROFILE: profile(
+            REPORTING_PROFILE,
+            settings.db_reporting_pool_size,
+            settings.db_reporting_max_overflow,
+        ),
+    }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout latency and waits."""
+
+    def capacity(self) -> int:
+        """Get the maximum number of connections (pool size plus overflow)."""
+        if self._max_overflow < 0:
+            return 0
+        return self.size() + self._max_overflow
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, recording latency against the pool profile."""
+        capacity = self.capacity()
+        waited = self.checkedin() == 0 and 0 < capacity <= self.checkedout()
+        start_time = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except SQLAlchemyTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            pool_metrics.record_checkout(
+                self.logging_name or REQUEST_PROFILE,
+                (time.perf_counter() - start_time) * 1000,
+                waited=waited,
+                timed_out=timed_out,
+            )
+
+
+def normalize_database_url(url: str) -> str:
+    """Convert a database URL to its async driver form."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://")
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://")
+    return url
+
+
+def pooling_enabled(url: str) -> bool:
+    """
+    Check whether a database URL should use a pooled engine.
+
+    SQLite is never pooled: aiosqlite connections are cheap and an in-memory
+    database must not be shared across a queue pool.
+    """
+    if "sqlite" in url:
+        return False
+    return settings.db_pool_mode.lower() in ("auto", "queue")
+
+
+def create_engine_for_profile(url: str, profile: PoolProfile) -> AsyncEngine:
+    """
+    Create an async engine for a workload profile.
+
+    Args:
+        url: Async database URL
+        profile: Pool profile to size the engine's pool with
+
+    Returns:
+        AsyncEngine: Pooled engine for PostgreSQL, NullPool engine for SQLite
+    """
+    if not pooling_enabled(url):
+        # SQLite-specific connection arguments for better concurrency
+        sqlite_args = {
+            "check_same_thread": False,
+            "uri": True,
+        } if "sqlite" in url else {}
+        return create_async_engine(
+            url,
+            echo=settings.debug,
+            poolclass=NullPool,
+            pool_pre_ping=profile.pre_ping,
+            connect_args=sqlite_args,
+        )
+
+    pooled_engine = create_async_engine(
+        url,
+        echo=settings.debug,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_recycle=profile.pool_recycle,
+        pool_timeout=profile.pool_timeout,
+        pool_pre_ping=profile.pre_ping,
+        pool_use_lifo=True,
+        pool_logging_name=profile.name,
+    )
+    pool_metrics.register_pool(profile.name, lambda: pooled_engine.sync_engine.pool)
+    logger.info(
+        f"Database pool '{profile.name}': size={profile.pool_size}, "
+        f"overflow={profile.max_overflow}, recycle={profile.pool_recycle}s"
+    )
+    return pooled_engine
+
+
+# Create async engines
 # Handle different database URLs (PostgreSQL, SQLite)
-db_url = settings.effective_database_url
-if db_url.startswith("postgresql://"):
-    db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
-elif db_url.startswith("sqlite://"):
-    db_url = db_url.replace("sqlite://", "sqlite+aiosqlite://")
-
-# SQLite-specific connection arguments for better concurrency
-sqlite_args = {
-    "check_same_thread": False,
-    "uri": True,
-} if "sqlite" in db_url else {}
-
-# Async engines use NullPool by default - QueuePool is not compatible with async
-# Use NullPool for all async database connections
-engine = create_async_engine(
-    db_url,
-    echo=settings.debug,
-    poolclass=NullPool,
-    pool_pre_ping=True,
-    connect_args=sqlite_args,
-)
+db_url = normalize_database_url(settings.effective_database_url)
+reporting_db_url = normalize_database_url(settings.reporting_database_url or db_url)
+pool_profiles = get_pool_profiles()
+
+engine = create_engine_for_profile(db_url, pool_profiles[REQUEST_PROFILE])
+
+# Without pooling there is nothing to isolate, so all workloads share one engine
+# (this also keeps SQLite in-memory databases visible to every session factory).
+if pooling_enabled(db_url):
+    background_engine = create_engine_for_profile(db_url, pool_profiles[BACKGROUND_PROFILE])
+else:
+    background_engine = engine
+
+if pooling_enabled(reporting_db_url) or reporting_db_url != db_url:
+    reporting_engine = create_engine_for_profile(
+        reporting_db_url, pool_profiles[REPORTING_PROFILE]
+    )
+else:
+    reporting_engine = engine
+
+
+def _make_session_maker(bind: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create a session factory bound to an engine."""
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
 
-# Create async session factory
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+
+# Create async session factories
+async_session_maker = _make_session_maker(engine)
+background_session_maker = _make_session_maker(background_engine)
+reporting_session_maker = _make_session_maker(reporting_engine)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -86,6 +251,103 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_reporting_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a session for read-only reporting queries.
+
+    Sessions come from the reporting pool (or read replica when
+    ``REPORTING_DATABASE_URL`` is set) and are never committed.
+
+    Yields:
+        AsyncSession: Read-only database session for the request.
+    """
+    async with reporting_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+
+@asynccontextmanager
+async def background_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a session from the background-job pool.
+
+    Use this for work that runs outside a request, such as subscription
+    renewal sweeps and log cleanup.
+
+    Example:
+        ```python
+        async with background_session() as db:
+            await ExecutionLogService(db).cleanup_old_logs()
+        ```
+    """
+    async with background_session_maker() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+async def upsert_increment(
+    db: AsyncSession,
+    model: type[Base],
+    key: dict[str, Any],
+    increments: dict[str, Any],
+    values: dict[str, Any] | None = None,
+) -> None:
+    """
+    Add to counter columns of the row at ``key``, creating it if missing.
+
+    Uses an atomic INSERT ... ON CONFLICT DO UPDATE on Postgres and SQLite,
+    so concurrent writers to one row don't lose increments. Other dialects
+    fall back to UPDATE, then INSERT if no row matched. Runs in the caller's
+    transaction.
+
+    Args:
+        db: Database session
+        model: Mapped class whose primary key is ``key``
+        key: Primary key column values
+        increments: Counter column deltas (initial values for a new row)
+        values: Other columns to overwrite on every write
+    """
+    values = values or {}
+    table = model.__table__
+    dialect = db.get_bind().dialect.name
+
+    if dialect in UPSERT_INSERTS:
+        stmt = UPSERT_INSERTS[dialect](table).values(**key, **increments, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key),
+            set_={
+                **{name: table.c[name] + stmt.excluded[name] for name in increments},
+                **{name: stmt.excluded[name] for name in values},
+            },
+        )
+        await db.execute(stmt)
+        return
+
+    result = await db.execute(
+        update(table)
+        .where(*(table.c[name] == value for name, value in key.items()))
+        .values(
+            **{name: table.c[name] + delta for name, delta in increments.items()},
+            **values,
+        )
+    )
+    if result.rowcount == 0:
+        await db.execute(insert(table).values(**key, **increments, **values))
+
+
 async def init_db() -> None:
     """
     Initialize the database by creating all tables.
@@ -103,6 +365,7 @@ async def init_db() -> None:
 
 
 async def close_db() -> None:
-    """Close the database engine and cleanup connections."""
-    await engine.dispose()
+    """Close the database engines and cleanup connections."""
+    for profile_engine in {id(e): e for e in (engine, background_engine, reporting_engine)}.values():
+        await profile_engine.dispose()
     logger.info("Database connections closed")
@@ -0,0 +1,270 @@
+"""
+Shared outbound HTTP clients.
+
+This module provides an application-scoped registry of ``httpx.AsyncClient``
+instances so that every call to the same paid service, the x402 facilitator,
+the MCP server or an alert webhook reuses pooled TCP/TLS connections instead
+of opening new ones per service instance or per request.
+
+Each client routes every origin (scheme, host, port) to its own connection
+pool, so connection and keep-alive limits apply per host and one slow host
+cannot starve the others. HTTP/2 is negotiated when the ``h2`` package is
+installed. Reuse and per-host in-flight requests are exported as Prometheus
+metrics.
+
+The registry is created in the FastAPI lifespan and closed on shutdown;
+code running outside the app (scripts, tests) gets a lazily created client.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import httpx
+
+from src.core.config import settings
+from src.services.metrics_service import metrics_collector
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# httpcore trace events emitted only when a new connection is opened
+NEW_CONNECTION_EVENTS = frozenset({
+    "connection.connect_tcp.started",
+    "connection.connect_unix_socket.started",
+})
+
+Origin = tuple[bytes, bytes, int | None]
+
+
+class _InFlightStream(httpx.AsyncByteStream):
+    """Response stream that runs a callback once when the body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+        await self._stream.aclose()
+
+
+class PerHostTransport(httpx.AsyncBaseTransport):
+    """
+    Transport with one connection pool per origin.
+
+    Pools are bound to the event loop that opened their connections, so all
+    pools are dropped when the transport is first used from a new loop. At
+    most ``max_hosts`` origins get a dedicated pool; any further origins
+    share a single overflow pool.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits,
+        http2: bool = False,
+        max_hosts: int = settings.http_max_tracked_hosts,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            limits: Connection limits applied to each origin's pool
+            http2: Whether to negotiate HTTP/2 (requires ``h2``)
+            max_hosts: Maximum origins with a dedicated pool
+        """
+        self.limits = limits
+        self.http2 = http2
+        self.max_hosts = max_hosts
+        self._pools: dict[Origin, httpx.AsyncHTTPTransport] = {}
+        self._overflow: httpx.AsyncHTTPTransport | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _new_pool(self) -> httpx.AsyncHTTPTransport:
+        return httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+
+    def _pool_for(self, request: httpx.Request) -> httpx.AsyncHTTPTransport:
+        """Get (or create) the connection pool for a request's origin."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Connections from a previous (closed) loop cannot be reused
+            self._pools = {}
+            self._overflow = None
+            self._loop = loop
+
+        origin = (request.url.raw_scheme, request.url.raw_host, request.url.port)
+        pool = self._pools.get(origin)
+        if pool is not None:
+            return pool
+
+        if len(self._pools) < self.max_hosts:
+            pool = self._pools[origin] = self._new_pool()
+            return pool
+
+        if self._overflow is None:
+            logger.warning(f"More than {self.max_hosts} HTTP origins in use, sharing an overflow pool")
+            self._overflow = self._new_pool()
+        return self._overflow
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        pool = self._pool_for(request)
+        host = request.url.host
+        opened_connection = False
+        outer_trace: Callable[[str, dict[str, Any]], Awaitable[None]] | None = (
+            request.extensions.get("trace")
+        )
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal opened_connection
+            if event_name in NEW_CONNECTION_EVENTS:
+                opened_connection = True
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        in_flight = metrics_collector.http_client_in_flight.labels(host)
+        in_flight.inc()
+        try:
+            response = await pool.handle_async_request(request)
+        except BaseException:
+            in_flight.dec()
+            raise
+
+        metrics_collector.record_http_client_request(host, reused=not opened_connection)
+        # The request stays in flight until its body has been read and closed
+        response.stream = _InFlightStream(response.stream, in_flight.dec)
+        return response
+
+    async def aclose(self) -> None:
+        pools = list(self._pools.values())
+        if self._overflow is not None:
+            pools.append(self._overflow)
+        self._pools = {}
+        self._overflow = None
+
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        if self._loop is not current_loop:
+            # Pools from another loop cannot be awaited; drop them.
+            return
+
+        for pool in pools:
+            try:
+                await pool.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP connection pool: {e}")
+
+
+class HTTPClientRegistry:
+    """
+    Application-scoped registry of pooled HTTP clients.
+
+    Most callers share the ``default`` client; a separately named client
+    only makes sense for traffic that needs isolated limits.
+    """
+
+    def __init__(
+        self,
+        timeout: float = settings.http_timeout_seconds,
+        max_connections_per_host: int = settings.http_max_connections_per_host,
+        max_keepalive_per_host: int = settings.http_max_keepalive_per_host,
+        keepalive_expiry: float = settings.http_keepalive_expiry_seconds,
+        http2: bool = settings.http2_enabled,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            timeout: Default request timeout in seconds
+            max_connections_per_host: Maximum open connections per origin
+            max_keepalive_per_host: Maximum idle keep-alive connections per origin
+            keepalive_expiry: Seconds an idle connection is kept before closing
+            http2: Negotiate HTTP/2 when the ``h2`` package is installed
+        """
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_keepalive_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=PerHostTransport(self.limits, http2=self.http2),
+        )
+
+    def get(self, name: str = "default") -> httpx.AsyncClient:
+        """
+        Get a shared client, creating it on first use or after it was closed.
+
+        Args:
+            name: Client name
+
+        Returns:
+            httpx.AsyncClient: Shared pooled client
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._create_client()
+            self._clients[name] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client and its connection pools."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client: {e}")
+
+
+# Global HTTP client registry
+http_clients = HTTPClientRegistry()
+
+
+def get_http_client(name: str = "default") -> httpx.AsyncClient:
+    """
+    Get a shared pooled HTTP client from the global registry.
+
+    Args:
+        name: Client name
+
+    Returns:
+        httpx.AsyncClient: Shared pooled client
+    """
+    return http_clients.get(name)
+
+
+async def init_http_clients() -> HTTPClientRegistry:
+    """Create the default shared HTTP client on application startup."""
+    http_clients.get()
+    protocol = "HTTP/2" if http_clients.http2 else "HTTP/1.1"
+    logger.info(
+        f"Shared HTTP client ready ({protocol}, "
+        f"{http_clients.limits.max_connections} connections per host)"
+    )
+    return http_clients
+
+
+async def close_http_clients() -> None:
+    """Close all shared HTTP clients on application shutdown."""
+    await http_clients.aclose()
@@ -3,20 +3,236 @@ Session memory manager for persistent conversation storage.
 
 This module provides memory persistence across agent command executions
 using the database-backed AgentMemory model.
+
+Agents only ever use the most recent turns of a conversation, so memory is
+loaded as a bounded window: the last N entries are fetched with a single
+``ORDER BY timestamp DESC LIMIT N`` query (served by the
+``(session_id, timestamp)`` index) and kept in a process-wide per-session
+LRU that is updated incrementally as new entries are saved. Entries that
+fall out of the window are folded into a compact running summary.
 """
 
 import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.models.agent_sessions import AgentMemory
 
 logger = logging.getLogger(__name__)
 
+# Number of older user requests quoted verbatim in the running summary
+SUMMARY_RECENT_COMMANDS = 3
+SUMMARY_COMMAND_MAX_CHARS = 80
+
+
+def memory_entry_from_record(record: AgentMemory) -> dict[str, Any]:
+    """Convert an AgentMemory row to the in-memory entry format."""
+    return {
+        "type": record.message_type,
+        "content": record.content,
+        "timestamp": record.timestamp.isoformat() if record.timestamp else None,
+        "metadata": record.extra_data or {},
+    }
+
+
+@dataclass
+class MemorySummary:
+    """Compact running summary of entries older than the memory window."""
+
+    message_count: int = 0
+    intent_counts: dict[str, int] = field(default_factory=dict)
+    recent_commands: deque[str] = field(
+        default_factory=lambda: deque(maxlen=SUMMARY_RECENT_COMMANDS)
+    )
+
+    def add(self, entry: dict[str, Any]) -> None:
+        """Fold an entry that left the window into the summary."""
+        self.message_count += 1
+        if entry.get("type") != "human":
+            return
+        intent = (entry.get("metadata") or {}).get("intent")
+        if intent:
+            self.intent_counts[intent] = self.intent_counts.get(intent, 0) + 1
+        content = entry.get("content") or ""
+        if len(content) > SUMMARY_COMMAND_MAX_CHARS:
+            content = content[:SUMMARY_COMMAND_MAX_CHARS - 3] + "..."
+        self.recent_commands.append(content)
+
+    def render(self) -> str:
+        """Render the summary as a single line for LLM prompts."""
+        if not self.message_count:
+            return ""
+        parts = [f"Earlier in this session: {self.message_count} messages"]
+        if self.intent_counts:
+            intents = ", ".join(
+                f"{intent} x{count}"
+                for intent, count in sorted(self.intent_counts.items(), key=lambda item: -item[1])
+            )
+            parts.append(f"intents: {intents}")
+        if self.recent_commands:
+            parts.append("earlier requests: " + "; ".join(self.recent_commands))
+        return ". ".join(parts)
+
+
+class SessionWindow:
+    """The most recent memory entries of one session plus an optional summary."""
+
+    __slots__ = ("entries", "summary")
+
+    def __init__(
+        self,
+        entries: list[dict[str, Any]],
+        window: int,
+        summary: MemorySummary | None = None,
+    ):
+        self.entries: deque[dict[str, Any]] = deque(entries[-window:], maxlen=window)
+        self.summary = summary
+
+    def append(self, entry: dict[str, Any]) -> None:
+        """Append an entry, folding the evicted one into the summary."""
+        if len(self.entries) == self.entries.maxlen:
+            evicted = self.entries[0]
+            if self.summary is not None:
+                self.summary.add(evicted)
+        self.entries.append(entry)
+
+
+class RecentTurnsCache:
+    """
+    Process-wide LRU of recent memory windows, keyed by session ID.
+
+    Holds at most ``max_sessions`` windows of at most ``window`` entries
+    each. Windows are only ever created from a database load, so a cached
+    window is always a faithful suffix of the stored history as written by
+    this process; callers invalidate a session whenever a write may not
+    have been persisted.
+    """
+
+    def __init__(
+        self,
+        window: int = settings.agent_memory_window,
+        max_sessions: int = settings.agent_memory_max_sessions,
+        summarize: bool = settings.agent_memory_summary_enabled,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            window: Maximum entries kept per session
+            max_sessions: Maximum sessions kept before evicting the least
+                recently used
+            summarize: Whether to keep a running summary of older entries
+        """
+        self.window = window
+        self.max_sessions = max_sessions
+        self.summarize = summarize
+        self.hits = 0
+        self.misses = 0
+        self._sessions: OrderedDict[UUID, SessionWindow] = OrderedDict()
+
+    def get(self, session_id: UUID) -> SessionWindow | None:
+        """Get the cached window for a session, marking it recently used."""
+        session_window = self._sessions.get(session_id)
+        if session_window is None:
+            self.misses += 1
+            return None
+        self._sessions.move_to_end(session_id)
+        self.hits += 1
+        return session_window
+
+    def put(
+        self,
+        session_id: UUID,
+        entries: list[dict[str, Any]],
+        summary: MemorySummary | None = None,
+    ) -> SessionWindow:
+        """Cache a window loaded from the database."""
+        if summary is None and self.summarize:
+            summary = MemorySummary()
+        session_window = SessionWindow(entries, self.window, summary)
+        self._sessions[session_id] = session_window
+        self._sessions.move_to_end(session_id)
+        if len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        return session_window
+
+    def append(self, session_id: UUID, entry: dict[str, Any]) -> None:
+        """Append a newly saved entry to a cached window, if there is one."""
+        session_window = self._sessions.get(session_id)
+        if session_window is not None:
+            session_window.append(entry)
+
+    def invalidate(self, session_id: UUID) -> None:
+        """Drop a session so its next load reads from the database."""
+        self._sessions.pop(session_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached sessions."""
+        self._sessions.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+# Global recent-turns cache shared by all executors in this process
+recent_turns_cache = RecentTurnsCache()
+
+
+async def load_memory_window(
+    db: AsyncSession,
+    session_id: UUID,
+    cache: RecentTurnsCache | None = None,
+) -> SessionWindow:
+    """
+    Load the most recent memory entries for a session.
+
+    Served from the recent-turns cache when possible; otherwise only the
+    last ``cache.window`` rows are selected, plus one COUNT query for the
+    summary when the window is full.
+
+    Args:
+        db: Database session
+        session_id: Agent session ID
+        cache: Recent-turns cache (defaults to the global cache)
+
+    Returns:
+        SessionWindow: Recent entries in chronological order
+    """
+    cache = cache if cache is not None else recent_turns_cache
+    session_window = cache.get(session_id)
+    if session_window is not None:
+        return session_window
+
+    result = await db.execute(
+        select(AgentMemory)
+        .where(AgentMemory.session_id == session_id)
+        .order_by(desc(AgentMemory.timestamp))
+        .limit(cache.window)
+    )
+    entries = [memory_entry_from_record(record) for record in reversed(result.scalars().all())]
+
+    summary = None
+    if cache.summarize:
+        summary = MemorySummary()
+        if len(entries) == cache.window:
+            total = await db.scalar(
+                select(func.count())
+                .select_from(AgentMemory)
+                .where(AgentMemory.session_id == session_id)
+            )
+            summary.message_count = max(0, (total or 0) - len(entries))
+
+    return cache.put(session_id, entries, summary)
+
 
 class SessionMemoryManager:
     """
@@ -80,6 +296,7 @@ class SessionMemoryManager:
         )
         self.db.add(agent_memory)
         await self.db.commit()
+        recent_turns_cache.invalidate(self.session_id)
 
         logger.info(f"Stored conversation for session {self.session_id}")
         return agent_memory.id
@@ -160,6 +377,7 @@ class SessionMemoryManager:
             delete(AgentMemory).where(AgentMemory.session_id == self.session_id)
         )
         await self.db.commit()
+        recent_turns_cache.invalidate(self.session_id)
         logger.info(f"Cleared all memory for session {self.session_id}")
 
     async def get_memory_count(self) -> int:
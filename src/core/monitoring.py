@@ -7,14 +7,16 @@ for agent execution, API endpoints, and system operations.
 
 import asyncio
 import logging
-import statistics
 import time
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, TypeVar
 
+from src.core.prometheus import DEFAULT_LATENCY_BUCKETS_MS, estimate_quantile
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -38,12 +40,23 @@ class MetricValue:
 
 @dataclass
 class PerformanceStats:
-    """Statistics for a set of measurements."""
+    """
+    Statistics for a set of measurements.
+
+    Values are counted into fixed latency buckets (milliseconds) instead of
+    being stored, so memory is constant and percentiles are estimated by
+    interpolating within the bucket that contains them.
+    """
     count: int = 0
     min_val: float = float('inf')
     max_val: float = float('-inf')
     sum_val: float = 0.0
-    values: list[float] = field(default_factory=list)
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS
+    bucket_counts: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
 
     def add_value(self, value: float) -> None:
         """Add a new value to the statistics."""
@@ -51,29 +64,52 @@ class PerformanceStats:
         self.min_val = min(self.min_val, value)
         self.max_val = max(self.max_val, value)
         self.sum_val += value
-        self.values.append(value)
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
 
     def get_average(self) -> float:
         """Get the average value."""
         return self.sum_val / self.count if self.count > 0 else 0.0
 
+    def get_quantile(self, q: float) -> float:
+        """Get an estimated quantile, clamped to the observed range."""
+        if self.count == 0:
+            return 0.0
+        estimate = estimate_quantile(q, self.buckets, self.bucket_counts)
+        return min(max(estimate, self.min_val), self.max_val)
+
     def get_median(self) -> float:
         """Get the median value."""
-        if not self.values:
-            return 0.0
-        return statistics.median(self.values)
+        return self.get_quantile(0.5)
 
     def get_p95(self) -> float:
         """Get the 95th percentile."""
-        if len(self.values) < 2:
-            return self.values[0] if self.values else 0.0
-        return statistics.quantiles(self.values, n=100)[94]
+        return self.get_quantile(0.95)
 
     def get_p99(self) -> float:
         """Get the 99th percentile."""
-        if len(self.values) < 2:
-            return self.values[0] if self.values else 0.0
-        return statistics.quantiles(self.values, n=100)[98]
+        return self.get_quantile(0.99)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise the statistics, including raw bucket counts for merging."""
+        return {
+            "count": self.count,
+            "min": self.min_val if self.count > 0 else 0,
+            "max": self.max_val if self.count > 0 else 0,
+            "average": self.get_average(),
+            "median": self.get_median(),
+            "p95": self.get_p95(),
+            "p99": self.get_p99(),
+            "buckets": list(self.bucket_counts),
+        }
+
+
+def merge_quantile(stats_list: list[dict[str, Any]], q: float) -> float:
+    """Estimate a quantile across several ``PerformanceStats.to_dict()`` results."""
+    merged = [0] * (len(DEFAULT_LATENCY_BUCKETS_MS) + 1)
+    for stats in stats_list:
+        for index, bucket_count in enumerate(stats.get("buckets", [])):
+            merged[index] += bucket_count
+    return estimate_quantile(q, DEFAULT_LATENCY_BUCKETS_MS, merged)
 
 
 class PerformanceRegistry:
@@ -84,14 +120,14 @@ class PerformanceRegistry:
         Initialize the performance registry.
 
         Args:
-            max_history: Maximum number of historical values to keep
+            max_history: Kept for compatibility; timings are bucketed, so
+                memory no longer grows with the number of observations
         """
         self.max_history = max_history
-        self._metrics: dict[str, list[MetricValue]] = defaultdict(list)
         self._counters: dict[str, int] = defaultdict(int)
         self._gauges: dict[str, float] = {}
         self._histograms: dict[str, PerformanceStats] = defaultdict(PerformanceStats)
-        self._timers: dict[str, list[float]] = defaultdict(list)
+        self._timers: dict[str, PerformanceStats] = defaultdict(PerformanceStats)
         self._labels: dict[str, dict[str, str]] = {}
 
     def counter(self, name: str, labels: dict[str, str] | None = None) -> None:
@@ -115,10 +151,7 @@ class PerformanceRegistry:
     def timer(self, name: str, duration_ms: float, labels: dict[str, str] | None = None) -> None:
         """Record a timing metric."""
         key = self._make_key(name, labels)
-        self._timers[key].append(duration_ms)
-        # Keep only recent timers to prevent memory growth
-        if len(self._timers[key]) > self.max_history:
-            self._timers[key] = self._timers[key][-self.max_history:]
+        self._timers[key].add_value(duration_ms)
         self._labels[key] = labels or {}
 
     def _make_key(self, name: str, labels: dict[str, str] | None = None) -> str:
@@ -146,11 +179,7 @@ class PerformanceRegistry:
     def get_timer_stats(self, name: str, labels: dict[str, str] | None = None) -> PerformanceStats:
         """Get timer statistics."""
         key = self._make_key(name, labels)
-        stats = PerformanceStats()
-        if key in self._timers:
-            for value in self._timers[key]:
-                stats.add_value(value)
-        return stats
+        return self._timers.get(key) or PerformanceStats()
 
     def get_all_metrics(self) -> dict[str, Any]:
         """Get all metrics in a structured format."""
@@ -163,35 +192,15 @@ class PerformanceRegistry:
         }
 
         for name, stats in self._histograms.items():
-            metrics["histograms"][name] = {
-                "count": stats.count,
-                "min": stats.min_val if stats.count > 0 else 0,
-                "max": stats.max_val if stats.count > 0 else 0,
-                "average": stats.get_average(),
-                "median": stats.get_median(),
-                "p95": stats.get_p95(),
-                "p99": stats.get_p99(),
-            }
-
-        for name, timer_values in self._timers.items():
-            stats = PerformanceStats()
-            for value in timer_values:
-                stats.add_value(value)
-            metrics["timers"][name] = {
-                "count": stats.count,
-                "min": stats.min_val if stats.count > 0 else 0,
-                "max": stats.max_val if stats.count > 0 else 0,
-                "average": stats.get_average(),
-                "median": stats.get_median(),
-                "p95": stats.get_p95(),
-                "p99": stats.get_p99(),
-            }
+            metrics["histograms"][name] = stats.to_dict()
+
+        for name, stats in self._timers.items():
+            metrics["timers"][name] = stats.to_dict()
 
         return metrics
 
     def reset(self) -> None:
         """Reset all metrics."""
-        self._metrics.clear()
         self._counters.clear()
         self._gauges.clear()
         self._histograms.clear()
@@ -484,47 +493,16 @@ class PerformanceMonitor:
         return total_time / total_count if total_count > 0 else 0.0
 
     def _calculate_p95_response_time(self, timings: dict[str, dict]) -> float:
-        """Calculate 95th percentile response time."""
+        """Calculate 95th percentile response time across all endpoints."""
         if not timings:
             return 0.0
-
-        all_values = []
-        for stats in timings.values():
-            # Use individual values if available, otherwise use samples based on count
-            if "values" in stats:
-                all_values.extend(stats["values"])
-            else:
-                # If no individual values, approximate using count and average
-                # This is a simplification for when we don't have detailed timing data
-                pass
-
-        if not all_values:
-            return 0.0
-
-        try:
-            return statistics.quantiles(all_values, n=100)[94]
-        except statistics.StatisticsError:
-            return 0.0
+        return merge_quantile(list(timings.values()), 0.95)
 
     def _calculate_p95_execution_time(self, timings: dict[str, dict]) -> float:
-        """Calculate 95th percentile execution time."""
+        """Calculate 95th percentile execution time across all commands."""
         if not timings:
             return 0.0
-
-        all_values = []
-        for stats in timings.values():
-            if "values" in stats:
-                all_values.extend(stats["values"])
-            else:
-                pass
-
-        if not all_values:
-            return 0.0
-
-        try:
-            return statistics.quantiles(all_values, n=100)[94]
-        except statistics.StatisticsError:
-            return 0.0
+        return merge_quantile(list(timings.values()), 0.95)
 
     def _calculate_error_rate(self, metrics: dict[str, Any]) -> float:
         """Calculate API error rate percentage."""
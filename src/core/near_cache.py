@@ -0,0 +1,455 @@
+"""
+Two-tier near cache: in-process LRU (L1) in front of Redis (L2).
+
+Hot, small keys such as ``mcp_services``, ``price:{service_id}`` and
+``services:discover:*`` are read far more often than they change. The near
+cache keeps their decoded values in a bounded per-process LRU so repeat
+reads cost no I/O and no JSON decoding. Redis stays the shared source of
+truth.
+
+Every write, delete and pattern delete is published on a Redis pub/sub
+channel. All uvicorn workers subscribe to it and drop the affected L1
+entries, so a worker never serves a value that another worker has
+replaced. L1 entries also expire after ``near_cache_ttl_seconds`` or the
+key's remaining Redis TTL, whichever is sooner. This bounds staleness if
+an invalidation message is lost.
+
+Values returned from L1 are shared between callers and must be treated as
+read-only.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any
+
+from src.core.cache import CacheClient, CacheInterface, CacheMetrics, cache_client
+from src.core.cache_codec import CacheCodec, cache_codec
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class NearCache(CacheInterface):
+    """In-process LRU/TTL tier backed by Redis, with pub/sub invalidation."""
+
+    def __init__(
+        self,
+        backend: CacheClient = cache_client,
+        max_entries: int = settings.near_cache_max_entries,
+        ttl_seconds: float = settings.near_cache_ttl_seconds,
+        channel: str = settings.near_cache_channel,
+        enabled: bool = settings.near_cache_enabled,
+        codec: CacheCodec = cache_codec,
+    ):
+        """
+        Initialize the near cache.
+
+        Args:
+            backend: Redis cache client used as L2
+            max_entries: Maximum L1 entries; least recently used are evicted
+            ttl_seconds: Maximum seconds a value is served from L1
+            channel: Redis pub/sub channel for invalidations
+            enabled: Whether to use L1 at all (False: Redis only)
+            codec: Encoding for values stored in Redis
+        """
+        self.backend = backend
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.channel = channel
+        self.enabled = enabled
+        self.codec = codec
+        self.node_id = uuid.uuid4().hex
+        self.metrics = CacheMetrics()
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._listener: asyncio.Task | None = None
+        self._pubsub: Any | None = None
+
+    @property
+    def _l1_active(self) -> bool:
+        # Without a subscription there are no invalidations, so no L1 either
+        return (
+            self.enabled
+            and self.max_entries > 0
+            and self.backend.available
+            and self._listener is not None
+        )
+
+    # L1 operations
+
+    def _l1_get(self, key: str) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _l1_put(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        if not self._l1_active:
+            return
+        ttl = self.ttl_seconds if not ttl_seconds or ttl_seconds <= 0 else min(ttl_seconds, self.ttl_seconds)
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _l1_evict(self, keys: list[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def _l1_evict_pattern(self, pattern: str) -> None:
+        if pattern == "*":
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if fnmatchcase(key, pattern)]:
+            del self._entries[key]
+
+    def _l1_fill(self, key: str, raw: Any, pttl_ms: int | None) -> Any:
+        value = self.codec.decode(raw)
+        if pttl_ms is not None and pttl_ms > 0:
+            self._l1_put(key, value, pttl_ms / 1000)
+        elif pttl_ms is None or pttl_ms == -1:  # unknown or no expiry
+            self._l1_put(key, value)
+        return value
+
+    # Invalidation
+
+    async def _publish(self, keys: list[str] | None = None, pattern: str | None = None) -> None:
+        """Tell other workers to drop keys (or a key pattern) from their L1."""
+        client = self.backend.client
+        if client is None or not self.enabled:
+            return
+        message = {"origin": self.node_id}
+        if keys:
+            message["keys"] = keys
+        if pattern:
+            message["pattern"] = pattern
+        try:
+            await client.publish(self.channel, json.dumps(message))
+        except Exception as e:
+            logger.warning(f"Near cache invalidation publish failed: {e}")
+
+    def handle_invalidation(self, data: Any) -> None:
+        """
+        Apply an invalidation message from the pub/sub channel.
+
+        Args:
+            data: Message payload (JSON with ``origin``, ``keys`` and/or ``pattern``)
+        """
+        try:
+            message = json.loads(data.decode("utf-8") if isinstance(data, bytes) else data)
+        except (json.JSONDecodeError, AttributeError, TypeError):
+            logger.warning(f"Ignoring malformed near cache invalidation: {data!r}")
+            return
+        if message.get("origin") == self.node_id:
+            return
+        self._l1_evict(message.get("keys", []))
+        if message.get("pattern"):
+            self._l1_evict_pattern(message["pattern"])
+
+    async def start(self) -> None:
+        """Subscribe to invalidations; L1 is only used while subscribed."""
+        client = self.backend.client
+        if client is None or not self.enabled or self._listener is not None:
+            return
+        try:
+            self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(self.channel)
+        except Exception as e:
+            logger.warning(f"Near cache disabled, could not subscribe to {self.channel}: {e}")
+            self.enabled = False
+            return
+        self._listener = asyncio.create_task(self._listen())
+        logger.info(f"Near cache subscribed to {self.channel} ({self.max_entries} entries, {self.ttl_seconds}s TTL)")
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+                if message and message.get("type") == "message":
+                    self.handle_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Invalidations may have been missed; start from an empty L1
+                logger.warning(f"Near cache invalidation listener error: {e}")
+                self._entries.clear()
+                await asyncio.sleep(1.0)
+
+    async def close(self) -> None:
+        """Stop listening for invalidations and drop L1."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(self.channel)
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.debug(f"Near cache pub/sub close error: {e}")
+            self._pubsub = None
+        self._entries.clear()
+
+    # CacheInterface
+
+    async def get(self, key: str) -> Any | None:
+        """Get a value, from L1 when possible, else from Redis."""
+        start_time = time.time()
+        try:
+            if self._l1_active:
+                found, value = self._l1_get(key)
+                if found:
+                    self.metrics.record_hit()
+                    self.metrics.record_tier_hit("l1")
+                    return value
+                self.metrics.record_tier_miss("l1")
+
+            client = self.backend.client
+            if client is None:
+                self.metrics.record_miss()
+                return None
+
+            if self._l1_active:
+                # Read the remaining TTL in the same round trip so L1 never outlives L2
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                    raw, pttl_ms = await pipe.execute()
+            else:
+                raw, pttl_ms = await client.get(key), None
+
+            if raw is None:
+                self.metrics.record_miss()
+                self.metrics.record_tier_miss("l2")
+                return None
+
+            self.metrics.record_hit()
+            self.metrics.record_tier_hit("l2")
+            return self._l1_fill(key, raw, pttl_ms)
+
+        except Exception as e:
+            logger.error(f"Near cache get error for key {key}: {e}")
+            self.metrics.record_error()
+            return None
+        finally:
+            self.metrics.record_get_time((time.time() - start_time) * 1000)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """Set a value in Redis and L1, and invalidate it in other workers."""
+        start_time = time.time()
+        try:
+            serialized = self.codec.encode(value)
+            success = await self.backend.set(key, serialized, ttl_seconds)
+            self._l1_evict([key])
+            if success:
+                self._l1_put(key, self.codec.decode(serialized), ttl_seconds)
+                await self._publish(keys=[key])
+            return success
+        except Exception as e:
+            logger.error(f"Near cache set error for key {key}: {e}")
+            self.metrics.record_error()
+            return False
+        finally:
+            self.metrics.record_set_time((time.time() - start_time) * 1000)
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key everywhere."""
+        start_time = time.time()
+        try:
+            self._l1_evict([key])
+            success = await self.backend.delete(key)
+            await self._publish(keys=[key])
+            return success
+        finally:
+            self.metrics.record_delete_time((time.time() - start_time) * 1000)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get many values; L1 misses are fetched from Redis in one MGET."""
+        results: dict[str, Any] = {}
+        missing: list[str] = []
+        for key in keys:
+            found, value = self._l1_get(key) if self._l1_active else (False, None)
+            if found:
+                results[key] = value
+                self.metrics.record_hit()
+                self.metrics.record_tier_hit("l1")
+            else:
+                if self._l1_active:
+                    self.metrics.record_tier_miss("l1")
+                missing.append(key)
+
+        client = self.backend.client
+        if not missing or client is None:
+            return results
+
+        try:
+            values = await client.mget(missing)
+        except Exception as e:
+            logger.error(f"Near cache get_many error: {e}")
+            self.metrics.record_error()
+            return results
+
+        for key, raw in zip(missing, values, strict=True):
+            if raw is None:
+                self.metrics.record_miss()
+                self.metrics.record_tier_miss("l2")
+                continue
+            self.metrics.record_hit()
+            self.metrics.record_tier_hit("l2")
+            # MGET has no TTLs; cap L1 lifetime at the default
+            results[key] = self._l1_fill(key, raw, None)
+        return results
+
+    async def set_many(
+        self,
+        key_value_pairs: dict[str, Any],
+        ttl_seconds: int | None = None,
+    ) -> bool:
+        """Set many values in one pipeline."""
+        client = self.backend.client
+        if not key_value_pairs or client is None:
+            return False
+        try:
+            serialized = {key: self.codec.encode(value) for key, value in key_value_pairs.items()}
+            async with client.pipeline(transaction=False) as pipe:
+                for key, raw in serialized.items():
+                    if ttl_seconds:
+                        pipe.setex(key, ttl_seconds, raw)
+                    else:
+                        pipe.set(key, raw)
+                await pipe.execute()
+            for key, raw in serialized.items():
+                self._l1_put(key, self.codec.decode(raw), ttl_seconds)
+            self.metrics.record_set(count=len(serialized))
+            await self._publish(keys=list(serialized))
+            return True
+        except Exception as e:
+            logger.error(f"Near cache set_many error: {e}")
+            self.metrics.record_error()
+            self._l1_evict(list(key_value_pairs))
+            return False
+
+    async def invalidate(self, keys: list[str]) -> None:
+        """
+        Drop keys from L1 here and in every other worker, leaving Redis as is.
+
+        Use after changing a key in Redis directly (e.g. INCR).
+
+        Args:
+            keys: Keys to drop
+        """
+        self._l1_evict(keys)
+        await self._publish(keys=keys)
+
+    async def delete_many(self, keys: list[str]) -> int:
+        """Delete many keys everywhere."""
+        client = self.backend.client
+        if not keys:
+            return 0
+        self._l1_evict(keys)
+        if client is None:
+            return 0
+        try:
+            deleted = await client.delete(*keys)
+            await self._publish(keys=keys)
+            self.metrics.record_delete(count=deleted or 0)
+            return deleted or 0
+        except Exception as e:
+            logger.error(f"Near cache delete_many error: {e}")
+            self.metrics.record_error()
+            return 0
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """
+        Delete every key matching a glob pattern everywhere.
+
+        Args:
+            pattern: Redis glob pattern (e.g. ``services:*``)
+
+        Returns:
+            Number of Redis keys deleted
+        """
+        self._l1_evict_pattern(pattern)
+        client = self.backend.client
+        if client is None:
+            return 0
+        try:
+            keys = [key async for key in client.scan_iter(match=pattern)]
+            deleted = await client.delete(*keys) if keys else 0
+            await self._publish(pattern=pattern)
+            if deleted:
+                self.metrics.record_delete(count=deleted)
+            return deleted
+        except Exception as e:
+            logger.error(f"Near cache delete_pattern error for {pattern}: {e}")
+            self.metrics.record_error()
+            return 0
+
+    async def keys(self, pattern: str = "*") -> list[str]:
+        """Get all Redis keys matching a pattern."""
+        client = self.backend.client
+        if client is None:
+            return []
+        try:
+            return [
+                key.decode("utf-8") if isinstance(key, bytes) else key
+                async for key in client.scan_iter(match=pattern)
+            ]
+        except Exception as e:
+            logger.error(f"Near cache keys error: {e}")
+            return []
+
+    async def flush(self) -> bool:
+        """Clear L1 in every worker and flush the Redis database."""
+        self._entries.clear()
+        client = self.backend.client
+        if client is None:
+            return False
+        try:
+            await client.flushdb()
+            await self._publish(pattern="*")
+            return True
+        except Exception as e:
+            logger.error(f"Near cache flush error: {e}")
+            return False
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """Get cache metrics, including l1/l2 hit ratios."""
+        metrics = self.metrics.get_metrics()
+        metrics["l1_entries"] = len(self._entries)
+        return metrics
+
+    def get_info(self) -> dict[str, Any]:
+        """Get near cache configuration."""
+        return {
+            "backend": "redis" if self.backend.available else "none",
+            "l1_enabled": self._l1_active,
+            "l1_max_entries": self.max_entries,
+            "l1_ttl_seconds": self.ttl_seconds,
+            "invalidation_channel": self.channel,
+            "subscribed": self._listener is not None,
+            "codec": self.codec.get_info(),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global near cache
+near_cache = NearCache()
@@ -0,0 +1,157 @@
+"""
+Keyset (cursor) pagination.
+
+OFFSET pagination makes the database read and discard every skipped row, so
+deep pages get linearly slower, and a ``count(*)`` of the filtered query
+doubled the cost of every page. History endpoints instead page on
+``(created_at, id)``, newest first:
+
+    WHERE (created_at, id) < (:cursor_created_at, :cursor_id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit + 1
+
+This is served by a composite index ending in ``(created_at, id)``, and
+each page costs the same no matter how deep it is. The extra row shows
+whether another page exists. The cursor is an opaque token encoding the last
+row's key.
+
+Totals are opt-in: "exact" runs the count, "estimate" uses the Postgres
+planner's row estimate (exact on other databases), and "none" skips it.
+"""
+
+import base64
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TOTAL_MODES = ("none", "estimate", "exact")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Encode a row's sort key as an opaque cursor.
+
+    Args:
+        created_at: Row creation time
+        row_id: Row primary key
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        (created_at, id) of the last row of that page
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def apply_keyset(
+    stmt: Select,
+    created_at_column: Any,
+    id_column: Any,
+    cursor: str | None,
+    limit: int,
+) -> Select:
+    """
+    Order a statement newest first and start it after ``cursor``.
+
+    Fetches ``limit + 1`` rows; pass the result to ``split_page``.
+
+    Args:
+        stmt: Filtered select statement
+        created_at_column: Timestamp column of the sort key
+        id_column: Primary key column (tie-breaker)
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Page size
+
+    Returns:
+        Statement with keyset filter, ordering and limit
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        # Expanded row comparison; portable and still uses the index range
+        stmt = stmt.where(
+            or_(
+                created_at_column < created_at,
+                and_(created_at_column == created_at, id_column < row_id),
+            )
+        )
+    return stmt.order_by(created_at_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], limit: int) -> tuple[list[Any], str | None]:
+    """
+    Trim the lookahead row and build the next cursor.
+
+    Args:
+        rows: Rows fetched with ``apply_keyset`` (model instances with
+            ``created_at`` and ``id``)
+        limit: Page size
+
+    Returns:
+        (page rows, next cursor or None on the last page)
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    last = page[-1]
+    return page, encode_cursor(last.created_at, last.id)
+
+
+async def count_rows(db: AsyncSession, stmt: Select, mode: str) -> tuple[int | None, bool]:
+    """
+    Count the rows a filtered statement matches.
+
+    Args:
+        db: Database session
+        stmt: Filtered statement, without ordering or limit
+        mode: "none", "estimate" or "exact"
+
+    Returns:
+        (total or None, whether the total is an estimate)
+    """
+    if mode == "none":
+        return None, False
+
+    if mode == "estimate" and db.get_bind().dialect.name == "postgresql":
+        compiled = stmt.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True})
+        # Driver-level SQL: rendered timestamps contain ":" that text() would bind
+        conn = await db.connection()
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"]), True
+
+    result = await db.execute(select(func.count()).select_from(stmt.subquery()))
+    return result.scalar() or 0, False
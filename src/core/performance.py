@@ -7,6 +7,7 @@ This module provides performance optimizations to help meet the 200ms p95 respon
 import asyncio
 import logging
 import time
+from collections import deque
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
@@ -14,23 +15,28 @@ from typing import Any
 from sqlalchemy import select
 
 from src.core.cache import cache_result
+from src.core.prometheus import DEFAULT_LATENCY_BUCKETS_MS, HistogramValue
 from src.services.cache import CacheService
 from src.services.metrics_service import metrics_collector
 
 logger = logging.getLogger(__name__)
 
+# Number of recent slow requests kept for the report
+SLOW_REQUEST_HISTORY = 100
+
 
 class PerformanceOptimizer:
     """Performance optimization utilities for API endpoints."""
 
-    def __init__(self):
+    def __init__(self, max_slow_requests: int = SLOW_REQUEST_HISTORY):
         self.cache_service = CacheService()
-        self.response_times: list[float] = []
-        self.slow_requests: list[dict[str, Any]] = []
+        # Response times are bucketed (constant memory, no re-sorting)
+        self.response_times = HistogramValue(DEFAULT_LATENCY_BUCKETS_MS)
+        self.slow_requests: deque[dict[str, Any]] = deque(maxlen=max_slow_requests)
 
     def track_response_time(self, endpoint: str, duration_ms: float):
         """Track response time for performance analysis."""
-        self.response_times.append(duration_ms)
+        self.response_times.observe(duration_ms)
 
         # Track slow requests for analysis
         if duration_ms > 200:  # p95 target is 200ms
@@ -44,8 +50,11 @@ class PerformanceOptimizer:
             logger.warning(f"Slow request detected: {endpoint} took {duration_ms:.2f}ms")
 
     def get_performance_stats(self) -> dict[str, float]:
-        """Get performance statistics."""
-        if not self.response_times:
+        """Get performance statistics (percentiles are bucket estimates)."""
+        histogram = self.response_times
+        total_requests = histogram.count
+
+        if total_requests == 0:
             return {
                 "avg_response_time_ms": 0,
                 "p50_response_time_ms": 0,
@@ -55,27 +64,18 @@ class PerformanceOptimizer:
                 "slow_requests_count": len(self.slow_requests)
             }
 
-        # Sort response times
-        sorted_times = sorted(self.response_times)
-        total_requests = len(sorted_times)
-
-        # Calculate percentiles
-        p50_idx = int(total_requests * 0.5)
-        p95_idx = int(total_requests * 0.95)
-        p99_idx = int(total_requests * 0.99)
-
         return {
-            "avg_response_time_ms": sum(sorted_times) / total_requests,
-            "p50_response_time_ms": sorted_times[p50_idx] if p50_idx < total_requests else sorted_times[-1],
-            "p95_response_time_ms": sorted_times[p95_idx] if p95_idx < total_requests else sorted_times[-1],
-            "p99_response_time_ms": sorted_times[p99_idx] if p99_idx < total_requests else sorted_times[-1],
+            "avg_response_time_ms": histogram.sum / total_requests,
+            "p50_response_time_ms": histogram.quantile(0.5),
+            "p95_response_time_ms": histogram.quantile(0.95),
+            "p99_response_time_ms": histogram.quantile(0.99),
             "total_requests": total_requests,
             "slow_requests_count": len(self.slow_requests)
         }
 
     def get_slow_requests_report(self) -> list[dict[str, Any]]:
         """Get report of slow requests."""
-        return self.slow_requests[-10:]  # Last 10 slow requests
+        return list(self.slow_requests)[-10:]  # Last 10 slow requests
 
 
 # Global performance optimizer instance
@@ -257,6 +257,7 @@ async def performance_middleware(request, call_next):
     if not request.url.path.startswith("/api/") or request.url.path == "/api/v1/metrics":
         return await call_next(request)
 
+    response = None
     try:
         response = await call_next(request)
         return response
@@ -265,8 +266,15 @@ async def performance_middleware(request, call_next):
         duration_ms = duration_seconds * 1000
 
         # Track in metrics collector
-        error = getattr(response, 'status_code', 500) >= 400
-        metrics_collector.record_request(duration_seconds, error=error)
+        status_code = getattr(response, 'status_code', 500)
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        metrics_collector.record_request(
+            duration_seconds,
+            error=status_code >= 400,
+            route=route,
+            method=request.method,
+            status_code=status_code,
+        )
 
         # Track in performance optimizer
         endpoint = request.url.path
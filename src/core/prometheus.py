@@ -0,0 +1,314 @@
+"""
+Lightweight Prometheus metric primitives.
+
+This module provides labelled counters, gauges and fixed-bucket histograms
+with constant memory per label set, plus a registry that renders the
+Prometheus text exposition format incrementally:
+
+    registry = MetricsRegistry()
+    latency = registry.histogram(
+        "paygent_http_request_duration_seconds",
+        "HTTP request latency",
+        labelnames=("route", "method"),
+    )
+    latency.labels(route="/api/v1/payments", method="GET").observe(0.042)
+
+    for chunk in registry.iter_lines():
+        ...
+
+Updates are plain attribute increments with no locking. Metrics are updated
+from the event loop thread, where each update completes without yielding;
+updates racing from worker threads may rarely be lost, which is acceptable
+for monitoring data and keeps the hot path to a few nanoseconds.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from math import inf
+
+# Request/operation latency buckets in seconds
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# The same buckets in milliseconds, for the ms-based performance registry
+DEFAULT_LATENCY_BUCKETS_MS = tuple(bound * 1000 for bound in DEFAULT_LATENCY_BUCKETS)
+
+
+def escape_label_value(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labelnames: Iterable[str], values: Iterable[str]) -> str:
+    """Render a ``{name="value",...}`` label block (empty when unlabelled)."""
+    pairs = ",".join(
+        f'{name}="{escape_label_value(value)}"' for name, value in zip(labelnames, values, strict=True)
+    )
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def format_value(value: float) -> str:
+    """Render a sample value, using integers where exact."""
+    if value == inf:
+        return "+Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def estimate_quantile(q: float, bounds: tuple[float, ...], counts: list[int]) -> float:
+    """
+    Estimate a quantile from bucket counts.
+
+    Uses linear interpolation within the bucket that contains the quantile,
+    matching Prometheus' ``histogram_quantile``. Observations in the overflow
+    bucket are reported as the highest finite bound.
+
+    Args:
+        q: Quantile in [0, 1]
+        bounds: Finite upper bounds, ascending
+        counts: Per-bucket (non-cumulative) counts, one more than bounds
+
+    Returns:
+        float: Estimated quantile, or 0.0 when there are no observations
+    """
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+
+    rank = q * total
+    cumulative = 0
+    for index, bucket_count in enumerate(counts):
+        if bucket_count and cumulative + bucket_count >= rank:
+            if index == len(bounds):
+                return bounds[-1]
+            lower = bounds[index - 1] if index > 0 else 0.0
+            upper = bounds[index]
+            return lower + (upper - lower) * ((rank - cumulative) / bucket_count)
+        cumulative += bucket_count
+    return bounds[-1]
+
+
+class CounterValue:
+    """A single counter series."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter."""
+        self.value += amount
+
+
+class GaugeValue:
+    """A single gauge series."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        self.value -= amount
+
+
+class HistogramValue:
+    """A single fixed-bucket histogram series."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # One slot per finite bound plus the +Inf overflow bucket
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile of the observations."""
+        return estimate_quantile(q, self.bounds, self.counts)
+
+
+class Metric(ABC):
+    """Base class for a named metric family with optional labels."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # Label values -> (pre-rendered label block, series)
+        self._series: dict[tuple[str, ...], tuple[str, object]] = {}
+
+    @abstractmethod
+    def _new_series(self) -> object:
+        """Create the series object for one set of label values."""
+
+    def labels(self, *values: str, **labels: str):
+        """
+        Get the series for a set of label values, creating it on first use.
+
+        Args:
+            *values: Label values in ``labelnames`` order
+            **labels: Label values by name
+
+        Returns:
+            The series object (CounterValue, GaugeValue or HistogramValue)
+        """
+        if labels:
+            values = tuple(str(labels[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(value) for value in values)
+        entry = self._series.get(values)
+        if entry is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            entry = (format_labels(self.labelnames, values), self._new_series())
+            self._series[values] = entry
+        return entry[1]
+
+    def series(self) -> Iterator[tuple[tuple[str, ...], object]]:
+        """Iterate over (label values, series) pairs."""
+        for values, (_, series) in list(self._series.items()):
+            yield values, series
+
+    def clear(self) -> None:
+        """Drop all series."""
+        self._series.clear()
+
+    def iter_lines(self) -> Iterator[str]:
+        """Render this metric family in the text exposition format."""
+        yield f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.metric_type}\n"
+        # Snapshot the series so new label sets created mid-render are safe
+        for label_block, series in list(self._series.values()):
+            yield from self._iter_samples(label_block, series)
+
+    def _iter_samples(self, label_block: str, series) -> Iterator[str]:
+        yield f"{self.name}{label_block} {format_value(series.value)}\n"
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def _new_series(self) -> CounterValue:
+        return CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled series."""
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def _new_series(self) -> GaugeValue:
+        return GaugeValue()
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled series."""
+        self.labels().set(value)
+
+
+class Histogram(Metric):
+    """Fixed-bucket histogram."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(bucket for bucket in buckets if bucket != inf))
+        self._le_labels = [format_value(bound) for bound in self.bounds] + ["+Inf"]
+
+    def _new_series(self) -> HistogramValue:
+        return HistogramValue(self.bounds)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on the unlabelled series."""
+        self.labels().observe(value)
+
+    def _iter_samples(self, label_block: str, series: HistogramValue) -> Iterator[str]:
+        # Splice ``le`` into the existing label block
+        prefix = f"{self.name}_bucket{{{label_block[1:-1]}," if label_block else f"{self.name}_bucket{{"
+        cumulative = 0
+        for le, bucket_count in zip(self._le_labels, series.counts, strict=True):
+            cumulative += bucket_count
+            yield f'{prefix}le="{le}"}} {cumulative}\n'
+        yield f"{self.name}_sum{label_block} {format_value(series.sum)}\n"
+        yield f"{self.name}_count{label_block} {series.count}\n"
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Register a metric family, returning the existing one on name clash."""
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Create (or get) a counter."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Create (or get) a gauge."""
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create (or get) a histogram."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Metric | None:
+        """Get a registered metric family by name."""
+        return self._metrics.get(name)
+
+    def iter_lines(self) -> Iterator[str]:
+        """Render every metric family, one chunk at a time."""
+        for metric in list(self._metrics.values()):
+            yield from metric.iter_lines()
+
+    def render(self) -> str:
+        """Render every metric family as a single string."""
+        return "".join(self.iter_lines())
+
+    def clear(self) -> None:
+        """Drop all series (metric families stay registered)."""
+        for metric in self._metrics.values():
+            metric.clear()
@@ -0,0 +1,253 @@
+"""
+Cache stampede protection.
+
+When a hot key expires, every concurrent caller misses at once and runs the
+same expensive query. ``get_or_compute`` makes sure only one caller
+recomputes it:
+
+- Single-flight: concurrent callers in one process share one in-flight
+  computation per key.
+- Lease: across workers, a short Redis ``SET NX PX`` lease elects one
+  recomputer. The other workers keep serving the old value if they have it,
+  or wait briefly for the new one to land.
+- XFetch early refresh: each entry stores how long it took to compute, and
+  callers recompute with rising probability as expiry approaches. Hot keys
+  are then refreshed before they expire instead of all callers missing
+  together. See Vattani et al., "Optimal Probabilistic Cache Stampede
+  Prevention" (VLDB 2015).
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.core.cache import cache_client
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Marks a cached value as an XFetch envelope (value plus compute metadata)
+ENVELOPE_MARKER = "__xfetch__"
+LEASE_SUFFIX = ":lease"
+LEASE_POLL_SECONDS = 0.05
+
+# Delete the lease only if we still hold it
+RELEASE_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _record(result: str) -> None:
+    # Imported lazily: the metrics service imports the cache service
+    from src.services.metrics_service import metrics_collector
+
+    metrics_collector.record_cache_recompute(result)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one computation."""
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fn`` once for all concurrent callers of ``key``.
+
+        The computation runs in its own task, so a caller that is cancelled
+        does not cancel it for the others.
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument coroutine function to run
+
+        Returns:
+            The shared result (exceptions are shared too)
+        """
+        task = self._calls.get(key)
+        if self.in_flight(key):
+            _record("coalesced")
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: str) -> bool:
+        """Check whether a computation for ``key`` is running."""
+        task = self._calls.get(key)
+        return task is not None and not task.done()
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+single_flight = SingleFlight()
+
+
+def wrap_entry(value: Any, delta_seconds: float, ttl_seconds: int) -> dict[str, Any]:
+    """Wrap a value with the metadata XFetch needs."""
+    return {
+        ENVELOPE_MARKER: True,
+        "value": value,
+        "delta": delta_seconds,
+        "expires_at": time.time() + ttl_seconds,
+    }
+
+
+def is_entry(cached: Any) -> bool:
+    """Check whether a cached value is an XFetch envelope."""
+    return isinstance(cached, dict) and cached.get(ENVELOPE_MARKER) is True
+
+
+def should_refresh_early(entry: dict[str, Any], beta: float) -> bool:
+    """
+    XFetch: decide whether to recompute an entry before it expires.
+
+    The probability rises as expiry nears and with the entry's compute time.
+
+    Args:
+        entry: Envelope from ``wrap_entry``
+        beta: Aggressiveness (1.0 is optimal, 0 disables early refresh)
+
+    Returns:
+        True if this caller should recompute now
+    """
+    if beta <= 0:
+        return False
+    # 1 - random() is in (0, 1], so the log is defined and <= 0
+    gap = -entry["delta"] * beta * math.log(1.0 - random.random())
+    return time.time() + gap >= entry["expires_at"]
+
+
+async def _acquire_lease(client: Any, key: str, ttl_ms: int) -> str | None:
+    token = uuid.uuid4().hex
+    acquired = await client.set(key + LEASE_SUFFIX, token, nx=True, px=ttl_ms)
+    return token if acquired else None
+
+
+async def _release_lease(client: Any, key: str, token: str) -> None:
+    lease_key = key + LEASE_SUFFIX
+    try:
+        await client.eval(RELEASE_LEASE_SCRIPT, 1, lease_key, token)
+    except Exception:
+        # Scripting unavailable (e.g. fakeredis without lua); not atomic but
+        # the lease TTL bounds any overlap
+        current = await client.get(lease_key)
+        if isinstance(current, bytes):
+            current = current.decode("utf-8")
+        if current == token:
+            await client.delete(lease_key)
+
+
+async def _wait_for_fill(cache: Any, key: str, timeout: float) -> Any | None:
+    """Poll the cache until another worker fills ``key`` or ``timeout`` passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LEASE_POLL_SECONDS)
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+    return None
+
+
+async def _recompute(
+    cache: Any,
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl_seconds: int,
+    stale: Any | None,
+    use_lease: bool,
+) -> Any:
+    client = cache_client.client if use_lease else None
+    token = None
+    if client is not None:
+        try:
+            token = await _acquire_lease(client, key, settings.cache_lease_ttl_ms)
+        except Exception as e:
+            logger.warning(f"Cache lease for {key} unavailable, recomputing locally: {e}")
+        else:
+            if token is None:
+                # Another worker is recomputing: serve what we have, or wait for it
+                if stale is not None:
+                    _record("stale")
+                    return stale["value"] if is_entry(stale) else stale
+                cached = await _wait_for_fill(cache, key, settings.cache_lease_wait_seconds)
+                if cached is not None:
+                    _record("remote")
+                    return cached["value"] if is_entry(cached) else cached
+                logger.warning(f"Timed out waiting for {key} to be recomputed, recomputing locally")
+
+    try:
+        start = time.monotonic()
+        value = await compute()
+        delta = time.monotonic() - start
+        _record("computed")
+        if value is not None:
+            await cache.set(key, wrap_entry(value, delta, ttl_seconds), ttl_seconds)
+        return value
+    finally:
+        if token is not None:
+            try:
+                await _release_lease(client, key, token)
+            except Exception as e:
+                logger.debug(f"Cache lease release for {key} failed: {e}")
+
+
+async def get_or_compute(
+    cache: Any,
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl_seconds: int,
+    beta: float | None = None,
+    use_lease: bool = True,
+) -> Any:
+    """
+    Get a cached value, recomputing it at most once across callers.
+
+    Values are stored as XFetch envelopes; plain values written by older
+    code are returned as-is. ``None`` results are not cached.
+
+    Args:
+        cache: Cache with async ``get(key)`` and ``set(key, value, ttl)``
+            (a CacheInterface or CacheService)
+        key: Cache key
+        compute: Zero-argument coroutine function producing the value
+        ttl_seconds: Cache TTL in seconds
+        beta: XFetch aggressiveness (default ``settings.cache_xfetch_beta``)
+        use_lease: Coordinate recomputes across workers with a Redis lease
+
+    Returns:
+        The cached or freshly computed value
+    """
+    beta = settings.cache_xfetch_beta if beta is None else beta
+
+    cached = await cache.get(key)
+    if cached is not None:
+        if not is_entry(cached):
+            return cached
+        if not should_refresh_early(cached, beta) or single_flight.in_flight(key):
+            # Still fresh, or someone here is already refreshing it
+            return cached["value"]
+        _record("early")
+
+    return await single_flight.do(
+        key,
+        lambda: _recompute(cache, key, compute, ttl_seconds, cached, use_lease),
+    )
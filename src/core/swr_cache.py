@@ -0,0 +1,198 @@
+"""
+Stale-while-revalidate cache for fast-moving market data.
+
+VVS quotes and MCP prices are requested for the same pair many times per
+second during agent planning. Each entry has two windows:
+
+- fresh (seconds): served as-is
+- stale (longer): served immediately, while one background task refreshes it
+
+Past the stale window the value is fetched inline, and concurrent fetches
+for the same key share one call. Every lookup reports ``as_of``, the wall
+clock time when the value was fetched, and a ``cache`` status of "live",
+"fresh" or "stale". Callers can then decide whether the data is recent
+enough.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Shared by all caches for refreshing values fetched with blocking calls
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="swr-refresh")
+
+
+@dataclass(frozen=True)
+class CachedValue:
+    """A cached value with its fetch time and how it was served."""
+
+    value: Any
+    as_of: float
+    cache: str
+
+
+@dataclass
+class _Entry:
+    value: Any
+    as_of: float
+    fetched_at: float
+
+
+class StaleWhileRevalidateCache:
+    """Process-wide LRU that serves stale values while refreshing in the background."""
+
+    def __init__(
+        self,
+        name: str,
+        fresh_seconds: float,
+        stale_seconds: float,
+        max_entries: int,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            name: Name used in logs
+            fresh_seconds: Seconds a value is served without refreshing
+            stale_seconds: Seconds (from fetch) a value may still be served while refreshing
+            max_entries: Maximum keys kept; least recently used are evicted
+        """
+        self.name = name
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = max(stale_seconds, fresh_seconds)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        # Sync lookups may refresh from worker threads
+        self._lock = threading.Lock()
+        self._refreshing: set[Hashable] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._flights = SingleFlight()
+
+    def _lookup(self, key: Hashable) -> tuple[_Entry | None, float]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, 0.0
+            age = time.monotonic() - entry.fetched_at
+            if age > self.stale_seconds:
+                del self._entries[key]
+                return None, age
+            self._entries.move_to_end(key)
+            return entry, age
+
+    def _store(self, key: Hashable, value: Any) -> _Entry:
+        entry = _Entry(value=value, as_of=time.time(), fetched_at=time.monotonic())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _claim_refresh(self, key: Hashable) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _release_refresh(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            value = await fetch()
+            if value is not None:
+                self._store(key, value)
+        except Exception as e:
+            logger.warning(f"{self.name} background refresh for {key} failed, keeping stale value: {e}")
+        finally:
+            self._release_refresh(key)
+
+    def _refresh_sync(self, key: Hashable, fetch: Callable[[], Any]) -> None:
+        try:
+            value = fetch()
+            if value is not None:
+                self._store(key, value)
+        except Exception as e:
+            logger.warning(f"{self.name} background refresh for {key} failed, keeping stale value: {e}")
+        finally:
+            self._release_refresh(key)
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> CachedValue:
+        """
+        Get a value, fetching or refreshing it with an async ``fetch``.
+
+        Args:
+            key: Cache key
+            fetch: Zero-argument coroutine function returning the value
+                (None results are returned but not cached)
+
+        Returns:
+            CachedValue with the value, its fetch time and cache status
+        """
+        entry, age = self._lookup(key)
+        if entry is not None:
+            if age > self.fresh_seconds and self._claim_refresh(key):
+                task = asyncio.create_task(self._refresh(key, fetch))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return CachedValue(entry.value, entry.as_of, "fresh" if age <= self.fresh_seconds else "stale")
+
+        async def fetch_and_store() -> CachedValue:
+            value = await fetch()
+            if value is None:
+                return CachedValue(None, time.time(), "live")
+            entry = self._store(key, value)
+            return CachedValue(entry.value, entry.as_of, "live")
+
+        return await self._flights.do(f"{self.name}:{key!r}", fetch_and_store)
+
+    def get_sync(self, key: Hashable, fetch: Callable[[], Any]) -> CachedValue:
+        """
+        Get a value, fetching or refreshing it with a blocking ``fetch``.
+
+        Stale values are refreshed on a shared worker thread.
+
+        Args:
+            key: Cache key
+            fetch: Zero-argument function returning the value
+
+        Returns:
+            CachedValue with the value, its fetch time and cache status
+        """
+        entry, age = self._lookup(key)
+        if entry is not None:
+            if age > self.fresh_seconds and self._claim_refresh(key):
+                _refresh_executor.submit(self._refresh_sync, key, fetch)
+            return CachedValue(entry.value, entry.as_of, "fresh" if age <= self.fresh_seconds else "stale")
+
+        value = fetch()
+        if value is None:
+            return CachedValue(None, time.time(), "live")
+        entry = self._store(key, value)
+        return CachedValue(entry.value, entry.as_of, "live")
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a key."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all keys."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
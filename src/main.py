@@ -4,6 +4,7 @@ Paygent - AI-Powered Multi-Agent Payment Orchestration Platform
 Main FastAPI application entry point with OpenAPI documentation.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import Any
@@ -11,7 +12,9 @@ from typing import Any
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.agents.agent_graphs import warm_agent_graphs
 from src.api import router as api_router
+from src.connectors.rpc import close_rpc_clients
 from src.core.cache import close_cache, init_cache
 from src.core.config import settings
 from src.core.database import close_db, init_db
@@ -19,10 +22,13 @@ from src.core.errors import (
     general_exception_handler,
     http_exception_handler,
 )
+from src.core.http_client import close_http_clients, init_http_clients
 from src.core.vercel_db import close_db as close_vercel_db
 from src.middleware.https_enforcement import https_enforcement_middleware
 from src.middleware.metrics import metrics_middleware
 from src.middleware.rate_limiter import rate_limit_middleware
+from src.services.execution_recorder import execution_recorder
+from src.x402.eip712 import shutdown_process_pool as shutdown_signing_pool
 
 # Configure logging
 logging.basicConfig(
@@ -33,7 +39,7 @@ logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI) -> None:  # noqa: ARG001
+async def lifespan(app: FastAPI) -> None:
     """
     Application lifespan handler for startup and shutdown events.
 
@@ -64,13 +70,33 @@ async def lifespan(app: FastAPI) -> None:  # noqa: ARG001
     except Exception as e:
         logger.warning(f"⚠ Redis cache initialization failed: {e}")
 
+    # Shared pooled HTTP client for x402 services, the facilitator, MCP and webhooks
+    app.state.http_clients = await init_http_clients()
+
+    # Write-behind execution logs, tool calls and memory
+    if settings.execution_recorder_enabled:
+        await execution_recorder.start()
+
+    # Build the agent and subagent graphs now rather than on the first command
+    if settings.agent_graph_warm_on_startup:
+        try:
+            ready = await asyncio.to_thread(warm_agent_graphs)
+            logger.info(f"✓ {ready} agent graphs warmed")
+        except Exception as e:
+            logger.warning(f"⚠ Agent graph warm-up failed: {e}")
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
+    # Drain queued execution records before the database pools close
+    await execution_recorder.stop()
     await close_db()
     await close_vercel_db()
     await close_cache()
+    await close_rpc_clients()
+    await close_http_clients()
+    shutdown_signing_pool()
     logger.info("All connections closed")
 
 
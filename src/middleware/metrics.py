@@ -26,6 +26,9 @@ async def metrics_middleware(
     - Request durations
     - Request errors
 
+    Requests are labelled with the matched route template rather than the
+    raw path, so IDs in URLs do not create a new series per request.
+
     Args:
         request: FastAPI request
         call_next: Next middleware/callable in the chain
@@ -47,12 +50,31 @@ async def metrics_middleware(
 
         # Record metrics
         error = response.status_code >= 400
-        metrics_collector.record_request(duration_seconds, error=error)
+        metrics_collector.record_request(
+            duration_seconds,
+            error=error,
+            route=_route_template(request),
+            method=request.method,
+            status_code=response.status_code,
+        )
 
         return response
 
     except Exception:
         # Record error metrics
         duration_seconds = time.time() - start_time
-        metrics_collector.record_request(duration_seconds, error=True)
+        metrics_collector.record_request(
+            duration_seconds,
+            error=True,
+            route=_route_template(request),
+            method=request.method,
+            status_code=500,
+        )
         raise
+
+
+def _route_template(request: Request) -> str:
+    """Get the matched route template, or a fixed label for unmatched paths."""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else "unmatched"
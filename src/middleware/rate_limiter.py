@@ -1,36 +1,129 @@
 """
 Rate limiting middleware for FastAPI.
 
-This module provides rate limiting functionality using Redis as the backend.
+This module provides sliding-window rate limiting using Redis as the backend.
 It supports per-IP and per-user rate limiting.
+
+Each check is a single atomic Lua script executed over the shared async
+Redis pool, so the read and the increment cannot race and the event loop is
+never blocked. When Redis is unavailable, a bounded in-memory LRU of
+sliding-window logs is used instead.
 """
 
 import logging
-import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from functools import wraps
+from itertools import count
 from typing import Any
 
 from fastapi import HTTPException, Request, status
 
 try:
-    from redis import Redis
     from redis.exceptions import RedisError
     REDIS_AVAILABLE = True
 except ImportError:
-    Redis = None
     REDIS_AVAILABLE = False
+    RedisError = Exception  # type: ignore[assignment,misc]
 
+from src.core.cache import cache_client
 from src.core.config import settings
+from src.core.constants import RATE_LIMIT_MAX_TRACKED_KEYS, RATE_LIMIT_WINDOW_SECONDS
 
 logger = logging.getLogger(__name__)
 
+# Sliding-window log: one sorted set per key, scored by request time in ms.
+# Expired entries are trimmed, the request is admitted only if the window
+# has room, and the key expires with the window. Time comes from the Redis
+# server so all app instances share one clock.
+#
+# KEYS[1] = rate limit key
+# ARGV[1] = window in ms, ARGV[2] = limit, ARGV[3] = unique member
+# Returns {allowed (0/1), requests in window, reset time in ms}
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local used = redis.call('ZCARD', key)
+local allowed = 0
+if used < limit then
+    redis.call('ZADD', key, now, ARGV[3])
+    used = used + 1
+    allowed = 1
+end
+redis.call('PEXPIRE', key, window)
+
+local reset = now + window
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window
+end
+return {allowed, used, reset}
+"""
+
+
+class InMemoryWindowStore:
+    """
+    Bounded sliding-window log store used when Redis is unavailable.
+
+    Keeps at most ``max_keys`` keys, evicting the least recently used, and at
+    most ``limit`` timestamps per key, so memory stays bounded regardless of
+    how many distinct clients are seen.
+    """
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_TRACKED_KEYS):
+        self.max_keys = max_keys
+        self._windows: OrderedDict[str, deque[float]] = OrderedDict()
+
+    def hit(self, key: str, limit: int, window_seconds: float) -> tuple[bool, int, float]:
+        """
+        Record a request against a key if the window has room.
+
+        Args:
+            key: Rate limit key
+            limit: Maximum requests per window
+            window_seconds: Window length in seconds
+
+        Returns:
+            Tuple of (is_allowed, requests_in_window, reset_timestamp)
+        """
+        now = time.time()
+        window = self._windows.get(key)
+        if window is None:
+            window = deque(maxlen=limit)
+            self._windows[key] = window
+            if len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+        else:
+            self._windows.move_to_end(key)
+
+        cutoff = now - window_seconds
+        while window and window[0] <= cutoff:
+            window.popleft()
+
+        allowed = len(window) < limit
+        if allowed:
+            window.append(now)
+
+        reset_time = (window[0] if window else now) + window_seconds
+        return allowed, len(window), reset_time
+
+    def clear(self) -> None:
+        """Drop all tracked keys."""
+        self._windows.clear()
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
 
 class RateLimiter:
     """
-    Rate limiter using Redis as the backend with in-memory fallback.
+    Sliding-window rate limiter using Redis with an in-memory fallback.
 
     Supports:
     - Per-IP rate limiting
@@ -39,47 +132,33 @@ class RateLimiter:
     - In-memory fallback when Redis unavailable
     """
 
-    # In-memory storage for rate limits (thread-safe)
-    _in_memory_counts: dict = defaultdict(lambda: {"count": 0, "reset_time": 0})
-    _lock = threading.Lock()
-
     def __init__(
         self,
         requests_per_minute: int = 100,
-        redis_client: Redis | None = None
+        redis_client: Any | None = None,
+        key_prefix: str = "rate_limit",
+        window_seconds: int = RATE_LIMIT_WINDOW_SECONDS,
+        max_tracked_keys: int = RATE_LIMIT_MAX_TRACKED_KEYS,
     ):
         """
         Initialize the rate limiter.
 
         Args:
-            requests_per_minute: Maximum requests per minute
-            redis_client: Optional Redis client (will create one if not provided)
+            requests_per_minute: Maximum requests per window
+            redis_client: Optional async Redis client (defaults to the shared
+                application cache client)
+            key_prefix: Prefix for rate limit keys
+            window_seconds: Sliding window length in seconds
+            max_tracked_keys: Maximum keys kept by the in-memory fallback
         """
         self.requests_per_minute = requests_per_minute
         self.redis = redis_client
-        self.window_seconds = 60
-        self._redis_available = False
-
-        # Try to get Redis client if not provided
-        if self.redis is None and REDIS_AVAILABLE:
-            try:
-                # Try to connect to Redis
-                self.redis = Redis.from_url(
-                    settings.effective_redis_url,
-                    decode_responses=True,
-                    socket_connect_timeout=2,
-                    socket_timeout=2,
-                )
-                # Test connection
-                self.redis.ping()
-                self._redis_available = True
-            except Exception as e:
-                logger.warning(f"Redis not available for rate limiting: {e}, using in-memory fallback")
-                self.redis = None
-        elif self.redis is not None:
-            self._redis_available = True
-        else:
-            logger.warning("Redis library not available for rate limiting, using in-memory fallback")
+        self.key_prefix = key_prefix
+        self.window_seconds = window_seconds
+        self._memory = InMemoryWindowStore(max_keys=max_tracked_keys)
+        self._script: Any | None = None
+        self._script_client: Any | None = None
+        self._members = count()
 
     def _get_key(self, request: Request, user_id: str | None = None) -> str:
         """
@@ -93,94 +172,69 @@ class RateLimiter:
             Redis key string
         """
         if user_id:
-            return f"rate_limit:user:{user_id}"
+            return f"{self.key_prefix}:user:{user_id}"
 
         # Use client IP address
-        client_ip = request.client.host if request.client else "unknown"
-        return f"rate_limit:ip:{client_ip}"
-
-    def _get_count(self, key: str) -> int:
-        """Get current request count for the key."""
-        if self._redis_available:
-            try:
-                count = self.redis.get(key)
-                return int(count) if count else 0
-            except RedisError as e:
-                logger.error(f"Error getting rate limit count from Redis: {e}")
-                # Fall through to in-memory
-
-        # In-memory fallback
-        with self._lock:
-            now = int(time.time())
-            data = self._in_memory_counts[key]
-
-            # Reset if window expired
-            if now >= data["reset_time"]:
-                data["count"] = 0
-                data["reset_time"] = now + self.window_seconds
-
-            return data["count"]
+        client_ip = request.client.host if request is not None and request.client else "unknown"
+        return f"{self.key_prefix}:ip:{client_ip}"
+
+    def _get_redis(self) -> Any | None:
+        """Get the async Redis client to use, if any."""
+        if self.redis is not None:
+            return self.redis
+        return cache_client.client
+
+    def _get_script(self, client: Any) -> Any:
+        """Get the registered Lua script, re-registering if the client changed."""
+        if self._script is None or self._script_client is not client:
+            # Script objects run via EVALSHA and fall back to EVAL once
+            self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+            self._script_client = client
+        return self._script
+
+    async def _hit_redis(self, client: Any, key: str) -> tuple[bool, int, float]:
+        """Run the sliding-window script for a key."""
+        script = self._get_script(client)
+        member = f"{time.time_ns()}:{next(self._members)}"
+        allowed, used, reset_ms = await script(
+            keys=[key],
+            args=[self.window_seconds * 1000, self.requests_per_minute, member],
+        )
+        return bool(int(allowed)), int(used), int(reset_ms) / 1000
 
-    def _increment_count(self, key: str, ttl: int) -> None:
-        """Increment request count and set TTL."""
-        if self._redis_available:
-            try:
-                pipe = self.redis.pipeline()
-                pipe.incr(key)
-                pipe.expire(key, ttl)
-                pipe.execute()
-                return
-            except RedisError as e:
-                logger.error(f"Error incrementing rate limit in Redis: {e}")
-                # Fall through to in-memory
-
-        # In-memory fallback
-        with self._lock:
-            now = int(time.time())
-            data = self._in_memory_counts[key]
-
-            # Reset if window expired
-            if now >= data["reset_time"]:
-                data["count"] = 1
-                data["reset_time"] = now + self.window_seconds
-            else:
-                data["count"] += 1
-
-    def check_limit(self, request: Request, user_id: str | None = None) -> tuple[bool, int, int]:
+    async def check_limit(
+        self,
+        request: Request,
+        user_id: str | None = None,
+        key: str | None = None,
+    ) -> tuple[bool, int, int]:
         """
-        Check if request is within rate limit.
+        Check if request is within rate limit, counting it if allowed.
 
         Args:
             request: FastAPI request
             user_id: Optional authenticated user ID
+            key: Optional explicit key suffix (overrides user/IP keys)
 
         Returns:
             Tuple of (is_allowed, remaining_requests, reset_time)
         """
-        key = self._get_key(request, user_id)
-
-        current_count = self._get_count(key)
-        is_allowed = current_count < self.requests_per_minute
-        remaining = max(0, self.requests_per_minute - current_count)
-
-        # Increment the count for this request
-        self._increment_count(key, self.window_seconds)
+        limit_key = f"{self.key_prefix}:{key}" if key else self._get_key(request, user_id)
 
-        # Calculate reset time
-        if self._redis_available:
+        client = self._get_redis()
+        result = None
+        if client is not None:
             try:
-                ttl = self.redis.ttl(key)
-                if ttl <= 0:
-                    ttl = self.window_seconds
-                reset_time = int(time.time()) + ttl
-            except RedisError:
-                reset_time = int(time.time()) + self.window_seconds
-        else:
-            # Use in-memory reset time
-            with self._lock:
-                reset_time = self._in_memory_counts[key]["reset_time"]
+                result = await self._hit_redis(client, limit_key)
+            except RedisError as e:
+                logger.error(f"Redis rate limit check failed: {e}, using in-memory fallback")
+
+        if result is None:
+            result = self._memory.hit(limit_key, self.requests_per_minute, self.window_seconds)
 
-        return is_allowed, remaining, reset_time
+        is_allowed, used, reset_time = result
+        remaining = max(0, self.requests_per_minute - used)
+        return is_allowed, remaining, int(reset_time)
 
     def get_headers(self, remaining: int, reset_time: int) -> dict:
         """Generate rate limit headers."""
@@ -227,7 +281,7 @@ async def rate_limit_middleware(
             user_id = token_data.user_id
 
     # Check rate limit
-    is_allowed, remaining, reset_time = _rate_limiter.check_limit(request, user_id)
+    is_allowed, remaining, reset_time = await _rate_limiter.check_limit(request, user_id)
 
     # Get headers
     headers = _rate_limiter.get_headers(remaining, reset_time)
@@ -275,6 +329,12 @@ def rate_limit(
         Returns:
             Callable: Rate-limited function wrapper
         """
+        # One limiter per endpoint, with its own key namespace
+        limiter = RateLimiter(
+            requests_per_minute=requests_per_minute,
+            key_prefix=f"rate_limit:{func.__module__}.{func.__qualname__}",
+        )
+
         @wraps(func)
         async def wrapper(*args, **kwargs):  # noqa: D417
             """Execute function with rate limiting.
@@ -288,22 +348,21 @@ def rate_limit(
             """
             # Get request from kwargs or args
             request = kwargs.get("request")
-            if not request:
+            if request is None:
                 # Try to find request in args
                 for arg in args:
                     if isinstance(arg, Request):
                         request = arg
                         break
 
-            if not request:
+            if request is None:
                 # No request found, skip rate limiting
                 return await func(*args, **kwargs)
 
-            # Create custom limiter for this endpoint
-            limiter = RateLimiter(requests_per_minute=requests_per_minute)
             user_id = kwargs.get("user_id")
+            key = key_func(request) if key_func else None
 
-            is_allowed, remaining, reset_time = limiter.check_limit(request, user_id)
+            is_allowed, remaining, reset_time = await limiter.check_limit(request, user_id, key)
 
             if not is_allowed:
                 raise HTTPException(
@@ -11,17 +11,19 @@ from src.models.agent_sessions import (
     ApprovalRequest,
     ServiceSubscription,
 )
-from src.models.execution_logs import ExecutionLog, ToolCall
-from src.models.payments import Payment
+from src.models.execution_logs import ExecutionLog, SessionToolUsage, ToolCall
+from src.models.payments import Payment, PaymentStatsRollup
 from src.models.services import Service
 
 __all__ = [
     "Base",
     "Service",
     "Payment",
+    "PaymentStatsRollup",
     "AgentSession",
     "ExecutionLog",
     "ToolCall",
+    "SessionToolUsage",
     "ApprovalRequest",
     "ServiceSubscription",
 ]
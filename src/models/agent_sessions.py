@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
@@ -76,6 +76,10 @@ class AgentMemory(Base):
     """Agent memory model for storing conversation history across sessions."""
 
     __tablename__ = "agent_memory"
+    __table_args__ = (
+        # Serves the windowed "latest N entries for a session" query
+        Index("idx_agent_memory_session_timestamp", "session_id", "timestamp"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True)
     session_id: Mapped[UUID] = mapped_column(ForeignKey("agent_sessions.id"))
@@ -8,7 +8,18 @@ commands, tool calls, and results for complete audit trails.
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
@@ -28,7 +39,12 @@ class ExecutionLog(Base):
     """
 
     __tablename__ = "execution_logs"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Keyset pagination of logs, newest first (B-trees scan backwards)
+        Index("idx_execution_logs_session_created", "session_id", "created_at", "id"),
+        Index("idx_execution_logs_created_id", "created_at", "id"),
+        {"extend_existing": True},
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=lambda: uuid4())
     session_id: Mapped[UUID] = mapped_column(ForeignKey("agent_sessions.id"), nullable=False)
@@ -38,7 +54,7 @@ class ExecutionLog(Base):
     result: Mapped[dict | None] = mapped_column(JSON)  # Final execution result
     total_cost: Mapped[float | None] = mapped_column(Float)  # Total LLM + transaction costs
     duration_ms: Mapped[int | None] = mapped_column(Integer)  # Execution duration in milliseconds
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default="completed")  # running, completed, failed, blocked
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="completed")  # running, completed, failed, blocked, cancelled
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
 
     def __repr__(self) -> str:
@@ -58,7 +74,11 @@ class ToolCall(Base):
     """
 
     __tablename__ = "tool_calls"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Tool usage GROUP BY joins calls to their execution log
+        Index("idx_tool_calls_log_tool", "execution_log_id", "tool_name"),
+        {"extend_existing": True},
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=lambda: uuid4())
     execution_log_id: Mapped[UUID] = mapped_column(ForeignKey("execution_logs.id"), nullable=False)
@@ -72,3 +92,24 @@ class ToolCall(Base):
 
     def __repr__(self) -> str:
         return f"<ToolCall(id={self.id}, tool='{self.tool_name}', success={self.success})>"
+
+
+class SessionToolUsage(Base):
+    """Per-session, per-tool call counters.
+
+    Incremented in the same transaction that records tool calls (see
+    src.services.tool_usage), so session summaries read a handful of rows
+    instead of aggregating the session's whole history.
+    """
+
+    __tablename__ = "session_tool_usage"
+
+    session_id: Mapped[UUID] = mapped_column(ForeignKey("agent_sessions.id"), primary_key=True)
+    tool_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    call_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_duration_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    last_called_at: Mapped[datetime | None] = mapped_column(DateTime)
+
+    def __repr__(self) -> str:
+        return f"<SessionToolUsage(session={self.session_id}, tool='{self.tool_name}', calls={self.call_count})>"
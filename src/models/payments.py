@@ -7,7 +7,7 @@ This module defines the SQLAlchemy models for payments and transactions.
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
@@ -17,6 +17,11 @@ class Payment(Base):
     """Payment model for tracking x402 payment transactions."""
 
     __tablename__ = "payments"
+    __table_args__ = (
+        # Keyset pagination of history, newest first (B-trees scan backwards)
+        Index("idx_payments_wallet_created", "agent_wallet", "created_at", "id"),
+        Index("idx_payments_created_id", "created_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=lambda: uuid4())
     agent_wallet: Mapped[str] = mapped_column(String(42), nullable=False)
@@ -30,3 +35,26 @@ class Payment(Base):
 
     def __repr__(self) -> str:
         return f"<Payment(id={self.id}, amount={self.amount}, status='{self.status}')>"
+
+
+class PaymentStatsRollup(Base):
+    """Payment count and amount per time bucket, wallet and status.
+
+    Maintained in the same transaction as payment writes (see
+    src.services.payment_rollups) so statistics never scan payments.
+    """
+
+    __tablename__ = "payment_stats_rollups"
+
+    granularity: Mapped[str] = mapped_column(String(8), primary_key=True)  # hour, day
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    agent_wallet: Mapped[str] = mapped_column(String(42), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    payment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    amount_total: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PaymentStatsRollup({self.granularity} {self.bucket_start}, "
+            f"wallet={self.agent_wallet}, status='{self.status}', count={self.payment_count})>"
+        )
@@ -7,7 +7,7 @@ This module defines the SQLAlchemy models for service registry and discovery.
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import BigInteger, Boolean, DateTime, Float, String, Text, func
+from sqlalchemy import DDL, BigInteger, Boolean, DateTime, Float, String, Text, event, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
@@ -33,3 +33,57 @@ class Service(Base):
 
     def __repr__(self) -> str:
         return f"<Service(id={self.id}, name='{self.name}', endpoint='{self.endpoint}')>"
+
+
+# Full-text search index over name and description (see src.services.service_search).
+# Created with the table for development databases; migrated databases get
+# the same objects from the 003_service_search and 007_service_fts_by_id migrations.
+POSTGRES_SEARCH_DDL = [
+    """
+    ALTER TABLE services ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_services_search ON services USING GIN (search_vector)",
+]
+
+# FTS5 table keyed by the service UUID and kept in sync with services by
+# triggers. It stores its own copy of the text: an external-content table
+# would be keyed by services.rowid, which VACUUM may renumber.
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS services_fts USING fts5(
+        id UNINDEXED, name, description
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_ai AFTER INSERT ON services BEGIN
+        INSERT INTO services_fts(id, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_ad AFTER DELETE ON services BEGIN
+        DELETE FROM services_fts WHERE id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS services_fts_au AFTER UPDATE OF name, description ON services BEGIN
+        UPDATE services_fts SET name = new.name, description = new.description
+        WHERE id = old.id;
+    END
+    """,
+    "INSERT INTO services_fts(id, name, description) SELECT id, name, description FROM services",
+]
+
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(Service.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(Service.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Service.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS services_fts").execute_if(dialect="sqlite"),
+)
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.agent_sessions import AgentSession
 from src.models.execution_logs import ExecutionLog
+from src.services.execution_log_service import ExecutionLogService
 
 logger = logging.getLogger(__name__)
 
@@ -168,37 +169,8 @@ class AgentService:
             return None
 
     async def get_session_summary(self, session_id: str) -> dict[str, Any]:
-        """Get session execution summary."""
-        logs = await self.get_execution_logs(session_id)
-        if not logs:
-            return {"session_id": session_id, "total_executions": 0}
-
-        total_executions = len(logs)
-        successful_executions = sum(1 for log in logs if log.result and log.result.get("success", False))
-        total_cost = sum(log.total_cost or 0 for log in logs)
-        total_duration = sum(log.duration_ms or 0 for log in logs)
-
-        # Get most used tools
-        tool_usage = {}
-        for log in logs:
-            if log.result and "tool_calls" in log.result:
-                for tool_call in log.result["tool_calls"]:
-                    tool_name = tool_call.get("tool_name", "unknown")
-                    tool_usage[tool_name] = tool_usage.get(tool_name, 0) + 1
-
-        most_used_tool = max(tool_usage.items(), key=lambda x: x[1]) if tool_usage else None
-
-        return {
-            "session_id": session_id,
-            "total_executions": total_executions,
-            "successful_executions": successful_executions,
-            "success_rate": successful_executions / total_executions if total_executions > 0 else 0,
-            "total_cost": total_cost,
-            "total_duration_ms": total_duration,
-            "average_duration_ms": total_duration / total_executions if total_executions > 0 else 0,
-            "most_used_tool": most_used_tool[0] if most_used_tool else None,
-            "tool_usage_count": most_used_tool[1] if most_used_tool else 0
-        }
+        """Get session execution summary (aggregated in SQL)."""
+        return await ExecutionLogService(self.db).get_session_summary(session_id)
 
     async def cleanup(self):
         """Clean up agent service."""
@@ -112,18 +112,17 @@ class AlertingService:
             return
 
         try:
-            import httpx
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    settings.alert_webhook_url,
-                    json=alert.to_dict(),
-                    headers={"Content-Type": "application/json"},
-                    timeout=5.0
-                )
-                if response.status_code == 200:
-                    logger.info(f"Successfully sent webhook alert to {settings.alert_webhook_url}")
-                else:
-                    logger.warning(f"Webhook alert returned status {response.status_code}")
+            from src.core.http_client import get_http_client
+            response = await get_http_client().post(
+                settings.alert_webhook_url,
+                json=alert.to_dict(),
+                headers={"Content-Type": "application/json"},
+                timeout=5.0
+            )
+            if response.status_code == 200:
+                logger.info(f"Successfully sent webhook alert to {settings.alert_webhook_url}")
+            else:
+                logger.warning(f"Webhook alert returned status {response.status_code}")
         except ImportError:
             logger.warning("httpx not available, webhook alert simulated")
             logger.info(f"Would send webhook alert to {settings.alert_webhook_url}")
@@ -18,6 +18,7 @@ from src.core.database import async_session_maker
 from src.models.agent_sessions import AgentSession, ApprovalRequest
 from src.models.payments import Payment
 from src.services.metrics_service import metrics_collector
+from src.services.retention import RetentionEngine, expire_approvals_policy
 
 logger = logging.getLogger(__name__)
 
@@ -142,28 +143,11 @@ class ApprovalService:
         return result.scalars().all()
 
     async def cleanup_expired_approvals(self, max_age_hours: int = 24) -> int:
-        """Clean up expired approval requests (older than max_age_hours)."""
-        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
-
-        # Get expired pending requests
-        expired_query = select(ApprovalRequest).where(
-            ApprovalRequest.decision == "pending",
-            ApprovalRequest.created_at < cutoff,
-        )
-
-        expired_result = await self.session.execute(expired_query)
-        expired_requests = expired_result.scalars().all()
-
-        # Mark as expired
-        if expired_requests:
-            for request in expired_requests:
-                request.decision = "expired"
-                request.decision_made_at = datetime.utcnow()
-
-            await self.session.commit()
-            logger.info(f"Cleaned up {len(expired_requests)} expired approval requests")
-
-        return len(expired_requests)
+        """Mark pending approval requests older than max_age_hours as expired, in chunks."""
+        result = await RetentionEngine(self.session).run(expire_approvals_policy(timedelta(hours=max_age_hours)))
+        if result.rows:
+            logger.info(f"Cleaned up {result.rows} expired approval requests")
+        return result.rows
 
     async def stream_pending_approvals(
         self, session_id: UUID | None = None
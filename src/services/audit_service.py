@@ -14,6 +14,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.execution_logs import ExecutionLog, ToolCall
+from src.services.tool_usage import increment_session_usage
 
 logger = logging.getLogger(__name__)
 
@@ -162,6 +163,19 @@ class AuditService:
             )
 
             self.db.add(tool_call)
+
+            # Keep the session's tool counters in the same transaction
+            session_id = await self.db.scalar(
+                select(ExecutionLog.session_id).where(ExecutionLog.id == execution_log_id)
+            )
+            if session_id is not None:
+                await increment_session_usage(self.db, session_id, [{
+                    "tool_name": tool_name,
+                    "success": success,
+                    "duration_ms": duration_ms,
+                    "created_at": tool_call.created_at,
+                }])
+
             await self.db.commit()
             await self.db.refresh(tool_call)
 
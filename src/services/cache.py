@@ -2,15 +2,23 @@
 Cache service for Paygent.
 
 This module provides a wrapper around Redis for caching operations,
-with graceful fallback when Redis is unavailable.
+with graceful fallback when Redis is unavailable. Reads and writes go
+through the in-process near cache (see src.core.near_cache), so hot keys
+are served from memory and invalidated across workers via pub/sub.
+
+Entries can be tagged with namespaces (see src.core.cache_namespaces) and
+invalidated as a group with ``invalidate`` in O(1), without scanning keys.
 """
 
-import json
 import logging
 import time
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any
 
 from src.core.cache import cache_client
+from src.core.cache_namespaces import CacheNamespaces, cache_namespaces
+from src.core.near_cache import NearCache, near_cache
+from src.core.single_flight import get_or_compute
 
 logger = logging.getLogger(__name__)
 
@@ -70,36 +78,46 @@ cache_metrics = CacheMetrics()
 class CacheService:
     """Service for cache operations with Redis backend."""
 
-    def __init__(self):
-        """Initialize the cache service."""
+    def __init__(
+        self,
+        near: NearCache | None = None,
+        namespaces: CacheNamespaces | None = None,
+    ):
+        """
+        Initialize the cache service.
+
+        Args:
+            near: Two-tier cache to read and write through (defaults to the global one)
+            namespaces: Namespace versions for tagged keys (defaults to the global one)
+        """
         self.client = cache_client
+        self.near = near if near is not None else near_cache
+        self.namespaces = namespaces if namespaces is not None else cache_namespaces
 
-    async def get(self, key: str) -> Any | None:
+    async def get(self, key: str, namespaces: Sequence[str] = ()) -> Any | None:
         """
         Get a value from cache with performance tracking.
 
         Args:
             key: Cache key
+            namespaces: Namespaces the entry was tagged with when set
 
         Returns:
             Cached value or None if not found/unavailable
         """
         start_time = time.time()
         try:
-            result = await self.client.get(key)
+            key = await self.namespaces.key(key, namespaces)
+            if key is None:
+                return None
+            value = await self.near.get(key)
             duration_ms = (time.time() - start_time) * 1000
 
-            if result:
-                # Try to parse as JSON, return raw if not JSON
-                try:
-                    value = json.loads(result)
-                    cache_metrics.record_hit(duration_ms)
-                    if duration_ms > 100:
-                        logger.warning(f"Slow cache hit: {key} took {duration_ms:.2f}ms")
-                    return value
-                except (json.JSONDecodeError, TypeError):
-                    cache_metrics.record_hit(duration_ms)
-                    return result
+            if value is not None:
+                cache_metrics.record_hit(duration_ms)
+                if duration_ms > 100:
+                    logger.warning(f"Slow cache hit: {key} took {duration_ms:.2f}ms")
+                return value
 
             cache_metrics.record_miss(duration_ms)
             return None
@@ -110,7 +128,11 @@ class CacheService:
             return None
 
     async def set(
-        self, key: str, value: Any, expiration: int | None = None
+        self,
+        key: str,
+        value: Any,
+        expiration: int | None = None,
+        namespaces: Sequence[str] = (),
     ) -> bool:
         """
         Set a value in cache with performance tracking.
@@ -118,18 +140,19 @@ class CacheService:
         Args:
             key: Cache key
             value: Value to cache
-            expiration: Optional TTL in seconds
+            expiration: Optional TTL in seconds (should be set for tagged entries,
+                which are orphaned rather than deleted on invalidation)
+            namespaces: Namespaces to tag the entry with
 
         Returns:
             True if successful, False otherwise
         """
         start_time = time.time()
         try:
-            # Serialize value if it's not a string
-            if not isinstance(value, str):
-                value = json.dumps(value)
-
-            result = await self.client.set(key, value, ttl=expiration)
+            key = await self.namespaces.key(key, namespaces)
+            if key is None:
+                return False
+            result = await self.near.set(key, value, ttl_seconds=expiration)
             duration_ms = (time.time() - start_time) * 1000
             cache_metrics.record_set(duration_ms)
 
@@ -143,6 +166,47 @@ class CacheService:
             logger.warning(f"Cache set failed: {e}")
             return False
 
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        expiration: int,
+        namespaces: Sequence[str] = (),
+    ) -> Any:
+        """
+        Get a value, computing it once across concurrent callers on a miss.
+
+        Hot keys are refreshed shortly before they expire (see
+        src.core.single_flight).
+
+        Args:
+            key: Cache key
+            compute: Zero-argument coroutine function producing a JSON-serializable value
+            expiration: TTL in seconds
+            namespaces: Namespaces to tag the entry with
+
+        Returns:
+            Cached or freshly computed value
+        """
+        key = await self.namespaces.key(key, namespaces)
+        if key is None:
+            return await compute()
+        return await get_or_compute(self, key, compute, expiration)
+
+    async def invalidate(self, *namespaces: str) -> bool:
+        """
+        Invalidate every entry tagged with any of the namespaces.
+
+        Bumps one version counter per namespace; old entries expire by TTL.
+
+        Args:
+            *namespaces: Namespaces to invalidate (e.g. "services", "service:{id}")
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self.namespaces.invalidate(*namespaces)
+
     async def delete(self, key: str) -> bool:
         """
         Delete a value from cache.
@@ -154,7 +218,9 @@ class CacheService:
             True if successful, False otherwise
         """
         try:
-            return await self.client.delete(key)
+            result = await self.near.delete(key)
+            cache_metrics.record_delete()
+            return result
         except Exception as e:
             logger.warning(f"Cache delete failed: {e}")
             return False
@@ -163,6 +229,9 @@ class CacheService:
         """
         Delete all keys matching a pattern.
 
+        Scans the whole keyspace; prefer tagging entries with namespaces and
+        calling ``invalidate``.
+
         Args:
             pattern: Pattern to match (e.g., "services:*")
 
@@ -170,23 +239,10 @@ class CacheService:
             Number of keys deleted
         """
         try:
-            if not self.client.available:
-                return 0
-
-            # Use SCAN to find all matching keys and delete them
-            from src.core.cache import cache_client
-            if not cache_client._client:
-                return 0
-
-            keys = []
-            async for key in cache_client._client.scan_iter(match=pattern):
-                keys.append(key)
-
-            if keys:
-                await cache_client._client.delete(*keys)
-                logger.info(f"Deleted {len(keys)} cache keys matching pattern: {pattern}")
-                return len(keys)
-            return 0
+            deleted = await self.near.delete_pattern(pattern)
+            if deleted:
+                logger.info(f"Deleted {deleted} cache keys matching pattern: {pattern}")
+            return deleted
         except Exception as e:
             logger.warning(f"Cache delete_pattern failed: {e}")
             return 0
@@ -6,12 +6,15 @@ execution logs from agent operations.
 """
 import logging
 from collections.abc import Sequence
+from datetime import timedelta
 from typing import Any
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import ExecutionLog
+from src.services.retention import RetentionEngine, execution_logs_policy
+from src.services.tool_usage import get_session_tool_usage, get_tool_counts_by_session
 
 logger = logging.getLogger(__name__)
 
@@ -190,13 +193,20 @@ class ExecutionLogService:
             return {"session_id": session_id, "total_executions": 0}
 
         try:
-            # Get total logs for session
-            total_logs = await self.db.execute(
-                select(func.count()).select_from(ExecutionLog).where(
-                    ExecutionLog.session_id == session_id
-                )
-            )
-            total_executions = total_logs.scalar()
+            # Counts, cost and duration in one pass over the session's logs
+            totals = (await self.db.execute(
+                select(
+                    func.count(ExecutionLog.id),
+                    func.count(ExecutionLog.id).filter(
+                        ExecutionLog.result["success"].as_boolean().is_(True)
+                    ),
+                    func.sum(ExecutionLog.total_cost),
+                    func.sum(ExecutionLog.duration_ms),
+                ).where(ExecutionLog.session_id == session_id)
+            )).one()
+            total_executions, successful_executions, total_cost, total_duration = totals
+            total_cost = total_cost or 0
+            total_duration = total_duration or 0
 
             if total_executions == 0:
                 return {
@@ -210,46 +220,9 @@ class ExecutionLogService:
                     "tool_usage_count": 0
                 }
 
-            # Get successful executions
-            successful_logs = await self.db.execute(
-                select(func.count()).select_from(ExecutionLog).where(
-                    and_(
-                        ExecutionLog.session_id == session_id,
-                        ExecutionLog.result.op('->>')('success') == 'true'
-                    )
-                )
-            )
-            successful_executions = successful_logs.scalar()
-
-            # Get total cost and duration
-            cost_duration = await self.db.execute(
-                select(
-                    func.sum(ExecutionLog.total_cost),
-                    func.sum(ExecutionLog.duration_ms)
-                ).select_from(ExecutionLog).where(
-                    ExecutionLog.session_id == session_id
-                )
-            )
-            cost_result = cost_duration.fetchone()
-
-            # Handle None cost_result
-            if cost_result is None:
-                total_cost = 0
-                total_duration = 0
-            else:
-                total_cost = cost_result[0] if cost_result[0] is not None else 0
-                total_duration = cost_result[1] if cost_result[1] is not None else 0
-
-            # Get tool usage
-            logs = await self.get_execution_logs(session_id)
-            tool_usage: dict[str, int] = {}
-            for log in logs:
-                if log.result and "tool_calls" in log.result:
-                    for tool_call in log.result["tool_calls"]:
-                        tool_name = tool_call.get("tool_name", "unknown")
-                        tool_usage[tool_name] = tool_usage.get(tool_name, 0) + 1
-
-            most_used_tool = max(tool_usage.items(), key=lambda x: x[1]) if tool_usage else None
+            # Most used tool from the per-session counters
+            tool_usage = await get_session_tool_usage(self.db, session_id)
+            most_used_tool = (tool_usage[0]["tool_name"], tool_usage[0]["call_count"]) if tool_usage else None
 
             return {
                 "session_id": session_id,
@@ -297,25 +270,12 @@ class ExecutionLogService:
             return {}
 
         try:
-            logs = await self.get_execution_logs(
+            return await get_tool_counts_by_session(
+                self.db,
                 session_id=session_id,
                 start_date=start_date,
-                end_date=end_date
+                end_date=end_date,
             )
-
-            tool_stats: dict[str, dict[str, int]] = {}
-            for log in logs:
-                if log.result and "tool_calls" in log.result:
-                    for tool_call in log.result["tool_calls"]:
-                        tool_name = tool_call.get("tool_name", "unknown")
-                        log_session_id = str(log.session_id)
-
-                        if log_session_id not in tool_stats:
-                            tool_stats[log_session_id] = {}
-
-                        tool_stats[log_session_id][tool_name] = tool_stats[log_session_id].get(tool_name, 0) + 1
-
-            return tool_stats
         except Exception as e:
             logger.error(f"Error getting tool usage stats: {e}")
             return {}
@@ -326,7 +286,7 @@ class ExecutionLogService:
         session_id: str | None = None
     ) -> int:
         """
-        Clean up old execution logs.
+        Clean up old execution logs (and their tool calls) in chunks.
 
         Args:
             days_to_keep: Number of days to keep logs
@@ -339,26 +299,9 @@ class ExecutionLogService:
             return 0
 
         try:
-            from datetime import datetime, timedelta
-
-            cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
-
-            query = select(ExecutionLog).where(
-                ExecutionLog.created_at < cutoff_date
-            )
-            if session_id:
-                query = query.where(ExecutionLog.session_id == session_id)
-
-            result = await self.db.execute(query)
-            logs_to_delete = result.scalars().all()
-
-            for log in logs_to_delete:
-                await self.db.delete(log)
-
-            await self.db.commit()
-            return len(logs_to_delete)
+            policy = execution_logs_policy(timedelta(days=days_to_keep), session_id=session_id)
+            result = await RetentionEngine(self.db).run(policy)
+            return result.rows
         except Exception as e:
             logger.error(f"Error cleaning up old logs: {e}")
-            if self.db:
-                await self.db.rollback()
             return 0
@@ -0,0 +1,303 @@
+"""
+Write-behind recording of agent executions.
+
+A single command used to commit several times on the request's critical
+path: the ``running`` execution log, the tool calls and final log update,
+and the conversation memory. The recorder takes those writes off the
+request path:
+
+- the executor enqueues records (log created, log finished, tool calls,
+  memory entry) on a bounded in-process queue and carries on
+- a background task drains the queue in batches of up to ``batch_size``
+  records, lingering up to ``flush_interval_ms`` for a batch to fill, and
+  writes each batch in one transaction with multi-row INSERTs and a bulk
+  UPDATE by primary key. A log created and finished within one batch is
+  inserted once with its final values.
+
+Durability is per call: ``flush()`` waits until everything enqueued before
+it has been written, so payment commands can respond only once their audit
+records are stored (``execution_log_durability``). When the queue is full,
+producers wait for space rather than dropping records (backpressure), and
+``stop()`` drains the queue before shutdown. Records arriving after the
+recorder has stopped are written through directly.
+
+A batch that fails is retried one record per transaction so a single bad
+record cannot lose the others.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.database import background_session_maker
+from src.models.agent_sessions import AgentMemory
+from src.models.execution_logs import ExecutionLog, ToolCall
+from src.services.metrics_service import metrics_collector
+from src.services.tool_usage import increment_session_usage, tool_call_rows
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_MODES = ("async", "payments", "sync")
+
+
+@dataclass
+class _Record:
+    """One queued write: ``kind`` selects how ``data`` is applied."""
+
+    kind: str  # log, log_update, tool_calls, memory, barrier, stop
+    data: Any = None
+
+
+_STOP = _Record("stop")
+
+
+def _row(instance: Any) -> dict[str, Any]:
+    """Column values of a model instance, keyed by attribute name."""
+    return {attr.key: getattr(instance, attr.key) for attr in instance.__mapper__.column_attrs}
+
+
+class ExecutionRecorder:
+    """Bounded queue of execution records written in batches by a background task."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        queue_size: int = settings.execution_recorder_queue_size,
+        batch_size: int = settings.execution_recorder_batch_size,
+        flush_interval_ms: int = settings.execution_recorder_flush_interval_ms,
+    ):
+        """
+        Initialize the recorder.
+
+        Args:
+            session_factory: Creates sessions for batch writes (default: background pool)
+            queue_size: Records held before producers wait for space
+            batch_size: Records written per transaction
+            flush_interval_ms: How long a partial batch waits to fill
+        """
+        self._session_factory = session_factory or background_session_maker
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self._queue: asyncio.Queue[_Record] | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether records are being accepted."""
+        return self._task is not None and not self._task.done() and not self._closing
+
+    @property
+    def depth(self) -> int:
+        """Records waiting to be written."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Start the background writer (no-op if already running)."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._closing = False
+        self._task = asyncio.create_task(self._run(), name="execution-recorder")
+        logger.info(
+            f"Execution recorder started (queue {self.queue_size}, batch {self.batch_size}, "
+            f"linger {self.flush_interval_ms}ms)"
+        )
+
+    async def stop(self, timeout: float = settings.execution_recorder_shutdown_timeout_seconds) -> None:
+        """
+        Stop accepting records and write everything already queued.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain before abandoning it
+        """
+        if self._task is None:
+            return
+        self._closing = True
+
+        async def drain() -> None:
+            await self._queue.put(_STOP)
+            await self._task
+
+        try:
+            await asyncio.wait_for(drain(), timeout)
+            logger.info(f"Execution recorder stopped ({self.written} written, {self.failed} failed)")
+        except TimeoutError:
+            logger.error(
+                f"Execution recorder did not drain within {timeout}s; "
+                f"{self.depth} records were not written"
+            )
+        finally:
+            self._task = None
+
+    async def _put(self, record: _Record) -> None:
+        if not self.running:
+            # Stopped (e.g. shutting down mid-request): write through instead of dropping
+            if self._task is not None:
+                # Still draining; let queued inserts land before updates that follow them
+                await asyncio.wait([self._task])
+            if record.kind == "barrier":
+                future, failed_before = record.data
+                future.set_result(self.failed == failed_before)
+            else:
+                await self._process([record])
+            return
+        waited = self._queue.full()
+        await self._queue.put(record)
+        metrics_collector.record_recorder_enqueue(self._queue.qsize(), waited)
+
+    async def log_started(self, execution_log: ExecutionLog) -> None:
+        """
+        Queue the insert of a new execution log.
+
+        Sets ``created_at`` now, so the log sorts by when the command ran
+        rather than when the batch was written.
+        """
+        if execution_log.created_at is None:
+            execution_log.created_at = datetime.utcnow()
+        await self._put(_Record("log", _row(execution_log)))
+
+    async def log_finished(self, log_id: UUID, values: dict[str, Any]) -> None:
+        """Queue an update of an execution log's columns."""
+        await self._put(_Record("log_update", (log_id, dict(values))))
+
+    async def tool_calls_made(
+        self, session_id: UUID, execution_log_id: UUID, calls: Sequence[dict[str, Any]]
+    ) -> None:
+        """Queue tool call rows and session counter increments (see ``record_tool_calls``)."""
+        if calls:
+            await self._put(_Record("tool_calls", (session_id, execution_log_id, list(calls))))
+
+    async def memory_saved(self, entry: AgentMemory) -> None:
+        """Queue the insert of a conversation memory entry."""
+        await self._put(_Record("memory", _row(entry)))
+
+    async def flush(self) -> bool:
+        """
+        Wait until every record queued before this call has been written.
+
+        Returns:
+            False if any record failed to write while waiting
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._put(_Record("barrier", (future, self.failed)))
+        return await future
+
+    async def _next_batch(self) -> list[_Record]:
+        """Wait for a record, then collect more until full, lingered out, or a barrier."""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval_ms / 1000
+        while len(batch) < self.batch_size and batch[-1].kind not in ("barrier", "stop"):
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            stopping = batch[-1] is _STOP
+            if stopping:
+                # Producers that were waiting on a full queue got in after the stop marker
+                while not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+            await self._process([record for record in batch if record is not _STOP])
+            if stopping:
+                return
+
+    async def _process(self, batch: list[_Record]) -> None:
+        records = [record for record in batch if record.kind != "barrier"]
+        started = time.perf_counter()
+        failed = 0
+        if records:
+            try:
+                await self._write(records)
+            except Exception as e:
+                logger.warning(f"Batch of {len(records)} execution records failed, retrying singly: {e}")
+                failed = await self._write_singly(records)
+        self.written += len(records) - failed
+        self.failed += failed
+        if records:
+            metrics_collector.record_recorder_flush(
+                len(records) - failed, failed, time.perf_counter() - started, self.depth
+            )
+
+        for record in batch:
+            if record.kind == "barrier":
+                future, failed_before = record.data
+                if not future.done():
+                    future.set_result(self.failed == failed_before)
+
+    async def _write_singly(self, records: list[_Record]) -> int:
+        failed = 0
+        for record in records:
+            try:
+                await self._write([record])
+            except Exception as e:
+                failed += 1
+                logger.error(f"Failed to write execution record ({record.kind}): {e}")
+        return failed
+
+    async def _write(self, records: list[_Record]) -> None:
+        """Write records in one transaction."""
+        logs: dict[UUID, dict[str, Any]] = {}
+        updates: dict[UUID, dict[str, Any]] = {}
+        calls_by_session: dict[UUID, list[dict[str, Any]]] = defaultdict(list)
+        memory: list[dict[str, Any]] = []
+
+        for record in records:
+            if record.kind == "log":
+                logs[record.data["id"]] = dict(record.data)
+            elif record.kind == "log_update":
+                log_id, values = record.data
+                if log_id in logs:
+                    # Created in this batch: insert the final values once
+                    logs[log_id].update(values)
+                else:
+                    updates.setdefault(log_id, {"id": log_id}).update(values)
+            elif record.kind == "tool_calls":
+                session_id, log_id, calls = record.data
+                calls_by_session[session_id].extend(tool_call_rows(log_id, calls))
+            elif record.kind == "memory":
+                memory.append(record.data)
+
+        async with self._session_factory() as db:
+            if logs:
+                await db.execute(insert(ExecutionLog), list(logs.values()))
+            if updates:
+                await db.execute(update(ExecutionLog), list(updates.values()))
+            tool_calls = [row for rows in calls_by_session.values() for row in rows]
+            if tool_calls:
+                await db.execute(insert(ToolCall), tool_calls)
+                for session_id, rows in calls_by_session.items():
+                    await increment_session_usage(db, session_id, rows)
+            if memory:
+                await db.execute(insert(AgentMemory), memory)
+            await db.commit()
+
+
+# Global recorder, started and drained by the application lifespan
+execution_recorder = ExecutionRecorder()
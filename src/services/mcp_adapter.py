@@ -105,6 +105,9 @@ class CryptoComMCPAdapter:
                                 "volume_24h": price_data.volume_24h,
                                 "change_24h": price_data.change_24h,
                                 "timestamp": price_data.timestamp,
+                                "source": price_data.source,
+                                "as_of": price_data.as_of,
+                                "cache": price_data.cache,
                                 "success": True
                             }
                         except Exception as e:
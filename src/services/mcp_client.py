@@ -8,7 +8,7 @@ to get real-time cryptocurrency prices and market data.
 import asyncio
 import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 
@@ -17,9 +17,19 @@ from httpx import TimeoutException as HttpxTimeoutException
 
 from src.core.config import settings
 from src.core.errors import create_safe_error_message
+from src.core.http_client import get_http_client
+from src.core.swr_cache import StaleWhileRevalidateCache
 
 logger = logging.getLogger(__name__)
 
+# Prices by (server, symbol), shared by all client instances
+price_cache = StaleWhileRevalidateCache(
+    "mcp_prices",
+    fresh_seconds=settings.price_cache_fresh_seconds,
+    stale_seconds=settings.price_cache_stale_seconds,
+    max_entries=settings.market_cache_max_entries,
+)
+
 
 @dataclass
 class PriceData:
@@ -29,6 +39,9 @@ class PriceData:
     volume_24h: float
     change_24h: float
     timestamp: int
+    source: str = "mcp"
+    as_of: float = 0.0  # epoch seconds when fetched from the server
+    cache: str = "live"  # live, fresh or stale
 
 
 class MCPServerError(Exception):
@@ -47,16 +60,17 @@ class MCPServerClient:
     - Rate limiting and error handling
     """
 
-    def __init__(self, server_url: str | None = None):
+    def __init__(self, server_url: str | None = None, http_client: httpx.AsyncClient | None = None):
         """
         Initialize the MCP server client.
 
         Args:
             server_url: URL of the MCP server. If None, uses settings.crypto_com_mcp_url
+            http_client: Optional HTTP client. Defaults to the shared pooled client.
         """
         self.server_url = server_url or settings.crypto_com_mcp_url
         self.api_key = settings.crypto_com_api_key
-        self.session = httpx.AsyncClient(timeout=30.0)
+        self._session = http_client
         self.last_request_time = 0
         self.rate_limit_delay = 0.1  # 100ms between requests
 
@@ -68,9 +82,15 @@ class MCPServerClient:
         """Async context manager exit."""
         await self.close()
 
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """HTTP client used for MCP requests."""
+        return self._session if self._session is not None else get_http_client()
+
     async def close(self) -> None:
-        """Close the HTTP session."""
-        await self.session.aclose()
+        """Close the HTTP session (the shared client is closed on app shutdown)."""
+        if self._session is not None:
+            await self._session.aclose()
 
     async def _rate_limit(self) -> None:
         """Enforce rate limiting between requests."""
@@ -130,12 +150,17 @@ class MCPServerClient:
             logger.error(f"MCP server unexpected error: {e}")
             raise MCPServerError(f"Unexpected error: {create_safe_error_message(e)}")
 
-    async def get_price(self, symbol: str) -> PriceData:
+    async def get_price(self, symbol: str, use_cache: bool = True) -> PriceData:
         """
         Get current price for a cryptocurrency symbol.
 
+        Prices are cached: fresh for ``price_cache_fresh_seconds``, then served
+        stale while one background refresh runs, up to ``price_cache_stale_seconds``.
+        ``as_of`` and ``cache`` on the result tell how old the price is.
+
         Args:
             symbol: Trading pair symbol (e.g., 'BTC_USDT', 'ETH_USDC')
+            use_cache: Serve cached prices
 
         Returns:
             PriceData with current market information
@@ -144,6 +169,16 @@ class MCPServerClient:
             price = await client.get_price("BTC_USDT")
             print(f"BTC/USDT: ${price.price}")
         """
+        if not use_cache:
+            return await self._fetch_price(symbol)
+
+        cached = await price_cache.get(
+            (self.server_url, symbol.upper()), lambda: self._fetch_price(symbol)
+        )
+        return replace(cached.value, as_of=round(cached.as_of, 3), cache=cached.cache)
+
+    async def _fetch_price(self, symbol: str) -> PriceData:
+        """Fetch a price from the MCP server."""
         logger.info(f"Getting price for {symbol}")
 
         # MCP protocol endpoint for market data
@@ -160,7 +195,8 @@ class MCPServerClient:
                 price=float(data["price"]),
                 volume_24h=float(data.get("volume", 0)),
                 change_24h=float(data.get("change", 0)),
-                timestamp=int(data.get("timestamp", int(datetime.now().timestamp())))
+                timestamp=int(data.get("timestamp", int(datetime.now().timestamp()))),
+                as_of=time.time(),
             )
 
             logger.info(f"Price data for {symbol}: {price_data.price}")
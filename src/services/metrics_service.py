@@ -6,11 +6,93 @@ Prometheus-formatted metrics for monitoring and observability.
 """
 
 import time
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+from typing import Any
 
+from src.core.prometheus import MetricsRegistry
 from src.services.cache import cache_metrics
 
 
+@dataclass
+class PoolCheckoutStats:
+    """Checkout statistics for a single database connection pool."""
+
+    checkouts: int = 0
+    waits: int = 0
+    timeouts: int = 0
+    total_checkout_ms: float = 0.0
+    max_checkout_ms: float = 0.0
+
+
+class DatabasePoolMetrics:
+    """Track database connection pool checkout latency, waits and saturation."""
+
+    def __init__(self):
+        self._stats: dict[str, PoolCheckoutStats] = {}
+        self._pools: dict[str, Callable[[], Any]] = {}
+
+    def register_pool(self, profile: str, pool_getter: Callable[[], Any]) -> None:
+        """
+        Register a pool so its live utilisation can be reported.
+
+        Args:
+            profile: Pool profile name (request, background, reporting)
+            pool_getter: Callable returning the engine's current pool. A getter is
+                used because ``engine.dispose()`` replaces the pool instance.
+        """
+        self._pools[profile] = pool_getter
+        self._stats.setdefault(profile, PoolCheckoutStats())
+
+    def record_checkout(
+        self, profile: str, duration_ms: float, waited: bool, timed_out: bool = False
+    ):
+        """Record a connection checkout from a pool."""
+        stats = self._stats.setdefault(profile, PoolCheckoutStats())
+        stats.checkouts += 1
+        stats.total_checkout_ms += duration_ms
+        stats.max_checkout_ms = max(stats.max_checkout_ms, duration_ms)
+        if waited:
+            stats.waits += 1
+        if timed_out:
+            stats.timeouts += 1
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get checkout statistics and live utilisation for every pool."""
+        result = {}
+        for profile, stats in self._stats.items():
+            entry: dict[str, Any] = {
+                "checkouts": stats.checkouts,
+                "waits": stats.waits,
+                "timeouts": stats.timeouts,
+                "avg_checkout_ms": round(
+                    stats.total_checkout_ms / stats.checkouts, 3
+                ) if stats.checkouts > 0 else 0.0,
+                "max_checkout_ms": round(stats.max_checkout_ms, 3),
+                "checked_out": 0,
+                "capacity": 0,
+                "saturation": 0.0,
+            }
+            pool_getter = self._pools.get(profile)
+            pool = pool_getter() if pool_getter else None
+            if pool is not None and hasattr(pool, "capacity"):
+                capacity = pool.capacity()
+                checked_out = pool.checkedout()
+                entry["checked_out"] = checked_out
+                entry["capacity"] = capacity
+                entry["saturation"] = round(checked_out / capacity, 4) if capacity > 0 else 0.0
+            result[profile] = entry
+        return result
+
+    def reset(self) -> None:
+        """Reset checkout statistics (registered pools are kept)."""
+        self._stats = {profile: PoolCheckoutStats() for profile in self._pools}
+
+
+# Global database pool metrics
+pool_metrics = DatabasePoolMetrics()
+
+
 @dataclass
 class MetricsCollector:
     """Collects and exposes application metrics for Prometheus."""
@@ -49,15 +131,135 @@ class MetricsCollector:
     # Timing tracking
     start_time: float = field(default_factory=time.time)
 
-    def record_request(self, duration_seconds: float, error: bool = False):
-        """Record a request."""
+    # Labelled counters and latency histograms
+    registry: MetricsRegistry = field(default_factory=MetricsRegistry)
+
+    def __post_init__(self):
+        self.http_requests = self.registry.counter(
+            "paygent_http_requests_total",
+            "HTTP requests by route template, method and status code",
+            ("route", "method", "status"),
+        )
+        self.http_request_duration = self.registry.histogram(
+            "paygent_http_request_duration_seconds",
+            "HTTP request latency by route template and method",
+            ("route", "method"),
+        )
+        self.agent_runs = self.registry.counter(
+            "paygent_agent_runs_total",
+            "Agent executions by parsed intent and outcome",
+            ("intent", "outcome"),
+        )
+        self.agent_run_duration = self.registry.histogram(
+            "paygent_agent_run_duration_seconds",
+            "Agent execution latency by parsed intent",
+            ("intent",),
+        )
+        self.tool_calls = self.registry.counter(
+            "paygent_tool_calls_total",
+            "Agent tool calls by tool name and outcome",
+            ("tool", "outcome"),
+        )
+        self.tool_call_duration = self.registry.histogram(
+            "paygent_tool_call_duration_seconds",
+            "Agent tool call latency by tool name",
+            ("tool",),
+        )
+        self.http_client_requests = self.registry.counter(
+            "paygent_http_client_requests_total",
+            "Outbound HTTP requests by host and whether a pooled connection was reused",
+            ("host", "connection"),
+        )
+        self.http_client_in_flight = self.registry.gauge(
+            "paygent_http_client_in_flight_requests",
+            "Outbound HTTP requests currently in flight by host",
+            ("host",),
+        )
+        self.x402_requirements_cache = self.registry.counter(
+            "paygent_x402_requirements_cache_total",
+            "x402 payment requirement lookups by result (hit, miss, invalidated)",
+            ("result",),
+        )
+        self.cache_recomputes = self.registry.counter(
+            "paygent_cache_recomputes_total",
+            "Cache fills by outcome (computed, coalesced, remote, stale, early)",
+            ("result",),
+        )
+        self.recorder_queue_depth = self.registry.gauge(
+            "paygent_execution_recorder_queue_depth",
+            "Execution records waiting to be written",
+        )
+        self.recorder_enqueue_waits = self.registry.counter(
+            "paygent_execution_recorder_enqueue_waits_total",
+            "Records that found the recorder queue full and waited for space",
+        )
+        self.recorder_records = self.registry.counter(
+            "paygent_execution_recorder_records_total",
+            "Execution records by write outcome (written, failed)",
+            ("outcome",),
+        )
+        self.recorder_flush_duration = self.registry.histogram(
+            "paygent_execution_recorder_flush_duration_seconds",
+            "Time to write one batch of execution records",
+        )
+        self.llm_cache_lookups = self.registry.counter(
+            "paygent_llm_cache_lookups_total",
+            "Agent LLM invocations by response cache result "
+            "(exact, normalized, semantic, miss, uncacheable, bypass)",
+            ("result",),
+        )
+        self.llm_cache_tokens_saved = self.registry.counter(
+            "paygent_llm_cache_tokens_saved_total",
+            "LLM tokens not spent because a cached response was served",
+        )
+        self.llm_cache_latency_saved = self.registry.counter(
+            "paygent_llm_cache_latency_saved_seconds_total",
+            "LLM invocation time not spent because a cached response was served",
+        )
+        self.agent_graph_lookups = self.registry.counter(
+            "paygent_agent_graph_lookups_total",
+            "Agent graph requests by whether a compiled graph was reused (hit) or built (build)",
+            ("result",),
+        )
+        self.agent_graph_build_duration = self.registry.histogram(
+            "paygent_agent_graph_build_duration_seconds",
+            "Time to build and compile one deepagents graph",
+        )
+
+    def record_request(
+        self,
+        duration_seconds: float,
+        error: bool = False,
+        route: str | None = None,
+        method: str | None = None,
+        status_code: int | None = None,
+    ):
+        """
+        Record a request.
+
+        Args:
+            duration_seconds: Request duration
+            error: Whether the request failed (status >= 400 or exception)
+            route: Route template (e.g. ``/api/v1/payments/{payment_id}``);
+                raw paths would create a series per ID, so pass the template
+            method: HTTP method
+            status_code: Response status code
+        """
         self.request_count += 1
         self.request_duration_seconds += duration_seconds
         if error:
             self.request_errors += 1
 
-    def record_agent_execution(self, duration_seconds: float, success: bool):
-        """Record an agent execution."""
+        if route is not None:
+            method = method or "UNKNOWN"
+            status = str(status_code) if status_code is not None else ("500" if error else "200")
+            self.http_requests.labels(route, method, status).inc()
+            self.http_request_duration.labels(route, method).observe(duration_seconds)
+
+    def record_agent_execution(
+        self, duration_seconds: float, success: bool, intent: str | None = None
+    ):
+        """Record an agent execution, optionally labelled by parsed intent."""
         self.agent_executions += 1
         self.agent_execution_duration_seconds += duration_seconds
         if success:
@@ -65,6 +267,62 @@ class MetricsCollector:
         else:
             self.agent_executions_failed += 1
 
+        intent = intent or "unknown"
+        self.agent_runs.labels(intent, "success" if success else "failure").inc()
+        self.agent_run_duration.labels(intent).observe(duration_seconds)
+
+    def record_tool_call(
+        self, tool_name: str, success: bool, duration_seconds: float | None = None
+    ):
+        """Record an agent tool call."""
+        self.tool_calls.labels(tool_name, "success" if success else "failure").inc()
+        if duration_seconds is not None:
+            self.tool_call_duration.labels(tool_name).observe(duration_seconds)
+
+    def record_http_client_request(self, host: str, reused: bool):
+        """Record an outbound HTTP request and whether it reused a connection."""
+        self.http_client_requests.labels(host, "reused" if reused else "new").inc()
+
+    def record_x402_requirements_cache(self, result: str):
+        """Record a payment requirements cache hit, miss or invalidation."""
+        self.x402_requirements_cache.labels(result).inc()
+
+    def record_cache_recompute(self, result: str):
+        """Record how a cache miss or early refresh was resolved."""
+        self.cache_recomputes.labels(result).inc()
+
+    def record_recorder_enqueue(self, depth: int, waited: bool):
+        """Record an execution record entering the write-behind queue."""
+        self.recorder_queue_depth.set(depth)
+        if waited:
+            self.recorder_enqueue_waits.inc()
+
+    def record_recorder_flush(
+        self, written: int, failed: int, duration_seconds: float, depth: int
+    ):
+        """Record a batch written by the execution recorder."""
+        self.recorder_records.labels("written").inc(written)
+        if failed:
+            self.recorder_records.labels("failed").inc(failed)
+        self.recorder_flush_duration.observe(duration_seconds)
+        self.recorder_queue_depth.set(depth)
+
+    def record_llm_cache(
+        self, result: str, tokens_saved: int = 0, latency_saved_seconds: float = 0.0
+    ):
+        """Record an agent LLM invocation and what a cache hit saved."""
+        self.llm_cache_lookups.labels(result).inc()
+        if tokens_saved:
+            self.llm_cache_tokens_saved.inc(tokens_saved)
+        if latency_saved_seconds:
+            self.llm_cache_latency_saved.inc(latency_saved_seconds)
+
+    def record_agent_graph(self, result: str, build_seconds: float | None = None):
+        """Record an agent graph lookup and, for builds, how long construction took."""
+        self.agent_graph_lookups.labels(result).inc()
+        if build_seconds is not None:
+            self.agent_graph_build_duration.observe(build_seconds)
+
     def record_payment(self, amount_usd: float, success: bool):
         """Record a payment."""
         self.payments_total += 1
@@ -109,6 +367,18 @@ class MetricsCollector:
         Returns:
             Prometheus-formatted metrics string
         """
+        return "".join(self.iter_prometheus_metrics())
+
+    def iter_prometheus_metrics(self) -> Iterator[str]:
+        """
+        Render all metrics in Prometheus text format, one family at a time.
+
+        Suitable for streaming responses: nothing is accumulated beyond the
+        family currently being rendered.
+
+        Yields:
+            str: Text exposition chunks
+        """
         uptime_seconds = time.time() - self.start_time
 
         # Calculate averages
@@ -124,121 +394,97 @@ class MetricsCollector:
         # Cache metrics from cache service
         cache_stats = cache_metrics.get_stats()
 
-        metrics = [
-            "# HELP paygent_uptime_seconds Application uptime in seconds",
-            "# TYPE paygent_uptime_seconds gauge",
-            f"paygent_uptime_seconds {uptime_seconds:.2f}",
-            "",
-            "# HELP paygent_request_total Total number of HTTP requests",
-            "# TYPE paygent_request_total counter",
-            f"paygent_request_total {self.request_count}",
-            "",
-            "# HELP paygent_request_errors_total Total number of HTTP request errors",
-            "# TYPE paygent_request_errors_total counter",
-            f"paygent_request_errors_total {self.request_errors}",
-            "",
-            "# HELP paygent_request_duration_seconds_total Total duration of all requests in seconds",
-            "# TYPE paygent_request_duration_seconds_total counter",
-            f"paygent_request_duration_seconds_total {self.request_duration_seconds:.3f}",
-            "",
-            "# HELP paygent_request_duration_seconds Average request duration in seconds",
-            "# TYPE paygent_request_duration_seconds gauge",
-            f"paygent_request_duration_seconds {avg_request_duration:.3f}",
-            "",
-            "# HELP paygent_agent_executions_total Total number of agent executions",
-            "# TYPE paygent_agent_executions_total counter",
-            f"paygent_agent_executions_total {self.agent_executions}",
-            "",
-            "# HELP paygent_agent_executions_success_total Total successful agent executions",
-            "# TYPE paygent_agent_executions_success_total counter",
-            f"paygent_agent_executions_success_total {self.agent_executions_success}",
-            "",
-            "# HELP paygent_agent_executions_failed_total Total failed agent executions",
-            "# TYPE paygent_agent_executions_failed_total counter",
-            f"paygent_agent_executions_failed_total {self.agent_executions_failed}",
-            "",
-            "# HELP paygent_agent_execution_duration_seconds Average agent execution duration",
-            "# TYPE paygent_agent_execution_duration_seconds gauge",
-            f"paygent_agent_execution_duration_seconds {avg_agent_duration:.3f}",
-            "",
-            "# HELP paygent_payments_total Total number of payments",
-            "# TYPE paygent_payments_total counter",
-            f"paygent_payments_total {self.payments_total}",
-            "",
-            "# HELP paygent_payments_success_total Total successful payments",
-            "# TYPE paygent_payments_success_total counter",
-            f"paygent_payments_success_total {self.payments_success}",
-            "",
-            "# HELP paygent_payments_failed_total Total failed payments",
-            "# TYPE paygent_payments_failed_total counter",
-            f"paygent_payments_failed_total {self.payments_failed}",
-            "",
-            "# HELP paygent_payments_total_value_usd Total value of all payments in USD",
-            "# TYPE paygent_payments_total_value_usd counter",
-            f"paygent_payments_total_value_usd {self.payments_total_value_usd:.2f}",
-            "",
-            "# HELP paygent_approvals_requested_total Total number of approval requests",
-            "# TYPE paygent_approvals_requested_total counter",
-            f"paygent_approvals_requested_total {self.approvals_requested}",
-            "",
-            "# HELP paygent_approvals_granted_total Total number of approvals granted",
-            "# TYPE paygent_approvals_granted_total counter",
-            f"paygent_approvals_granted_total {self.approvals_granted}",
-            "",
-            "# HELP paygent_approvals_denied_total Total number of approvals denied",
-            "# TYPE paygent_approvals_denied_total counter",
-            f"paygent_approvals_denied_total {self.approvals_denied}",
-            "",
-            "# HELP paygent_websocket_connections_total Total WebSocket connections",
-            "# TYPE paygent_websocket_connections_total counter",
-            f"paygent_websocket_connections_total {self.websocket_connections}",
-            "",
-            "# HELP paygent_websocket_messages_received_total Total WebSocket messages received",
-            "# TYPE paygent_websocket_messages_received_total counter",
-            f"paygent_websocket_messages_received_total {self.websocket_messages_received}",
-            "",
-            "# HELP paygent_websocket_messages_sent_total Total WebSocket messages sent",
-            "# TYPE paygent_websocket_messages_sent_total counter",
-            f"paygent_websocket_messages_sent_total {self.websocket_messages_sent}",
-            "",
-            "# HELP paygent_sessions_created_total Total sessions created",
-            "# TYPE paygent_sessions_created_total counter",
-            f"paygent_sessions_created_total {self.sessions_created}",
-            "",
-            "# HELP paygent_sessions_active Current number of active sessions",
-            "# TYPE paygent_sessions_active gauge",
-            f"paygent_sessions_active {self.sessions_active}",
-            "",
-            "# HELP paygent_cache_hits_total Total cache hits",
-            "# TYPE paygent_cache_hits_total counter",
-            f"paygent_cache_hits_total {cache_stats['hits']}",
-            "",
-            "# HELP paygent_cache_misses_total Total cache misses",
-            "# TYPE paygent_cache_misses_total counter",
-            f"paygent_cache_misses_total {cache_stats['misses']}",
-            "",
-            "# HELP paygent_cache_hit_rate Cache hit rate percentage",
-            "# TYPE paygent_cache_hit_rate gauge",
-            f"paygent_cache_hit_rate {cache_stats['hit_rate_percent']}",
-            "",
-            "# HELP paygent_cache_sets_total Total cache set operations",
-            "# TYPE paygent_cache_sets_total counter",
-            f"paygent_cache_sets_total {cache_stats['sets']}",
-            "",
-            "# HELP paygent_cache_deletes_total Total cache delete operations",
-            "# TYPE paygent_cache_deletes_total counter",
-            f"paygent_cache_deletes_total {cache_stats['deletes']}",
-            "",
-            "# HELP paygent_cache_avg_get_time_ms Average cache get time in milliseconds",
-            "# TYPE paygent_cache_avg_get_time_ms gauge",
-            f"paygent_cache_avg_get_time_ms {cache_stats['avg_get_time_ms']}",
-            "",
-            "# HELP paygent_cache_avg_set_time_ms Average cache set time in milliseconds",
-            "# TYPE paygent_cache_avg_set_time_ms gauge",
-            f"paygent_cache_avg_set_time_ms {cache_stats['avg_set_time_ms']}",
+        scalars = (
+            ("paygent_uptime_seconds", "gauge",
+             "Application uptime in seconds", f"{uptime_seconds:.2f}"),
+            ("paygent_request_total", "counter",
+             "Total number of HTTP requests", self.request_count),
+            ("paygent_request_errors_total", "counter",
+             "Total number of HTTP request errors", self.request_errors),
+            ("paygent_request_duration_seconds_total", "counter",
+             "Total duration of all requests in seconds", f"{self.request_duration_seconds:.3f}"),
+            ("paygent_request_duration_seconds", "gauge",
+             "Average request duration in seconds", f"{avg_request_duration:.3f}"),
+            ("paygent_agent_executions_total", "counter",
+             "Total number of agent executions", self.agent_executions),
+            ("paygent_agent_executions_success_total", "counter",
+             "Total successful agent executions", self.agent_executions_success),
+            ("paygent_agent_executions_failed_total", "counter",
+             "Total failed agent executions", self.agent_executions_failed),
+            ("paygent_agent_execution_duration_seconds", "gauge",
+             "Average agent execution duration", f"{avg_agent_duration:.3f}"),
+            ("paygent_payments_total", "counter",
+             "Total number of payments", self.payments_total),
+            ("paygent_payments_success_total", "counter",
+             "Total successful payments", self.payments_success),
+            ("paygent_payments_failed_total", "counter",
+             "Total failed payments", self.payments_failed),
+            ("paygent_payments_total_value_usd", "counter",
+             "Total value of all payments in USD", f"{self.payments_total_value_usd:.2f}"),
+            ("paygent_approvals_requested_total", "counter",
+             "Total number of approval requests", self.approvals_requested),
+            ("paygent_approvals_granted_total", "counter",
+             "Total number of approvals granted", self.approvals_granted),
+            ("paygent_approvals_denied_total", "counter",
+             "Total number of approvals denied", self.approvals_denied),
+            ("paygent_websocket_connections_total", "counter",
+             "Total WebSocket connections", self.websocket_connections),
+            ("paygent_websocket_messages_received_total", "counter",
+             "Total WebSocket messages received", self.websocket_messages_received),
+            ("paygent_websocket_messages_sent_total", "counter",
+             "Total WebSocket messages sent", self.websocket_messages_sent),
+            ("paygent_sessions_created_total", "counter",
+             "Total sessions created", self.sessions_created),
+            ("paygent_sessions_active", "gauge",
+             "Current number of active sessions", self.sessions_active),
+            ("paygent_cache_hits_total", "counter",
+             "Total cache hits", cache_stats["hits"]),
+            ("paygent_cache_misses_total", "counter",
+             "Total cache misses", cache_stats["misses"]),
+            ("paygent_cache_hit_rate", "gauge",
+             "Cache hit rate percentage", cache_stats["hit_rate_percent"]),
+            ("paygent_cache_sets_total", "counter",
+             "Total cache set operations", cache_stats["sets"]),
+            ("paygent_cache_deletes_total", "counter",
+             "Total cache delete operations", cache_stats["deletes"]),
+            ("paygent_cache_avg_get_time_ms", "gauge",
+             "Average cache get time in milliseconds", cache_stats["avg_get_time_ms"]),
+            ("paygent_cache_avg_set_time_ms", "gauge",
+             "Average cache set time in milliseconds", cache_stats["avg_set_time_ms"]),
+        )
+        for name, metric_type, help_text, value in scalars:
+            yield f"# HELP {name} {help_text}\n# TYPE {name} {metric_type}\n{name} {value}\n"
+
+        yield from self.registry.iter_lines()
+        yield from self._iter_pool_prometheus_metrics()
+
+    def _iter_pool_prometheus_metrics(self) -> Iterator[str]:
+        """Render database pool metrics, one sample per pool profile."""
+        pool_stats = pool_metrics.get_stats()
+        if not pool_stats:
+            return
+
+        series = [
+            ("paygent_db_pool_checkouts_total", "counter",
+             "Total connections checked out of the pool", "checkouts"),
+            ("paygent_db_pool_waits_total", "counter",
+             "Checkouts that found the pool at capacity and had to wait", "waits"),
+            ("paygent_db_pool_timeouts_total", "counter",
+             "Checkouts that timed out waiting for a connection", "timeouts"),
+            ("paygent_db_pool_checkout_ms_avg", "gauge",
+             "Average pool checkout latency in milliseconds", "avg_checkout_ms"),
+            ("paygent_db_pool_checkout_ms_max", "gauge",
+             "Maximum pool checkout latency in milliseconds", "max_checkout_ms"),
+            ("paygent_db_pool_checked_out", "gauge",
+             "Connections currently checked out", "checked_out"),
+            ("paygent_db_pool_saturation", "gauge",
+             "Checked out connections divided by pool size plus overflow", "saturation"),
         ]
 
-        return "\n".join(metrics)
+        for name, metric_type, help_text, stat_key in series:
+            yield f"# HELP {name} {help_text}\n# TYPE {name} {metric_type}\n"
+            for profile, stats in pool_stats.items():
+                yield f'{name}{{pool="{profile}"}} {stats[stat_key]}\n'
 
 
 # Global metrics collector instance
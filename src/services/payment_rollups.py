@@ -0,0 +1,249 @@
+"""
+Incrementally maintained payment statistics.
+
+Payment statistics used to GROUP BY and SUM over every payment in the
+window on each request, and dashboards poll that endpoint constantly.
+Instead, payment_stats_rollups keeps payment counts and amounts per
+(hour | day bucket, wallet, status). It is updated in the same transaction
+as the payment write:
+
+- a new payment adds 1 (and its amount) to its status's buckets
+- a status change moves 1 (and the amount) from the old status to the new
+
+Buckets are keyed on the payment's ``created_at``, so a status change
+updates the buckets the payment was counted in originally. Statistics then
+sum at most ``days`` daily rows plus up to 24 hourly rows for the partial
+first day, per wallet and status.
+
+``rebuild_rollups`` backfills from raw payments, and ``check_rollups``
+compares rollups to raw rows (see scripts/backfill_payment_rollups.py).
+"""
+
+import logging
+import math
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import upsert_increment
+from src.models.payments import Payment, PaymentStatsRollup
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES = ("hour", "day")
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    """Truncate a timestamp to the start of its hour or day bucket."""
+    if granularity == "hour":
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+async def _add(
+    db: AsyncSession,
+    created_at: datetime,
+    agent_wallet: str,
+    status: str,
+    count: int,
+    amount: float,
+) -> None:
+    """Add count/amount to the hour and day buckets of one wallet and status."""
+    for granularity in GRANULARITIES:
+        await upsert_increment(
+            db,
+            PaymentStatsRollup,
+            key={
+                "granularity": granularity,
+                "bucket_start": bucket_start(created_at, granularity),
+                "agent_wallet": agent_wallet,
+                "status": status,
+            },
+            increments={"payment_count": count, "amount_total": amount},
+        )
+
+
+async def record_payment_created(db: AsyncSession, payment: Payment) -> None:
+    """
+    Count a new payment. Call after flush, before commit.
+
+    Args:
+        db: Session holding the payment write
+        payment: Flushed payment with ``created_at`` loaded
+    """
+    await _add(db, payment.created_at, payment.agent_wallet, payment.status, 1, payment.amount)
+
+
+async def record_status_change(db: AsyncSession, payment: Payment, old_status: str) -> None:
+    """
+    Move a payment between status buckets. Call before commit.
+
+    Args:
+        db: Session holding the payment write
+        payment: Payment with its new status
+        old_status: Status before the update
+    """
+    if old_status == payment.status:
+        return
+    await _add(db, payment.created_at, payment.agent_wallet, old_status, -1, -payment.amount)
+    await _add(db, payment.created_at, payment.agent_wallet, payment.status, 1, payment.amount)
+
+
+async def get_status_totals(
+    db: AsyncSession,
+    since: datetime,
+    wallet_address: str | None = None,
+) -> dict[str, tuple[int, float]]:
+    """
+    Sum rollups from ``since`` (hour resolution) to now, by status.
+
+    Hourly buckets cover the partial first day and daily buckets the rest.
+
+    Args:
+        db: Database session
+        since: Window start
+        wallet_address: Optional wallet filter
+
+    Returns:
+        Mapping of status to (payment count, amount total)
+    """
+    first_hour = bucket_start(since, "hour")
+    first_day = bucket_start(first_hour, "day")
+    if first_day < first_hour:
+        first_day += timedelta(days=1)
+
+    conditions = [
+        or_(
+            and_(
+                PaymentStatsRollup.granularity == "hour",
+                PaymentStatsRollup.bucket_start >= first_hour,
+                PaymentStatsRollup.bucket_start < first_day,
+            ),
+            and_(
+                PaymentStatsRollup.granularity == "day",
+                PaymentStatsRollup.bucket_start >= first_day,
+            ),
+        )
+    ]
+    if wallet_address:
+        conditions.append(PaymentStatsRollup.agent_wallet == wallet_address)
+
+    result = await db.execute(
+        select(
+            PaymentStatsRollup.status,
+            func.sum(PaymentStatsRollup.payment_count).label("count"),
+            func.sum(PaymentStatsRollup.amount_total).label("amount"),
+        )
+        .where(*conditions)
+        .group_by(PaymentStatsRollup.status)
+    )
+    return {row.status: (int(row.count or 0), float(row.amount or 0.0)) for row in result}
+
+
+async def rebuild_rollups(db: AsyncSession, batch_size: int = 5000) -> int:
+    """
+    Recompute all rollups from raw payments (backfill).
+
+    Runs in the caller's transaction; commit afterwards.
+
+    Args:
+        db: Database session
+        batch_size: Rows streamed per fetch
+
+    Returns:
+        Number of payments aggregated
+    """
+    totals: dict[tuple[str, datetime, str, str], list] = defaultdict(lambda: [0, 0.0])
+    processed = 0
+
+    stream = await db.stream(
+        select(Payment.created_at, Payment.agent_wallet, Payment.status, Payment.amount)
+        .execution_options(yield_per=batch_size)
+    )
+    async for created_at, agent_wallet, status, amount in stream:
+        for granularity in GRANULARITIES:
+            bucket = totals[(granularity, bucket_start(created_at, granularity), agent_wallet, status)]
+            bucket[0] += 1
+            bucket[1] += amount
+        processed += 1
+
+    await db.execute(delete(PaymentStatsRollup))
+    rows = [
+        {
+            "granularity": granularity,
+            "bucket_start": start,
+            "agent_wallet": agent_wallet,
+            "status": status,
+            "payment_count": count,
+            "amount_total": amount,
+        }
+        for (granularity, start, agent_wallet, status), (count, amount) in totals.items()
+    ]
+    for offset in range(0, len(rows), batch_size):
+        await db.execute(insert(PaymentStatsRollup), rows[offset:offset + batch_size])
+
+    logger.info(f"Rebuilt payment rollups from {processed} payments ({len(rows)} buckets)")
+    return processed
+
+
+async def check_rollups(db: AsyncSession) -> list[dict[str, Any]]:
+    """
+    Compare each granularity's rollups to raw payments per wallet and status.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Mismatches (empty when consistent), each with the wallet, status,
+        granularity and the raw vs rollup count and amount
+    """
+    raw_result = await db.execute(
+        select(
+            Payment.agent_wallet,
+            Payment.status,
+            func.count(Payment.id).label("count"),
+            func.sum(Payment.amount).label("amount"),
+        ).group_by(Payment.agent_wallet, Payment.status)
+    )
+    raw = {(row.agent_wallet, row.status): (row.count, float(row.amount or 0.0)) for row in raw_result}
+
+    rollup_result = await db.execute(
+        select(
+            PaymentStatsRollup.granularity,
+            PaymentStatsRollup.agent_wallet,
+            PaymentStatsRollup.status,
+            func.sum(PaymentStatsRollup.payment_count).label("count"),
+            func.sum(PaymentStatsRollup.amount_total).label("amount"),
+        ).group_by(
+            PaymentStatsRollup.granularity,
+            PaymentStatsRollup.agent_wallet,
+            PaymentStatsRollup.status,
+        )
+    )
+    rollups: dict[str, dict[tuple[str, str], tuple[int, float]]] = {g: {} for g in GRANULARITIES}
+    for row in rollup_result:
+        rollups.setdefault(row.granularity, {})[(row.agent_wallet, row.status)] = (
+            int(row.count or 0),
+            float(row.amount or 0.0),
+        )
+
+    mismatches = []
+    for granularity, totals in rollups.items():
+        for agent_wallet, status in raw.keys() | totals.keys():
+            raw_count, raw_amount = raw.get((agent_wallet, status), (0, 0.0))
+            count, amount = totals.get((agent_wallet, status), (0, 0.0))
+            # Amounts are float sums built in a different order; allow rounding drift
+            if count != raw_count or not math.isclose(amount, raw_amount, rel_tol=1e-9, abs_tol=1e-6):
+                mismatches.append({
+                    "granularity": granularity,
+                    "agent_wallet": agent_wallet,
+                    "status": status,
+                    "raw_count": raw_count,
+                    "rollup_count": count,
+                    "raw_amount": raw_amount,
+                    "rollup_amount": amount,
+                })
+    return mismatches
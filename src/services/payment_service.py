@@ -10,13 +10,22 @@ from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.pagination import apply_keyset, count_rows, decode_cursor, split_page
 from src.models.payments import Payment
+from src.services.payment_rollups import (
+    get_status_totals,
+    record_payment_created,
+    record_status_change,
+)
 
 logger = logging.getLogger(__name__)
 
+# Reads of a payment's status before giving up on a contended status update
+STATUS_UPDATE_ATTEMPTS = 3
+
 
 class PaymentService:
     """Service for payment history and statistics."""
@@ -36,23 +45,32 @@ class PaymentService:
         status: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
-        offset: int = 0,
+        cursor: str | None = None,
         limit: int = 20,
+        total: str = "none",
     ) -> dict[str, Any]:
         """
-        Get payment history with filtering and pagination.
+        Get payment history with filtering and keyset pagination.
 
         Args:
             wallet_address: Filter by wallet address
             status: Filter by payment status (pending, confirmed, failed)
             start_date: Filter by start date
             end_date: Filter by end date
-            offset: Pagination offset
+            cursor: ``next_cursor`` from the previous page
             limit: Max results to return
+            total: "none", "estimate" or "exact" total count
 
         Returns:
-            Dict containing payment history
+            Dict containing payment history and the next cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
+        # Validate before the catch-all so a bad cursor is a client error
+        if cursor:
+            decode_cursor(cursor)
+
         try:
             # Build query with filters
             query = select(Payment)
@@ -71,18 +89,12 @@ class PaymentService:
             if conditions:
                 query = query.where(*conditions)
 
-            # Get total count
-            count_result = await self.db.execute(
-                select(func.count()).select_from(query.subquery())
-            )
-            total = count_result.scalar() or 0
-
-            # Get paginated results
-            query = query.order_by(Payment.created_at.desc())
-            query = query.offset(offset).limit(limit)
+            count, is_estimate = await count_rows(self.db, query, total)
 
+            # Get the page after the cursor
+            query = apply_keyset(query, Payment.created_at, Payment.id, cursor, limit)
             result = await self.db.execute(query)
-            payments = result.scalars().all()
+            payments, next_cursor = split_page(result.scalars().all(), limit)
 
             # Format response
             payment_list = []
@@ -102,8 +114,9 @@ class PaymentService:
             return {
                 "success": True,
                 "payments": payment_list,
-                "total": total,
-                "offset": offset,
+                "next_cursor": next_cursor,
+                "total": count,
+                "total_is_estimate": is_estimate,
                 "limit": limit,
             }
 
@@ -113,8 +126,9 @@ class PaymentService:
                 "success": False,
                 "error": str(e),
                 "payments": [],
-                "total": 0,
-                "offset": offset,
+                "next_cursor": None,
+                "total": None,
+                "total_is_estimate": False,
                 "limit": limit,
             }
 
@@ -225,7 +239,8 @@ class PaymentService:
         Get payment statistics.
 
         Calculates aggregate statistics including total payments,
-        success rates, and amounts over a time period.
+        success rates, and amounts over a time period. Answered from
+        payment_stats_rollups at hour resolution.
 
         Args:
             wallet_address: Optional wallet address to filter by
@@ -238,22 +253,9 @@ class PaymentService:
             # Calculate date cutoff
             cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-            # Build query
-            conditions = [Payment.created_at >= cutoff_date]
-            if wallet_address:
-                conditions.append(Payment.agent_wallet == wallet_address)
-
-            # Get count by status
-            result = await self.db.execute(
-                select(
-                    Payment.status,
-                    func.count(Payment.id).label('count')
-                )
-                .where(*conditions)
-                .group_by(Payment.status)
-            )
-
-            status_counts = {row.status: row.count for row in result}
+            # Count and amount by status, from the hourly/daily rollups
+            totals = await get_status_totals(self.db, cutoff_date, wallet_address)
+            status_counts = {status: count for status, (count, _) in totals.items()}
 
             total_payments = sum(status_counts.values())
             confirmed_payments = status_counts.get('confirmed', 0)
@@ -267,13 +269,8 @@ class PaymentService:
                 else 0.0
             )
 
-            # Get total amount (only confirmed payments)
-            result = await self.db.execute(
-                select(func.sum(Payment.amount))
-                .where(*conditions)
-                .where(Payment.status == 'confirmed')
-            )
-            total_amount = result.scalar() or 0.0
+            # Total amount (only confirmed payments)
+            total_amount = totals.get('confirmed', (0, 0.0))[1]
 
             return {
                 "success": True,
@@ -339,6 +336,10 @@ class PaymentService:
             status=status,
         )
         self.db.add(payment)
+        await self.db.flush()
+        # Load the server-side created_at so rollups use the stored bucket
+        await self.db.refresh(payment)
+        await record_payment_created(self.db, payment)
         await self.db.commit()
         await self.db.refresh(payment)
 
@@ -354,6 +355,9 @@ class PaymentService:
         """
         Update payment status.
 
+        The update is conditional on the status read, so concurrent updates
+        cannot move the payment's rollups from a status it no longer has.
+
         Args:
             payment_id: Payment ID
             status: New status
@@ -362,19 +366,37 @@ class PaymentService:
         Returns:
             Updated Payment object or None if not found
         """
+        values: dict[str, Any] = {"status": status}
+        if tx_hash:
+            values["tx_hash"] = tx_hash
+
         try:
-            result = await self.db.execute(
-                select(Payment).where(Payment.id == payment_id)
-            )
-            payment = result.scalar_one_or_none()
+            for _ in range(STATUS_UPDATE_ATTEMPTS):
+                result = await self.db.execute(
+                    select(Payment)
+                    .where(Payment.id == payment_id)
+                    .execution_options(populate_existing=True)
+                )
+                payment = result.scalar_one_or_none()
 
-            if not payment:
-                return None
+                if not payment:
+                    return None
 
-            payment.status = status
-            if tx_hash:
-                payment.tx_hash = tx_hash
+                # Applies only if no concurrent update changed the status since it was read
+                old_status = payment.status
+                updated = await self.db.execute(
+                    update(Payment)
+                    .where(Payment.id == payment_id, Payment.status == old_status)
+                    .values(**values)
+                )
+                if updated.rowcount:
+                    break
+            else:
+                logger.warning(f"Payment {payment_id} status kept changing, not updated to {status}")
+                await self.db.rollback()
+                return None
 
+            await record_status_change(self.db, payment, old_status)
             await self.db.commit()
             await self.db.refresh(payment)
 
@@ -0,0 +1,355 @@
+"""
+Chunked, set-based data retention.
+
+Cleanup used to select every expired row into memory and delete it with one
+ORM ``delete()`` per row inside a single transaction. On a large backlog
+that meant unbounded memory and one long transaction holding locks.
+
+The retention engine works through expired rows in chunks. Each chunk is
+its own short transaction:
+
+1. select up to ``batch_size`` expired primary keys (oldest first)
+2. optionally hand the full rows to an archiver
+3. delete dependent rows (e.g. ``tool_calls`` of the logs being deleted),
+   deepest first, archiving them under their table name first when the
+   policy archives
+4. ``DELETE ... WHERE id IN (<chunk ids>)``, or ``UPDATE`` for policies
+   that mark rows instead of removing them
+
+Between chunks it sleeps ``throttle_ms`` so replication and concurrent
+requests keep up. A chunk's keys are read once, so the dependent and
+parent statements always act on the same rows.
+
+Policies are defined per table. ``default_policies()`` builds them from
+settings, and the service cleanup methods build them with their own ages.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.models.agent_sessions import (
+    AgentMemory,
+    AgentSession,
+    ApprovalRequest,
+    ServiceSubscription,
+)
+from src.models.execution_logs import ExecutionLog, SessionToolUsage, ToolCall
+
+logger = logging.getLogger(__name__)
+
+# Receives (policy name, rows as dicts) before they are deleted
+Archiver = Callable[[str, list[dict[str, Any]]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Dependent:
+    """Rows that reference the rows being deleted and must go first."""
+
+    model: Any
+    foreign_key: str
+    dependents: tuple["Dependent", ...] = ()
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How long rows of one table are kept and what happens to them after."""
+
+    name: str
+    model: Any
+    age_column: str
+    max_age: timedelta
+    conditions: tuple[Any, ...] = ()
+    dependents: tuple[Dependent, ...] = ()
+    # Set to mark expired rows with these values instead of deleting them
+    update_values: Callable[[], dict[str, Any]] | None = None
+    archive: bool = False
+
+
+@dataclass
+class RetentionResult:
+    """Outcome of running one policy."""
+
+    policy: str
+    rows: int = 0
+    dependent_rows: int = 0
+    chunks: int = 0
+    archived: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+def _pk(model: Any):
+    return model.__table__.primary_key.columns.values()[0]
+
+
+def _row_dict(row: Any) -> dict[str, Any]:
+    return {column.key: getattr(row, column.key) for column in row.__table__.columns}
+
+
+class JsonlArchiver:
+    """Append archived rows to ``<directory>/<policy>-<YYYY-MM-DD>.jsonl``."""
+
+    def __init__(self, directory: str):
+        """
+        Initialize the archiver.
+
+        Args:
+            directory: Directory for archive files (created if missing)
+        """
+        self.directory = directory
+
+    def _write(self, policy: str, rows: list[dict[str, Any]]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{policy}-{datetime.utcnow():%Y-%m-%d}.jsonl")
+        with open(path, "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    async def __call__(self, policy: str, rows: list[dict[str, Any]]) -> None:
+        await asyncio.to_thread(self._write, policy, rows)
+
+
+class RetentionEngine:
+    """Apply retention policies in short, throttled chunks."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        batch_size: int = settings.retention_batch_size,
+        throttle_ms: int = settings.retention_throttle_ms,
+        archiver: Archiver | None = None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            db: Database session; committed after every chunk
+            batch_size: Rows per chunk
+            throttle_ms: Pause between chunks
+            archiver: Receives rows of ``archive=True`` policies before deletion
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.throttle_ms = throttle_ms
+        self.archiver = archiver
+
+    def _expired(self, policy: RetentionPolicy, now: datetime):
+        cutoff = now - policy.max_age
+        return [getattr(policy.model, policy.age_column) < cutoff, *policy.conditions]
+
+    async def count(self, policy: RetentionPolicy, now: datetime | None = None) -> int:
+        """Count rows a policy would act on (dry run)."""
+        now = now or datetime.utcnow()
+        result = await self.db.execute(
+            select(func.count()).select_from(policy.model).where(*self._expired(policy, now))
+        )
+        return result.scalar() or 0
+
+    async def _archive(
+        self, name: str, model: Any, condition: Any, result: RetentionResult
+    ) -> None:
+        rows = (await self.db.execute(select(model).where(condition))).scalars().all()
+        if rows:
+            await self.archiver(name, [_row_dict(row) for row in rows])
+            result.archived += len(rows)
+
+    async def _delete_dependents(
+        self,
+        dependents: Sequence[Dependent],
+        parent_ids: Sequence[Any],
+        result: RetentionResult,
+        archive: bool = False,
+    ) -> int:
+        deleted = 0
+        for dependent in dependents:
+            fk = getattr(dependent.model, dependent.foreign_key)
+            if dependent.dependents:
+                child_ids = (await self.db.execute(
+                    select(_pk(dependent.model)).where(fk.in_(parent_ids))
+                )).scalars().all()
+                if child_ids:
+                    deleted += await self._delete_dependents(
+                        dependent.dependents, child_ids, result, archive
+                    )
+            if archive:
+                await self._archive(
+                    dependent.model.__tablename__, dependent.model, fk.in_(parent_ids), result
+                )
+            removed = await self.db.execute(
+                delete(dependent.model).where(fk.in_(parent_ids)).execution_options(synchronize_session=False)
+            )
+            deleted += removed.rowcount or 0
+        return deleted
+
+    async def _chunk(
+        self, policy: RetentionPolicy, now: datetime, result: RetentionResult
+    ) -> tuple[int, int]:
+        """Act on one chunk; returns (rows selected, rows deleted or updated)."""
+        pk = _pk(policy.model)
+        age = getattr(policy.model, policy.age_column)
+        ids = (await self.db.execute(
+            select(pk).where(*self._expired(policy, now)).order_by(age).limit(self.batch_size)
+        )).scalars().all()
+        if not ids:
+            return 0, 0
+
+        if policy.update_values is not None:
+            await self.db.execute(
+                update(policy.model)
+                .where(pk.in_(ids))
+                .values(**policy.update_values())
+                .execution_options(synchronize_session=False)
+            )
+            return len(ids), len(ids)
+
+        archive = policy.archive and self.archiver is not None
+        if archive:
+            await self._archive(policy.name, policy.model, pk.in_(ids), result)
+
+        result.dependent_rows += await self._delete_dependents(
+            policy.dependents, ids, result, archive
+        )
+        deleted = await self.db.execute(
+            delete(policy.model).where(pk.in_(ids)).execution_options(synchronize_session=False)
+        )
+        return len(ids), deleted.rowcount or 0
+
+    async def run(self, policy: RetentionPolicy, now: datetime | None = None) -> RetentionResult:
+        """
+        Apply one policy until no expired rows remain.
+
+        Args:
+            policy: Retention policy
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            RetentionResult with counts; a failed chunk is rolled back and stops the run
+        """
+        now = now or datetime.utcnow()
+        result = RetentionResult(policy=policy.name)
+        while True:
+            try:
+                selected, affected = await self._chunk(policy, now, result)
+                await self.db.commit()
+            except Exception as e:
+                await self.db.rollback()
+                logger.error(f"Retention {policy.name} chunk failed: {e}")
+                result.errors.append(str(e))
+                break
+
+            result.rows += affected
+            if affected:
+                result.chunks += 1
+            # Rows removed concurrently lower the count affected, not selected
+            if selected < self.batch_size:
+                break
+            if self.throttle_ms:
+                await asyncio.sleep(self.throttle_ms / 1000)
+
+        if result.rows:
+            logger.info(
+                f"Retention {policy.name}: {result.rows} rows in {result.chunks} chunks "
+                f"({result.dependent_rows} dependent, {result.archived} archived)"
+            )
+        return result
+
+    async def run_all(self, policies: Sequence[RetentionPolicy]) -> list[RetentionResult]:
+        """Apply policies in order (children before the parents they reference)."""
+        return [await self.run(policy) for policy in policies]
+
+
+# Building blocks for the policies below
+TOOL_CALLS = Dependent(ToolCall, "execution_log_id")
+EXECUTION_LOG_DEPENDENTS = (TOOL_CALLS,)
+SESSION_DEPENDENTS = (
+    Dependent(ExecutionLog, "session_id", EXECUTION_LOG_DEPENDENTS),
+    Dependent(ApprovalRequest, "session_id"),
+    Dependent(AgentMemory, "session_id"),
+    Dependent(ServiceSubscription, "session_id"),
+    Dependent(SessionToolUsage, "session_id"),
+)
+
+
+def execution_logs_policy(max_age: timedelta, session_id: Any = None, archive: bool = False) -> RetentionPolicy:
+    """Delete execution logs (and their tool calls) older than ``max_age``."""
+    conditions = (ExecutionLog.session_id == session_id,) if session_id else ()
+    return RetentionPolicy(
+        name="execution_logs",
+        model=ExecutionLog,
+        age_column="created_at",
+        max_age=max_age,
+        conditions=conditions,
+        dependents=EXECUTION_LOG_DEPENDENTS,
+        archive=archive,
+    )
+
+
+def expire_approvals_policy(max_age: timedelta) -> RetentionPolicy:
+    """Mark approval requests still pending after ``max_age`` as expired."""
+    return RetentionPolicy(
+        name="expire_approvals",
+        model=ApprovalRequest,
+        age_column="created_at",
+        max_age=max_age,
+        conditions=(ApprovalRequest.decision == "pending",),
+        update_values=lambda: {"decision": "expired", "decision_made_at": datetime.utcnow()},
+    )
+
+
+def approvals_policy(max_age: timedelta, archive: bool = False) -> RetentionPolicy:
+    """Delete approval requests older than ``max_age``, except pending ones."""
+    return RetentionPolicy(
+        name="approval_requests",
+        model=ApprovalRequest,
+        age_column="created_at",
+        max_age=max_age,
+        conditions=((ApprovalRequest.decision.is_(None)) | (ApprovalRequest.decision != "pending"),),
+        archive=archive,
+    )
+
+
+def sessions_policy(max_age: timedelta, archive: bool = False) -> RetentionPolicy:
+    """Delete sessions inactive for ``max_age`` with all their rows, unless a subscription is active."""
+    active_subscription = (
+        exists()
+        .where(ServiceSubscription.session_id == AgentSession.id)
+        .where(ServiceSubscription.status == "active")
+    )
+    return RetentionPolicy(
+        name="agent_sessions",
+        model=AgentSession,
+        age_column="last_active",
+        max_age=max_age,
+        conditions=(~active_subscription,),
+        dependents=SESSION_DEPENDENTS,
+        archive=archive,
+    )
+
+
+def default_policies() -> list[RetentionPolicy]:
+    """Policies from settings, ordered so children are trimmed before parents."""
+    archive = settings.retention_archive_dir is not None
+    return [
+        expire_approvals_policy(timedelta(hours=settings.approval_expiry_hours)),
+        execution_logs_policy(timedelta(days=settings.execution_log_retention_days), archive=archive),
+        approvals_policy(timedelta(days=settings.approval_retention_days), archive=archive),
+        sessions_policy(timedelta(days=settings.session_retention_days), archive=archive),
+    ]
+
+
+def default_archiver() -> Archiver | None:
+    """JSONL archiver for ``retention_archive_dir``, if configured."""
+    if settings.retention_archive_dir:
+        return JsonlArchiver(settings.retention_archive_dir)
+    return None
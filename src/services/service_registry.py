@@ -5,7 +5,6 @@ This service manages MCP-compatible service discovery and registry
 for the Paygent platform.
 """
 
-import json
 import logging
 from typing import Any
 
@@ -14,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.services import Service
 from src.services.cache import CacheService
+from src.services.service_search import apply_text_search
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +31,10 @@ class ServiceRegistryService:
         self.db = db
         self.cache_service = CacheService()
 
+    def _dialect(self) -> str:
+        """Database dialect name of the session's engine."""
+        return self.db.get_bind().dialect.name
+
     async def discover_services(
         self,
         query: str = "",
@@ -41,7 +45,7 @@ class ServiceRegistryService:
         mcp_compatible: bool | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Service | dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """
         Discover services based on search criteria with caching.
 
@@ -56,7 +60,7 @@ class ServiceRegistryService:
             offset: Offset for pagination
 
         Returns:
-            List of matching services
+            List of matching services as dicts
         """
         try:
             # Create cache key from all parameters
@@ -64,50 +68,42 @@ class ServiceRegistryService:
             cache_params = f"{query}:{category}:{min_price}:{max_price}:{min_reputation}:{mcp_compatible}:{limit}:{offset}"
             cache_key = f"services:discover:{hashlib.md5(cache_params.encode()).hexdigest()}"
 
-            # Try cache first (5 minute TTL)
-            cached = await self.cache_service.get(cache_key)
-            if cached:
-                logger.info(f"Cache hit for services discovery: {query}")
-                # Convert cached dicts back to Service objects if needed
-                # For now, return as-is since API expects dicts or objects
-                return cached
+            async def search() -> list[dict[str, Any]]:
+                # Build query
+                stmt = select(Service)
 
-            # Build query
-            stmt = select(Service)
+                # Apply filters
+                # Note: category filter removed - Service model doesn't have category field
 
-            # Apply filters
-            if query:
-                stmt = stmt.where(
-                    Service.name.contains(query) | Service.description.contains(query)
-                )
+                if min_price is not None:
+                    stmt = stmt.where(Service.price_amount >= min_price)
 
-            # Note: category filter removed - Service model doesn't have category field
+                if max_price is not None:
+                    stmt = stmt.where(Service.price_amount <= max_price)
 
-            if min_price is not None:
-                stmt = stmt.where(Service.price_amount >= min_price)
+                if min_reputation is not None:
+                    stmt = stmt.where(Service.reputation_score >= min_reputation)
 
-            if max_price is not None:
-                stmt = stmt.where(Service.price_amount <= max_price)
+                if mcp_compatible is not None:
+                    stmt = stmt.where(Service.mcp_compatible == mcp_compatible)
 
-            if min_reputation is not None:
-                stmt = stmt.where(Service.reputation_score >= min_reputation)
+                # Text matches are ranked by relevance blended with reputation
+                if query:
+                    stmt = apply_text_search(stmt, query, self._dialect())
+                else:
+                    stmt = stmt.order_by(Service.reputation_score.desc())
 
-            if mcp_compatible is not None:
-                stmt = stmt.where(Service.mcp_compatible == mcp_compatible)
+                # Apply pagination
+                stmt = stmt.limit(limit).offset(offset)
 
-            # Apply ordering and pagination
-            stmt = stmt.order_by(Service.reputation_score.desc()).limit(limit).offset(offset)
+                # Execute query
+                result = await self.db.execute(stmt)
+                services = result.scalars().all()
 
-            # Execute query
-            result = await self.db.execute(stmt)
-            services = result.scalars().all()
+                logger.info(f"Found {len(services)} services for query: {query}")
 
-            logger.info(f"Found {len(services)} services for query: {query}")
-
-            # Cache results for 5 minutes (300 seconds)
-            if services:
                 # Convert Service objects to dictionaries for JSON serialization
-                services_data = [
+                return [
                     {
                         "id": str(service.id),
                         "name": service.name,
@@ -124,10 +120,11 @@ class ServiceRegistryService:
                     }
                     for service in services
                 ]
-                await self.cache_service.set(cache_key, services_data, expiration=300)
-                logger.info(f"Cached {len(services)} services for {cache_key}")
 
-            return services
+            # Cached for 5 minutes; concurrent misses share a single query
+            return await self.cache_service.get_or_compute(
+                cache_key, search, expiration=300, namespaces=["services"]
+            )
 
         except Exception as e:
             logger.error(f"Service discovery failed: {e}")
@@ -200,7 +197,7 @@ class ServiceRegistryService:
             await self.db.refresh(service)
 
             # Invalidate cache
-            await self.cache_service.delete_pattern("services:*")
+            await self.cache_service.invalidate("services")
 
             logger.info(f"Registered service: {name}")
             return service
@@ -239,8 +236,7 @@ class ServiceRegistryService:
             await self.db.refresh(service)
 
             # Invalidate cache
-            await self.cache_service.delete_pattern(f"service:{service_id}")
-            await self.cache_service.delete_pattern("services:*")
+            await self.cache_service.invalidate(f"service:{service_id}", "services")
 
             logger.info(f"Updated service: {service_id}")
             return service
@@ -267,9 +263,10 @@ class ServiceRegistryService:
 
             # Check cache first
             cache_key = f"price:{service_id}"
-            cached_price = await self.cache_service.get(cache_key)
+            namespaces = [f"service:{service_id}"]
+            cached_price = await self.cache_service.get(cache_key, namespaces=namespaces)
             if cached_price:
-                return json.loads(cached_price)
+                return cached_price
 
             # Get current price
             pricing = {
@@ -284,7 +281,7 @@ class ServiceRegistryService:
 
             # Cache for 1 minute
             await self.cache_service.set(
-                cache_key, json.dumps(pricing), expiration=60
+                cache_key, pricing, expiration=60, namespaces=namespaces
             )
 
             return pricing
@@ -328,8 +325,7 @@ class ServiceRegistryService:
             await self.db.refresh(service)
 
             # Invalidate cache
-            await self.cache_service.delete_pattern(f"service:{service_id}")
-            await self.cache_service.delete_pattern("services:*")
+            await self.cache_service.invalidate(f"service:{service_id}", "services")
 
             logger.info(f"Updated reputation for service {service_id}: {new_score}")
             return service
@@ -348,9 +344,9 @@ class ServiceRegistryService:
         """
         try:
             # Check cache first
-            cached_services = await self.cache_service.get("mcp_services")
+            cached_services = await self.cache_service.get("mcp_services", namespaces=["services"])
             if cached_services:
-                return json.loads(cached_services)
+                return cached_services
 
             # Query MCP-compatible services
             stmt = select(Service).where(Service.mcp_compatible)
@@ -374,7 +370,7 @@ class ServiceRegistryService:
             ]
 
             await self.cache_service.set(
-                "mcp_services", json.dumps(services_data), expiration=300
+                "mcp_services", services_data, expiration=300, namespaces=["services"]
             )
 
             return services
@@ -395,9 +391,7 @@ class ServiceRegistryService:
             List of matching services
         """
         try:
-            stmt = select(Service).where(
-                Service.name.contains(query) | Service.description.contains(query)
-            )
+            stmt = apply_text_search(select(Service), query, self._dialect())
 
             # Apply filters
             for key, value in filters.items():
@@ -0,0 +1,89 @@
+"""
+Full-text service search.
+
+``name LIKE '%query%'`` cannot use an index, so text discovery used to scan
+the whole services table. Text queries now go through a real text index:
+
+- Postgres: the generated ``search_vector`` tsvector column with a GIN
+  index. Name is weighted above description, and ranking uses
+  ``ts_rank_cd``.
+- SQLite (development/tests): the ``services_fts`` FTS5 table, ranked with
+  ``bm25``.
+
+Each query word is prefix-matched, and all words must match. Results are
+ordered by a blend of text relevance and reputation, weighted by
+``service_search_relevance_weight``. Other dialects fall back to LIKE.
+The index objects are defined in src.models.services and the
+003_service_search and 007_service_fts_by_id migrations.
+"""
+
+import re
+
+from sqlalchemy import Select, func, literal_column, or_, table, text
+
+from src.core.config import settings
+from src.models.services import Service
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+# Reputation scores are 0-5
+MAX_REPUTATION = 5.0
+
+
+def query_terms(query: str) -> list[str]:
+    """Split a user query into index-safe words."""
+    return _WORD.findall(query.lower())
+
+
+def _blend(relevance, weight: float):
+    # relevance and reputation are both scaled to [0, 1] before blending
+    reputation = func.coalesce(Service.reputation_score, 0.0) / MAX_REPUTATION
+    return relevance * weight + reputation * (1.0 - weight)
+
+
+def apply_text_search(
+    stmt: Select,
+    query: str,
+    dialect: str,
+    relevance_weight: float | None = None,
+) -> Select:
+    """
+    Filter a ``select(Service)`` by a text query and order by blended rank.
+
+    Args:
+        stmt: Statement selecting from services
+        query: User search text
+        dialect: Database dialect name ("postgresql", "sqlite", ...)
+        relevance_weight: Weight of text relevance vs reputation (0-1);
+            defaults to ``settings.service_search_relevance_weight``
+
+    Returns:
+        Statement with the text filter and ordering applied
+    """
+    weight = settings.service_search_relevance_weight if relevance_weight is None else relevance_weight
+    terms = query_terms(query)
+
+    if terms and dialect == "postgresql":
+        tsquery = func.to_tsquery("english", " & ".join(f"{term}:*" for term in terms))
+        vector = literal_column("services.search_vector")
+        # Normalization 32 scales rank into [0, 1)
+        relevance = func.ts_rank_cd(vector, tsquery, 32)
+        return stmt.where(vector.op("@@")(tsquery)).order_by(_blend(relevance, weight).desc())
+
+    if terms and dialect == "sqlite":
+        fts = table("services_fts")
+        match = " ".join(f'"{term}"*' for term in terms)
+        # bm25 is <= 0 (more negative is better); map to [0, 1). Weights follow
+        # the FTS columns: id (not indexed), name, description
+        score = -func.bm25(literal_column("services_fts"), 0.0, 10.0, 1.0)
+        relevance = score / (score + 1.0)
+        return (
+            stmt.join(fts, literal_column("services_fts.id") == literal_column("services.id"))
+            .where(text("services_fts MATCH :fts_query").bindparams(fts_query=match))
+            .order_by(_blend(relevance, weight).desc())
+        )
+
+    # No index for this dialect (or nothing indexable in the query)
+    return stmt.where(
+        or_(Service.name.contains(query), Service.description.contains(query))
+    ).order_by(Service.reputation_score.desc())
@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.agent_sessions import (
@@ -19,6 +19,12 @@ from src.models.agent_sessions import (
 )
 from src.models.execution_logs import ExecutionLog
 from src.services.metrics_service import metrics_collector
+from src.services.retention import (
+    RetentionEngine,
+    approvals_policy,
+    execution_logs_policy,
+    sessions_policy,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -410,32 +416,19 @@ class SessionService:
         Returns:
             Number of cleaned up records
         """
+        max_age = timedelta(hours=max_age_hours)
         try:
-            cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-
-            # Delete old execution logs
-            stmt = delete(ExecutionLog).where(ExecutionLog.created_at < cutoff_time)
-            result = await self.db.execute(stmt)
-            deleted_logs = result.rowcount
-
-            # Delete old approval requests
-            stmt = delete(ApprovalRequest).where(ApprovalRequest.created_at < cutoff_time)
-            result = await self.db.execute(stmt)
-            deleted_approvals = result.rowcount
-
-            # Delete old sessions
-            stmt = delete(AgentSession).where(AgentSession.last_active < cutoff_time)
-            result = await self.db.execute(stmt)
-            deleted_sessions = result.rowcount
-
-            await self.db.commit()
-
-            total_deleted = deleted_logs + deleted_approvals + deleted_sessions
+            # Logs and approvals first, then sessions with whatever rows remain
+            results = await RetentionEngine(self.db).run_all([
+                execution_logs_policy(max_age),
+                approvals_policy(max_age),
+                sessions_policy(max_age),
+            ])
+            total_deleted = sum(result.rows for result in results)
             logger.info(f"Cleaned up {total_deleted} old records")
 
             return total_deleted
 
         except Exception as e:
-            await self.db.rollback()
             logger.error(f"Failed to cleanup old sessions: {e}")
             return 0
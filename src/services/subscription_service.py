@@ -77,9 +77,7 @@ class SubscriptionService:
             )
 
             # Invalidate cache
-            await self.cache_service.delete_pattern(
-                f"subscription:session:{session_id}:*"
-            )
+            await self.cache_service.invalidate(f"subscriptions:session:{session_id}")
 
             return subscription
 
@@ -125,7 +123,8 @@ class SubscriptionService:
         try:
             # Check cache first
             cache_key = f"subscription:session:{session_id}:{include_expired}"
-            cached = await self.cache_service.get(cache_key)
+            namespaces = ["subscriptions", f"subscriptions:session:{session_id}"]
+            cached = await self.cache_service.get(cache_key, namespaces=namespaces)
             if cached:
                 return cached
 
@@ -143,7 +142,9 @@ class SubscriptionService:
             subscriptions = result.scalars().all()
 
             # Cache for 5 minutes
-            await self.cache_service.set(cache_key, subscriptions, expiration=300)
+            await self.cache_service.set(
+                cache_key, subscriptions, expiration=300, namespaces=namespaces
+            )
 
             return list(subscriptions)
 
@@ -167,7 +168,8 @@ class SubscriptionService:
         try:
             # Check cache first
             cache_key = f"subscription:active:{session_id}:{service_id}"
-            cached = await self.cache_service.get(cache_key)
+            namespaces = ["subscriptions", f"subscriptions:session:{session_id}"]
+            cached = await self.cache_service.get(cache_key, namespaces=namespaces)
             if cached is not None:
                 return cached
 
@@ -184,7 +186,9 @@ class SubscriptionService:
             is_active = subscription is not None
 
             # Cache for 1 minute (shorter TTL for active status)
-            await self.cache_service.set(cache_key, is_active, expiration=60)
+            await self.cache_service.set(
+                cache_key, is_active, expiration=60, namespaces=namespaces
+            )
 
             return is_active
 
@@ -266,11 +270,8 @@ class SubscriptionService:
             await self.db.commit()
 
             # Invalidate cache
-            await self.cache_service.delete_pattern(
-                f"subscription:session:{subscription.session_id}:*"
-            )
-            await self.cache_service.delete_pattern(
-                f"subscription:active:{subscription.session_id}:*"
+            await self.cache_service.invalidate(
+                f"subscriptions:session:{subscription.session_id}"
             )
 
             logger.info(
@@ -309,11 +310,8 @@ class SubscriptionService:
             await self.db.commit()
 
             # Invalidate cache
-            await self.cache_service.delete_pattern(
-                f"subscription:session:{subscription.session_id}:*"
-            )
-            await self.cache_service.delete_pattern(
-                f"subscription:active:{subscription.session_id}:*"
+            await self.cache_service.invalidate(
+                f"subscriptions:session:{subscription.session_id}"
             )
 
             logger.info(f"Cancelled subscription {subscription_id}")
@@ -348,7 +346,7 @@ class SubscriptionService:
 
             if expired_ids:
                 # Invalidate all subscription caches
-                await self.cache_service.delete_pattern("subscription:*")
+                await self.cache_service.invalidate("subscriptions")
                 logger.info(f"Expired {len(expired_ids)} subscriptions")
 
             return len(expired_ids)
@@ -0,0 +1,271 @@
+"""
+Tool usage accounting.
+
+Session summaries and tool statistics used to load every ExecutionLog in
+the session or date range, then count tools by walking each log's JSON.
+Tool calls are now stored as rows in ``tool_calls``, and aggregates come
+from the database:
+
+- ``session_tool_usage`` counters (calls, failures, duration per session
+  and tool) are incremented in the same transaction that records the
+  calls. A session summary reads one row per tool the session has used.
+- Tool statistics over a date range use GROUP BY on ``tool_calls`` joined
+  to ``execution_logs``.
+
+``backfill_tool_usage`` creates tool_calls rows for logs written before
+this (from their JSON) and rebuilds the counters.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import upsert_increment
+from src.models.execution_logs import ExecutionLog, SessionToolUsage, ToolCall
+
+logger = logging.getLogger(__name__)
+
+
+def _call_succeeded(call: dict[str, Any]) -> bool:
+    if "success" in call:
+        return bool(call["success"])
+    result = call.get("result")
+    return result.get("success", True) if isinstance(result, dict) else True
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def tool_call_rows(execution_log_id: UUID, calls: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Convert executor tool call dicts to ``tool_calls`` rows.
+
+    Args:
+        execution_log_id: Parent execution log
+        calls: Dicts with ``tool_name`` and optionally ``tool_args``,
+            ``result``, ``success``, ``error``, ``duration_ms`` and ``timestamp``
+
+    Returns:
+        Row dicts for an insert into tool_calls
+    """
+    now = datetime.utcnow()
+    rows = []
+    for call in calls:
+        result = call.get("result", call.get("tool_result"))
+        if result is not None and not isinstance(result, dict):
+            result = {"value": result}
+        rows.append({
+            "id": uuid4(),
+            "execution_log_id": execution_log_id,
+            "tool_name": call.get("tool_name", "unknown"),
+            "tool_args": call.get("tool_args", call.get("arguments")) or {},
+            "tool_result": result,
+            "success": _call_succeeded(call),
+            "error_message": call.get("error") or call.get("error_message"),
+            "duration_ms": call.get("duration_ms"),
+            "created_at": _parse_timestamp(call.get("timestamp")) or now,
+        })
+    return rows
+
+
+async def increment_session_usage(
+    db: AsyncSession,
+    session_id: UUID,
+    rows: Sequence[dict[str, Any]],
+) -> None:
+    """
+    Add tool call rows to a session's counters, in the caller's transaction.
+
+    Args:
+        db: Database session
+        session_id: Session the calls belong to
+        rows: Rows as built by ``tool_call_rows``
+    """
+    per_tool: dict[str, list] = defaultdict(lambda: [0, 0, 0, None])
+    for row in rows:
+        totals = per_tool[row["tool_name"]]
+        totals[0] += 1
+        totals[1] += 0 if row["success"] else 1
+        totals[2] += row["duration_ms"] or 0
+        if totals[3] is None or row["created_at"] > totals[3]:
+            totals[3] = row["created_at"]
+
+    for tool_name, (calls, failures, duration_ms, last_called_at) in per_tool.items():
+        await upsert_increment(
+            db,
+            SessionToolUsage,
+            key={"session_id": session_id, "tool_name": tool_name},
+            increments={
+                "call_count": calls,
+                "failure_count": failures,
+                "total_duration_ms": duration_ms,
+            },
+            values={"last_called_at": last_called_at},
+        )
+
+
+async def record_tool_calls(
+    db: AsyncSession,
+    session_id: UUID,
+    execution_log_id: UUID,
+    calls: Sequence[dict[str, Any]],
+) -> None:
+    """
+    Store tool calls and update the session's counters. Does not commit.
+
+    Args:
+        db: Database session holding the execution log write
+        session_id: Session the execution belongs to
+        execution_log_id: Parent execution log
+        calls: Executor tool call dicts (see ``tool_call_rows``)
+    """
+    if not calls:
+        return
+    rows = tool_call_rows(execution_log_id, calls)
+    await db.execute(insert(ToolCall), rows)
+    await increment_session_usage(db, session_id, rows)
+
+
+async def get_session_tool_usage(db: AsyncSession, session_id: UUID | str) -> list[dict[str, Any]]:
+    """
+    Get a session's tool counters, most used first.
+
+    Args:
+        db: Database session
+        session_id: Agent session ID
+
+    Returns:
+        List of {tool_name, call_count, failure_count, total_duration_ms, last_called_at}
+    """
+    result = await db.execute(
+        select(SessionToolUsage)
+        .where(SessionToolUsage.session_id == session_id)
+        .order_by(SessionToolUsage.call_count.desc(), SessionToolUsage.tool_name)
+    )
+    return [
+        {
+            "tool_name": usage.tool_name,
+            "call_count": usage.call_count,
+            "failure_count": usage.failure_count,
+            "total_duration_ms": usage.total_duration_ms,
+            "last_called_at": usage.last_called_at,
+        }
+        for usage in result.scalars().all()
+        if usage.call_count > 0
+    ]
+
+
+async def get_tool_counts_by_session(
+    db: AsyncSession,
+    session_id: UUID | str | None = None,
+    start_date: datetime | str | None = None,
+    end_date: datetime | str | None = None,
+) -> dict[str, dict[str, int]]:
+    """
+    Count tool calls per session and tool with a GROUP BY.
+
+    Date filters apply to the execution log's ``created_at``.
+
+    Args:
+        db: Database session
+        session_id: Optional session filter
+        start_date: Optional window start
+        end_date: Optional window end
+
+    Returns:
+        Mapping of session ID to {tool name: call count}
+    """
+    query = (
+        select(ExecutionLog.session_id, ToolCall.tool_name, func.count(ToolCall.id).label("calls"))
+        .join(ExecutionLog, ToolCall.execution_log_id == ExecutionLog.id)
+        .group_by(ExecutionLog.session_id, ToolCall.tool_name)
+    )
+    if session_id:
+        query = query.where(ExecutionLog.session_id == session_id)
+    if start_date:
+        query = query.where(ExecutionLog.created_at >= start_date)
+    if end_date:
+        query = query.where(ExecutionLog.created_at <= end_date)
+
+    stats: dict[str, dict[str, int]] = {}
+    for row in await db.execute(query):
+        stats.setdefault(str(row.session_id), {})[row.tool_name] = row.calls
+    return stats
+
+
+async def backfill_tool_usage(db: AsyncSession, batch_size: int = 500) -> int:
+    """
+    Create tool_calls rows for logs that only have JSON tool calls, then rebuild counters.
+
+    Runs in the caller's transaction; commit afterwards.
+
+    Args:
+        db: Database session
+        batch_size: Execution logs streamed per fetch
+
+    Returns:
+        Number of tool call rows created
+    """
+    has_rows = select(ToolCall.id).where(ToolCall.execution_log_id == ExecutionLog.id).exists()
+    stream = await db.stream(
+        select(ExecutionLog.id, ExecutionLog.tool_calls)
+        .where(ExecutionLog.tool_calls.is_not(None), ~has_rows)
+        .execution_options(yield_per=batch_size)
+    )
+    created = 0
+    pending: list[dict[str, Any]] = []
+    async for log_id, calls in stream:
+        if isinstance(calls, list):
+            pending.extend(tool_call_rows(log_id, [c for c in calls if isinstance(c, dict)]))
+        if len(pending) >= batch_size:
+            await db.execute(insert(ToolCall), pending)
+            created += len(pending)
+            pending = []
+    if pending:
+        await db.execute(insert(ToolCall), pending)
+        created += len(pending)
+
+    # Rebuild all counters from rows so they also cover calls recorded individually
+    await db.execute(delete(SessionToolUsage))
+    totals = await db.execute(
+        select(
+            ExecutionLog.session_id,
+            ToolCall.tool_name,
+            func.count(ToolCall.id).label("calls"),
+            func.count(ToolCall.id).filter(ToolCall.success.is_(False)).label("failures"),
+            func.coalesce(func.sum(ToolCall.duration_ms), 0).label("duration_ms"),
+            func.max(ToolCall.created_at).label("last_called_at"),
+        )
+        .join(ExecutionLog, ToolCall.execution_log_id == ExecutionLog.id)
+        .group_by(ExecutionLog.session_id, ToolCall.tool_name)
+    )
+    counters = [
+        {
+            "session_id": row.session_id,
+            "tool_name": row.tool_name,
+            "call_count": row.calls,
+            "failure_count": row.failures,
+            "total_duration_ms": row.duration_ms,
+            "last_called_at": row.last_called_at,
+        }
+        for row in totals
+    ]
+    if counters:
+        await db.execute(insert(SessionToolUsage), counters)
+
+    logger.info(f"Backfilled {created} tool calls; rebuilt {len(counters)} session tool counters")
+    return created
@@ -11,25 +11,44 @@ from typing import Any
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from web3 import Web3
 
+from src.connectors.multicall import BatchReader
+from src.connectors.rpc import AsyncRPCClient, get_rpc_client
 from src.core.config import settings
+from src.core.pagination import apply_keyset, count_rows, decode_cursor, split_page
 from src.models.payments import Payment
+from src.services.payment_rollups import record_payment_created
 
 logger = logging.getLogger(__name__)
 
+# Token addresses on Cronos testnet
+TOKEN_ADDRESSES = {
+    "USDC": "0x2336cE47712A4BC7fCC4FC6c4693e54F9D75Cd72",  # devUSDC.e on Cronos testnet
+    "USDT": "0xB8888885888898888888F8888888888888888f",  # Mock address
+    "CRO": None,  # Native token
+}
+
 
 class WalletService:
     """Service for wallet management operations."""
 
-    def __init__(self, db: AsyncSession, wallet_address: str | None = None):
+    def __init__(
+        self,
+        db: AsyncSession,
+        wallet_address: str | None = None,
+        rpc_client: AsyncRPCClient | None = None,
+    ):
         """
         Initialize the wallet service.
 
         Args:
             db: Database session
             wallet_address: Optional wallet address (defaults to config)
+            rpc_client: Optional RPC client (defaults to the shared Cronos client)
         """
         self.db = db
+        self.rpc_client = rpc_client
         self.wallet_address = wallet_address or settings.default_wallet_address
         self.daily_limit_usd = settings.default_daily_limit_usd
 
@@ -40,8 +59,11 @@ class WalletService:
         """
         Check wallet token balances.
 
+        All balances are read in a single batched RPC round trip.
+
         Args:
-            tokens: Optional list of token symbols to query (default: CRO, USDC)
+            tokens: Optional list of token symbols or contract addresses to
+                query (default: CRO, USDC)
 
         Returns:
             Dict containing balance information
@@ -58,57 +80,39 @@ class WalletService:
             total_balance_usd = 0.0
 
             try:
-                # Import web3 for blockchain interaction
-                from web3 import Web3
-
-                from src.core.config import settings
-
-                # Connect to Cronos RPC
-                w3 = Web3(Web3.HTTPProvider(settings.cronos_rpc_url))
-
-                if not w3.is_connected():
-                    logger.warning("Failed to connect to Cronos RPC, using mock balances")
-                    return await self._get_mock_balances(tokens)
+                rpc = self.rpc_client or get_rpc_client(settings.cronos_rpc_url)
+                reader = BatchReader(
+                    rpc,
+                    multicall_address=settings.multicall_address,
+                    max_calls_per_batch=settings.rpc_batch_max_calls,
+                )
 
-                # Token addresses on Cronos testnet
+                # Tokens may be given as known symbols or as contract addresses
                 token_addresses = {
-                    "USDC": "0x2336cE47712A4BC7fCC4FC6c4693e54F9D75Cd72",  # devUSDC.e on Cronos testnet
-                    "USDT": "0xB8888885888898888888F8888888888888888f",  # Mock address
-                    "CRO": None,  # Native token
+                    token: TOKEN_ADDRESSES.get(token) or (token if Web3.is_address(token) else None)
+                    for token in tokens
                 }
 
-                # ERC20 ABI for balance checking
-                erc20_abi = [
-                    {
-                        "constant": True,
-                        "inputs": [{"name": "_owner", "type": "address"}],
-                        "name": "balanceOf",
-                        "outputs": [{"name": "balance", "type": "uint256"}],
-                        "type": "function",
-                    },
-                    {
-                        "constant": True,
-                        "inputs": [],
-                        "name": "decimals",
-                        "outputs": [{"name": "", "type": "uint8"}],
-                        "type": "function",
-                    },
-                ]
-
-                # Check each token
-                for token_symbol in tokens:
-                    token_address = token_addresses.get(token_symbol)
-
-                    if token_symbol == "CRO":
+                # Read every balance (and any uncached token metadata) in one batch
+                snapshot = await reader.get_balances(
+                    self.wallet_address,
+                    [address for address in token_addresses.values() if address],
+                    include_native="CRO" in tokens,
+                )
+
+                for token in tokens:
+                    token_address = token_addresses[token]
+                    token_symbol = token
+
+                    if token == "CRO":
                         # Native CRO balance
-                        balance_wei = w3.eth.get_balance(self.wallet_address)
-                        balance = float(w3.from_wei(balance_wei, 'ether'))
+                        balance = float(Web3.from_wei(snapshot.native_wei, 'ether'))
                     elif token_address:
                         # ERC20 token balance
-                        contract = w3.eth.contract(address=Web3.to_checksum_address(token_address), abi=erc20_abi)
-                        balance_wei = contract.functions.balanceOf(Web3.to_checksum_address(self.wallet_address)).call()
-                        decimals = contract.functions.decimals().call()
-                        balance = float(balance_wei / (10 ** decimals))
+                        token_balance = snapshot.tokens[token_address]
+                        balance = float(token_balance.balance)
+                        if token not in TOKEN_ADDRESSES:
+                            token_symbol = token_balance.metadata.symbol or token
                     else:
                         # Unknown token, use mock
                         balance = 0.0
@@ -119,7 +123,7 @@ class WalletService:
 
                     balances.append({
                         "token_symbol": token_symbol,
-                        "token_address": token_address or self._get_token_address(token_symbol),
+                        "token_address": token_address or self._get_token_address(token),
                         "balance": balance,
                         "balance_usd": balance_usd,
                     })
@@ -291,6 +295,9 @@ class WalletService:
                 status="confirmed",
             )
             self.db.add(payment)
+            await self.db.flush()
+            await self.db.refresh(payment)
+            await record_payment_created(self.db, payment)
             await self.db.commit()
 
             logger.info(f"Transfer executed: {mock_tx_hash}")
@@ -317,36 +324,37 @@ class WalletService:
 
     async def get_transaction_history(
         self,
-        offset: int = 0,
+        cursor: str | None = None,
         limit: int = 20,
+        total: str = "none",
     ) -> dict[str, Any]:
         """
         Get wallet transaction history.
 
         Args:
-            offset: Pagination offset
+            cursor: ``next_cursor`` from the previous page
             limit: Max results to return
+            total: "none", "estimate" or "exact" total count
 
         Returns:
-            Dict containing transaction history
+            Dict containing transaction history and the next cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
+        # Validate before the catch-all so a bad cursor is a client error
+        if cursor:
+            decode_cursor(cursor)
+
         try:
-            # Get total count
-            count_result = await self.db.execute(
-                select(func.count())
-                .where(Payment.agent_wallet == self.wallet_address)
-            )
-            total = count_result.scalar() or 0
+            query = select(Payment).where(Payment.agent_wallet == self.wallet_address)
+            count, is_estimate = await count_rows(self.db, query, total)
 
-            # Get paginated transactions
+            # Get the page after the cursor (served by idx_payments_wallet_created)
             result = await self.db.execute(
-                select(Payment)
-                .where(Payment.agent_wallet == self.wallet_address)
-                .order_by(Payment.created_at.desc())
-                .offset(offset)
-                .limit(limit)
+                apply_keyset(query, Payment.created_at, Payment.id, cursor, limit)
             )
-            payments = result.scalars().all()
+            payments, next_cursor = split_page(result.scalars().all(), limit)
 
             transactions = []
             for payment in payments:
@@ -366,8 +374,9 @@ class WalletService:
             return {
                 "success": True,
                 "transactions": transactions,
-                "total": total,
-                "offset": offset,
+                "next_cursor": next_cursor,
+                "total": count,
+                "total_is_estimate": is_estimate,
                 "limit": limit,
             }
 
@@ -377,8 +386,9 @@ class WalletService:
                 "success": False,
                 "error": str(e),
                 "transactions": [],
-                "total": 0,
-                "offset": offset,
+                "next_cursor": None,
+                "total": None,
+                "total_is_estimate": False,
                 "limit": limit,
             }
 
@@ -8,6 +8,7 @@ payment execution, EIP-712 signature generation, and facilitator integration.
 import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 from httpx import AsyncClient, Response
@@ -15,21 +16,53 @@ from httpx import TimeoutException as HttpxTimeoutException
 
 from src.core.config import settings
 from src.core.errors import create_safe_error_message
+from src.core.http_client import get_http_client
 from src.services.metrics_service import metrics_collector
+from src.x402.batch import ConcurrencyLimiter, MicroBatcher
+from src.x402.requirements import PaymentRequirementsCache, payment_requirements_cache
 
 logger = logging.getLogger(__name__)
 
+# Payer wallet address (mock checksum address for development)
+PAYER_WALLET_ADDRESS = "0xFCAd0B19bB29D4674531d6f115237E16AfCE377c"
+
+# Facilitator URLs found not to support bulk submission
+_BULK_SUBMIT_UNSUPPORTED: set[str] = set()
+
+# Abandoned batches whose submitted payments are still finishing
+_SETTLING_BATCHES: set[asyncio.Task] = set()
+
 
 class X402PaymentService:
     """Service for x402 payment protocol operations."""
 
-    def __init__(self):
-        """Initialize the X402 payment service."""
+    def __init__(
+        self,
+        http_client: AsyncClient | None = None,
+        requirements_cache: PaymentRequirementsCache | None = None,
+    ):
+        """
+        Initialize the X402 payment service.
+
+        Args:
+            http_client: Optional HTTP client. Defaults to the shared pooled
+                client, so connections to services and the facilitator are
+                reused across service instances.
+            requirements_cache: Payment requirements cache (defaults to the global one)
+        """
         self.facilitator_url = settings.x402_facilitator_url
-        self.client = AsyncClient(timeout=30.0)
+        self._client = http_client
+        self.requirements_cache = (
+            requirements_cache if requirements_cache is not None else payment_requirements_cache
+        )
         self.retry_attempts = 3
         self.retry_delay = 1.0
 
+    @property
+    def client(self) -> AsyncClient:
+        """HTTP client used for service and facilitator requests."""
+        return self._client if self._client is not None else get_http_client()
+
     def _safe_parse_json(self, response: Response) -> dict[str, Any] | None:
         """
         Safely parse JSON from HTTP response with error handling.
@@ -55,6 +88,66 @@ class X402PaymentService:
             logger.warning(f"Failed to parse response JSON: {e}")
             return None
 
+    def _response_result(self, response: Response) -> dict[str, Any]:
+        """
+        Build the result for a service response that is not HTTP 402.
+
+        Args:
+            response: HTTP response from the service
+
+        Returns:
+            Dict containing payment result
+        """
+        if response.status_code == 200:
+            # No payment required - safely parse response
+            response_data = self._safe_parse_json(response)
+            if response_data is None and response.content:
+                # JSON parsing failed but there's content
+                logger.warning("Response data could not be parsed as JSON")
+                return {
+                    "success": False,
+                    "error": "invalid_response_format",
+                    "message": "Service returned an invalid response format. Please contact support.",
+                }
+
+            return {
+                "success": True,
+                "payment_id": None,
+                "tx_hash": None,
+                "status": "no_payment_required",
+                "message": "Service does not require payment",
+                "data": response_data,
+            }
+
+        elif response.status_code == 429:
+            # Rate limit exceeded
+            retry_after = response.headers.get("Retry-After", "60")
+            return {
+                "success": False,
+                "error": "rate_limited",
+                "message": f"Service rate limit exceeded. Please try again in {retry_after} seconds.",
+            }
+
+        elif response.status_code >= 500:
+            # Server errors - these might be temporary
+            error_data = self._safe_parse_json(response)
+            error_msg = error_data.get("error", "Service error") if error_data else "Service error"
+            return {
+                "success": False,
+                "error": f"HTTP {response.status_code}",
+                "message": f"Service is currently unavailable ({response.status_code}). Please try again later. Error: {error_msg}",
+            }
+
+        else:
+            # Other HTTP errors
+            error_data = self._safe_parse_json(response)
+            error_msg = error_data.get("error", "Unknown error") if error_data else "Unknown error"
+            return {
+                "success": False,
+                "error": f"HTTP {response.status_code}",
+                "message": f"Service returned error: {response.status_code} - {error_msg}",
+            }
+
     async def execute_payment(
         self,
         service_url: str,
@@ -103,6 +196,9 @@ class X402PaymentService:
                 return {
                     "success": False,
                     "error": payment_result.get("error"),
+                    # Set when the payment settled but the service rejected its proof
+                    "payment_id": payment_result.get("payment_id"),
+                    "tx_hash": payment_result.get("tx_hash"),
                     "message": payment_result.get("message", "Payment execution failed"),
                 }
 
@@ -125,6 +221,200 @@ class X402PaymentService:
                 "message": create_safe_error_message(e),
             }
 
+    async def execute_payments_batch(
+        self,
+        payments: list[dict[str, Any]],
+        max_concurrency: int | None = None,
+        max_per_host: int | None = None,
+        on_abandoned: Callable[[int, dict[str, Any]], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """
+        Execute many x402 payment flows concurrently.
+
+        Each payment runs its own request, 402, sign, submit and paid-retry
+        pipeline. Flows that reach signing or facilitator submission at the
+        same time share one signing pass and one bulk facilitator request.
+        Service requests are bounded globally and per host.
+
+        If the consumer stops early, flows that have not reached facilitator
+        submission are cancelled. Flows that have may already be settled, so
+        they finish in the background and their results go to ``on_abandoned``.
+
+        Args:
+            payments: Payments with service_url, amount, token and optional description
+            max_concurrency: Maximum service requests in flight (default from settings)
+            max_per_host: Maximum service requests in flight per host (default from settings)
+            on_abandoned: Async callback receiving (index, result) for submitted
+                payments whose result was not consumed
+
+        Yields:
+            (index, result) tuples in the order payments settle, where index is
+            the payment's position in ``payments`` and result has the same
+            shape as ``execute_payment``
+        """
+        limiter = ConcurrencyLimiter(
+            max_concurrency or settings.x402_batch_max_concurrency,
+            max_per_host or settings.x402_batch_max_per_host,
+        )
+        signer = MicroBatcher(self._generate_eip712_signatures, max_size=len(payments) or 1)
+        submitter = MicroBatcher(self._submit_batch_to_facilitator, max_size=len(payments) or 1)
+        submitted: set[int] = set()
+        yielded: set[int] = set()
+
+        async def run(index: int, payment: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+            result = await self._execute_batch_payment(
+                payment, limiter, signer, submitter, on_submit=lambda: submitted.add(index)
+            )
+            metrics_collector.record_payment(amount_usd=payment["amount"], success=result["success"])
+            return index, result
+
+        tasks = [asyncio.create_task(run(index, payment)) for index, payment in enumerate(payments)]
+        try:
+            for settled in asyncio.as_completed(tasks):
+                index, result = await settled
+                yielded.add(index)
+                yield index, result
+        finally:
+            for index, task in enumerate(tasks):
+                if index not in submitted:
+                    task.cancel()
+            abandoned = {index: tasks[index] for index in sorted(submitted - yielded)}
+            if abandoned:
+                # Awaiting here could be cancelled again along with the consumer
+                drain = asyncio.create_task(
+                    self._finish_abandoned(abandoned, on_abandoned, signer, submitter, len(payments))
+                )
+                _SETTLING_BATCHES.add(drain)
+                drain.add_done_callback(_SETTLING_BATCHES.discard)
+            else:
+                await self._close_batch(signer, submitter, len(payments))
+
+    async def _finish_abandoned(
+        self,
+        flows: dict[int, asyncio.Task],
+        on_abandoned: Callable[[int, dict[str, Any]], Awaitable[None]] | None,
+        signer: MicroBatcher,
+        submitter: MicroBatcher,
+        size: int,
+    ) -> None:
+        """
+        Let submitted flows of an abandoned batch finish and hand over their results.
+
+        Args:
+            flows: Flow tasks keyed by payment index
+            on_abandoned: Async callback receiving (index, result)
+            signer: Shared signing stage of the batch
+            submitter: Shared facilitator submission stage of the batch
+            size: Number of payments in the batch
+        """
+        for index, task in flows.items():
+            _, result = await task
+            logger.warning(
+                f"x402 batch consumer went away after payment {index} was submitted "
+                f"(tx_hash={result.get('tx_hash')})"
+            )
+            if on_abandoned is None:
+                continue
+            try:
+                await on_abandoned(index, result)
+            except Exception as e:
+                logger.error(f"Failed to hand over abandoned batch payment {index}: {e}")
+        await self._close_batch(signer, submitter, size)
+
+    async def _close_batch(self, signer: MicroBatcher, submitter: MicroBatcher, size: int) -> None:
+        """Close a batch's shared stages and log how many rounds they used."""
+        await signer.aclose()
+        await submitter.aclose()
+        logger.info(
+            f"x402 batch of {size} payments used {signer.batches} signing "
+            f"and {submitter.batches} facilitator round(s)"
+        )
+
+    async def _execute_batch_payment(
+        self,
+        payment: dict[str, Any],
+        limiter: ConcurrencyLimiter,
+        signer: MicroBatcher,
+        submitter: MicroBatcher,
+        on_submit: Callable[[], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run one x402 flow of a batch.
+
+        Args:
+            payment: Payment with service_url, amount, token and optional description
+            limiter: Global and per-host request limiter
+            signer: Shared signing stage
+            submitter: Shared facilitator submission stage
+            on_submit: Called when the flow hands its payment to the facilitator
+
+        Returns:
+            Dict containing payment execution result
+        """
+        service_url = payment["service_url"]
+        try:
+            if self._has_cached_requirement(service_url, payment["amount"], payment["token"]):
+                signature_result = await signer.submit(payment)
+                if not signature_result["success"]:
+                    return signature_result
+
+                if on_submit is not None:
+                    on_submit()
+                facilitator_result = await submitter.submit((payment, signature_result["signature"]))
+                if not facilitator_result["success"]:
+                    return facilitator_result
+
+                async with limiter.acquire(service_url):
+                    final_response = await self._paid_request(service_url, facilitator_result)
+                return self._preemptive_result(service_url, final_response, facilitator_result)
+
+            async with limiter.acquire(service_url):
+                response = await self.client.get(
+                    service_url,
+                    headers={
+                        "Accept": "application/json",
+                        "User-Agent": "Paygent/1.0",
+                    },
+                )
+
+            if response.status_code != 402:
+                return self._response_result(response)
+
+            requirement_error = self._check_payment_requirements(
+                response, service_url, payment["amount"], payment["token"]
+            )
+            if requirement_error:
+                return requirement_error
+
+            signature_result = await signer.submit(payment)
+            if not signature_result["success"]:
+                return signature_result
+
+            if on_submit is not None:
+                on_submit()
+            facilitator_result = await submitter.submit((payment, signature_result["signature"]))
+            if not facilitator_result["success"]:
+                return facilitator_result
+
+            async with limiter.acquire(service_url):
+                final_response = await self._paid_request(service_url, facilitator_result)
+            return self._settled_result(final_response, facilitator_result)
+
+        except HttpxTimeoutException as e:
+            logger.warning(f"x402 batch payment to {service_url} timed out: {e}")
+            return {
+                "success": False,
+                "error": "timeout",
+                "message": "The payment service is taking too long to respond. This could be due to network issues or high service load. Please try again.",
+            }
+        except Exception as e:
+            logger.error(f"x402 batch payment to {service_url} failed: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": create_safe_error_message(e),
+            }
+
     async def _make_payment_request(
         self,
         service_url: str,
@@ -145,6 +435,15 @@ class X402PaymentService:
             Dict containing payment result
         """
         try:
+            # Pay up front when the service's requirement is already known
+            if self._has_cached_requirement(service_url, amount, token):
+                return await self._pay_preemptively(
+                    service_url=service_url,
+                    amount=amount,
+                    token=token,
+                    description=description,
+                )
+
             # Retry logic for payment requests
             for attempt in range(self.retry_attempts):
                 try:
@@ -174,55 +473,8 @@ class X402PaymentService:
                         else:
                             continue  # Retry if payment failed
 
-                    elif response.status_code == 200:
-                        # No payment required - safely parse response
-                        response_data = self._safe_parse_json(response)
-                        if response_data is None and response.content:
-                            # JSON parsing failed but there's content
-                            logger.warning("Response data could not be parsed as JSON")
-                            return {
-                                "success": False,
-                                "error": "invalid_response_format",
-                                "message": "Service returned an invalid response format. Please contact support.",
-                            }
-
-                        return {
-                            "success": True,
-                            "payment_id": None,
-                            "tx_hash": None,
-                            "status": "no_payment_required",
-                            "message": "Service does not require payment",
-                            "data": response_data,
-                        }
-
-                    elif response.status_code == 429:
-                        # Rate limit exceeded
-                        retry_after = response.headers.get("Retry-After", "60")
-                        return {
-                            "success": False,
-                            "error": "rate_limited",
-                            "message": f"Service rate limit exceeded. Please try again in {retry_after} seconds.",
-                        }
-
-                    elif response.status_code >= 500:
-                        # Server errors - these might be temporary
-                        error_data = self._safe_parse_json(response)
-                        error_msg = error_data.get("error", "Service error") if error_data else "Service error"
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status_code}",
-                            "message": f"Service is currently unavailable ({response.status_code}). Please try again later. Error: {error_msg}",
-                        }
-
                     else:
-                        # Other HTTP errors
-                        error_data = self._safe_parse_json(response)
-                        error_msg = error_data.get("error", "Unknown error") if error_data else "Unknown error"
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status_code}",
-                            "message": f"Service returned error: {response.status_code} - {error_msg}",
-                        }
+                        return self._response_result(response)
 
                 except HttpxTimeoutException as e:
                     # Handle timeout specifically with user-friendly message
@@ -283,32 +535,11 @@ class X402PaymentService:
             Dict containing payment execution result
         """
         try:
-            # Parse 402 response headers
-            payment_required_header = response.headers.get("Payment-Required")
-            if not payment_required_header:
-                return {
-                    "success": False,
-                    "error": "missing_payment_required_header",
-                    "message": "Service did not provide Payment-Required header",
-                }
-
-            # Parse payment required header (format: "x402; amount=0.10; token=USDC")
-            payment_info = self._parse_payment_required_header(payment_required_header)
-
-            # Verify payment details
-            if payment_info.get("amount") != str(amount):
-                return {
-                    "success": False,
-                    "error": "amount_mismatch",
-                    "message": f"Requested amount {amount} does not match service requirement {payment_info.get('amount')}",
-                }
-
-            if payment_info.get("token") != token:
-                return {
-                    "success": False,
-                    "error": "token_mismatch",
-                    "message": f"Requested token {token} does not match service requirement {payment_info.get('token')}",
-                }
+            requirement_error = self._check_payment_requirements(
+                response, service_url, amount, token
+            )
+            if requirement_error:
+                return requirement_error
 
             # Step 3: Generate EIP-712 signature
             signature_result = await self._generate_eip712_signature(
@@ -334,30 +565,9 @@ class X402PaymentService:
                 return facilitator_result
 
             # Step 5: Retry original request with payment proof
-            final_response = await self.client.get(
-                service_url,
-                headers={
-                    "Accept": "application/json",
-                    "User-Agent": "Paygent/1.0",
-                    "Payment-Proof": facilitator_result["payment_proof"],
-                },
-            )
+            final_response = await self._paid_request(service_url, facilitator_result)
 
-            if final_response.status_code == 200:
-                return {
-                    "success": True,
-                    "payment_id": facilitator_result["payment_id"],
-                    "tx_hash": facilitator_result["tx_hash"],
-                    "status": "completed",
-                    "message": "Payment completed successfully",
-                    "data": final_response.json() if final_response.content else None,
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"HTTP {final_response.status_code}",
-                    "message": "Service still requires payment after facilitator submission",
-                }
+            return self._settled_result(final_response, facilitator_result)
 
         except Exception as e:
             logger.error(f"402 response handling failed: {e}")
@@ -367,6 +577,226 @@ class X402PaymentService:
                 "message": f"402 response handling failed: {str(e)}",
             }
 
+    def _check_payment_requirements(
+        self,
+        response: Response,
+        service_url: str,
+        amount: float,
+        token: str,
+    ) -> dict[str, Any] | None:
+        """
+        Check a 402 response's Payment-Required header against the payment.
+
+        The requirement is cached so later payments to the same service can
+        skip the unpaid request.
+
+        Args:
+            response: HTTP 402 response from service
+            service_url: URL of the service to pay
+            amount: Amount to pay
+            token: Token symbol
+
+        Returns:
+            Error result if the service requires something else, None if it matches
+        """
+        payment_required_header = response.headers.get("Payment-Required")
+        if not payment_required_header:
+            return {
+                "success": False,
+                "error": "missing_payment_required_header",
+                "message": "Service did not provide Payment-Required header",
+            }
+
+        # Parse payment required header (format: "x402; amount=0.10; token=USDC")
+        payment_info = self._parse_payment_required_header(payment_required_header)
+        if payment_info.get("amount") and payment_info.get("token"):
+            self.requirements_cache.put(service_url, payment_info["amount"], payment_info["token"])
+
+        # Verify payment details ("0.10" and 0.1 are the same amount)
+        try:
+            amount_matches = float(payment_info.get("amount", "")) == float(amount)
+        except ValueError:
+            amount_matches = False
+        if not amount_matches:
+            return {
+                "success": False,
+                "error": "amount_mismatch",
+                "message": f"Requested amount {amount} does not match service requirement {payment_info.get('amount')}",
+            }
+
+        if payment_info.get("token") != token:
+            return {
+                "success": False,
+                "error": "token_mismatch",
+                "message": f"Requested token {token} does not match service requirement {payment_info.get('token')}",
+            }
+
+        return None
+
+    def _settled_result(
+        self,
+        final_response: Response,
+        facilitator_result: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Build the result for the service response to a paid retry.
+
+        Args:
+            final_response: Service response to the request with payment proof
+            facilitator_result: Result of the facilitator submission
+
+        Returns:
+            Dict containing payment execution result
+        """
+        if final_response.status_code == 200:
+            return {
+                "success": True,
+                "payment_id": facilitator_result["payment_id"],
+                "tx_hash": facilitator_result["tx_hash"],
+                "status": "completed",
+                "message": "Payment completed successfully",
+                "data": final_response.json() if final_response.content else None,
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"HTTP {final_response.status_code}",
+                "message": "Service still requires payment after facilitator submission",
+            }
+
+    def _has_cached_requirement(self, service_url: str, amount: float, token: str) -> bool:
+        """
+        Check whether a fresh cached requirement covers this payment.
+
+        A cached requirement for a different amount or token is invalidated,
+        so the service is asked again.
+
+        Args:
+            service_url: URL of the service to pay
+            amount: Amount to pay
+            token: Token symbol
+
+        Returns:
+            True if the payment can be signed and attached up front
+        """
+        requirement = self.requirements_cache.get(service_url)
+        if requirement is None:
+            metrics_collector.record_x402_requirements_cache("miss")
+            return False
+
+        if not requirement.matches(amount, token):
+            self.requirements_cache.invalidate(service_url)
+            metrics_collector.record_x402_requirements_cache("invalidated")
+            return False
+
+        metrics_collector.record_x402_requirements_cache("hit")
+        return True
+
+    async def _pay_preemptively(
+        self,
+        service_url: str,
+        amount: float,
+        token: str,
+        description: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Pay using a cached requirement, without the unpaid request.
+
+        Args:
+            service_url: URL of the service to pay
+            amount: Amount to pay
+            token: Token symbol
+            description: Optional payment description
+
+        Returns:
+            Dict containing payment result
+        """
+        logger.info(f"Using cached payment requirement for {service_url}")
+        signature_result = await self._generate_eip712_signature(
+            service_url=service_url,
+            amount=amount,
+            token=token,
+            description=description,
+        )
+        if not signature_result["success"]:
+            return signature_result
+
+        facilitator_result = await self._submit_to_facilitator(
+            service_url=service_url,
+            amount=amount,
+            token=token,
+            signature=signature_result["signature"],
+            description=description,
+        )
+        if not facilitator_result["success"]:
+            return facilitator_result
+
+        final_response = await self._paid_request(service_url, facilitator_result)
+        return self._preemptive_result(service_url, final_response, facilitator_result)
+
+    def _preemptive_result(
+        self,
+        service_url: str,
+        final_response: Response,
+        facilitator_result: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Build the result for a request sent with a pre-emptive proof.
+
+        The facilitator has already settled the payment, so a 402 answer is
+        reported as a failure carrying the payment for reconciliation rather
+        than paid again after rediscovering the requirement.
+
+        Args:
+            service_url: URL of the service
+            final_response: Service response to the request with payment proof
+            facilitator_result: Result of the facilitator submission
+
+        Returns:
+            Dict containing payment result
+        """
+        if final_response.status_code == 402:
+            logger.warning(
+                f"Pre-emptive payment proof rejected by {service_url} after settlement "
+                f"(payment {facilitator_result['payment_id']})"
+            )
+            self.requirements_cache.invalidate(service_url)
+            metrics_collector.record_x402_requirements_cache("invalidated")
+            return {
+                "success": False,
+                "error": "payment_proof_rejected",
+                "payment_id": facilitator_result["payment_id"],
+                "tx_hash": facilitator_result["tx_hash"],
+                "message": (
+                    "Payment was settled but the service rejected the proof. "
+                    "It has not been retried; reconcile it with the service."
+                ),
+            }
+
+        if final_response.status_code == 200:
+            return self._settled_result(final_response, facilitator_result)
+
+        # Settled either way, so keep the payment for reconciliation
+        result = self._response_result(final_response)
+        result["payment_id"] = facilitator_result["payment_id"]
+        result["tx_hash"] = facilitator_result["tx_hash"]
+        return result
+
+    async def _paid_request(
+        self,
+        service_url: str,
+        facilitator_result: dict[str, Any],
+    ) -> Response:
+        """Request the service with a facilitator payment proof attached."""
+        return await self.client.get(
+            service_url,
+            headers={
+                "Accept": "application/json",
+                "User-Agent": "Paygent/1.0",
+                "Payment-Proof": facilitator_result["payment_proof"],
+            },
+        )
+
     def _parse_payment_required_header(self, header: str) -> dict[str, str]:
         """
         Parse Payment-Required header.
@@ -420,30 +850,17 @@ class X402PaymentService:
             # Get signature generator
             generator = get_signature_generator()
 
-            # Get wallet address (mock for development)
-            wallet_address = "0xFCAd0B19bB29D4674531d6f115237E16AfCE377c"  # Mock checksum address
-
             # Create payment data
             payment_data = generator.create_payment_data(
                 service_url=service_url,
                 amount=amount,
                 token=token,
-                wallet_address=wallet_address,
+                wallet_address=PAYER_WALLET_ADDRESS,
                 description=description,
             )
 
             # Sign payment
-            signature_result = generator.sign_payment(payment_data)
-
-            if signature_result["success"]:
-                return {
-                    "success": True,
-                    "signature": signature_result["signature"],
-                    "signer": signature_result["signer"],
-                    "message": "EIP-712 signature generated successfully",
-                }
-            else:
-                return signature_result
+            return self._signature_result(generator.sign_payment(payment_data))
 
         except Exception as e:
             logger.error(f"EIP-712 signature generation failed: {e}")
@@ -453,6 +870,60 @@ class X402PaymentService:
                 "message": f"EIP-712 signature generation failed: {str(e)}",
             }
 
+    async def _generate_eip712_signatures(
+        self,
+        payments: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Generate EIP-712 signatures for many payments in one pass.
+
+        Signing runs in a worker thread so a large batch does not block the
+        event loop.
+
+        Args:
+            payments: Payments with service_url, amount, token and description
+
+        Returns:
+            One signature result per payment, in order
+        """
+        try:
+            from src.x402.signature import get_signature_generator
+
+            generator = get_signature_generator()
+            messages = [
+                generator.create_payment_message(
+                    service_url=payment["service_url"],
+                    amount=payment["amount"],
+                    token=payment["token"],
+                    wallet_address=PAYER_WALLET_ADDRESS,
+                    description=payment.get("description"),
+                )
+                for payment in payments
+            ]
+            signature_results = await asyncio.to_thread(generator.sign_messages, messages)
+            return [self._signature_result(result) for result in signature_results]
+
+        except Exception as e:
+            logger.error(f"EIP-712 batch signature generation failed: {e}")
+            error = {
+                "success": False,
+                "error": str(e),
+                "message": f"EIP-712 signature generation failed: {str(e)}",
+            }
+            return [dict(error) for _ in payments]
+
+    def _signature_result(self, signature_result: dict[str, Any]) -> dict[str, Any]:
+        """Normalize a signature generator result."""
+        if signature_result["success"]:
+            return {
+                "success": True,
+                "signature": signature_result["signature"],
+                "signer": signature_result["signer"],
+                "message": "EIP-712 signature generated successfully",
+            }
+        else:
+            return signature_result
+
     async def _submit_to_facilitator(
         self,
         service_url: str,
@@ -505,14 +976,13 @@ class X402PaymentService:
                     }
 
             # Prepare facilitator request
-            facilitator_payload = {
-                "serviceUrl": service_url,
-                "amount": amount,
-                "token": token,
-                "description": description or "",
-                "signature": signature,
-                "timestamp": 1234567890,
-            }
+            facilitator_payload = self._facilitator_payload(
+                service_url=service_url,
+                amount=amount,
+                token=token,
+                signature=signature,
+                description=description,
+            )
 
             # Submit to facilitator
             facilitator_response = await self.client.post(
@@ -525,15 +995,7 @@ class X402PaymentService:
             )
 
             if facilitator_response.status_code == 200:
-                response_data = facilitator_response.json()
-
-                return {
-                    "success": True,
-                    "payment_id": response_data.get("paymentId"),
-                    "tx_hash": response_data.get("txHash"),
-                    "payment_proof": response_data.get("paymentProof"),
-                    "message": "Payment submitted to facilitator successfully",
-                }
+                return self._facilitator_result(facilitator_response.json())
             else:
                 return {
                     "success": False,
@@ -549,6 +1011,125 @@ class X402PaymentService:
                 "message": f"Facilitator submission failed: {str(e)}",
             }
 
+    async def _submit_batch_to_facilitator(
+        self,
+        items: list[tuple[dict[str, Any], dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """
+        Submit signed payments to the facilitator in one request.
+
+        Uses the facilitator's bulk ``/submit-payments`` endpoint and falls
+        back to concurrent single submissions when it is not supported or
+        the bulk request fails, so one failed call does not fail every item.
+
+        Args:
+            items: (payment, signature) pairs
+
+        Returns:
+            One facilitator submission result per item, in order
+        """
+        bulk = (
+            self.facilitator_url
+            and not settings.debug
+            and self.facilitator_url not in _BULK_SUBMIT_UNSUPPORTED
+        )
+        if bulk:
+            try:
+                facilitator_response = await self.client.post(
+                    f"{self.facilitator_url}/submit-payments",
+                    json={
+                        "payments": [
+                            self._facilitator_payload(
+                                service_url=payment["service_url"],
+                                amount=payment["amount"],
+                                token=payment["token"],
+                                signature=signature,
+                                description=payment.get("description"),
+                            )
+                            for payment, signature in items
+                        ]
+                    },
+                    headers={
+                        "Content-Type": "application/json",
+                        "User-Agent": "Paygent/1.0",
+                    },
+                )
+
+                if facilitator_response.status_code in (404, 405, 501):
+                    logger.info("Facilitator has no bulk endpoint, submitting payments individually")
+                    _BULK_SUBMIT_UNSUPPORTED.add(self.facilitator_url)
+                elif facilitator_response.status_code == 200:
+                    response_data = self._safe_parse_json(facilitator_response) or {}
+                    results = response_data.get("results")
+                    if isinstance(results, list) and len(results) == len(items):
+                        return [
+                            self._facilitator_result(result)
+                            if result.get("paymentId")
+                            else {
+                                "success": False,
+                                "error": result.get("error"),
+                                "message": result.get("message", "Facilitator rejected payment"),
+                            }
+                            for result in results
+                        ]
+                    error = {
+                        "success": False,
+                        "error": "invalid_response_format",
+                        "message": "Facilitator returned an invalid bulk response",
+                    }
+                    return [dict(error) for _ in items]
+                else:
+                    # Each signature has its own nonce, so a payment the failed
+                    # call did settle cannot be settled again
+                    logger.warning(
+                        f"Facilitator bulk submission returned {facilitator_response.status_code}, "
+                        "submitting payments individually"
+                    )
+
+            except Exception as e:
+                logger.warning(f"Facilitator bulk submission failed, submitting payments individually: {e}")
+
+        return list(
+            await asyncio.gather(*(
+                self._submit_to_facilitator(
+                    service_url=payment["service_url"],
+                    amount=payment["amount"],
+                    token=payment["token"],
+                    signature=signature,
+                    description=payment.get("description"),
+                )
+                for payment, signature in items
+            ))
+        )
+
+    def _facilitator_payload(
+        self,
+        service_url: str,
+        amount: float,
+        token: str,
+        signature: dict[str, Any],
+        description: str | None = None,
+    ) -> dict[str, Any]:
+        """Build the facilitator request body for one payment."""
+        return {
+            "serviceUrl": service_url,
+            "amount": amount,
+            "token": token,
+            "description": description or "",
+            "signature": signature,
+            "timestamp": 1234567890,
+        }
+
+    def _facilitator_result(self, response_data: dict[str, Any]) -> dict[str, Any]:
+        """Build the submission result from a facilitator payment response."""
+        return {
+            "success": True,
+            "payment_id": response_data.get("paymentId"),
+            "tx_hash": response_data.get("txHash"),
+            "payment_proof": response_data.get("paymentProof"),
+            "message": "Payment submitted to facilitator successfully",
+        }
+
     async def verify_payment(self, payment_id: str) -> dict[str, Any]:
         """
         Verify payment status with facilitator.
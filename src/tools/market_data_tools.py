@@ -93,6 +93,8 @@ class GetPriceTool(BaseTool):
                 "volume_24h": price_data.volume_24h,
                 "change_24h": price_data.change_24h,
                 "timestamp": price_data.timestamp,
+                "as_of": price_data.as_of,
+                "cache": price_data.cache,
                 "success": True,
                 "source": "Crypto.com Market Data MCP Server"
             }
@@ -0,0 +1,132 @@
+"""
+Concurrency primitives for batched x402 payments.
+
+``MicroBatcher`` coalesces items submitted by concurrent payment flows so a
+stage such as EIP-712 signing or facilitator submission runs once per group
+of waiting flows instead of once per payment. ``ConcurrencyLimiter`` bounds
+in-flight requests globally and per host.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Generic, TypeVar
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Run a batch function over items submitted concurrently.
+
+    ``submit`` enqueues an item and waits for its result. A single worker
+    takes every item queued at that moment (up to ``max_size``) and passes
+    them to ``batch_fn`` in one call, so flows that reach the stage together
+    share one pass.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[T]], Awaitable[list[R]]],
+        max_size: int = 100,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_fn: Async function returning one result per item, in order
+            max_size: Maximum items per batch_fn call
+        """
+        self.batch_fn = batch_fn
+        self.max_size = max_size
+        self.batches = 0
+        self._queue: asyncio.Queue[tuple[T, asyncio.Future[R]]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+
+    async def submit(self, item: T) -> R:
+        """
+        Submit an item and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            Result for the item
+        """
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        while not self._queue.empty():
+            # Let flows that are about to submit join this batch
+            await asyncio.sleep(0)
+            batch = [self._queue.get_nowait()]
+            while len(batch) < self.max_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            items = [item for item, _ in batch]
+            self.batches += 1
+            try:
+                results = await self.batch_fn(items)
+                if len(results) != len(items):
+                    raise ValueError(f"Batch returned {len(results)} results for {len(items)} items")
+            except Exception as e:
+                logger.error(f"Batch of {len(items)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), result in zip(batch, results, strict=True):
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                # Worker cancelled with this batch in flight: its submitters must not wait forever
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+
+    async def aclose(self) -> None:
+        """Cancel the worker; in-flight and pending submitters are cancelled with it."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            # Wait for the worker to resolve its in-flight batch before draining the queue
+            await asyncio.gather(self._worker, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+
+class ConcurrencyLimiter:
+    """Bound concurrent requests globally and per host."""
+
+    def __init__(self, max_concurrency: int, max_per_host: int):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum requests in flight across all hosts
+            max_per_host: Maximum requests in flight to a single host
+        """
+        self.max_per_host = max_per_host
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def acquire(self, url: str):
+        """Hold a global and a per-host slot for the duration of a request."""
+        host = urlsplit(url).netloc
+        semaphore = self._hosts.get(host)
+        if semaphore is None:
+            semaphore = self._hosts[host] = asyncio.Semaphore(self.max_per_host)
+        # Per-host first, so a busy host does not hold global slots while queued
+        async with semaphore, self._global:
+            yield
+
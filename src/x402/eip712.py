@@ -0,0 +1,262 @@
+"""
+Precomputed EIP-712 hashing and signing for x402 payments.
+
+``encode_typed_data`` rebuilds and re-hashes the domain separator and the
+type string for every message. For a fixed domain (chain ID and verifying
+contract) and a fixed ``Payment`` type, both hashes are constants, so
+``TypedDataEngine`` computes them once and only hashes each message's
+struct. Digests are signed and recovered directly with ``eth_keys``.
+
+``sign_many``/``verify_many`` process batches in one call and fan large
+batches out to a process pool.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from eth_keys import keys
+from eth_utils import keccak
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Field = dict[str, str]
+
+
+def encode_type(primary_type: str, fields: list[Field]) -> str:
+    """Build the EIP-712 type string, e.g. ``Payment(string serviceUrl,...)``."""
+    members = ",".join(f"{field['type']} {field['name']}" for field in fields)
+    return f"{primary_type}({members})"
+
+
+def encode_value(solidity_type: str, value: Any) -> bytes:
+    """
+    Encode one atomic or dynamic EIP-712 value as a 32-byte word.
+
+    Args:
+        solidity_type: Field type (string, bytes, bool, address, uintN, intN, bytesN)
+        value: Field value
+
+    Returns:
+        32-byte encoding
+    """
+    if solidity_type == "string":
+        return keccak(text=value)
+    if solidity_type == "bytes":
+        return keccak(value if isinstance(value, bytes) else bytes.fromhex(value.removeprefix("0x")))
+    if solidity_type == "bool":
+        return int(bool(value)).to_bytes(32, "big")
+    if solidity_type == "address":
+        return bytes.fromhex(value.removeprefix("0x").rjust(64, "0"))
+    if solidity_type.startswith("uint"):
+        return int(value).to_bytes(32, "big")
+    if solidity_type.startswith("int"):
+        return int(value).to_bytes(32, "big", signed=True)
+    if solidity_type.startswith("bytes"):
+        raw = value if isinstance(value, bytes) else bytes.fromhex(value.removeprefix("0x"))
+        return raw.ljust(32, b"\0")
+    raise ValueError(f"Unsupported EIP-712 field type: {solidity_type}")
+
+
+class StructType:
+    """An EIP-712 struct type with its type hash computed once."""
+
+    def __init__(self, name: str, fields: list[Field]):
+        """
+        Initialize the struct type.
+
+        Args:
+            name: Type name
+            fields: Field definitions (``name``/``type`` dicts), in order
+        """
+        self.name = name
+        self.fields = [(field["name"], field["type"]) for field in fields]
+        self.type_hash = keccak(text=encode_type(name, fields))
+
+    def hash(self, data: dict[str, Any]) -> bytes:
+        """Compute ``hashStruct(data)``."""
+        encoded = bytearray(self.type_hash)
+        for name, solidity_type in self.fields:
+            encoded += encode_value(solidity_type, data[name])
+        return keccak(bytes(encoded))
+
+
+class TypedDataEngine:
+    """
+    Sign and verify messages of one EIP-712 type under one domain.
+
+    The domain separator and message type hash are computed once per
+    engine, so each signature costs one struct hash, one digest hash and
+    one ECDSA operation.
+    """
+
+    def __init__(
+        self,
+        domain: dict[str, Any],
+        domain_fields: list[Field],
+        primary_type: str,
+        message_fields: list[Field],
+        private_key: bytes | None = None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            domain: EIP-712 domain values
+            domain_fields: ``EIP712Domain`` field definitions
+            primary_type: Message type name
+            message_fields: Message field definitions
+            private_key: 32-byte signing key (verification only if None)
+        """
+        self.domain_separator = StructType("EIP712Domain", domain_fields).hash(domain)
+        self.message_type = StructType(primary_type, message_fields)
+        self._prefix = b"\x19\x01" + self.domain_separator
+        self._key_bytes = bytes(private_key) if private_key is not None else None
+        self._private_key = keys.PrivateKey(self._key_bytes) if self._key_bytes else None
+        self._init_args = (domain, domain_fields, primary_type, message_fields)
+
+    @property
+    def address(self) -> str | None:
+        """Checksum address of the signing key."""
+        if self._private_key is None:
+            return None
+        return self._private_key.public_key.to_checksum_address()
+
+    def digest(self, message: dict[str, Any]) -> bytes:
+        """Compute the EIP-712 digest ``keccak(0x1901 || domainSeparator || hashStruct(message))``."""
+        return keccak(self._prefix + self.message_type.hash(message))
+
+    def sign(self, message: dict[str, Any]) -> str:
+        """
+        Sign a message.
+
+        Args:
+            message: Message values
+
+        Returns:
+            0x-prefixed 65-byte signature (r || s || v, v in {27, 28})
+        """
+        if self._private_key is None:
+            raise ValueError("No signing key configured")
+        signature = self._private_key.sign_msg_hash(self.digest(message))
+        return "0x" + (
+            signature.r.to_bytes(32, "big")
+            + signature.s.to_bytes(32, "big")
+            + bytes([signature.v + 27])
+        ).hex()
+
+    def recover(self, message: dict[str, Any], signature: str) -> str:
+        """
+        Recover the signer of a message.
+
+        Args:
+            message: Message values that were signed
+            signature: 0x-prefixed 65-byte signature
+
+        Returns:
+            Checksum address of the signer
+        """
+        raw = bytes.fromhex(signature.removeprefix("0x"))
+        if len(raw) != 65:
+            raise ValueError("Signature must be 65 bytes")
+        v = raw[64] - 27 if raw[64] >= 27 else raw[64]
+        parsed = keys.Signature(vrs=(v, int.from_bytes(raw[:32], "big"), int.from_bytes(raw[32:64], "big")))
+        public_key = parsed.recover_public_key_from_msg_hash(self.digest(message))
+        return public_key.to_checksum_address()
+
+    def verify(self, message: dict[str, Any], signature: str, expected_address: str) -> bool:
+        """Check that ``signature`` over ``message`` was made by ``expected_address``."""
+        try:
+            return self.recover(message, signature).lower() == expected_address.lower()
+        except Exception as e:
+            logger.debug(f"Signature verification failed: {e}")
+            return False
+
+    def sign_many(self, messages: list[dict[str, Any]]) -> list[str]:
+        """
+        Sign many messages.
+
+        Batches of at least ``x402_sign_process_pool_threshold`` messages are
+        split across a process pool.
+
+        Args:
+            messages: Message values
+
+        Returns:
+            One signature per message, in order
+        """
+        if self._private_key is None:
+            raise ValueError("No signing key configured")
+        if not _use_process_pool(len(messages)):
+            return [self.sign(message) for message in messages]
+        return _map_chunks(_sign_chunk, self._worker_args(), messages)
+
+    def verify_many(self, items: list[tuple[dict[str, Any], str, str]]) -> list[bool]:
+        """
+        Verify many signatures.
+
+        Args:
+            items: (message, signature, expected_address) tuples
+
+        Returns:
+            One verification result per item, in order
+        """
+        if not _use_process_pool(len(items)):
+            return [self.verify(message, signature, address) for message, signature, address in items]
+        return _map_chunks(_verify_chunk, self._worker_args(), items)
+
+    def _worker_args(self) -> tuple[Any, ...]:
+        return (*self._init_args, self._key_bytes)
+
+
+# Shared process pool for large signing batches (created on first use)
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _pool_workers() -> int:
+    return settings.x402_sign_process_workers or os.cpu_count() or 1
+
+
+def _use_process_pool(count: int) -> bool:
+    threshold = settings.x402_sign_process_pool_threshold
+    return threshold > 0 and count >= threshold and _pool_workers() > 1
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=_pool_workers())
+    return _process_pool
+
+
+def _map_chunks(worker, engine_args: tuple[Any, ...], items: list[Any]) -> list[Any]:
+    """Split items into one chunk per worker and concatenate the results in order."""
+    workers = _pool_workers()
+    size = -(-len(items) // workers)
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    pool = _get_process_pool()
+    results: list[Any] = []
+    for chunk_results in pool.map(worker, [engine_args] * len(chunks), chunks):
+        results.extend(chunk_results)
+    return results
+
+
+def _sign_chunk(engine_args: tuple[Any, ...], messages: list[dict[str, Any]]) -> list[str]:
+    engine = TypedDataEngine(*engine_args)
+    return [engine.sign(message) for message in messages]
+
+
+def _verify_chunk(engine_args: tuple[Any, ...], items: list[tuple[dict[str, Any], str, str]]) -> list[bool]:
+    engine = TypedDataEngine(*engine_args)
+    return [engine.verify(message, signature, address) for message, signature, address in items]
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the signing process pool, if one was started."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
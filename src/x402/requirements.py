@@ -0,0 +1,93 @@
+"""
+Cached x402 payment requirements.
+
+Paying an x402 service normally starts with an unpaid request whose only
+purpose is to receive HTTP 402 and its ``Payment-Required`` header. For
+services called repeatedly at a stable price, the parsed requirement is
+cached per service URL so the next payment can be signed and attached
+up front, skipping that round trip.
+
+Entries expire after a TTL and are invalidated when the caller's amount or
+token no longer matches, or when the service rejects a pre-emptive proof.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.core.config import settings
+
+
+@dataclass(frozen=True)
+class PaymentRequirement:
+    """Amount and token a service asked for in its Payment-Required header."""
+
+    amount: str
+    token: str
+    expires_at: float
+
+    def matches(self, amount: float, token: str) -> bool:
+        """Check whether a payment of ``amount`` ``token`` satisfies the requirement."""
+        try:
+            return float(self.amount) == float(amount) and self.token == token
+        except ValueError:
+            return False
+
+
+class PaymentRequirementsCache:
+    """Process-wide LRU of payment requirements keyed by service URL."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = settings.x402_requirements_ttl_seconds,
+        max_entries: int = settings.x402_requirements_max_entries,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds a requirement is trusted after it was seen
+            max_entries: Maximum service URLs kept; least recently used are evicted
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, PaymentRequirement] = OrderedDict()
+
+    def get(self, service_url: str) -> PaymentRequirement | None:
+        """Get the fresh requirement for a service, if any."""
+        requirement = self._entries.get(service_url)
+        if requirement is None:
+            return None
+        if requirement.expires_at <= time.monotonic():
+            del self._entries[service_url]
+            return None
+        self._entries.move_to_end(service_url)
+        return requirement
+
+    def put(self, service_url: str, amount: str, token: str) -> None:
+        """Store the requirement a service just returned."""
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        self._entries[service_url] = PaymentRequirement(
+            amount=amount,
+            token=token,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._entries.move_to_end(service_url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, service_url: str) -> None:
+        """Forget the requirement for a service."""
+        self._entries.pop(service_url, None)
+
+    def clear(self) -> None:
+        """Drop all cached requirements."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global payment requirements cache
+payment_requirements_cache = PaymentRequirementsCache()
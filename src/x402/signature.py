@@ -10,14 +10,19 @@ import time
 from typing import Any
 
 from eth_account import Account
-from eth_account.messages import encode_typed_data
 from pydantic import BaseModel, Field
 
 from src.core.config import settings
+from src.x402.eip712 import TypedDataEngine
 
 logger = logging.getLogger(__name__)
 
 
+def _to_smallest_unit(amount: float) -> int:
+    """Convert a token amount to 6 decimal places (USDC standard)."""
+    return int(amount * 1e6)
+
+
 class PaymentSignatureData(BaseModel):
     """Data model for payment signature."""
 
@@ -91,6 +96,15 @@ class EIP712SignatureGenerator:
             except Exception as e:
                 logger.error(f"Failed to initialize account: {e}")
 
+        # Domain separator and Payment type hash are computed once here
+        self.engine = TypedDataEngine(
+            domain=self.domain,
+            domain_fields=self.TYPES["EIP712Domain"],
+            primary_type="Payment",
+            message_fields=self.TYPES["Payment"],
+            private_key=bytes(self.account.key) if self.account else None,
+        )
+
         # Nonce tracking (in production, use Redis or database)
         self._nonces = {}
 
@@ -133,13 +147,48 @@ class EIP712SignatureGenerator:
         """
         return PaymentSignatureData(
             service_url=service_url,
-            amount=int(amount * 1e6),  # Convert to 6 decimal places (USDC standard)
+            amount=_to_smallest_unit(amount),
             token=token,
             description=description or "",
             wallet_address=wallet_address,
             nonce=self.get_nonce(wallet_address),
         )
 
+    def create_payment_message(
+        self,
+        service_url: str,
+        amount: float,
+        token: str,
+        wallet_address: str,
+        description: str | None = None,
+        timestamp: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Create an EIP-712 Payment message without model validation.
+
+        Fast path equivalent of ``create_payment_data`` for batch signing.
+
+        Args:
+            service_url: URL of the service being paid
+            amount: Payment amount (will be converted to smallest unit)
+            token: Token symbol
+            wallet_address: Payer's wallet address
+            description: Optional payment description
+            timestamp: Payment timestamp (defaults to now)
+
+        Returns:
+            Payment message keyed by EIP-712 field name
+        """
+        return {
+            "serviceUrl": service_url,
+            "amount": _to_smallest_unit(amount),
+            "token": token,
+            "description": description or "",
+            "timestamp": timestamp if timestamp is not None else int(time.time()),
+            "nonce": self.get_nonce(wallet_address),
+            "walletAddress": wallet_address,
+        }
+
     def sign_payment(self, payment_data: PaymentSignatureData) -> dict[str, Any]:
         """
         Sign payment data using EIP-712.
@@ -150,61 +199,85 @@ class EIP712SignatureGenerator:
         Returns:
             Dict containing signature and metadata
         """
-        try:
-            if not self.account:
-                return {
+        if not self.account:
+            return {
+                "success": False,
+                "error": "no_signer_configured",
+                "message": "No signer account configured",
+            }
+
+        return self._sign_message(self._payment_message(payment_data))
+
+    def sign_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Sign many Payment messages in one pass.
+
+        Large batches are spread over a process pool
+        (see ``x402_sign_process_pool_threshold``). If the batch fails, the
+        messages are signed one at a time so only the bad ones fail.
+
+        Args:
+            messages: Messages from ``create_payment_message``
+
+        Returns:
+            One sign_payment-style result per message, in order
+        """
+        if not self.account:
+            return [
+                {
                     "success": False,
                     "error": "no_signer_configured",
                     "message": "No signer account configured",
                 }
+                for _ in messages
+            ]
 
-            # Create message - ensure wallet address is a proper string
-            # The payment_data.wallet_address might be coming in with extra quotes
-            wallet_address = str(payment_data.wallet_address)
-            # Remove any surrounding quotes that might have been added
-            if wallet_address.startswith(("'", '"')) and wallet_address.endswith(("'", '"')):
-                wallet_address = wallet_address[1:-1]
-
-            message = {
-                "serviceUrl": payment_data.service_url,
-                "amount": payment_data.amount,
-                "token": payment_data.token,
-                "description": payment_data.description or "",
-                "timestamp": payment_data.timestamp,
-                "nonce": payment_data.nonce,
-                "walletAddress": wallet_address,
-            }
+        try:
+            signatures = self.engine.sign_many(messages)
+        except Exception as e:
+            # One bad message must not fail the others
+            logger.warning(f"Batch payment signing failed, signing one at a time: {e}")
+            return [self._sign_message(message) for message in messages]
 
-            # Encode typed data
-            encoded_message = encode_typed_data(
-                domain_data=self.domain,
-                message_types={"Payment": self.TYPES["Payment"]},
-                message_data=message,
-            )
-
-            # Sign message
-            signed_message = self.account.sign_message(encoded_message)
-
-            # Create signature object - ensure signature has 0x prefix
-            signature_hex = signed_message.signature.hex()
-            if not signature_hex.startswith("0x"):
-                signature_hex = "0x" + signature_hex
-
-            signature = {
-                "domain": self.domain,
-                "types": {"Payment": self.TYPES["Payment"]},
-                "message": message,
-                "signature": signature_hex,
-                "signerAddress": self.account.address,
-            }
+        return [
+            self._signature_result(message, signature_hex)
+            for message, signature_hex in zip(messages, signatures, strict=True)
+        ]
 
-            return {
-                "success": True,
-                "signature": signature,
-                "signer": self.account.address,
-                "message": "Payment signed successfully",
-            }
+    def sign_payments(self, payments: list[PaymentSignatureData]) -> list[dict[str, Any]]:
+        """
+        Sign many payments in one pass.
+
+        Args:
+            payments: Payment signature data to sign
 
+        Returns:
+            One sign_payment result per payment, in order
+        """
+        return self.sign_messages([self._payment_message(payment_data) for payment_data in payments])
+
+    def _payment_message(self, payment_data: PaymentSignatureData) -> dict[str, Any]:
+        """Build the EIP-712 Payment message for payment data."""
+        # Ensure wallet address is a proper string; it might come in with extra quotes
+        wallet_address = str(payment_data.wallet_address)
+        # Remove any surrounding quotes that might have been added
+        if wallet_address.startswith(("'", '"')) and wallet_address.endswith(("'", '"')):
+            wallet_address = wallet_address[1:-1]
+
+        return {
+            "serviceUrl": payment_data.service_url,
+            "amount": payment_data.amount,
+            "token": payment_data.token,
+            "description": payment_data.description or "",
+            "timestamp": payment_data.timestamp,
+            "nonce": payment_data.nonce,
+            "walletAddress": wallet_address,
+        }
+
+    def _sign_message(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Sign one message, reporting a failure as a result rather than raising."""
+        try:
+            return self._signature_result(message, self.engine.sign(message))
         except Exception as e:
             logger.error(f"Payment signing failed: {e}")
             return {
@@ -213,6 +286,23 @@ class EIP712SignatureGenerator:
                 "message": f"Payment signing failed: {str(e)}",
             }
 
+    def _signature_result(self, message: dict[str, Any], signature_hex: str) -> dict[str, Any]:
+        """Build the signature object returned for a signed message."""
+        signature = {
+            "domain": self.domain,
+            "types": {"Payment": self.TYPES["Payment"]},
+            "message": message,
+            "signature": signature_hex,
+            "signerAddress": self.account.address,
+        }
+
+        return {
+            "success": True,
+            "signature": signature,
+            "signer": self.account.address,
+            "message": "Payment signed successfully",
+        }
+
     def verify_signature(
         self,
         signature: str,
@@ -230,23 +320,19 @@ class EIP712SignatureGenerator:
         Returns:
             True if signature is valid
         """
-        try:
-            # Encode typed data
-            encoded_message = encode_typed_data(
-                domain_data=self.domain,
-                message_types={"Payment": self.TYPES["Payment"]},
-                message_data=message,
-            )
+        return self.engine.verify(message, signature, expected_address)
 
-            # Recover address from signature
-            recovered_address = Account.recover_message(encoded_message, signature=signature)
+    def verify_signatures(self, items: list[tuple[dict[str, Any], str, str]]) -> list[bool]:
+        """
+        Verify many EIP-712 signatures.
 
-            # Verify address matches
-            return recovered_address.lower() == expected_address.lower()
+        Args:
+            items: (message, signature, expected_address) tuples
 
-        except Exception as e:
-            logger.error(f"Signature verification failed: {e}")
-            return False
+        Returns:
+            One verification result per item, in order
+        """
+        return self.engine.verify_many(items)
 
 
 # Singleton instance
@@ -82,6 +82,29 @@ def mock_blockchain():
     return mock
 
 
+@pytest.fixture(autouse=True)
+def clear_payment_requirements_cache():
+    """Start every test without cached x402 payment requirements."""
+    from src.x402.requirements import payment_requirements_cache
+
+    payment_requirements_cache.clear()
+    yield
+    payment_requirements_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_market_data_caches():
+    """Start every test without cached VVS quotes or MCP prices."""
+    from src.connectors.vvs import quote_cache
+    from src.services.mcp_client import price_cache
+
+    quote_cache.clear()
+    price_cache.clear()
+    yield
+    quote_cache.clear()
+    price_cache.clear()
+
+
 @pytest.fixture
 def mock_x402_client():
     """Create a mock x402 payment client."""
@@ -0,0 +1,125 @@
+"""
+Local JSON-RPC stub for on-chain read tests.
+
+Serves ``eth_getBalance``, ``eth_chainId`` and ``eth_call`` from in-memory
+tables over a real HTTP socket, so async Web3 code paths can be exercised
+without a Cronos node. JSON-RPC batch requests are supported, and Multicall3
+``aggregate3``/``getEthBalance`` are emulated when a multicall address is set.
+"""
+
+from typing import Any
+
+from aiohttp import web
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector
+
+BALANCE_OF_SELECTOR = "0x" + function_signature_to_4byte_selector("balanceOf(address)").hex()
+DECIMALS_SELECTOR = "0x" + function_signature_to_4byte_selector("decimals()").hex()
+SYMBOL_SELECTOR = "0x" + function_signature_to_4byte_selector("symbol()").hex()
+GET_AMOUNTS_OUT_SELECTOR = "0x" + function_signature_to_4byte_selector(
+    "getAmountsOut(uint256,address[])"
+).hex()
+AGGREGATE3_SELECTOR = "0x" + function_signature_to_4byte_selector(
+    "aggregate3((address,bool,bytes)[])"
+).hex()
+GET_ETH_BALANCE_SELECTOR = "0x" + function_signature_to_4byte_selector(
+    "getEthBalance(address)"
+).hex()
+
+
+class JsonRpcStub:
+    """Minimal Ethereum JSON-RPC server backed by dictionaries."""
+
+    def __init__(self, chain_id: int = 338, multicall_address: str | None = None):
+        self.chain_id = chain_id
+        self.multicall_address = multicall_address.lower() if multicall_address else None
+        self.native_balances: dict[str, int] = {}
+        # (contract address lowercase, selector) -> ABI-encoded return data
+        self.call_results: dict[tuple[str, str], bytes] = {}
+        self.requests: list[dict[str, Any]] = []
+        self.http_requests = 0
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    def set_native_balance(self, address: str, wei: int) -> None:
+        """Set the native balance returned for an address."""
+        self.native_balances[address.lower()] = wei
+
+    def set_erc20(self, token: str, balance: int, decimals: int, symbol: str = "TKN") -> None:
+        """Set ERC20 balanceOf/decimals/symbol results for a token contract."""
+        token = token.lower()
+        self.call_results[(token, BALANCE_OF_SELECTOR)] = encode(["uint256"], [balance])
+        self.call_results[(token, DECIMALS_SELECTOR)] = encode(["uint8"], [decimals])
+        self.call_results[(token, SYMBOL_SELECTOR)] = encode(["string"], [symbol])
+
+    def set_amounts_out(self, router: str, amounts: list[int]) -> None:
+        """Set the getAmountsOut result for a router contract."""
+        self.call_results[(router.lower(), GET_AMOUNTS_OUT_SELECTOR)] = encode(
+            ["uint256[]"], [amounts]
+        )
+
+    def methods(self) -> list[str]:
+        """Get the JSON-RPC methods received, in order."""
+        return [request["method"] for request in self.requests]
+
+    def _handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        self.requests.append(request)
+        method = request["method"]
+        params = request.get("params", [])
+        response: dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+
+        if method == "eth_chainId":
+            response["result"] = hex(self.chain_id)
+        elif method == "eth_getBalance":
+            response["result"] = hex(self.native_balances.get(params[0].lower(), 0))
+        elif method == "eth_call":
+            call = params[0]
+            data = call.get("data") or call.get("input") or ""
+            result = self._call(call["to"].lower(), data)
+            if result is not None:
+                response["result"] = "0x" + result.hex()
+            else:
+                response["error"] = {"code": -32000, "message": "execution reverted"}
+        else:
+            response["error"] = {"code": -32601, "message": f"Method not found: {method}"}
+        return response
+
+    def _call(self, to: str, data: str) -> bytes | None:
+        """Execute an eth_call, emulating Multicall3 when configured."""
+        selector = data[:10]
+        if to == self.multicall_address:
+            if selector == GET_ETH_BALANCE_SELECTOR:
+                (owner,) = decode(["address"], bytes.fromhex(data[10:]))
+                return encode(["uint256"], [self.native_balances.get(owner.lower(), 0)])
+            if selector == AGGREGATE3_SELECTOR:
+                (calls,) = decode(["(address,bool,bytes)[]"], bytes.fromhex(data[10:]))
+                outcomes = []
+                for target, _allow_failure, call_data in calls:
+                    result = self._call(target.lower(), "0x" + call_data.hex())
+                    outcomes.append((result is not None, result or b""))
+                return encode(["(bool,bytes)[]"], [outcomes])
+        return self.call_results.get((to, selector))
+
+    async def _dispatch(self, http_request: web.Request) -> web.Response:
+        self.http_requests += 1
+        payload = await http_request.json()
+        if isinstance(payload, list):
+            return web.json_response([self._handle(item) for item in payload])
+        return web.json_response(self._handle(payload))
+
+    async def start(self) -> str:
+        """Start serving on an ephemeral localhost port and return the URL."""
+        app = web.Application()
+        app.router.add_post("/", self._dispatch)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
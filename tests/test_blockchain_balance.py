@@ -1,139 +1,157 @@
-"""Test blockchain balance checking using web3.py.
+"""Test blockchain balance checking through the async RPC layer.
 
-Tests that the wallet service can check actual blockchain balances
-and falls back to mock data on failure.
+Tests that the wallet service reads balances from a JSON-RPC endpoint
+without blocking the event loop, and falls back to mock data on failure.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
+from src.connectors.rpc import AsyncRPCClient
+from src.services.wallet_service import TOKEN_ADDRESSES, WalletService
+from tests.fixtures.json_rpc_stub import JsonRpcStub
 
-@pytest.mark.asyncio
-async def test_check_balance_with_web3():
-    """Test checking balance using web3.py."""
-    # Mock database
-    mock_db = AsyncMock()
-
-    from src.services.wallet_service import WalletService
-
-    service = WalletService(mock_db)
-
-    # Mock web3 connection
-    with patch('src.services.wallet_service.Web3') as mock_web3:
-        # Setup mocks
-        mock_w3_instance = MagicMock()
-        mock_web3.return_value = mock_w3_instance
-        mock_w3_instance.is_connected.return_value = True
-        mock_w3_instance.eth.get_balance.return_value = 1000000000000000000000  # 1000 CRO
-        mock_w3_instance.from_wei.return_value = 1000.0
-
-        # Mock ERC20 contract
-        mock_contract = MagicMock()
-        mock_contract.functions.balanceOf.return_value.call.return_value = 100000000  # 100 USDC (6 decimals)
-        mock_contract.functions.decimals.return_value.call.return_value = 6
-        mock_w3_instance.eth.contract.return_value = mock_contract
-        mock_w3_instance.to_checksum_address.side_effect = lambda x: x
-
-        # Check balances
-        result = await service.check_balance(tokens=["CRO", "USDC"])
+WALLET = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0"
 
-        assert result["success"] is True
-        assert len(result["balances"]) == 2
-        assert result["balances"][0]["token_symbol"] in ["CRO", "USDC"]
-        assert result["balances"][0]["balance"] >= 0
 
+@pytest.fixture
+async def rpc_stub():
+    """Run a local JSON-RPC stub for the duration of a test."""
+    stub = JsonRpcStub()
+    await stub.start()
+    yield stub
+    await stub.stop()
 
-@pytest.mark.asyncio
-async def test_check_balance_fallback_on_web3_failure():
-    """Test that check_balance falls back to mock when web3 fails."""
-    mock_db = AsyncMock()
-    from src.services.wallet_service import WalletService
 
-    service = WalletService(mock_db)
+@pytest.fixture
+async def rpc_client(rpc_stub):
+    """Create an async RPC client pointed at the stub."""
+    client = AsyncRPCClient(rpc_stub.url)
+    yield client
+    await client.close()
 
-    # Mock web3 connection failure
-    with patch('src.services.wallet_service.Web3') as mock_web3:
-        mock_w3_instance = MagicMock()
-        mock_web3.return_value = mock_w3_instance
-        mock_w3_instance.is_connected.return_value = False
 
-        # Should fall back to mock balances
-        result = await service.check_balance(tokens=["CRO", "USDC"])
+@pytest.mark.asyncio
+async def test_check_balance_with_web3(rpc_stub, rpc_client):
+    """Test checking native and ERC20 balances over async RPC."""
+    rpc_stub.set_native_balance(WALLET, 1000 * 10**18)  # 1000 CRO
+    rpc_stub.set_erc20(TOKEN_ADDRESSES["USDC"], balance=100_000_000, decimals=6)
 
-        assert result["success"] is True
-        assert len(result["balances"]) == 2
-        # Mock balances should be present
-        assert any(b["balance"] > 0 for b in result["balances"])
+    service = WalletService(AsyncMock(), wallet_address=WALLET, rpc_client=rpc_client)
+    result = await service.check_balance(tokens=["CRO", "USDC"])
+
+    assert result["success"] is True
+    balances = {b["token_symbol"]: b["balance"] for b in result["balances"]}
+    assert balances == {"CRO": 1000.0, "USDC": 100.0}
+    assert "eth_getBalance" in rpc_stub.methods()
+    assert "eth_call" in rpc_stub.methods()
 
 
 @pytest.mark.asyncio
-async def test_check_balance_handles_exceptions():
-    """Test that check_balance handles exceptions gracefully."""
-    mock_db = AsyncMock()
-    from src.services.wallet_service import WalletService
+async def test_check_balance_fallback_on_web3_failure():
+    """Test that check_balance falls back to mock when the RPC is unreachable."""
+    unreachable = AsyncRPCClient("http://127.0.0.1:9/", timeout_seconds=1.0)
+    service = WalletService(AsyncMock(), rpc_client=unreachable)
+
+    try:
+        result = await service.check_balance(tokens=["CRO", "USDC"])
+    finally:
+        await unreachable.close()
+
+    assert result["success"] is True
+    assert len(result["balances"]) == 2
+    # Mock balances should be present
+    assert any(b["balance"] > 0 for b in result["balances"])
 
-    service = WalletService(mock_db)
 
-    # Mock web3 to raise exception
-    with patch('src.services.wallet_service.Web3', side_effect=Exception("Connection error")):
-        # Should fall back to mock balances
-        result = await service.check_balance(tokens=["USDC"])
+@pytest.mark.asyncio
+async def test_check_balance_handles_exceptions(rpc_client):
+    """Test that a reverted token call falls back to mock balances."""
+    # No ERC20 results registered, so eth_call reverts
+    service = WalletService(AsyncMock(), wallet_address=WALLET, rpc_client=rpc_client)
+    result = await service.check_balance(tokens=["USDC"])
 
-        assert result["success"] is True
-        assert len(result["balances"]) == 1
+    assert result["success"] is True
+    assert len(result["balances"]) == 1
+    assert result["balances"][0]["balance"] == 100.0  # mock USDC balance
 
 
 @pytest.mark.asyncio
-async def test_get_native_token_balance():
+async def test_get_native_token_balance(rpc_stub, rpc_client):
     """Test checking native CRO balance."""
-    mock_db = AsyncMock()
-    from src.services.wallet_service import WalletService
+    rpc_stub.set_native_balance(WALLET, 50 * 10**18)
+
+    service = WalletService(AsyncMock(), wallet_address=WALLET, rpc_client=rpc_client)
+    result = await service.check_balance(tokens=["CRO"])
+
+    assert result["success"] is True
+    assert result["balances"][0]["token_symbol"] == "CRO"
+    assert result["balances"][0]["balance"] == 50.0
 
-    service = WalletService(mock_db, wallet_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0")
 
-    # Mock web3 for native token balance
-    with patch('src.services.wallet_service.Web3') as mock_web3:
-        mock_w3_instance = MagicMock()
-        mock_web3.return_value = mock_w3_instance
-        mock_w3_instance.is_connected.return_value = True
-        mock_w3_instance.eth.get_balance.return_value = 50000000000000000000  # 50 CRO
-        mock_w3_instance.from_wei.return_value = 50.0
-        mock_w3_instance.to_checksum_address.side_effect = lambda x: x
+@pytest.mark.asyncio
+async def test_get_erc20_token_balance(rpc_stub, rpc_client):
+    """Test checking ERC20 token balance."""
+    rpc_stub.set_erc20(TOKEN_ADDRESSES["USDC"], balance=50_000_000, decimals=6)
 
-        result = await service.check_balance(tokens=["CRO"])
+    service = WalletService(AsyncMock(), wallet_address=WALLET, rpc_client=rpc_client)
+    result = await service.check_balance(tokens=["USDC"])
 
-        assert result["success"] is True
-        assert result["balances"][0]["token_symbol"] == "CRO"
-        assert result["balances"][0]["balance"] == 50.0
+    assert result["success"] is True
+    assert result["balances"][0]["token_symbol"] == "USDC"
+    assert result["balances"][0]["balance"] == 50.0
 
 
 @pytest.mark.asyncio
-async def test_get_erc20_token_balance():
-    """Test checking ERC20 token balance."""
-    mock_db = AsyncMock()
-    from src.services.wallet_service import WalletService
+async def test_check_balance_by_address_in_one_round_trip(rpc_stub, rpc_client):
+    """Test that a portfolio of token addresses is read in a single request."""
+    tokens = [f"0x{index:040x}" for index in range(1, 25)]
+    for index, token in enumerate(tokens):
+        rpc_stub.set_erc20(token, balance=index * 10**18, decimals=18, symbol=f"TK{index}")
+    await rpc_client.chain_id()
+    before = rpc_stub.http_requests
 
-    service = WalletService(mock_db, wallet_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0")
+    service = WalletService(AsyncMock(), wallet_address=WALLET, rpc_client=rpc_client)
+    result = await service.check_balance(tokens=["CRO", *tokens])
 
-    # Mock web3 for ERC20 token
-    with patch('src.services.wallet_service.Web3') as mock_web3:
-        mock_w3_instance = MagicMock()
-        mock_web3.return_value = mock_w3_instance
-        mock_w3_instance.is_connected.return_value = True
-        mock_w3_instance.to_checksum_address.side_effect = lambda x: x
+    assert rpc_stub.http_requests - before == 1
+    assert len(result["balances"]) == 25
+    assert result["balances"][5]["token_symbol"] == "TK4"
+    assert result["balances"][5]["balance"] == 4.0
 
-        # Mock contract
-        mock_contract = MagicMock()
-        mock_contract.functions.balanceOf.return_value.call.return_value = 50000000  # 50 USDC
-        mock_contract.functions.decimals.return_value.call.return_value = 6
-        mock_w3_instance.eth.contract.return_value = mock_contract
 
-        result = await service.check_balance(tokens=["USDC"])
+@pytest.mark.asyncio
+async def test_rpc_client_reuses_pooled_session(rpc_stub, rpc_client):
+    """Test that repeated reads share one web3 instance and HTTP session."""
+    rpc_stub.set_native_balance(WALLET, 1)
+
+    first = await rpc_client.get_web3()
+    await rpc_client.get_balance(WALLET)
+    await rpc_client.get_balance(WALLET)
+
+    assert await rpc_client.get_web3() is first
+    assert await rpc_client.chain_id() == 338
 
-        assert result["success"] is True
-        assert result["balances"][0]["token_symbol"] == "USDC"
-        assert result["balances"][0]["balance"] == 50.0
+
+@pytest.mark.asyncio
+async def test_vvs_async_quote_uses_rpc_layer(rpc_stub, monkeypatch):
+    """Test that the VVS async quote reads getAmountsOut over async RPC."""
+    from src.connectors import vvs as vvs_module
+    from src.connectors.vvs import VVSFinanceConnector
+
+    connector = VVSFinanceConnector(use_mock=False, use_testnet=True)
+    client = AsyncRPCClient(rpc_stub.url)
+    monkeypatch.setattr(vvs_module, "get_rpc_client", lambda _url=None: client)
+    rpc_stub.set_amounts_out(connector.router_address, [10**19, 750_000])
+
+    try:
+        quote = await connector.get_quote_async("CRO", "USDC", 10)
+    finally:
+        await client.close()
+
+    assert quote["source"] == "on-chain"
+    assert quote["expected_amount_out"] == "0.75"
 
 
 if __name__ == "__main__":
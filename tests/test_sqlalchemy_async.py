@@ -192,8 +192,9 @@ class TestSQLAlchemyAsyncOperations:
         # Check pool configuration
         from sqlalchemy.pool import NullPool
 
-        # Async engine should use NullPool
-        assert isinstance(engine.pool, NullPool)
+        # SQLite engines use NullPool; only server databases get a queue pool
+        if "sqlite" in engine.url.drivername:
+            assert isinstance(engine.pool, NullPool)
 
     @pytest.mark.asyncio
     async def test_database_url_conversion(self):
@@ -121,7 +121,7 @@ def test_security_implementation():
     assert token_data.username == "test_user"
 
 
-def test_rate_limiting():
+async def test_rate_limiting():
     """Test rate limiting functionality."""
     from src.middleware.rate_limiter import RateLimiter
 
@@ -130,7 +130,7 @@ def test_rate_limiting():
     # Test basic functionality
     results = []
     for i in range(5):
-        is_allowed, remaining, reset_time = limiter.check_limit(None, f"test_key_{i}")
+        is_allowed, remaining, reset_time = await limiter.check_limit(None, f"test_key_{i}")
         results.append(is_allowed)
 
     # Should allow requests within limit
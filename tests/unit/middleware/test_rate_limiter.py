@@ -3,8 +3,14 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from fakeredis import FakeAsyncRedis
 
-from src.middleware.rate_limiter import RateLimiter, rate_limit, rate_limit_middleware
+from src.middleware.rate_limiter import (
+    InMemoryWindowStore,
+    RateLimiter,
+    rate_limit,
+    rate_limit_middleware,
+)
 
 
 class TestRateLimiter:
@@ -26,26 +32,28 @@ class TestRateLimiter:
         key = limiter._get_key(mock_request)
         assert key == "rate_limit:ip:192.168.1.1"
 
-    def test_check_limit_within_limit(self):
+    @pytest.mark.asyncio
+    async def test_check_limit_within_limit(self):
         limiter = RateLimiter(requests_per_minute=100)
         mock_request = MagicMock()
         mock_request.client.host = "192.168.1.100"
-        is_allowed, remaining, reset_time = limiter.check_limit(mock_request)
+        is_allowed, remaining, reset_time = await limiter.check_limit(mock_request)
         assert is_allowed is True
-        assert remaining == 100  # First request, 100 remaining before increment
+        assert remaining == 99  # First request counted
 
-    def test_check_limit_at_limit(self):
+    @pytest.mark.asyncio
+    async def test_check_limit_at_limit(self):
         limiter = RateLimiter(requests_per_minute=2)
         mock_request = MagicMock()
         mock_request.client.host = "192.168.1.101"
 
-        is_allowed1, _, _ = limiter.check_limit(mock_request)
+        is_allowed1, _, _ = await limiter.check_limit(mock_request)
         assert is_allowed1 is True
 
-        is_allowed2, _, _ = limiter.check_limit(mock_request)
+        is_allowed2, _, _ = await limiter.check_limit(mock_request)
         assert is_allowed2 is True
 
-        is_allowed3, remaining, _ = limiter.check_limit(mock_request)
+        is_allowed3, remaining, _ = await limiter.check_limit(mock_request)
         assert is_allowed3 is False
         assert remaining == 0
 
@@ -56,6 +64,66 @@ class TestRateLimiter:
         assert headers["X-RateLimit-Remaining"] == "50"
 
 
+class TestInMemoryWindowStore:
+    def test_window_slides(self, monkeypatch):
+        store = InMemoryWindowStore()
+        clock = iter([0.0, 1.0, 2.0, 61.5])
+        monkeypatch.setattr("src.middleware.rate_limiter.time.time", lambda: next(clock))
+
+        assert store.hit("k", limit=2, window_seconds=60)[0] is True
+        assert store.hit("k", limit=2, window_seconds=60)[0] is True
+        allowed, used, reset_time = store.hit("k", limit=2, window_seconds=60)
+        assert allowed is False
+        assert used == 2
+        assert reset_time == 60.0  # oldest request leaves the window
+
+        # First request has slid out of the window
+        assert store.hit("k", limit=2, window_seconds=60)[0] is True
+
+    def test_evicts_least_recently_used_keys(self):
+        store = InMemoryWindowStore(max_keys=3)
+        for key in ["a", "b", "c"]:
+            store.hit(key, limit=10, window_seconds=60)
+        store.hit("a", limit=10, window_seconds=60)  # refresh "a"
+        store.hit("d", limit=10, window_seconds=60)
+
+        assert len(store) == 3
+        assert "b" not in store._windows
+        assert "a" in store._windows
+
+
+class TestRedisRateLimiter:
+    @pytest.mark.asyncio
+    async def test_lua_sliding_window(self):
+        redis_client = FakeAsyncRedis(decode_responses=True)
+        limiter = RateLimiter(requests_per_minute=3, redis_client=redis_client)
+        mock_request = MagicMock()
+        mock_request.client.host = "192.168.1.110"
+
+        results = [await limiter.check_limit(mock_request) for _ in range(4)]
+
+        assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+        assert [remaining for _, remaining, _ in results] == [2, 1, 0, 0]
+        # Rejected requests are not recorded in the window
+        assert await redis_client.zcard("rate_limit:ip:192.168.1.110") == 3
+        assert 0 < await redis_client.pttl("rate_limit:ip:192.168.1.110") <= 60_000
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_memory_on_redis_error(self):
+        from redis.exceptions import ConnectionError as RedisConnectionError
+
+        broken_script = AsyncMock(side_effect=RedisConnectionError("down"))
+        redis_client = MagicMock()
+        redis_client.register_script.return_value = broken_script
+        limiter = RateLimiter(requests_per_minute=1, redis_client=redis_client)
+        mock_request = MagicMock()
+        mock_request.client.host = "192.168.1.111"
+
+        assert (await limiter.check_limit(mock_request))[0] is True
+        assert (await limiter.check_limit(mock_request))[0] is False
+        assert broken_script.await_count == 2
+
+
 class TestRateLimitMiddleware:
     @pytest.mark.asyncio
     async def test_skips_non_api_routes(self):
@@ -89,12 +157,12 @@ class TestRateLimitMiddleware:
 
         limiter = RateLimiter(requests_per_minute=2)
 
-        is_allowed1, _, _ = limiter.check_limit(mock_request)
-        is_allowed2, _, _ = limiter.check_limit(mock_request)
+        is_allowed1, _, _ = await limiter.check_limit(mock_request)
+        is_allowed2, _, _ = await limiter.check_limit(mock_request)
         assert is_allowed1 is True
         assert is_allowed2 is True
 
-        is_allowed3, _, _ = limiter.check_limit(mock_request)
+        is_allowed3, _, _ = await limiter.check_limit(mock_request)
         assert is_allowed3 is False
 
 
@@ -112,16 +180,22 @@ class TestRateLimitDecorator:
 
     @pytest.mark.asyncio
     async def test_decorator_blocks_excessive_requests(self):
+        from fastapi import HTTPException, Request
+
         @rate_limit(requests_per_minute=1)
         async def test_endpoint(request):
             return {"status": "ok"}
 
-        mock_request = MagicMock()
+        mock_request = MagicMock(spec=Request)
         mock_request.client.host = "192.168.1.105"
 
         result = await test_endpoint(mock_request)
         assert result == {"status": "ok"}
 
+        with pytest.raises(HTTPException) as exc_info:
+            await test_endpoint(mock_request)
+        assert exc_info.value.status_code == 429
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,160 @@
+"""
+Unit tests for the shared agent graph registry.
+
+Tests that a graph configuration is built once and shared, that any change
+of model, tools, prompt or options builds a separate graph, that the
+registry stays bounded, and that subagents and the startup warm-up use the
+same graphs.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+import pytest
+
+from src.agents.agent_graphs import (
+    AgentGraphRegistry,
+    agent_graphs,
+    session_config,
+    tool_key,
+    warm_agent_graphs,
+)
+from src.agents.vvs_trader_subagent import VVSTraderSubagent
+
+
+class FakeFactory:
+    """Stands in for create_deep_agent, recording each build."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, **kwargs):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls.append(kwargs)
+        return object()
+
+
+class NamedTool:
+    def __init__(self, name: str):
+        self.name = name
+
+
+@pytest.fixture
+def shared_registry(monkeypatch):
+    """The process-wide registry, empty and building with a fake factory."""
+    factory = FakeFactory()
+    monkeypatch.setattr(agent_graphs, "factory", factory)
+    monkeypatch.setattr(agent_graphs, "_graphs", OrderedDict())
+    return factory
+
+
+def test_same_configuration_is_built_once():
+    """Test that repeated lookups reuse the compiled graph."""
+    factory = FakeFactory()
+    registry = AgentGraphRegistry(max_graphs=4, factory=factory)
+
+    graphs = {id(registry.get("m", [NamedTool("a")], "prompt")) for _ in range(5)}
+
+    assert len(graphs) == 1
+    assert len(factory.calls) == 1
+    assert (registry.builds, registry.hits) == (1, 4)
+    assert factory.calls[0]["system_prompt"] == "prompt"
+
+
+@pytest.mark.parametrize("change", [
+    {"model": "other"},
+    {"tools": [NamedTool("a"), NamedTool("b")]},
+    {"system_prompt": "other prompt"},
+    {"base_url": "https://proxy.example"},
+])
+def test_any_configuration_change_builds_a_new_graph(change):
+    """Test that graphs are only shared by identical configurations."""
+    factory = FakeFactory()
+    registry = AgentGraphRegistry(max_graphs=4, factory=factory)
+    base = {"model": "m", "tools": [NamedTool("a")], "system_prompt": "prompt"}
+
+    first = registry.get(**base)
+    second = registry.get(**{**base, **change})
+
+    assert first is not second
+    assert len(factory.calls) == 2
+
+
+def test_tool_instances_of_the_same_tool_share_a_key():
+    """Test that tools created per session still map to one graph."""
+    assert tool_key(NamedTool("get_price")) == tool_key(NamedTool("get_price"))
+    assert tool_key(NamedTool("get_price")) != tool_key(NamedTool("get_prices"))
+
+
+def test_least_recently_used_graph_is_dropped():
+    """Test that the registry stays bounded."""
+    factory = FakeFactory()
+    registry = AgentGraphRegistry(max_graphs=2, factory=factory)
+
+    for prompt in ("a", "b", "a", "c"):
+        registry.get("m", [], prompt)
+    registry.get("m", [], "a")
+    registry.get("m", [], "b")
+
+    assert len(registry) == 2
+    assert [call["system_prompt"] for call in factory.calls] == ["a", "b", "c", "b"]
+
+
+def test_concurrent_first_requests_build_once():
+    """Test that threads racing for a cold graph share one build."""
+    factory = FakeFactory(delay=0.05)
+    registry = AgentGraphRegistry(max_graphs=4, factory=factory)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        graphs = list(pool.map(lambda _: registry.get("m", [], "prompt"), range(8)))
+
+    assert len(factory.calls) == 1
+    assert len({id(graph) for graph in graphs}) == 1
+
+
+def test_unavailable_without_factory(monkeypatch):
+    """Test that lookups return None when deepagents is not installed."""
+    monkeypatch.setattr("src.agents.agent_graphs.create_deep_agent", None)
+    registry = AgentGraphRegistry(max_graphs=4)
+
+    assert registry.available is False
+    assert registry.get("m", [], "prompt") is None
+
+
+def test_session_config_carries_session_state():
+    """Test that per-session values travel in the run config."""
+    session_id = uuid4()
+
+    config = session_config(session_id, workspace_dir="/tmp/ws")
+
+    assert config == {"configurable": {"thread_id": str(session_id), "workspace_dir": "/tmp/ws"}}
+
+
+def test_subagents_share_one_graph(shared_registry):
+    """Test that a subagent spawned per swap reuses the graph of earlier ones."""
+    subagents = [
+        VVSTraderSubagent(db=None, session_id=uuid4(), parent_agent_id=uuid4()) for _ in range(3)
+    ]
+    for subagent in subagents:
+        subagent.available = True
+
+    assert len({id(subagent.agent) for subagent in subagents}) == 1
+    assert len(shared_registry.calls) == 1
+
+
+def test_warm_up_prebuilds_subagent_graphs(shared_registry):
+    """Test that after warm-up the first subagent finds its graph ready."""
+    assert warm_agent_graphs() == 4
+    builds = len(shared_registry.calls)
+
+    subagent = VVSTraderSubagent(db=None, session_id=uuid4(), parent_agent_id=uuid4())
+    subagent.available = True
+
+    assert subagent.agent is not None
+    assert len(shared_registry.calls) == builds
@@ -0,0 +1,119 @@
+"""
+Unit tests for windowed agent memory loading.
+
+Tests that only the most recent entries are loaded, that older entries are
+summarized, and that repeat commands in a session are served from the
+recent-turns cache without querying agent_memory.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.agents.agent_executor_enhanced import AgentExecutorEnhanced
+from src.core.memory import RecentTurnsCache, load_memory_window, recent_turns_cache
+from src.models.agent_sessions import AgentMemory, AgentSession
+
+
+@pytest.fixture
+def memory_selects(db_session):
+    """Record SELECT statements against agent_memory."""
+    statements: list[str] = []
+
+    def before_cursor_execute(_conn, _cursor, statement, _parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "agent_memory" in statement:
+            statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _create_session(db_session, entries: int = 0):
+    session = AgentSession(id=uuid4(), user_id=uuid4(), wallet_address=None, config={})
+    db_session.add(session)
+    start = datetime(2026, 1, 1)
+    for index in range(entries):
+        db_session.add(AgentMemory(
+            id=uuid4(),
+            session_id=session.id,
+            message_type="human" if index % 2 == 0 else "ai",
+            content=f"message {index}",
+            timestamp=start + timedelta(seconds=index),
+            extra_data={"intent": "payment"} if index % 2 == 0 else {},
+        ))
+    await db_session.commit()
+    return session.id
+
+
+@pytest.mark.asyncio
+async def test_loads_only_latest_window(db_session, memory_selects):
+    """Test that a load fetches the last N entries in chronological order."""
+    session_id = await _create_session(db_session, entries=30)
+    cache = RecentTurnsCache(window=10, max_sessions=10)
+
+    window = await load_memory_window(db_session, session_id, cache)
+
+    assert [entry["content"] for entry in window.entries] == [f"message {i}" for i in range(20, 30)]
+    assert window.summary.message_count == 20
+    # One windowed SELECT plus one COUNT for the summary
+    assert len(memory_selects) == 2
+
+
+@pytest.mark.asyncio
+async def test_repeat_load_is_served_from_cache(db_session, memory_selects):
+    """Test that a cached session is loaded without any query."""
+    session_id = await _create_session(db_session, entries=4)
+    cache = RecentTurnsCache(window=10, max_sessions=10)
+
+    await load_memory_window(db_session, session_id, cache)
+    memory_selects.clear()
+    window = await load_memory_window(db_session, session_id, cache)
+
+    assert memory_selects == []
+    assert len(window.entries) == 4
+    assert cache.hits == 1
+
+
+def test_evicted_entries_fold_into_summary():
+    """Test that appends keep the window bounded and summarize the overflow."""
+    cache = RecentTurnsCache(window=2, max_sessions=1)
+    first, second = uuid4(), uuid4()
+    cache.put(first, [])
+    for index in range(5):
+        entry_type = "human" if index % 2 == 0 else "ai"
+        cache.append(first, {"type": entry_type, "content": f"cmd {index}", "metadata": {"intent": "swap"}})
+
+    window = cache.get(first)
+    assert [entry["content"] for entry in window.entries] == ["cmd 3", "cmd 4"]
+    summary = window.summary.render()
+    assert "3 messages" in summary
+    assert "swap x2" in summary
+    assert "cmd 2" in summary
+
+    # Least recently used session is evicted
+    cache.put(second, [])
+    assert cache.get(first) is None
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_repeat_commands_make_no_memory_queries(db_session, memory_selects):
+    """Test that save_memory keeps the cache current across commands."""
+    session_id = await _create_session(db_session)
+    recent_turns_cache.invalidate(session_id)
+
+    executor = AgentExecutorEnhanced(session_id, db_session)
+    await executor.execute_command("Check my balance")
+    memory_selects.clear()
+
+    executor2 = AgentExecutorEnhanced(session_id, db_session)
+    result = await executor2.execute_command("Swap 100 CRO for USDC")
+
+    assert result["success"] is True
+    assert memory_selects == []
+    assert "Check my balance" in result["memory_context"]
+    assert len(executor2.memory) == 4
@@ -0,0 +1,69 @@
+"""
+Unit tests for the cache value codec.
+
+Tests that values round-trip with their types intact, that large payloads
+are compressed, and that values written before the codec still decode.
+"""
+
+import json
+
+import pytest
+
+from src.core import cache_codec as codecs
+from src.core.cache_codec import CacheCodec
+
+SERVICES = [
+    {
+        "id": f"00000000-0000-0000-0000-{i:012d}",
+        "name": f"Market Data Feed {i}",
+        "description": "Real-time OHLCV and order book snapshots",
+        "price_amount": 0.001 * i,
+        "mcp_compatible": i % 2 == 0,
+    }
+    for i in range(50)
+]
+
+SERIALIZERS = ["json"] + (["orjson"] if codecs.ORJSON_AVAILABLE else []) + (
+    ["msgpack"] if codecs.MSGPACK_AVAILABLE else []
+)
+
+
+@pytest.mark.parametrize("serializer", SERIALIZERS)
+@pytest.mark.parametrize(
+    "value",
+    ["42", '{"looks": "like json"}', b"\x00\xffbinary", 42, 1.5, True, None, {"price": 0.25}, SERVICES],
+)
+def test_round_trip_keeps_types(serializer, value):
+    """Test that strings stay strings and structured values round-trip."""
+    codec = CacheCodec(serializer=serializer, compression="zlib", compress_min_bytes=256)
+
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_large_values_are_compressed():
+    """Test that payloads above the threshold are compressed and small ones are not."""
+    codec = CacheCodec(serializer="json", compression="zlib", compress_min_bytes=1024)
+
+    large = codec.encode(SERVICES)
+    small = codec.encode({"price": 0.25})
+
+    assert large[2] == codecs.COMPRESS_ZLIB
+    assert len(large) < len(json.dumps(SERVICES)) / 2
+    assert small[2] == codecs.COMPRESS_NONE
+
+
+def test_legacy_values_decode():
+    """Test that plain JSON and raw strings written before the codec still decode."""
+    codec = CacheCodec()
+
+    assert codec.decode(json.dumps(SERVICES).encode("utf-8")) == SERVICES
+    assert codec.decode(b"plain text") == "plain text"
+    assert codec.decode("17") == 17
+
+
+def test_unknown_options_rejected():
+    """Test that misconfigured serializer or compression names fail fast."""
+    with pytest.raises(ValueError):
+        CacheCodec(serializer="pickle")
+    with pytest.raises(ValueError):
+        CacheCodec(compression="brotli")
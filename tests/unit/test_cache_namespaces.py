@@ -0,0 +1,88 @@
+"""
+Unit tests for generation-versioned cache namespaces.
+
+Tests that tagged entries are invalidated by a version bump without
+deleting keys, that entries tagged with several namespaces are invalidated
+by any of them, and that bumps reach other workers' near caches.
+"""
+
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from src.core.cache import CacheClient
+from src.core.cache_namespaces import CacheNamespaces
+from src.core.near_cache import NearCache
+from src.services.cache import CacheService
+
+
+async def _worker(server: FakeServer) -> CacheService:
+    backend = CacheClient()
+    backend._client = FakeAsyncRedis(server=server)
+    backend._available = True
+    near = NearCache(backend=backend, channel="test:invalidate", enabled=True)
+    await near.start()
+    return CacheService(near=near, namespaces=CacheNamespaces(cache=near))
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_orphans_tagged_entries(server):
+    """Test that a bump makes tagged entries unreachable without deleting them."""
+    cache = await _worker(server)
+    try:
+        await cache.set("mcp_services", [{"id": "svc-1"}], expiration=300, namespaces=["services"])
+        await cache.set("price:svc-1", {"price": 1.0}, expiration=60, namespaces=["service:svc-1"])
+        assert await cache.get("mcp_services", namespaces=["services"]) == [{"id": "svc-1"}]
+
+        keys_before = await cache.near.keys("mcp_services:v*")
+        assert await cache.invalidate("services")
+
+        assert await cache.get("mcp_services", namespaces=["services"]) is None
+        assert await cache.get("price:svc-1", namespaces=["service:svc-1"]) == {"price": 1.0}
+        # The old entry is left for its TTL rather than scanned and deleted
+        assert await cache.near.keys("mcp_services:v*") == keys_before
+    finally:
+        await cache.near.close()
+
+
+@pytest.mark.asyncio
+async def test_entry_with_several_namespaces(server):
+    """Test that an entry tagged with two namespaces is invalidated by either."""
+    cache = await _worker(server)
+    namespaces = ["subscriptions", "subscriptions:session:s1"]
+    try:
+        await cache.set("subscription:active:s1:svc", True, expiration=60, namespaces=namespaces)
+        await cache.invalidate("subscriptions:session:s2")
+        assert await cache.get("subscription:active:s1:svc", namespaces=namespaces) is True
+
+        await cache.invalidate("subscriptions")
+        assert await cache.get("subscription:active:s1:svc", namespaces=namespaces) is None
+    finally:
+        await cache.near.close()
+
+
+@pytest.mark.asyncio
+async def test_bump_reaches_other_workers(server):
+    """Test that a worker with the old version in L1 sees another worker's bump."""
+    worker_a = await _worker(server)
+    worker_b = await _worker(server)
+    try:
+        await worker_a.set("services:discover:x", ["a"], expiration=300, namespaces=["services"])
+        assert await worker_b.get("services:discover:x", namespaces=["services"]) == ["a"]
+
+        await worker_a.invalidate("services")
+        for _ in range(200):
+            if await worker_b.get("services:discover:x", namespaces=["services"]) is None:
+                break
+            await asyncio.sleep(0.01)
+        else:
+            pytest.fail("worker_b kept serving the invalidated entry")
+    finally:
+        await worker_a.near.close()
+        await worker_b.near.close()
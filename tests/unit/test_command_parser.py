@@ -2,7 +2,7 @@
 Tests for the command parser module.
 """
 
-from src.agents.command_parser import CommandParser, ParsedCommand
+from src.agents.command_parser import CommandParser, ParsedCommand, command_parser, parse_command
 
 
 class TestParsedCommand:
@@ -303,3 +303,92 @@ class TestCommandParser:
 
         assert result.intent == "payment"
         assert "market data api service" in result.parameters["recipient"]
+
+
+class TestIntentPrefilter:
+    """Test that skipping intents without trigger words keeps results unchanged."""
+
+    def test_trigger_inside_word_still_matches(self):
+        """Test that patterns are not word-bounded, so neither are triggers."""
+        parser = CommandParser(cache_size=0)
+
+        assert parser.parse("repay 5 USDC to alice").intent == "payment"
+
+    def test_overlapping_triggers(self):
+        """Test that a trigger inside another word ("how" in "show") is found."""
+        parser = CommandParser(cache_size=0)
+
+        result = parser.parse("show much USDC do I have")
+
+        assert result.intent == "balance_check"
+        assert result.parameters["token"] == "USDC"
+
+    def test_unicode_case_folding_tries_all_intents(self):
+        """Test that non-ASCII commands matching case-insensitively are still parsed."""
+        parser = CommandParser(cache_size=0)
+
+        assert parser.parse("\u017fwap 10 CRO for USDC").intent == "swap"
+
+    def test_keyword_fallback_scores(self):
+        """Test keyword scoring when no pattern matches."""
+        parser = CommandParser(cache_size=0)
+
+        result = parser.parse("I want to pay for market data")
+
+        assert result.intent == "payment"
+        assert result.confidence == 0.7 * 1 / 4
+
+
+class TestParseCache:
+    """Test the parsed command LRU."""
+
+    def test_repeat_parse_is_cached(self):
+        """Test that the same stripped command is parsed once."""
+        parser = CommandParser(cache_size=8)
+
+        first = parser.parse("Swap 10 CRO for USDC")
+        second = parser.parse("  Swap 10 CRO for USDC ")
+
+        assert (parser.cache_misses, parser.cache_hits) == (1, 1)
+        assert second.parameters == first.parameters
+
+    def test_cached_parameters_are_not_shared(self):
+        """Test that mutating a result does not change later results."""
+        parser = CommandParser(cache_size=8)
+
+        parser.parse("Pay 1 USDC to alice").parameters["amount"] = 1000
+
+        assert parser.parse("Pay 1 USDC to alice").parameters["amount"] == 1.0
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the cache stays bounded, evicting the oldest entry."""
+        parser = CommandParser(cache_size=2)
+
+        parser.parse("Check my balance")
+        parser.parse("Find defi services")
+        parser.parse("Check my balance")
+        parser.parse("Swap 1 CRO for USDC")
+        parser.parse("Check my balance")
+        parser.parse("Find defi services")
+
+        assert parser.cache_hits == 2
+        assert parser.cache_misses == 4
+
+    def test_cache_disabled(self):
+        """Test that a cache size of 0 parses every time."""
+        parser = CommandParser(cache_size=0)
+
+        parser.parse("Check my balance")
+        parser.parse("Check my balance")
+
+        assert parser.cache_hits == 0
+
+    def test_module_parser_is_shared(self):
+        """Test that parse_command uses the process-wide parser."""
+        command_parser.clear_cache()
+        hits = command_parser.cache_hits
+
+        parse_command("What is my balance")
+        parse_command("What is my balance")
+
+        assert command_parser.cache_hits == hits + 1
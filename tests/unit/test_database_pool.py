@@ -0,0 +1,119 @@
+"""Unit tests for database pool profiles and pool metrics."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core import database
+from src.core.database import (
+    BACKGROUND_PROFILE,
+    REPORTING_PROFILE,
+    REQUEST_PROFILE,
+    InstrumentedAsyncQueuePool,
+    get_pool_profiles,
+    normalize_database_url,
+    pooling_enabled,
+)
+from src.services.metrics_service import DatabasePoolMetrics, metrics_collector, pool_metrics
+
+
+class TestPoolProfiles:
+    def test_profiles_follow_settings(self, monkeypatch):
+        monkeypatch.setattr(database.settings, "db_pool_size", 7)
+        monkeypatch.setattr(database.settings, "db_background_pool_size", 1)
+        monkeypatch.setattr(database.settings, "db_reporting_max_overflow", 9)
+
+        profiles = get_pool_profiles()
+
+        assert set(profiles) == {REQUEST_PROFILE, BACKGROUND_PROFILE, REPORTING_PROFILE}
+        assert profiles[REQUEST_PROFILE].pool_size == 7
+        assert profiles[BACKGROUND_PROFILE].pool_size == 1
+        assert profiles[REPORTING_PROFILE].max_overflow == 9
+
+    def test_url_normalization(self):
+        assert normalize_database_url("postgresql://u@h/db") == "postgresql+asyncpg://u@h/db"
+        assert normalize_database_url("sqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+
+    def test_pooling_modes(self, monkeypatch):
+        assert not pooling_enabled("sqlite+aiosqlite:///:memory:")
+        assert pooling_enabled("postgresql+asyncpg://u@h/db")
+
+        monkeypatch.setattr(database.settings, "db_pool_mode", "null")
+        assert not pooling_enabled("postgresql+asyncpg://u@h/db")
+
+    def test_sqlite_profiles_share_engine(self):
+        assert database.background_engine is database.engine
+        assert database.reporting_engine is database.engine
+
+
+class TestInstrumentedPool:
+    @pytest.mark.asyncio
+    async def test_checkout_metrics_and_saturation(self, tmp_path):
+        pool_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=1,
+            max_overflow=1,
+            pool_logging_name="unit-test",
+        )
+        pool_metrics.register_pool("unit-test", lambda: pool_engine.sync_engine.pool)
+        try:
+            async with pool_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                stats = pool_metrics.get_stats()["unit-test"]
+                assert stats["checked_out"] == 1
+                assert stats["capacity"] == 2
+                assert stats["saturation"] == 0.5
+
+            stats = pool_metrics.get_stats()["unit-test"]
+            assert stats["checkouts"] >= 1
+            assert stats["checked_out"] == 0
+        finally:
+            await pool_engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_wait_recorded_when_pool_exhausted(self, tmp_path):
+        pool_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'wait.db'}",
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=5,
+            pool_logging_name="unit-wait",
+        )
+        try:
+            first = await pool_engine.connect()
+
+            async def release_later():
+                await asyncio.sleep(0.05)
+                await first.close()
+
+            release = asyncio.create_task(release_later())
+            async with pool_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            await release
+
+            assert pool_metrics.get_stats()["unit-wait"]["waits"] == 1
+        finally:
+            await pool_engine.dispose()
+
+
+class TestPoolPrometheusExport:
+    def test_pool_metrics_rendered_per_profile(self):
+        metrics = DatabasePoolMetrics()
+        metrics.record_checkout("request", 2.5, waited=True)
+
+        stats = metrics.get_stats()["request"]
+        assert stats["checkouts"] == 1
+        assert stats["waits"] == 1
+        assert stats["avg_checkout_ms"] == 2.5
+
+    def test_collector_exports_pool_series(self):
+        pool_metrics.record_checkout("request", 1.0, waited=False)
+
+        output = metrics_collector.get_prometheus_metrics()
+
+        assert 'paygent_db_pool_checkouts_total{pool="request"}' in output
+        assert "# TYPE paygent_db_pool_saturation gauge" in output
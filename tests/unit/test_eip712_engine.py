@@ -0,0 +1,135 @@
+"""
+Unit tests for the precomputed EIP-712 signing engine.
+
+Tests that the engine produces the same digests and signatures as
+eth_account's encode_typed_data, and that batch signing and verification
+agree with the single-message path, including through the process pool.
+"""
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+
+from src.core.config import settings
+from src.x402 import eip712
+from src.x402.signature import EIP712SignatureGenerator, PaymentSignatureData
+
+WALLET = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0"
+
+
+@pytest.fixture
+def generator() -> EIP712SignatureGenerator:
+    return EIP712SignatureGenerator(private_key=Account.create().key.hex())
+
+
+def _messages(generator: EIP712SignatureGenerator, count: int) -> list[dict]:
+    return [
+        generator.create_payment_message(
+            service_url=f"https://api.example.com/v1/data/{i}",
+            amount=0.25 + i,
+            token="USDC",
+            wallet_address=WALLET,
+            description="Market data ✓",
+            timestamp=1640995200,
+        )
+        for i in range(count)
+    ]
+
+
+def test_signature_matches_eth_account(generator):
+    """Test that the fast path signs exactly what encode_typed_data signs."""
+    message = _messages(generator, 1)[0]
+
+    reference = generator.account.sign_message(
+        encode_typed_data(
+            domain_data=generator.domain,
+            message_types={"Payment": generator.TYPES["Payment"]},
+            message_data=message,
+        )
+    )
+    signature = generator.engine.sign(message)
+
+    assert signature == "0x" + bytes(reference.signature).hex()
+    assert generator.engine.digest(message) == bytes(reference.message_hash)
+
+
+def test_sign_payment_round_trip(generator):
+    """Test that sign_payment output verifies and tampering is detected."""
+    payment_data = generator.create_payment_data(
+        service_url="https://api.example.com/v1/data",
+        amount=1.0,
+        token="USDC",
+        wallet_address=WALLET,
+    )
+    result = generator.sign_payment(payment_data)
+    signature = result["signature"]
+
+    assert result["success"] is True
+    assert generator.verify_signature(signature["signature"], signature["message"], result["signer"])
+
+    tampered = {**signature["message"], "amount": signature["message"]["amount"] + 1}
+    assert not generator.verify_signature(signature["signature"], tampered, result["signer"])
+
+
+def test_sign_many_matches_single(generator):
+    """Test that batch signing returns the same signatures in order."""
+    messages = _messages(generator, 5)
+
+    signatures = generator.engine.sign_many(messages)
+
+    assert signatures == [generator.engine.sign(message) for message in messages]
+    items = [
+        (message, signature, generator.account.address)
+        for message, signature in zip(messages, signatures, strict=True)
+    ]
+    assert generator.verify_signatures(items) == [True] * 5
+
+
+def test_sign_many_process_pool(generator, monkeypatch):
+    """Test that large batches fan out to the process pool and keep order."""
+    monkeypatch.setattr(settings, "x402_sign_process_pool_threshold", 4)
+    monkeypatch.setattr(settings, "x402_sign_process_workers", 2)
+    messages = _messages(generator, 9)
+
+    try:
+        signatures = generator.engine.sign_many(messages)
+        items = [
+        (message, signature, generator.account.address)
+        for message, signature in zip(messages, signatures, strict=True)
+    ]
+        items[3] = (items[3][0], items[3][1], WALLET)
+        verified = generator.engine.verify_many(items)
+    finally:
+        eip712.shutdown_process_pool()
+
+    assert signatures == [generator.engine.sign(message) for message in messages]
+    assert verified == [True, True, True, False, True, True, True, True, True]
+
+
+def test_sign_messages_without_signer():
+    """Test that batch signing without a key reports an error per message."""
+    generator = EIP712SignatureGenerator()
+
+    results = generator.sign_messages(_messages(generator, 2))
+
+    assert [result["error"] for result in results] == ["no_signer_configured"] * 2
+
+
+def test_sign_payments_isolates_bad_payments(generator):
+    """Test that one unsignable payment fails alone and quoted wallets are normalized."""
+    payments = [
+        PaymentSignatureData(
+            service_url="https://api.example.com/v1/data",
+            amount=250000,
+            token="USDC",
+            nonce=nonce,
+            wallet_address=wallet,
+        )
+        for nonce, wallet in enumerate([f'"{WALLET}"', "not-an-address", WALLET])
+    ]
+
+    results = generator.sign_payments(payments)
+
+    assert [result["success"] for result in results] == [True, False, True]
+    assert results[0]["signature"]["message"]["walletAddress"] == WALLET
+    assert results[0] == generator.sign_payment(payments[0])
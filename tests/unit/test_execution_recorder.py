@@ -0,0 +1,155 @@
+"""
+Unit tests for the write-behind execution recorder.
+
+Tests that queued logs, tool calls and memory are written in batches, that
+flush() and stop() guarantee the records are stored, that a failing record
+does not lose the rest of its batch, and that the executor records through
+the recorder.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.agents.agent_executor_enhanced import AgentExecutorEnhanced
+from src.models.agent_sessions import AgentMemory, AgentSession
+from src.models.execution_logs import ExecutionLog, SessionToolUsage, ToolCall
+from src.services.execution_recorder import ExecutionRecorder
+
+
+@pytest.fixture
+def session_factory(async_engine):
+    return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def recorder(session_factory):
+    recorder = ExecutionRecorder(session_factory, queue_size=100, batch_size=50, flush_interval_ms=5)
+    await recorder.start()
+    yield recorder
+    await recorder.stop()
+
+
+async def _agent_session(session_factory) -> AgentSession:
+    async with session_factory() as db:
+        session = AgentSession(id=uuid4(), user_id=uuid4(), config={})
+        db.add(session)
+        await db.commit()
+    return session
+
+
+async def _count(session_factory, model) -> int:
+    async with session_factory() as db:
+        return (await db.execute(select(func.count()).select_from(model))).scalar()
+
+
+def _memory(session_id, content: str = "hello") -> AgentMemory:
+    return AgentMemory(
+        id=uuid4(), session_id=session_id, message_type="human", content=content, extra_data={},
+    )
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_log_tool_calls_and_memory(recorder, session_factory):
+    """Test that a log started and finished before flush lands with its final values."""
+    session = await _agent_session(session_factory)
+    log = ExecutionLog(id=uuid4(), session_id=session.id, command="swap", tool_calls=[], status="running")
+
+    await recorder.log_started(log)
+    await recorder.log_finished(log.id, {"status": "completed", "duration_ms": 12})
+    await recorder.tool_calls_made(session.id, log.id, [
+        {"tool_name": "swap_tokens", "tool_args": {}, "result": {"success": True}},
+    ])
+    await recorder.memory_saved(_memory(session.id))
+    assert await recorder.flush() is True
+
+    async with session_factory() as db:
+        stored = await db.get(ExecutionLog, log.id)
+        usage = (await db.execute(select(SessionToolUsage))).scalar_one()
+    assert (stored.status, stored.duration_ms) == ("completed", 12)
+    assert stored.created_at == log.created_at
+    assert (usage.tool_name, usage.call_count) == ("swap_tokens", 1)
+    assert await _count(session_factory, ToolCall) == 1
+    assert await _count(session_factory, AgentMemory) == 1
+
+
+@pytest.mark.asyncio
+async def test_update_of_log_written_in_earlier_batch(recorder, session_factory):
+    """Test that finishing a log already written updates it in place."""
+    session = await _agent_session(session_factory)
+    log = ExecutionLog(id=uuid4(), session_id=session.id, command="pay", tool_calls=[], status="running")
+
+    await recorder.log_started(log)
+    await recorder.flush()
+    await recorder.log_finished(log.id, {"status": "failed", "result": {"success": False}})
+    await recorder.flush()
+
+    async with session_factory() as db:
+        stored = await db.get(ExecutionLog, log.id)
+    assert (stored.status, stored.result) == ("failed", {"success": False})
+
+
+@pytest.mark.asyncio
+async def test_failed_record_does_not_lose_batch(recorder, session_factory):
+    """Test that a record violating a constraint is dropped alone."""
+    session = await _agent_session(session_factory)
+
+    await recorder.memory_saved(_memory(session.id, "kept"))
+    await recorder.memory_saved(_memory(session.id, None))
+    await recorder.memory_saved(_memory(session.id, "also kept"))
+
+    assert await recorder.flush() is False
+    assert recorder.failed == 1
+    assert await _count(session_factory, AgentMemory) == 2
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure(session_factory):
+    """Test that producers wait for space instead of dropping records."""
+    session = await _agent_session(session_factory)
+    recorder = ExecutionRecorder(session_factory, queue_size=2, batch_size=2, flush_interval_ms=0)
+    await recorder.start()
+
+    await asyncio.gather(*(recorder.memory_saved(_memory(session.id, str(i))) for i in range(10)))
+    await recorder.stop()
+
+    assert recorder.written == 10
+    assert await _count(session_factory, AgentMemory) == 10
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queue_and_later_records_write_through(session_factory):
+    """Test that shutdown writes queued records and the recorder still accepts late ones."""
+    session = await _agent_session(session_factory)
+    recorder = ExecutionRecorder(session_factory, queue_size=100, batch_size=50, flush_interval_ms=1000)
+    await recorder.start()
+
+    for i in range(5):
+        await recorder.memory_saved(_memory(session.id, str(i)))
+    await recorder.stop()
+    assert await _count(session_factory, AgentMemory) == 5
+
+    assert recorder.running is False
+    await recorder.memory_saved(_memory(session.id, "late"))
+    assert await _count(session_factory, AgentMemory) == 6
+
+
+@pytest.mark.asyncio
+async def test_executor_records_through_recorder(recorder, session_factory, db_session):
+    """Test that the executor's log and memory arrive via the recorder."""
+    session = await _agent_session(session_factory)
+
+    executor = AgentExecutorEnhanced(session.id, db_session, recorder=recorder)
+    result = await executor.execute_command("Check my balance")
+    assert await recorder.flush() is True
+
+    async with session_factory() as db:
+        log = await db.get(ExecutionLog, executor.current_execution_log_id)
+        memory = (await db.execute(
+            select(AgentMemory).where(AgentMemory.session_id == session.id)
+        )).scalars().all()
+    assert log.status == ("completed" if result["success"] else "failed")
+    assert sorted(entry.message_type for entry in memory) == ["ai", "human"]
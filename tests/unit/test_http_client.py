@@ -0,0 +1,110 @@
+"""
+Unit tests for the shared pooled HTTP client.
+
+Tests that connections are pooled per origin and reused across requests,
+and that reuse and in-flight requests are reported as metrics.
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from src.core.http_client import HTTPClientRegistry, PerHostTransport
+from src.services.metrics_service import metrics_collector
+
+
+@pytest.fixture
+async def server():
+    """Run a local HTTP server that answers every GET with ``ok``."""
+    release = asyncio.Event()
+    release.set()
+
+    async def handle(_request: web.Request) -> web.Response:
+        await release.wait()
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", release
+    await runner.cleanup()
+
+
+def _requests(connection: str) -> float:
+    counter = metrics_collector.http_client_requests.labels("127.0.0.1", connection)
+    return counter.value
+
+
+@pytest.mark.asyncio
+async def test_connections_reused_across_requests(server):
+    """Test that sequential requests to one host share a keep-alive connection."""
+    url, _ = server
+    registry = HTTPClientRegistry(http2=False)
+    client = registry.get()
+    new_before, reused_before = _requests("new"), _requests("reused")
+
+    for _ in range(3):
+        response = await client.get(f"{url}/ping")
+        assert response.text == "ok"
+
+    assert _requests("new") - new_before == 1
+    assert _requests("reused") - reused_before == 2
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registry_returns_shared_client():
+    """Test that the registry hands out one client per name until closed."""
+    registry = HTTPClientRegistry(http2=False)
+    client = registry.get()
+
+    assert registry.get() is client
+    assert registry.get("isolated") is not client
+
+    await registry.aclose()
+    assert client.is_closed
+    assert registry.get() is not client
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_per_origin(server):
+    """Test that each origin gets its own pool, with an overflow pool past the cap."""
+    url, _ = server
+    registry = HTTPClientRegistry(http2=False)
+    client = registry.get()
+    transport = client._transport
+    assert isinstance(transport, PerHostTransport)
+    transport.max_hosts = 1
+
+    await client.get(f"{url}/a")
+    await client.get(url.replace("127.0.0.1", "localhost") + "/b")
+
+    assert len(transport._pools) == 1
+    assert transport._overflow is not None
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_in_flight_gauge(server):
+    """Test that a request counts as in flight until its response is read."""
+    url, release = server
+    registry = HTTPClientRegistry(http2=False)
+    client = registry.get()
+    gauge = metrics_collector.http_client_in_flight.labels("127.0.0.1")
+    baseline = gauge.value
+
+    release.clear()
+    task = asyncio.create_task(client.get(f"{url}/slow"))
+    await asyncio.sleep(0.05)
+    assert gauge.value == baseline + 1
+
+    release.set()
+    await task
+    assert gauge.value == baseline
+    await registry.aclose()
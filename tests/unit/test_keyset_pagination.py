@@ -0,0 +1,117 @@
+"""
+Unit tests for keyset (cursor) pagination.
+
+Tests cursor encoding, that paging through payment history visits every
+row exactly once (including rows sharing a timestamp), and optional totals.
+"""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from src.models.payments import Payment
+from src.services.payment_service import PaymentService
+from src.services.wallet_service import WalletService
+
+WALLET = "0x" + "a" * 40
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes to the key it was built from."""
+    created_at = datetime(2026, 10, 16, 12, 30, 0, 123456)
+    row_id = uuid4()
+    cursor = encode_cursor(created_at, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", encode_cursor(datetime.now(), uuid4())[:-4]])
+def test_invalid_cursor(cursor):
+    """Test that malformed cursors raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+async def _seed(db_session, count: int) -> list[Payment]:
+    base = datetime(2026, 10, 1)
+    payments = [
+        Payment(
+            id=uuid4(),
+            agent_wallet=WALLET if i % 3 else "0x" + "b" * 40,
+            recipient="0x" + "c" * 40,
+            amount=float(i),
+            token="USDC",
+            status="confirmed",
+            # Pairs share a timestamp so the id tie-breaker matters
+            created_at=base + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(payments)
+    await db_session.flush()
+    return payments
+
+
+@pytest.mark.asyncio
+async def test_payment_history_pages_cover_all_rows(db_session):
+    """Test that following next_cursor returns every payment once, newest first."""
+    payments = await _seed(db_session, 25)
+    service = PaymentService(db_session)
+
+    seen = []
+    cursor = None
+    while True:
+        page = await service.get_payment_history(cursor=cursor, limit=7)
+        assert page["success"]
+        assert page["total"] is None
+        seen.extend(page["payments"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 25
+    assert {p["id"] for p in seen} == {str(p.id) for p in payments}
+    timestamps = [p["created_at"] for p in seen]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_last_full_page_has_no_cursor(db_session):
+    """Test that a page ending exactly at the last row has no next cursor."""
+    await _seed(db_session, 10)
+    page = await PaymentService(db_session).get_payment_history(limit=10)
+
+    assert len(page["payments"]) == 10
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_exact_total_and_bad_cursor(db_session):
+    """Test the opt-in exact total and that bad cursors are raised, not swallowed."""
+    await _seed(db_session, 9)
+    service = PaymentService(db_session)
+
+    page = await service.get_payment_history(wallet_address=WALLET, limit=2, total="exact")
+    assert page["total"] == 6
+    assert page["total_is_estimate"] is False
+
+    with pytest.raises(InvalidCursorError):
+        await service.get_payment_history(cursor="garbage")
+
+
+@pytest.mark.asyncio
+async def test_transaction_history_pages(db_session):
+    """Test cursor pagination of a wallet's transactions."""
+    await _seed(db_session, 12)
+    wallet = WalletService(db_session, wallet_address=WALLET)
+
+    first = await wallet.get_transaction_history(limit=5)
+    second = await wallet.get_transaction_history(cursor=first["next_cursor"], limit=5)
+
+    assert len(first["transactions"]) == 5
+    assert len(second["transactions"]) == 3
+    assert second["next_cursor"] is None
+    assert first["transactions"][-1]["timestamp"] >= second["transactions"][0]["timestamp"]
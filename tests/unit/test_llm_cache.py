@@ -0,0 +1,206 @@
+"""
+Unit tests for the agent LLM response cache.
+
+Tests exact, normalized and semantic hits, that money-moving commands and
+answers from non read-only tools never reach the cache, that TTLs follow
+the tools used, and that concurrent misses share one invocation.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.agents import llm_cache
+from src.agents.llm_cache import LLMResponseCache, cache_scope, normalize_prompt
+
+
+class FakeAgent:
+    """Agent whose answers call the given tools and report token usage."""
+
+    def __init__(self, tools: tuple[str, ...] = (), delay: float = 0.0):
+        self.tools = tools
+        self.delay = delay
+        self.calls = 0
+
+    async def ainvoke(self, payload, config=None):
+        del config  # accepted like the real agent's, unused here
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        content = payload["messages"][0]["content"]
+        messages = [SimpleNamespace(type="human", content=content)]
+        if self.tools:
+            messages.append(SimpleNamespace(
+                type="ai",
+                content="",
+                tool_calls=[{"name": tool, "args": {}} for tool in self.tools],
+                usage_metadata={"total_tokens": 400},
+            ))
+        messages.append(SimpleNamespace(
+            type="ai", content=f"answer to {content}", usage_metadata={"total_tokens": 600},
+        ))
+        return {"messages": messages}
+
+
+SCOPE = cache_scope("model", "prompt", [])
+
+
+def test_normalize_prompt():
+    """Test that case, punctuation and filler do not change the key."""
+    assert normalize_prompt("Get prices for BTC, ETH, and CRO!") == "get prices for btc eth and cro"
+    assert normalize_prompt(" please get prices for btc  eth ") == "get prices for btc eth"
+    assert normalize_prompt("Price of BTC/USDC at 0.10?") == "price of btc/usdc at 0.10"
+
+
+@pytest.mark.asyncio
+async def test_exact_and_normalized_hits():
+    """Test that repeats and rephrasings differing only in form are served from cache."""
+    cache = LLMResponseCache(max_entries=8, default_ttl_seconds=60)
+    agent = FakeAgent(("get_crypto_prices",))
+
+    first = await cache.ainvoke(agent, "Get prices for BTC, ETH, and CRO", SCOPE)
+    exact = await cache.ainvoke(agent, "Get prices for BTC, ETH, and CRO", SCOPE)
+    normalized = await cache.ainvoke(agent, "get prices for btc eth and cro please", SCOPE)
+
+    assert (first.cache, exact.cache, normalized.cache) == ("miss", "exact", "normalized")
+    assert normalized.result is first.result
+    assert agent.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_scopes_are_separate():
+    """Test that agents with different configurations do not share answers."""
+    cache = LLMResponseCache(max_entries=8, default_ttl_seconds=60)
+    agent = FakeAgent()
+
+    await cache.ainvoke(agent, "What services are available", SCOPE)
+    other_scope = cache_scope("model", "other", [])
+    other = await cache.ainvoke(agent, "What services are available", other_scope)
+
+    assert other.cache == "miss"
+    assert agent.calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("command", [
+    "Pay 0.10 USDC to the market data API",
+    "Swap 100 USDC for CRO",
+    "Open a 10x long position on BTC",
+    "Please buy me some CRO",
+    "Withdraw everything from the vault",
+])
+async def test_money_moving_commands_bypass(command):
+    """Test that commands that may move money always invoke the agent."""
+    cache = LLMResponseCache(max_entries=8, default_ttl_seconds=60)
+    agent = FakeAgent()
+
+    results = [await cache.ainvoke(agent, command, SCOPE) for _ in range(2)]
+
+    assert [r.cache for r in results] == ["bypass", "bypass"]
+    assert agent.calls == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_answers_from_other_tools_are_not_stored():
+    """Test that an answer using a tool outside the read-only list is not cached."""
+    cache = LLMResponseCache(max_entries=8, default_ttl_seconds=60)
+    agent = FakeAgent(("get_crypto_price", "check_balance"))
+
+    results = [await cache.ainvoke(agent, "How is my wallet doing", SCOPE) for _ in range(2)]
+
+    assert [r.cache for r in results] == ["uncacheable", "uncacheable"]
+    assert agent.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_follows_tools_used(monkeypatch):
+    """Test that a price answer expires with the price TTL, before the default TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(
+        llm_cache, "time", SimpleNamespace(monotonic=lambda: now[0], perf_counter=time.perf_counter)
+    )
+    cache = LLMResponseCache(max_entries=8, default_ttl_seconds=300)
+    prices, plain = FakeAgent(("get_crypto_price",)), FakeAgent()
+
+    await cache.ainvoke(prices, "What is the BTC price", SCOPE)
+    await cache.ainvoke(plain, "What is x402", SCOPE)
+    now[0] += llm_cache.READ_ONLY_TOOL_TTL_SECONDS["get_crypto_price"] + 1
+
+    assert (await cache.ainvoke(prices, "What is the BTC price", SCOPE)).cache == "miss"
+    assert (await cache.ainvoke(plain, "What is x402", SCOPE)).cache == "exact"
+
+
+@pytest.mark.asyncio
+async def test_hits_report_savings(monkeypatch):
+    """Test that a hit records the tokens and latency of the original invocation."""
+    recorded = []
+    monkeypatch.setattr(
+        llm_cache.metrics_collector, "record_llm_cache",
+        lambda result, tokens=0, latency=0.0: recorded.append((result, tokens, latency)),
+    )
+    cache = LLMResponseCache(max_entries=8, default_ttl_seconds=60)
+    agent = FakeAgent(("discover_services",), delay=0.01)
+
+    await cache.ainvoke(agent, "What services are available", SCOPE)
+    await cache.ainvoke(agent, "What services are available", SCOPE)
+
+    assert [r[0] for r in recorded] == ["miss", "exact"]
+    assert recorded[1][1] == 1000
+    assert recorded[1][2] >= 0.01
+
+
+@pytest.mark.asyncio
+async def test_semantic_hit_requires_same_entities():
+    """Test that similar questions hit only when their numbers and symbols match."""
+    vectors = {
+        "what is the btc price": (1.0, 0.0),
+        "how much is btc worth right now": (0.98, 0.2),
+        "how much is eth worth right now": (0.98, 0.2),
+        "list x402 providers": (0.0, 1.0),
+    }
+
+    async def embed(text):
+        return vectors[text]
+
+    cache = LLMResponseCache(
+        max_entries=8, default_ttl_seconds=60, similarity_threshold=0.95, embedder=embed
+    )
+    agent = FakeAgent(("get_crypto_price",))
+
+    await cache.ainvoke(agent, "What is the BTC price", SCOPE)
+    paraphrase = await cache.ainvoke(agent, "How much is BTC worth right now", SCOPE)
+    other_token = await cache.ainvoke(agent, "How much is ETH worth right now", SCOPE)
+    unrelated = await cache.ainvoke(agent, "List x402 providers", SCOPE)
+
+    assert (paraphrase.cache, other_token.cache, unrelated.cache) == ("semantic", "miss", "miss")
+    assert agent.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_invocation():
+    """Test that simultaneous identical questions invoke the agent once."""
+    cache = LLMResponseCache(max_entries=8, default_ttl_seconds=60)
+    agent = FakeAgent(delay=0.05)
+
+    results = await asyncio.gather(*(
+        cache.ainvoke(agent, "What services are available", SCOPE) for _ in range(5)
+    ))
+
+    assert agent.calls == 1
+    assert len({id(r.result) for r in results}) == 1
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_is_evicted():
+    """Test that the cache stays bounded."""
+    cache = LLMResponseCache(max_entries=2, default_ttl_seconds=60)
+    agent = FakeAgent()
+
+    for command in ("What is x402", "What is MCP", "What is x402", "What is Cronos"):
+        await cache.ainvoke(agent, command, SCOPE)
+
+    assert len(cache) == 2
+    assert (await cache.ainvoke(agent, "What is x402", SCOPE)).cache == "exact"
+    assert (await cache.ainvoke(agent, "What is MCP", SCOPE)).cache == "miss"
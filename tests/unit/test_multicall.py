@@ -0,0 +1,112 @@
+"""
+Unit tests for batched on-chain reads.
+
+Tests that multi-token balance checks cost a single RPC round trip in both
+JSON-RPC batch and Multicall3 modes, and that token metadata is cached.
+"""
+
+import pytest
+from eth_abi import encode
+
+from src.connectors.multicall import (
+    MULTICALL3_ADDRESS,
+    BatchReader,
+    TokenMetadataCache,
+    decode_symbol,
+)
+from src.connectors.rpc import AsyncRPCClient, RPCError
+from tests.fixtures.json_rpc_stub import DECIMALS_SELECTOR, JsonRpcStub
+
+WALLET = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0"
+TOKENS = [
+    "0x2336cE47712A4BC7fCC4FC6c4693e54F9D75Cd72",
+    "0x66e428c3f67a68878562e79A0234c1F83c208770",
+    "0xc21223249CA28397B4B6541dfFaEcC539BfF0c59",
+]
+
+
+@pytest.fixture(params=["jsonrpc", "multicall"])
+async def stub_and_reader(request):
+    """Run a stub with three tokens and a reader in either batching mode."""
+    multicall = MULTICALL3_ADDRESS if request.param == "multicall" else None
+    stub = JsonRpcStub(multicall_address=multicall)
+    await stub.start()
+    stub.set_native_balance(WALLET, 5 * 10**18)
+    for index, token in enumerate(TOKENS):
+        stub.set_erc20(token, balance=(index + 1) * 10**6, decimals=6, symbol=f"T{index}")
+
+    client = AsyncRPCClient(stub.url)
+    reader = BatchReader(client, multicall_address=multicall, metadata_cache=TokenMetadataCache())
+    yield stub, reader
+    await client.close()
+    await stub.stop()
+
+
+@pytest.mark.asyncio
+async def test_balances_in_single_round_trip(stub_and_reader):
+    """Test that native and token balances share one HTTP request."""
+    stub, reader = stub_and_reader
+    await reader.rpc.chain_id()  # resolved once per client
+    before = stub.http_requests
+
+    snapshot = await reader.get_balances(WALLET, TOKENS)
+
+    assert stub.http_requests - before == 1
+    assert snapshot.native_wei == 5 * 10**18
+    assert [snapshot.tokens[t].balance for t in TOKENS] == [1.0, 2.0, 3.0]
+    assert [snapshot.tokens[t].metadata.symbol for t in TOKENS] == ["T0", "T1", "T2"]
+
+
+@pytest.mark.asyncio
+async def test_token_metadata_is_cached(stub_and_reader):
+    """Test that decimals and symbols are only read the first time."""
+    stub, reader = stub_and_reader
+    await reader.get_balances(WALLET, TOKENS)
+    assert len(reader.metadata_cache) == 3
+
+    # Drop decimals from the stub; cached metadata must still be used
+    for token in TOKENS:
+        del stub.call_results[(token.lower(), DECIMALS_SELECTOR)]
+
+    snapshot = await reader.get_balances(WALLET, TOKENS, include_native=False)
+    assert snapshot.native_wei is None
+    assert snapshot.tokens[TOKENS[2]].balance == 3.0
+
+
+@pytest.mark.asyncio
+async def test_failed_balance_read_raises(stub_and_reader):
+    """Test that a reverted balanceOf surfaces as an RPC error."""
+    _stub, reader = stub_and_reader
+    unknown = "0x0000000000000000000000000000000000000bad"
+
+    with pytest.raises(RPCError):
+        await reader.get_balances(WALLET, [TOKENS[0], unknown])
+
+
+@pytest.mark.asyncio
+async def test_large_batches_are_chunked_in_order():
+    """Test that calls beyond the batch limit are split but keep their order."""
+    stub = JsonRpcStub()
+    await stub.start()
+    for index, token in enumerate(TOKENS):
+        stub.set_erc20(token, balance=index, decimals=18)
+    client = AsyncRPCClient(stub.url)
+    reader = BatchReader(client, max_calls_per_batch=2, metadata_cache=TokenMetadataCache())
+
+    try:
+        await client.chain_id()
+        before = stub.http_requests
+        snapshot = await reader.get_balances(WALLET, TOKENS, include_native=False)
+    finally:
+        await client.close()
+        await stub.stop()
+
+    # 3 balanceOf + 3 decimals + 3 symbol calls in chunks of 2
+    assert stub.http_requests - before == 5
+    assert [snapshot.tokens[t].balance_wei for t in TOKENS] == [0, 1, 2]
+
+
+def test_decode_symbol_handles_bytes32():
+    """Test decoding of legacy bytes32 token symbols."""
+    assert decode_symbol(encode(["string"], ["USDC"])) == "USDC"
+    assert decode_symbol(b"MKR".ljust(32, b"\x00")) == "MKR"
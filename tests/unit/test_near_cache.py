@@ -0,0 +1,125 @@
+"""
+Unit tests for the two-tier near cache.
+
+Tests that L1 serves repeat reads without touching Redis, that writes in
+one worker invalidate L1 in another via pub/sub, that L1 respects its size
+and TTL bounds, and that per-tier hit ratios are reported.
+"""
+
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from src.core.cache import CacheClient
+from src.core.cache_codec import CacheCodec
+from src.core.near_cache import NearCache
+
+
+def _backend(server: FakeServer) -> CacheClient:
+    client = CacheClient()
+    client._client = FakeAsyncRedis(server=server)
+    client._available = True
+    return client
+
+
+async def _near(server: FakeServer, **kwargs) -> NearCache:
+    cache = NearCache(backend=_backend(server), channel="test:invalidate", enabled=True, **kwargs)
+    await cache.start()
+    return cache
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.mark.asyncio
+async def test_l1_hit_skips_redis(server):
+    """Test that a repeat read is served from L1 with the decoded value."""
+    cache = await _near(server, max_entries=16, ttl_seconds=30)
+    try:
+        await cache.set("price:svc-1", {"price": 0.25, "token": "USDC"}, ttl_seconds=60)
+        # Change Redis behind the cache's back: L1 must still answer
+        await cache.backend.client.set("price:svc-1", '{"price": 9.99}')
+
+        assert await cache.get("price:svc-1") == {"price": 0.25, "token": "USDC"}
+        metrics = cache.get_metrics()
+        assert metrics["l1_hits"] == 1
+        assert metrics.get("l2_hits", 0) == 0
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_other_workers(server):
+    """Test that a set or delete in one worker evicts L1 in another."""
+    worker_a = await _near(server, max_entries=16, ttl_seconds=30)
+    worker_b = await _near(server, max_entries=16, ttl_seconds=30)
+    try:
+        await worker_a.set("mcp_services", ["a"])
+        assert await worker_b.get("mcp_services") == ["a"]
+        assert "mcp_services" in worker_b._entries
+
+        await worker_a.set("mcp_services", ["a", "b"])
+        await _wait_until(lambda: "mcp_services" not in worker_b._entries)
+        assert await worker_b.get("mcp_services") == ["a", "b"]
+
+        await worker_a.delete_pattern("mcp_*")
+        await _wait_until(lambda: "mcp_services" not in worker_b._entries)
+        assert await worker_b.get("mcp_services") is None
+    finally:
+        await worker_a.close()
+        await worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_l1_bounded_by_size_and_ttl(server):
+    """Test LRU eviction and that L1 never outlives the Redis TTL."""
+    cache = await _near(server, max_entries=2, ttl_seconds=30)
+    try:
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+        assert list(cache._entries) == ["a", "c"]
+
+        await cache.backend.client.set("short", "value", px=50)
+        assert await cache.get("short") == "value"
+        await asyncio.sleep(0.1)
+        assert await cache.get("short") is None
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_disabled_l1_reads_through(server):
+    """Test that with L1 disabled every read goes to Redis."""
+    cache = NearCache(backend=_backend(server), enabled=False)
+    await cache.start()
+
+    await cache.set("key", "value")
+    assert await cache.get("key") == "value"
+    assert len(cache) == 0
+    assert cache.get_metrics()["l2_hits"] == 1
+
+
+
+@pytest.mark.asyncio
+async def test_backend_get_decodes_codec_values(server):
+    """Test that CacheClient.get decodes compressed codec values and leaves plain ones as text."""
+    backend = _backend(server)
+    services = [{"name": f"Market Data Feed {i}", "price": 0.25} for i in range(20)]
+    encoded = CacheCodec(compression="zlib", compress_min_bytes=16).encode(services)
+    await backend.client.set("mcp_services", encoded)
+    await backend.client.set("plain", '{"price": 9.99}')
+
+    assert await backend.get("mcp_services") == services
+    assert await backend.get("plain") == '{"price": 9.99}'
@@ -0,0 +1,129 @@
+"""
+Unit tests for incrementally maintained payment statistics.
+
+Tests that payment writes keep rollups in step with raw rows, that stats
+are answered from rollups, and that backfill and the consistency check
+agree with raw payments.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import update
+
+from src.models.payments import Payment
+from src.services.payment_rollups import (
+    check_rollups,
+    get_status_totals,
+    rebuild_rollups,
+    record_status_change,
+)
+from src.services.payment_service import PaymentService
+
+WALLET = "0x" + "a" * 40
+OTHER_WALLET = "0x" + "b" * 40
+RECIPIENT = "0x" + "c" * 40
+
+
+@pytest.mark.asyncio
+async def test_writes_update_rollups(db_session):
+    """Test that create and status updates move counts between status buckets."""
+    service = PaymentService(db_session)
+    first = await service.create_payment(WALLET, RECIPIENT, 10.0, "USDC")
+    await service.create_payment(WALLET, RECIPIENT, 5.0, "USDC", status="confirmed")
+    await service.create_payment(OTHER_WALLET, RECIPIENT, 2.5, "USDC", status="failed")
+
+    await service.update_payment_status(first.id, "confirmed", tx_hash="0x" + "1" * 64)
+
+    stats = (await service.get_payment_stats())["stats"]
+    assert stats["total_payments"] == 3
+    assert stats["confirmed_payments"] == 2
+    assert stats["pending_payments"] == 0
+    assert stats["failed_payments"] == 1
+    assert stats["total_amount_usd"] == 15.0
+
+    wallet_stats = (await service.get_payment_stats(wallet_address=WALLET))["stats"]
+    assert wallet_stats["total_payments"] == 2
+    assert wallet_stats["success_rate"] == 1.0
+
+    assert await check_rollups(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_status_change_is_not_counted_twice(db_session, monkeypatch):
+    """Test that a status changed between read and write is re-read before the rollup moves."""
+    service = PaymentService(db_session)
+    payment = await service.create_payment(WALLET, RECIPIENT, 10.0, "USDC")
+    execute = db_session.execute
+    raced = []
+
+    async def racing_execute(statement, *args, **kwargs):
+        if getattr(statement, "table", None) is Payment.__table__ and not raced:
+            # Another writer fails the payment after our read
+            raced.append(True)
+            await execute(update(Payment).where(Payment.id == payment.id).values(status="failed"))
+            failed = SimpleNamespace(
+                created_at=payment.created_at, agent_wallet=WALLET, amount=10.0, status="failed"
+            )
+            await record_status_change(db_session, failed, "pending")
+        return await execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db_session, "execute", racing_execute)
+    updated = await service.update_payment_status(payment.id, "confirmed")
+    monkeypatch.undo()
+
+    assert updated.status == "confirmed"
+    stats = (await service.get_payment_stats())["stats"]
+    assert (stats["pending_payments"], stats["failed_payments"]) == (0, 0)
+    assert stats["confirmed_payments"] == 1
+    assert await check_rollups(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_backfill_and_consistency_check(db_session):
+    """Test that rows written around the service show up as mismatches until backfilled."""
+    now = datetime.utcnow()
+    db_session.add_all([
+        Payment(
+            id=uuid4(),
+            agent_wallet=WALLET,
+            recipient=RECIPIENT,
+            amount=1.0 + i,
+            token="USDC",
+            status="confirmed" if i % 2 else "pending",
+            created_at=now - timedelta(hours=5 * i),
+        )
+        for i in range(10)
+    ])
+    await db_session.flush()
+
+    mismatches = await check_rollups(db_session)
+    assert {m["granularity"] for m in mismatches} == {"hour", "day"}
+
+    assert await rebuild_rollups(db_session, batch_size=3) == 10
+    assert await check_rollups(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_window_uses_hourly_then_daily_buckets(db_session):
+    """Test that the stats window starts at hour resolution and excludes older rows."""
+    now = datetime.utcnow()
+    since = now - timedelta(days=2)
+    db_session.add_all([
+        # Before the window
+        Payment(id=uuid4(), agent_wallet=WALLET, recipient=RECIPIENT, amount=100.0,
+                token="USDC", status="confirmed", created_at=since - timedelta(hours=2)),
+        # Same day as the window start, but after it
+        Payment(id=uuid4(), agent_wallet=WALLET, recipient=RECIPIENT, amount=1.0,
+                token="USDC", status="confirmed", created_at=since + timedelta(hours=1)),
+        # Within the window's full days
+        Payment(id=uuid4(), agent_wallet=WALLET, recipient=RECIPIENT, amount=2.0,
+                token="USDC", status="confirmed", created_at=now - timedelta(minutes=5)),
+    ])
+    await db_session.flush()
+    await rebuild_rollups(db_session)
+
+    totals = await get_status_totals(db_session, since)
+    assert totals["confirmed"] == (2, 3.0)
@@ -2,9 +2,14 @@
 Tests for the agent planner module.
 """
 
+import asyncio
 from datetime import datetime
+from uuid import uuid4
 
-from src.agents.planner import CommandPlanner, ExecutionPlan, PlanStep
+import pytest
+
+from src.agents.agent_executor_enhanced import AgentExecutorEnhanced
+from src.agents.planner import CommandPlanner, ExecutionPlan, PlanError, PlanExecutor, PlanStep
 
 
 class TestPlanStep:
@@ -275,3 +280,205 @@ class TestCommandPlanner:
         result = planner.should_plan("check balance then swap", "unknown_intent")
         # Should still detect sequential keywords
         assert result is True
+
+
+class TestPlanGraph:
+    """Test building dependency DAGs from multi-step commands."""
+
+    def test_reads_run_together_before_write(self):
+        """Test that consecutive reads are independent and a write waits for them."""
+        plan = CommandPlanner().create_plan(
+            "Check my balance and find services then swap 10 CRO for USDC"
+        )
+
+        assert [(s.action_type, s.dependencies) for s in plan.steps] == [
+            ("balance_check", []),
+            ("service_discovery", []),
+            ("swap", [1, 2]),
+        ]
+
+    def test_read_after_write_waits_for_it(self):
+        """Test that a read following a write sees its effects."""
+        plan = CommandPlanner().create_plan("Swap 10 CRO for USDC then check my balance")
+
+        assert [(s.action_type, s.dependencies) for s in plan.steps] == [
+            ("swap", []),
+            ("balance_check", [1]),
+        ]
+
+    def test_incomplete_clause_is_not_planned(self):
+        """Test that a clause without its parameters falls back to a single intent."""
+        assert CommandPlanner().create_plan("Find a service and pay for it") is None
+        assert CommandPlanner().create_plan("Check my balance") is None
+
+    def test_cycle_is_rejected(self):
+        """Test that cyclic dependencies fail validation."""
+        plan = ExecutionPlan(
+            plan_id="cycle",
+            command="",
+            steps=[
+                PlanStep(step_id=1, description="a", action_type="test", dependencies=[2]),
+                PlanStep(step_id=2, description="b", action_type="test", dependencies=[1]),
+            ],
+        )
+
+        with pytest.raises(PlanError):
+            plan.validate()
+
+
+class TestPlanExecutor:
+    """Test running plans as dependency DAGs."""
+
+    @staticmethod
+    def _plan(*steps: PlanStep) -> ExecutionPlan:
+        return ExecutionPlan(plan_id="plan", command="", steps=list(steps))
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        """Test that a plan takes as long as its critical path."""
+        async def slow(_step, inputs):
+            await asyncio.sleep(0.1)
+            return {"success": True, "inputs": sorted(inputs)}
+
+        plan = self._plan(
+            PlanStep(step_id=1, description="balance", action_type="slow"),
+            PlanStep(step_id=2, description="quote", action_type="slow"),
+            PlanStep(step_id=3, description="swap", action_type="slow", dependencies=[1, 2]),
+        )
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await PlanExecutor({"slow": slow}).execute(plan)
+
+        assert loop.time() - started < 0.28
+        assert plan.status == "completed"
+        assert results[3]["inputs"] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_dependents_only(self):
+        """Test that a failed step skips its dependents while other branches finish."""
+        async def ok(_step, _inputs):
+            return {"success": True}
+
+        async def declined(_step, _inputs):
+            return {"success": False, "error": "insufficient balance"}
+
+        plan = self._plan(
+            PlanStep(step_id=1, description="pay", action_type="declined"),
+            PlanStep(step_id=2, description="after pay", action_type="ok", dependencies=[1]),
+            PlanStep(step_id=3, description="independent", action_type="ok"),
+        )
+
+        await PlanExecutor({"ok": ok, "declined": declined}).execute(plan)
+
+        assert [s.status for s in plan.steps] == ["failed", "skipped", "completed"]
+        assert plan.steps[0].error == "insufficient balance"
+        assert plan.status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped_per_session(self):
+        """Test that steps of one session never exceed the cap."""
+        running = 0
+        peak = 0
+
+        async def tracked(_step, _inputs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"success": True}
+
+        plans = [
+            self._plan(*(PlanStep(step_id=i, description="", action_type="t") for i in range(4)))
+            for _ in range(2)
+        ]
+        await asyncio.gather(*(
+            PlanExecutor({"t": tracked}, session_id="session", max_concurrency=3).execute(plan)
+            for plan in plans
+        ))
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_cancellation_cancels_running_steps(self):
+        """Test that cancelling a plan stops steps in flight and marks the rest."""
+        async def slow(_step, _inputs):
+            await asyncio.sleep(10)
+
+        plan = self._plan(
+            PlanStep(step_id=1, description="a", action_type="slow"),
+            PlanStep(step_id=2, description="b", action_type="slow", dependencies=[1]),
+        )
+        task = asyncio.create_task(PlanExecutor({"slow": slow}).execute(plan))
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert plan.status == "cancelled"
+        assert [s.status for s in plan.steps] == ["cancelled", "cancelled"]
+
+
+class TestPlanBudget:
+    """Test that a plan's budget covers all of its steps together."""
+
+    @staticmethod
+    def _executor(monkeypatch) -> tuple[AgentExecutorEnhanced, list]:
+        executor = AgentExecutorEnhanced(uuid4(), db=None, use_allowlist=False)
+        executed = []
+
+        async def execute_intent(parsed, _budget_limit_usd):
+            executed.append(parsed.parameters["amount"])
+            return {"success": True, "total_cost_usd": parsed.parameters["amount"]}
+
+        monkeypatch.setattr(executor, "_execute_intent", execute_intent)
+        return executor, executed
+
+    @pytest.mark.asyncio
+    async def test_plan_over_budget_runs_no_step(self, monkeypatch):
+        """Test that payments each within budget but over it together are refused."""
+        executor, executed = self._executor(monkeypatch)
+        plan = CommandPlanner().create_plan(
+            "Pay 8 USDC to service A then pay 8 USDC to service B"
+        )
+
+        result = await executor._execute_step_plan(plan, budget_limit_usd=10.0)
+
+        assert result["success"] is False
+        assert "budget limit" in result["error"]
+        assert executed == []
+
+    @pytest.mark.asyncio
+    async def test_plan_within_budget_runs_every_step(self, monkeypatch):
+        """Test that a plan whose total fits the budget runs all its payments."""
+        executor, executed = self._executor(monkeypatch)
+        plan = CommandPlanner().create_plan(
+            "Pay 4 USDC to service A then pay 4 USDC to service B"
+        )
+
+        result = await executor._execute_step_plan(plan, budget_limit_usd=10.0)
+
+        assert result["success"] is True
+        assert executed == [4.0, 4.0]
+        assert result["total_cost_usd"] == 8.0
+
+    @pytest.mark.asyncio
+    async def test_dependent_step_gets_dependency_results(self, monkeypatch):
+        """Test that a step's parameters carry the results of the steps it depends on."""
+        executor, _ = self._executor(monkeypatch)
+        received = []
+
+        async def execute_intent(parsed, _budget_limit_usd):
+            received.append(parsed.parameters)
+            return {"success": True, "total_cost_usd": parsed.parameters["amount"]}
+
+        monkeypatch.setattr(executor, "_execute_intent", execute_intent)
+        plan = CommandPlanner().create_plan(
+            "Pay 4 USDC to service A then pay 4 USDC to service B"
+        )
+
+        await executor._execute_step_plan(plan, budget_limit_usd=None)
+
+        assert "dependencies" not in received[0]
+        assert received[1]["dependencies"] == {1: {"success": True, "total_cost_usd": 4.0}}
@@ -0,0 +1,171 @@
+"""
+Unit tests for Prometheus metric primitives and labelled collector metrics.
+
+Tests histogram bucketing and quantile estimation, text exposition
+rendering, and that the performance registries use constant memory.
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.core.monitoring import PerformanceRegistry, PerformanceStats
+from src.core.performance import PerformanceOptimizer
+from src.core.prometheus import Histogram, MetricsRegistry, estimate_quantile
+from src.services.metrics_service import MetricsCollector
+
+
+class TestHistogram:
+    def test_observations_land_in_le_buckets(self):
+        histogram = Histogram("latency_seconds", "Latency", buckets=(0.1, 0.5, 1.0))
+        for value in [0.05, 0.1, 0.3, 0.9, 5.0]:
+            histogram.observe(value)
+
+        series = histogram.labels()
+        assert series.counts == [2, 1, 1, 1]  # 0.1 is inclusive (le)
+        assert series.count == 5
+        assert series.sum == pytest.approx(6.35)
+
+    def test_rendering_is_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        histogram.labels(route="/a").observe(0.05)
+        histogram.labels(route="/a").observe(0.5)
+
+        text = "".join(histogram.iter_lines())
+
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 2' in text
+        assert 'latency_seconds_count{route="/a"} 2' in text
+
+    def test_quantile_interpolates_within_bucket(self):
+        bounds = (10.0, 20.0, 30.0)
+        # 100 observations spread evenly over (10, 20]
+        assert estimate_quantile(0.5, bounds, [0, 100, 0, 0]) == pytest.approx(15.0)
+        assert estimate_quantile(0.95, bounds, [0, 100, 0, 0]) == pytest.approx(19.5)
+        # Overflow bucket reports the highest finite bound
+        assert estimate_quantile(0.99, bounds, [0, 0, 0, 5]) == 30.0
+        assert estimate_quantile(0.5, bounds, [0, 0, 0, 0]) == 0.0
+
+
+class TestRegistry:
+    def test_labels_are_escaped_and_cached(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests", ("path",))
+        counter.labels(path='/a"b\\c').inc()
+        counter.labels(path='/a"b\\c').inc(2)
+
+        assert 'requests_total{path="/a\\"b\\\\c"} 3' in registry.render()
+
+    def test_register_returns_existing_family(self):
+        registry = MetricsRegistry()
+        first = registry.counter("requests_total", "Requests")
+        assert registry.counter("requests_total", "Requests") is first
+
+    def test_wrong_label_count_raises(self):
+        counter = MetricsRegistry().counter("requests_total", "Requests", ("route", "method"))
+        with pytest.raises(ValueError):
+            counter.labels("/a")
+
+
+class TestMetricsCollector:
+    def test_labelled_request_metrics(self):
+        collector = MetricsCollector()
+        collector.record_request(0.04, route="/api/v1/payments/{payment_id}", method="GET", status_code=200)
+        collector.record_request(0.3, error=True, route="/api/v1/payments/{payment_id}", method="GET", status_code=404)
+
+        text = collector.get_prometheus_metrics()
+
+        assert collector.request_count == 2
+        assert 'paygent_http_requests_total{route="/api/v1/payments/{payment_id}",method="GET",status="404"} 1' in text
+        assert 'paygent_http_request_duration_seconds_count{route="/api/v1/payments/{payment_id}",method="GET"} 2' in text
+        assert "paygent_request_total 2" in text
+
+    def test_intent_and_tool_metrics(self):
+        collector = MetricsCollector()
+        collector.record_agent_execution(1.2, success=True, intent="payment")
+        collector.record_tool_call("x402_payment", success=False, duration_seconds=0.8)
+
+        text = collector.get_prometheus_metrics()
+
+        assert 'paygent_agent_runs_total{intent="payment",outcome="success"} 1' in text
+        assert 'paygent_tool_calls_total{tool="x402_payment",outcome="failure"} 1' in text
+        assert 'paygent_tool_call_duration_seconds_bucket{tool="x402_payment",le="1"} 1' in text
+
+    @pytest.mark.asyncio
+    async def test_executor_times_tool_calls(self, monkeypatch):
+        from uuid import uuid4
+
+        from src.agents import agent_executor_enhanced
+        from src.agents.agent_executor_enhanced import AgentExecutorEnhanced
+
+        collector = MetricsCollector()
+        monkeypatch.setattr(agent_executor_enhanced, "metrics_collector", collector)
+        executor = AgentExecutorEnhanced(uuid4(), db=None, use_allowlist=False)
+
+        await executor._execute_balance_check_with_logging(
+            agent_executor_enhanced.command_parser.parse("Check my balance")
+        )
+
+        text = collector.get_prometheus_metrics()
+        assert 'paygent_tool_call_duration_seconds_count{tool="check_balance"} 1' in text
+        assert executor.tool_calls[-1]["duration_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_endpoint_uses_route_templates(self):
+        from fastapi import FastAPI
+
+        from src.api.routes.metrics import router as metrics_router
+        from src.middleware.metrics import metrics_middleware
+
+        app = FastAPI()
+        app.middleware("http")(metrics_middleware)
+        app.include_router(metrics_router, prefix="/api/v1")
+
+        @app.get("/api/v1/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"id": item_id}
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/api/v1/items/abc123")
+            await client.get("/api/v1/items/def456")
+            response = await client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'route="/api/v1/items/{item_id}",method="GET",status="200"' in response.text
+        assert "abc123" not in response.text
+
+
+class TestBoundedPerformanceStats:
+    def test_performance_stats_do_not_store_values(self):
+        stats = PerformanceStats()
+        for value in range(1, 10001):
+            stats.add_value(value / 100)  # 0.01ms .. 100ms
+
+        assert stats.count == 10000
+        assert len(stats.bucket_counts) == len(stats.buckets) + 1
+        assert 40 <= stats.get_median() <= 60
+        assert stats.get_p99() <= stats.max_val
+
+    def test_registry_timer_percentiles(self):
+        registry = PerformanceRegistry()
+        for _ in range(95):
+            registry.timer("api.calls.duration", 20.0)
+        for _ in range(5):
+            registry.timer("api.calls.duration", 900.0)
+
+        timer = registry.get_all_metrics()["timers"]["api.calls.duration"]
+        assert timer["count"] == 100
+        assert timer["p99"] > 500
+        assert timer["median"] < 50
+
+    def test_optimizer_keeps_bounded_history(self):
+        optimizer = PerformanceOptimizer(max_slow_requests=5)
+        for index in range(50):
+            optimizer.track_response_time(f"/api/{index}", 250.0 + index)
+
+        stats = optimizer.get_performance_stats()
+        assert stats["total_requests"] == 50
+        assert stats["slow_requests_count"] == 5
+        assert 250 <= stats["p50_response_time_ms"] <= 500
@@ -0,0 +1,166 @@
+"""
+Unit tests for chunked data retention.
+
+Tests that expired rows are deleted in batches together with their
+dependent rows, that archiving sees rows and their dependents before
+deletion, that stale approvals are expired rather than deleted, and that
+sessions with an active subscription are kept.
+"""
+
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from src.models.agent_sessions import AgentSession, ApprovalRequest, ServiceSubscription
+from src.models.execution_logs import ExecutionLog, ToolCall
+from src.services.retention import (
+    JsonlArchiver,
+    RetentionEngine,
+    execution_logs_policy,
+    expire_approvals_policy,
+    sessions_policy,
+)
+
+OLD = datetime.utcnow() - timedelta(days=60)
+
+
+async def _count(db_session, model) -> int:
+    return (await db_session.execute(select(func.count()).select_from(model))).scalar()
+
+
+async def _session_with_logs(db_session, old_logs: int, new_logs: int = 0) -> AgentSession:
+    session = AgentSession(id=uuid4(), user_id=uuid4(), config={}, last_active=OLD)
+    db_session.add(session)
+    for i in range(old_logs + new_logs):
+        log = ExecutionLog(
+            id=uuid4(),
+            session_id=session.id,
+            command=f"command {i}",
+            created_at=OLD if i < old_logs else datetime.utcnow(),
+        )
+        call = ToolCall(id=uuid4(), execution_log_id=log.id, tool_name="check_balance", tool_args={})
+        db_session.add_all([log, call])
+    await db_session.commit()
+    return session
+
+
+def _archived(directory, name: str) -> list[dict]:
+    (archive,) = directory.glob(f"{name}-*.jsonl")
+    return [json.loads(line) for line in archive.read_text().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_old_logs_deleted_in_chunks_with_tool_calls(db_session):
+    """Test that expired logs and their tool calls go in batch-sized chunks."""
+    await _session_with_logs(db_session, old_logs=7, new_logs=2)
+
+    engine = RetentionEngine(db_session, batch_size=3, throttle_ms=0)
+    result = await engine.run(execution_logs_policy(timedelta(days=30)))
+
+    assert (result.rows, result.chunks, result.dependent_rows) == (7, 3, 7)
+    assert result.errors == []
+    assert await _count(db_session, ExecutionLog) == 2
+    assert await _count(db_session, ToolCall) == 2
+
+
+@pytest.mark.asyncio
+async def test_count_is_a_dry_run(db_session):
+    """Test that count reports expired rows without deleting them."""
+    await _session_with_logs(db_session, old_logs=4, new_logs=1)
+
+    engine = RetentionEngine(db_session, batch_size=2, throttle_ms=0)
+    assert await engine.count(execution_logs_policy(timedelta(days=30))) == 4
+    assert await _count(db_session, ExecutionLog) == 5
+
+
+@pytest.mark.asyncio
+async def test_archiver_receives_rows_before_delete(db_session, tmp_path):
+    """Test that archived policies write every deleted row to JSONL."""
+    await _session_with_logs(db_session, old_logs=5)
+
+    engine = RetentionEngine(db_session, batch_size=2, throttle_ms=0, archiver=JsonlArchiver(str(tmp_path)))
+    result = await engine.run(execution_logs_policy(timedelta(days=30), archive=True))
+
+    assert result.archived == 10
+    rows = _archived(tmp_path, "execution_logs")
+    assert sorted(row["command"] for row in rows) == [f"command {i}" for i in range(5)]
+    assert len(_archived(tmp_path, "tool_calls")) == 5
+
+
+@pytest.mark.asyncio
+async def test_rows_removed_mid_chunk_do_not_end_the_run(db_session):
+    """Test that a full chunk whose delete hits fewer rows is followed by the next chunk."""
+    await _session_with_logs(db_session, old_logs=5)
+
+    async def archiver(name, rows):
+        # Another process deletes one of the chunk's logs first
+        if name == "execution_logs":
+            await db_session.execute(delete(ExecutionLog).where(ExecutionLog.id == rows[0]["id"]))
+
+    engine = RetentionEngine(db_session, batch_size=2, throttle_ms=0, archiver=archiver)
+    result = await engine.run(execution_logs_policy(timedelta(days=30), archive=True))
+
+    assert result.errors == []
+    assert await _count(db_session, ExecutionLog) == 0
+
+
+@pytest.mark.asyncio
+async def test_archived_sessions_archive_their_dependent_rows(db_session, tmp_path):
+    """Test that a session's logs, tool calls and approvals are archived before deletion."""
+    session = await _session_with_logs(db_session, old_logs=3)
+    db_session.add(ApprovalRequest(
+        id=uuid4(), session_id=session.id, tool_name="swap", tool_args={}, decision="approved",
+    ))
+    await db_session.commit()
+
+    engine = RetentionEngine(db_session, batch_size=10, throttle_ms=0, archiver=JsonlArchiver(str(tmp_path)))
+    result = await engine.run(sessions_policy(timedelta(days=30), archive=True))
+
+    assert result.rows == 1
+    assert result.archived == 1 + 3 + 3 + 1
+    assert [row["id"] for row in _archived(tmp_path, "agent_sessions")] == [str(session.id)]
+    assert len(_archived(tmp_path, "execution_logs")) == 3
+    assert len(_archived(tmp_path, "tool_calls")) == 3
+    assert len(_archived(tmp_path, "approval_requests")) == 1
+    assert await _count(db_session, ToolCall) == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_pending_approvals_are_expired(db_session):
+    """Test that pending approvals past the expiry are marked, not deleted."""
+    session = AgentSession(id=uuid4(), user_id=uuid4(), config={})
+    stale = ApprovalRequest(
+        id=uuid4(), session_id=session.id, tool_name="swap", tool_args={}, decision="pending",
+        created_at=datetime.utcnow() - timedelta(hours=48),
+    )
+    fresh = ApprovalRequest(id=uuid4(), session_id=session.id, tool_name="swap", tool_args={}, decision="pending")
+    db_session.add_all([session, stale, fresh])
+    await db_session.commit()
+
+    engine = RetentionEngine(db_session, batch_size=10, throttle_ms=0)
+    result = await engine.run(expire_approvals_policy(timedelta(hours=24)))
+
+    assert result.rows == 1
+    decisions = dict((await db_session.execute(select(ApprovalRequest.id, ApprovalRequest.decision))).all())
+    assert decisions == {stale.id: "expired", fresh.id: "pending"}
+
+
+@pytest.mark.asyncio
+async def test_sessions_with_active_subscription_are_kept(db_session):
+    """Test that inactive sessions are removed with their rows unless subscribed."""
+    expired = await _session_with_logs(db_session, old_logs=2)
+    subscribed = await _session_with_logs(db_session, old_logs=1)
+    db_session.add(ServiceSubscription(id=uuid4(), session_id=subscribed.id, service_id=uuid4(), status="active"))
+    await db_session.commit()
+
+    engine = RetentionEngine(db_session, batch_size=10, throttle_ms=0)
+    result = await engine.run(sessions_policy(timedelta(days=30)))
+
+    assert result.rows == 1
+    remaining = (await db_session.execute(select(AgentSession.id))).scalars().all()
+    assert remaining == [subscribed.id]
+    assert (await db_session.execute(select(ExecutionLog.session_id).distinct())).scalars().all() == [subscribed.id]
+    assert expired.id not in remaining
@@ -0,0 +1,98 @@
+"""
+Unit tests for full-text service search.
+
+Tests ranking on the SQLite FTS5 index (relevance blended with
+reputation), prefix matching of query words, and that the index follows
+updates and deletes made through the ORM.
+"""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from src.models.services import Service
+from src.services.service_search import apply_text_search, query_terms
+
+
+def _service(name: str, description: str, reputation: float = 3.0) -> Service:
+    return Service(
+        id=uuid4(),
+        name=name,
+        description=description,
+        endpoint=f"https://example.com/{name.lower().replace(' ', '-')}",
+        pricing_model="pay-per-call",
+        price_amount=0.01,
+        price_token="USDC",
+        reputation_score=reputation,
+    )
+
+
+async def _search(db_session, query: str, weight: float = 0.7) -> list[str]:
+    stmt = apply_text_search(select(Service), query, "sqlite", relevance_weight=weight)
+    result = await db_session.execute(stmt)
+    return [service.name for service in result.scalars().all()]
+
+
+def test_query_terms_strip_operators():
+    """Test that FTS syntax in user input is reduced to plain words."""
+    assert query_terms('Price "feed" OR -oracle*') == ["price", "feed", "or", "oracle"]
+    assert query_terms("  ") == []
+
+
+@pytest.mark.asyncio
+async def test_name_match_ranks_above_description_match(db_session):
+    """Test that a name hit outranks a description-only hit of equal reputation."""
+    db_session.add_all([
+        _service("Weather API", "Forecasts that mention price once"),
+        _service("Price Oracle", "Token prices for Cronos pairs"),
+        _service("Image Resizer", "Thumbnails on demand"),
+    ])
+    await db_session.flush()
+
+    assert await _search(db_session, "price") == ["Price Oracle", "Weather API"]
+
+
+@pytest.mark.asyncio
+async def test_prefix_and_all_terms_required(db_session):
+    """Test that words are prefix-matched and every word must match."""
+    db_session.add_all([
+        _service("Market Data Feed", "Streaming OHLCV candles"),
+        _service("Market Sentiment", "Social signals"),
+    ])
+    await db_session.flush()
+
+    assert await _search(db_session, "mark feed") == ["Market Data Feed"]
+    assert sorted(await _search(db_session, "mark")) == ["Market Data Feed", "Market Sentiment"]
+
+
+@pytest.mark.asyncio
+async def test_reputation_breaks_relevance_ties(db_session):
+    """Test that equally relevant services are ordered by reputation."""
+    db_session.add_all([
+        _service("Swap Router A", "DEX routing", reputation=2.0),
+        _service("Swap Router B", "DEX routing", reputation=4.5),
+    ])
+    await db_session.flush()
+
+    assert await _search(db_session, "swap router") == ["Swap Router B", "Swap Router A"]
+    # With no relevance weight the order is reputation alone
+    assert await _search(db_session, "swap", weight=0.0) == ["Swap Router B", "Swap Router A"]
+
+
+@pytest.mark.asyncio
+async def test_index_follows_updates_and_deletes(db_session):
+    """Test that triggers keep the FTS index in sync with the services table."""
+    service = _service("Legacy Gateway", "Old payments endpoint")
+    other = _service("Bridge Relay", "Cross-chain transfers")
+    db_session.add_all([service, other])
+    await db_session.flush()
+
+    service.name = "Settlement Gateway"
+    await db_session.flush()
+    assert await _search(db_session, "legacy") == []
+    assert await _search(db_session, "settlement") == ["Settlement Gateway"]
+
+    await db_session.delete(other)
+    await db_session.flush()
+    assert await _search(db_session, "bridge") == []
@@ -0,0 +1,133 @@
+"""
+Unit tests for cache stampede protection.
+
+Tests that concurrent misses share one computation, that a worker which
+loses the Redis lease serves the value computed by the lease holder, and
+that XFetch early refresh triggers only near expiry.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from src.core import single_flight as sf
+from src.core.cache import CacheClient
+
+
+class DictCache:
+    """Minimal in-memory cache with the get/set shape get_or_compute expects."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, _ttl=None):
+        self.data[key] = value
+        return True
+
+
+@pytest.fixture
+def redis_backend(monkeypatch) -> CacheClient:
+    client = CacheClient()
+    client._client = FakeAsyncRedis()
+    client._available = True
+    monkeypatch.setattr(sf, "cache_client", client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_compute_once():
+    """Test that 50 concurrent misses run the computation once."""
+    cache = DictCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return ["svc-1", "svc-2"]
+
+    results = await asyncio.gather(
+        *(sf.get_or_compute(cache, "services:discover:x", compute, 300, use_lease=False) for _ in range(50))
+    )
+
+    assert calls == 1
+    assert all(result == ["svc-1", "svc-2"] for result in results)
+    assert sf.is_entry(cache.data["services:discover:x"])
+    assert len(sf.single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_cached():
+    """Test that a failing computation fails all waiters and caches nothing."""
+    cache = DictCache()
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(
+        *(sf.get_or_compute(cache, "k", compute, 60, use_lease=False) for _ in range(5)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.data == {}
+
+
+@pytest.mark.asyncio
+async def test_lease_loser_waits_for_holder(redis_backend, monkeypatch):
+    """Test that a worker without the lease returns the holder's value."""
+    monkeypatch.setattr(sf.settings, "cache_lease_wait_seconds", 2.0)
+    cache = DictCache()
+    await redis_backend.client.set("k" + sf.LEASE_SUFFIX, "other-worker", px=5000)
+
+    async def other_worker_fills():
+        await asyncio.sleep(0.1)
+        cache.data["k"] = sf.wrap_entry({"price": 1.5}, 0.1, 60)
+
+    async def compute():
+        raise AssertionError("lease loser must not recompute")
+
+    filler = asyncio.create_task(other_worker_fills())
+    assert await sf.get_or_compute(cache, "k", compute, 60) == {"price": 1.5}
+    await filler
+
+
+@pytest.mark.asyncio
+async def test_lease_released_after_compute(redis_backend):
+    """Test that the lease holder releases the lease once the value is cached."""
+    cache = DictCache()
+
+    async def compute():
+        assert await redis_backend.client.exists("k" + sf.LEASE_SUFFIX)
+        return 42
+
+    assert await sf.get_or_compute(cache, "k", compute, 60) == 42
+    assert not await redis_backend.client.exists("k" + sf.LEASE_SUFFIX)
+
+
+def test_xfetch_refreshes_only_near_expiry():
+    """Test that early refresh never fires far from expiry and always fires after it."""
+    fresh = {"delta": 0.01, "expires_at": time.time() + 300}
+    expired = {"delta": 0.01, "expires_at": time.time() - 1}
+
+    assert not any(sf.should_refresh_early(fresh, beta=1.0) for _ in range(1000))
+    assert all(sf.should_refresh_early(expired, beta=1.0) for _ in range(100))
+    assert not sf.should_refresh_early(expired, beta=0)
+
+
+@pytest.mark.asyncio
+async def test_plain_values_are_returned_as_is():
+    """Test that values written before envelopes existed are still served."""
+    cache = DictCache()
+    cache.data["legacy"] = [{"id": "svc-1"}]
+
+    async def compute():
+        raise AssertionError("should not recompute")
+
+    assert await sf.get_or_compute(cache, "legacy", compute, 60) == [{"id": "svc-1"}]
@@ -0,0 +1,110 @@
+"""
+Unit tests for the stale-while-revalidate market data cache.
+
+Tests that fresh values are served without fetching, that stale values are
+served immediately while exactly one background refresh runs, that
+expired values are fetched inline with concurrent misses coalesced, and
+that failed refreshes keep the stale value.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.swr_cache import StaleWhileRevalidateCache
+
+
+class Source:
+    """Counts fetches and returns an increasing value."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def fetch(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("rpc down")
+        return {"price": self.calls}
+
+    def fetch_sync(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {"price": self.calls}
+
+
+def _age(cache: StaleWhileRevalidateCache, key, seconds: float) -> None:
+    cache._entries[key].fetched_at -= seconds
+
+
+@pytest.mark.asyncio
+async def test_fresh_then_stale_then_refreshed():
+    """Test fresh hits, a stale hit with one background refresh, then the new value."""
+    cache = StaleWhileRevalidateCache("test", fresh_seconds=2, stale_seconds=30, max_entries=8)
+    source = Source(delay=0.05)
+
+    first = await cache.get("CRO-USDC", source.fetch)
+    assert (first.value, first.cache) == ({"price": 1}, "live")
+    assert (await cache.get("CRO-USDC", source.fetch)).cache == "fresh"
+
+    _age(cache, "CRO-USDC", 5)
+    stale = await asyncio.gather(*(cache.get("CRO-USDC", source.fetch) for _ in range(20)))
+    assert all(result.value == {"price": 1} and result.cache == "stale" for result in stale)
+    assert all(result.as_of == first.as_of for result in stale)
+
+    await asyncio.sleep(0.1)
+    assert source.calls == 2
+    refreshed = await cache.get("CRO-USDC", source.fetch)
+    assert (refreshed.value, refreshed.cache) == ({"price": 2}, "fresh")
+    assert refreshed.as_of > first.as_of
+
+
+@pytest.mark.asyncio
+async def test_expired_misses_are_coalesced():
+    """Test that concurrent misses past the stale window share one fetch."""
+    cache = StaleWhileRevalidateCache("test", fresh_seconds=1, stale_seconds=5, max_entries=8)
+    source = Source(delay=0.05)
+    await cache.get("k", source.fetch)
+    _age(cache, "k", 10)
+
+    results = await asyncio.gather(*(cache.get("k", source.fetch) for _ in range(10)))
+
+    assert source.calls == 2
+    assert all(result.cache == "live" and result.value == {"price": 2} for result in results)
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_stale_value():
+    """Test that a failing background refresh leaves the stale value in place."""
+    cache = StaleWhileRevalidateCache("test", fresh_seconds=1, stale_seconds=30, max_entries=8)
+    await cache.get("k", Source().fetch)
+    _age(cache, "k", 5)
+
+    failing = Source(fail=True)
+    assert (await cache.get("k", failing.fetch)).value == {"price": 1}
+    await asyncio.sleep(0.01)
+
+    assert failing.calls == 1
+    assert (await cache.get("k", failing.fetch)).cache == "stale"
+
+
+def test_sync_stale_refreshes_in_background():
+    """Test that blocking lookups return stale values without waiting for the refresh."""
+    cache = StaleWhileRevalidateCache("test", fresh_seconds=1, stale_seconds=30, max_entries=8)
+    source = Source(delay=0.2)
+    cache.get_sync("k", source.fetch_sync)
+    _age(cache, "k", 5)
+
+    start = time.monotonic()
+    stale = cache.get_sync("k", source.fetch_sync)
+    assert time.monotonic() - start < 0.1
+    assert stale.cache == "stale"
+
+    deadline = time.monotonic() + 2
+    while cache.get_sync("k", source.fetch_sync).value != {"price": 2}:
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+    assert source.calls == 2
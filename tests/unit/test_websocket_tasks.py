@@ -0,0 +1,80 @@
+"""
+Unit tests for WebSocket execution task tracking.
+
+Tests that a cancel message reaches the execution it names rather than the
+newest queued one, and that a disconnect cancels running and queued
+executions alike.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.routes.websocket import ConnectionManager
+
+SESSION_ID = "session-1"
+
+
+async def _execution(manager: ConnectionManager, execution_id: str | None = None) -> None:
+    if execution_id is not None:
+        manager.bind_execution(execution_id, asyncio.current_task())
+    await asyncio.sleep(10)
+
+
+def _start(manager: ConnectionManager, execution_id: str | None = None) -> asyncio.Task:
+    task = asyncio.create_task(_execution(manager, execution_id))
+    manager.register_execution_task(SESSION_ID, task)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_cancel_reaches_named_running_execution():
+    """Test that cancelling the running execution does not hit the queued one."""
+    manager = ConnectionManager()
+    running = _start(manager, "exec-1")
+    queued = _start(manager)
+    await asyncio.sleep(0)
+
+    assert manager.get_execution_task(SESSION_ID) is running
+    assert manager.cancel_execution(SESSION_ID, "exec-1") is True
+    await asyncio.gather(running, return_exceptions=True)
+
+    assert running.cancelled()
+    assert not queued.done()
+    assert manager.get_execution_tasks(SESSION_ID) == [queued]
+    assert "exec-1" not in manager.executions
+    queued.cancel()
+
+
+@pytest.mark.asyncio
+async def test_unknown_id_only_cancels_unannounced_running_execution():
+    """Test that an unknown ID cancels a starting execution but never a queued one."""
+    manager = ConnectionManager()
+    running = _start(manager, "exec-1")
+    queued = _start(manager)
+    await asyncio.sleep(0)
+
+    assert manager.cancel_execution(SESSION_ID, "exec-unknown") is False
+    assert not running.done() and not queued.done()
+
+    running.cancel()
+    await asyncio.gather(running, return_exceptions=True)
+    starting = manager.get_execution_task(SESSION_ID)
+
+    assert starting is queued
+    assert manager.cancel_execution(SESSION_ID, "exec-unknown") is True
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_running_and_queued_executions():
+    """Test that a disconnect leaves no execution of the session behind."""
+    manager = ConnectionManager()
+    tasks = [_start(manager, "exec-1"), _start(manager)]
+    await asyncio.sleep(0)
+
+    manager.disconnect(SESSION_ID, "user-1")
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(task.cancelled() for task in tasks)
+    assert manager.get_execution_tasks(SESSION_ID) == []
+    assert manager.executions == {}
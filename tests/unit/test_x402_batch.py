@@ -0,0 +1,278 @@
+"""
+Unit tests for concurrent x402 payment batches.
+
+Tests that batch flows share signing and facilitator rounds, that request
+concurrency is bounded per host, that results stream back per payment, and
+that payments already submitted finish when the consumer goes away.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from eth_account import Account
+
+from src.core.config import settings
+from src.services import x402_service as x402_module
+from src.services.x402_service import X402PaymentService
+from src.x402 import signature
+from src.x402.batch import ConcurrencyLimiter, MicroBatcher
+
+FACILITATOR_URL = "https://facilitator.test"
+
+
+class MockX402Transport:
+    """Paid services and a facilitator served from an httpx.MockTransport."""
+
+    def __init__(self, bulk: bool = True, bulk_status: int = 200):
+        self.bulk = bulk
+        self.bulk_status = bulk_status
+        self.facilitator_calls: list[str] = []
+        self.in_flight: dict[str, int] = {}
+        self.max_in_flight: dict[str, int] = {}
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "facilitator.test":
+            self.facilitator_calls.append(request.url.path)
+            if request.url.path == "/submit-payments":
+                if not self.bulk:
+                    return httpx.Response(404)
+                if self.bulk_status != 200:
+                    return httpx.Response(self.bulk_status)
+                payments = json.loads(request.content)["payments"]
+                return httpx.Response(200, json={"results": [
+                    {"paymentId": f"pay-{i}", "txHash": f"0x{i}", "paymentProof": f"proof-{i}"}
+                    for i in range(len(payments))
+                ]})
+            return httpx.Response(200, json={"paymentId": "pay", "txHash": "0x1", "paymentProof": "proof"})
+
+        host = request.url.host
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.max_in_flight[host] = max(self.max_in_flight.get(host, 0), self.in_flight[host])
+        await asyncio.sleep(0.01)
+        self.in_flight[host] -= 1
+
+        if request.url.path == "/free":
+            return httpx.Response(200, json={"data": "free"})
+        if request.headers.get("Payment-Proof"):
+            return httpx.Response(200, json={"data": "paid"})
+        return httpx.Response(402, headers={"Payment-Required": "x402; amount=0.10; token=USDC"})
+
+
+class GatedFacilitator(MockX402Transport):
+    """Mock services whose facilitator holds submissions until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "facilitator.test":
+            self.entered.set()
+            await self.release.wait()
+        elif request.url.path == "/slow":
+            await asyncio.sleep(10)
+        return await super().handler(request)
+
+
+@pytest.fixture
+def signer(monkeypatch):
+    """Use a throwaway signing key."""
+    monkeypatch.setattr(
+        signature, "_generator",
+        signature.EIP712SignatureGenerator(private_key=Account.create().key.hex()),
+    )
+    monkeypatch.setattr(settings, "debug", False)
+    monkeypatch.setattr(x402_module, "_BULK_SUBMIT_UNSUPPORTED", set())
+
+
+def _service(transport: MockX402Transport) -> X402PaymentService:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(transport.handler))
+    service = X402PaymentService(http_client=client)
+    service.facilitator_url = FACILITATOR_URL
+    return service
+
+
+async def _collect(service: X402PaymentService, payments: list[dict], **kwargs) -> dict[int, dict]:
+    return {index: result async for index, result in service.execute_payments_batch(payments, **kwargs)}
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("signer")
+async def test_batch_submits_to_facilitator_in_bulk():
+    """Test that concurrent payments share one bulk facilitator request."""
+    transport = MockX402Transport()
+    service = _service(transport)
+    payments = [
+        {"service_url": f"https://svc{i}.test/", "amount": 0.10, "token": "USDC"}
+        for i in range(10)
+    ]
+
+    results = await _collect(service, payments)
+
+    assert sorted(results) == list(range(10))
+    assert all(result["success"] for result in results.values())
+    assert {result["status"] for result in results.values()} == {"completed"}
+    assert set(transport.facilitator_calls) == {"/submit-payments"}
+    assert len(transport.facilitator_calls) < len(payments)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("signer")
+async def test_batch_falls_back_to_single_submissions():
+    """Test that a facilitator without a bulk endpoint gets one request per payment."""
+    transport = MockX402Transport(bulk=False)
+    service = _service(transport)
+    payments = [
+        {"service_url": f"https://svc{i}.test/", "amount": 0.10, "token": "USDC"}
+        for i in range(3)
+    ]
+
+    results = await _collect(service, payments)
+
+    assert all(result["success"] for result in results.values())
+    assert transport.facilitator_calls == ["/submit-payments"] + ["/submit-payment"] * 3
+
+    transport.facilitator_calls.clear()
+    await _collect(service, payments[:1])
+    assert transport.facilitator_calls == ["/submit-payment"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("signer")
+async def test_failed_bulk_submission_falls_back_per_payment():
+    """Test that a failed bulk facilitator call resubmits each payment on its own."""
+    transport = MockX402Transport(bulk_status=503)
+    service = _service(transport)
+    payments = [
+        {"service_url": f"https://svc{i}.test/", "amount": 0.10, "token": "USDC"}
+        for i in range(3)
+    ]
+
+    results = await _collect(service, payments)
+
+    assert all(result["success"] for result in results.values())
+    assert "/submit-payments" in transport.facilitator_calls
+    assert transport.facilitator_calls.count("/submit-payment") == 3
+    # A failed call is not a missing endpoint: the next batch tries bulk again
+    assert FACILITATOR_URL not in x402_module._BULK_SUBMIT_UNSUPPORTED
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("signer")
+async def test_batch_bounds_requests_per_host():
+    """Test that no more than max_per_host requests hit one host at once."""
+    transport = MockX402Transport()
+    service = _service(transport)
+    payments = [{"service_url": "https://busy.test/", "amount": 0.10, "token": "USDC"}] * 12
+
+    results = await _collect(service, payments, max_concurrency=10, max_per_host=3)
+
+    assert len(results) == 12
+    assert transport.max_in_flight["busy.test"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("signer")
+async def test_batch_reports_each_payment():
+    """Test that free, mismatched and paid services each get their own result."""
+    transport = MockX402Transport()
+    service = _service(transport)
+    payments = [
+        {"service_url": "https://svc.test/free", "amount": 0.10, "token": "USDC"},
+        {"service_url": "https://svc.test/", "amount": 0.50, "token": "USDC"},
+        {"service_url": "https://svc.test/", "amount": 0.10, "token": "USDC"},
+    ]
+
+    results = await _collect(service, payments)
+
+    assert results[0]["status"] == "no_payment_required"
+    assert results[1]["error"] == "amount_mismatch"
+    assert results[2]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("signer")
+async def test_abandoned_batch_finishes_submitted_payments():
+    """Test that submitted payments still settle and are handed over when the consumer leaves."""
+    transport = GatedFacilitator()
+    service = _service(transport)
+    payments = [
+        {"service_url": "https://svc.test/free", "amount": 0.10, "token": "USDC"},
+        {"service_url": "https://svc1.test/", "amount": 0.10, "token": "USDC"},
+        {"service_url": "https://svc2.test/", "amount": 0.10, "token": "USDC"},
+        {"service_url": "https://svc.test/slow", "amount": 0.10, "token": "USDC"},
+    ]
+    abandoned: dict[int, dict] = {}
+
+    async def record(index: int, result: dict) -> None:
+        abandoned[index] = result
+
+    stream = service.execute_payments_batch(payments, on_abandoned=record)
+    first, _ = await stream.__anext__()
+    await transport.entered.wait()
+    await asyncio.sleep(0.05)  # let both paid flows reach the facilitator
+    await stream.aclose()
+    transport.release.set()
+    await asyncio.wait_for(asyncio.gather(*x402_module._SETTLING_BATCHES), 1)
+
+    assert first == 0
+    assert sorted(abandoned) == [1, 2]
+    assert all(result["success"] and result["tx_hash"] for result in abandoned.values())
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_coalesces_concurrent_submits():
+    """Test that items submitted together are processed in one call."""
+    calls: list[list[int]] = []
+
+    async def double(items: list[int]) -> list[int]:
+        calls.append(items)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(double)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert results == [0, 2, 4, 6, 8]
+    assert calls == [[0, 1, 2, 3, 4]]
+    await batcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_close_resolves_in_flight_and_queued_items():
+    """Test that closing mid-batch cancels every submitter instead of leaving it waiting."""
+    started = asyncio.Event()
+
+    async def slow(items: list[int]) -> list[int]:
+        started.set()
+        await asyncio.sleep(10)
+        return items
+
+    batcher = MicroBatcher(slow, max_size=2)
+    submits = [asyncio.create_task(batcher.submit(i)) for i in range(4)]
+    await started.wait()
+
+    await batcher.aclose()
+    results = await asyncio.wait_for(asyncio.gather(*submits, return_exceptions=True), 1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_global_bound():
+    """Test that the global bound applies across hosts."""
+    limiter = ConcurrencyLimiter(max_concurrency=2, max_per_host=2)
+    active = peak = 0
+
+    async def request(url: str) -> None:
+        nonlocal active, peak
+        async with limiter.acquire(url):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(request(f"https://h{i}.test/") for i in range(6)))
+    assert peak == 2
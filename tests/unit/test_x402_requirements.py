@@ -0,0 +1,169 @@
+"""
+Unit tests for cached x402 payment requirements.
+
+Tests that a repeat payment to a known service skips the unpaid request,
+and that the cached requirement is dropped on mismatch, expiry or a
+rejected proof without the rejected payment being settled twice.
+"""
+
+import json
+
+import httpx
+import pytest
+from eth_account import Account
+
+from src.core.config import settings
+from src.services import x402_service as x402_module
+from src.services.x402_service import X402PaymentService
+from src.x402 import signature
+from src.x402.requirements import PaymentRequirementsCache
+
+SERVICE_URL = "https://svc.test/data"
+
+
+class PaidService:
+    """A paid service and facilitator served from an httpx.MockTransport."""
+
+    def __init__(self, amount: str = "0.10"):
+        self.amount = amount
+        self.accept_proofs = True
+        self.proof_status = 200
+        self.unpaid_requests = 0
+        self.paid_requests = 0
+        self.facilitator_calls = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "facilitator.test":
+            self.facilitator_calls += 1
+            settled = {"paymentId": "pay", "txHash": "0x1", "paymentProof": "proof"}
+            if request.url.path == "/submit-payments":
+                payments = json.loads(request.content)["payments"]
+                return httpx.Response(200, json={"results": [settled] * len(payments)})
+            return httpx.Response(200, json=settled)
+        if request.headers.get("Payment-Proof") and self.accept_proofs:
+            self.paid_requests += 1
+            return httpx.Response(self.proof_status, json={"data": "paid"})
+        self.unpaid_requests += 1
+        return httpx.Response(402, headers={"Payment-Required": f"x402; amount={self.amount}; token=USDC"})
+
+
+@pytest.fixture
+def paid_service(monkeypatch):
+    """Service, signer and an X402PaymentService with its own cache."""
+    monkeypatch.setattr(
+        signature, "_generator",
+        signature.EIP712SignatureGenerator(private_key=Account.create().key.hex()),
+    )
+    monkeypatch.setattr(settings, "debug", False)
+    service = PaidService()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(service.handler))
+    x402 = X402PaymentService(http_client=client, requirements_cache=PaymentRequirementsCache(ttl_seconds=60))
+    x402.facilitator_url = "https://facilitator.test"
+    x402.retry_attempts = 1
+    monkeypatch.setattr(x402_module, "_BULK_SUBMIT_UNSUPPORTED", set())
+    return service, x402
+
+
+@pytest.mark.asyncio
+async def test_repeat_payment_skips_discovery(paid_service):
+    """Test that the second payment sends only the paid request."""
+    service, x402 = paid_service
+
+    first = await x402.execute_payment(SERVICE_URL, 0.10, "USDC")
+    second = await x402.execute_payment(SERVICE_URL, 0.10, "USDC")
+
+    assert first["success"] and second["success"]
+    assert service.unpaid_requests == 1
+    assert service.paid_requests == 2
+
+
+@pytest.mark.asyncio
+async def test_amount_mismatch_invalidates(paid_service):
+    """Test that a payment for a different amount asks the service again."""
+    service, x402 = paid_service
+    await x402.execute_payment(SERVICE_URL, 0.10, "USDC")
+
+    result = await x402.execute_payment(SERVICE_URL, 0.20, "USDC")
+
+    assert result["success"] is False
+    assert service.unpaid_requests == 2
+    assert service.paid_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_proof_is_not_paid_again(paid_service):
+    """Test that a rejected pre-emptive proof is reported, not settled a second time."""
+    service, x402 = paid_service
+    await x402.execute_payment(SERVICE_URL, 0.10, "USDC")
+    service.facilitator_calls = 0
+
+    service.accept_proofs = False
+    result = await x402.execute_payment(SERVICE_URL, 0.10, "USDC")
+
+    assert result["success"] is False
+    assert result["error"] == "payment_proof_rejected"
+    assert (result["payment_id"], result["tx_hash"]) == ("pay", "0x1")
+    assert service.facilitator_calls == 1
+    assert service.unpaid_requests == 2  # first discovery and the rejected proof, no rediscovery
+    assert x402.requirements_cache.get(SERVICE_URL) is None
+
+
+@pytest.mark.asyncio
+async def test_failed_proof_response_keeps_payment(paid_service):
+    """Test that a service error after a pre-emptive settlement still reports the payment."""
+    service, x402 = paid_service
+    await x402.execute_payment(SERVICE_URL, 0.10, "USDC")
+
+    service.proof_status = 500
+    result = await x402.execute_payment(SERVICE_URL, 0.10, "USDC")
+
+    assert result["success"] is False
+    assert result["error"] == "HTTP 500"
+    assert (result["payment_id"], result["tx_hash"]) == ("pay", "0x1")
+
+
+@pytest.mark.asyncio
+async def test_batch_rejected_proof_is_not_paid_again(paid_service):
+    """Test that a batch flow with a rejected pre-emptive proof settles only once."""
+    service, x402 = paid_service
+    await x402.execute_payment(SERVICE_URL, 0.10, "USDC")
+    service.facilitator_calls = 0
+
+    service.accept_proofs = False
+    payments = [{"service_url": SERVICE_URL, "amount": 0.10, "token": "USDC"}]
+    results = [result async for _, result in x402.execute_payments_batch(payments)]
+
+    assert results[0]["error"] == "payment_proof_rejected"
+    assert results[0]["payment_id"] is not None
+    assert service.facilitator_calls == 1
+    assert service.unpaid_requests == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_uses_cached_requirement(paid_service):
+    """Test that batch payments also skip discovery for known services."""
+    service, x402 = paid_service
+    await x402.execute_payment(SERVICE_URL, 0.10, "USDC")
+
+    payments = [{"service_url": SERVICE_URL, "amount": 0.10, "token": "USDC"}] * 3
+    results = [result async for _, result in x402.execute_payments_batch(payments)]
+
+    assert all(result["success"] for result in results)
+    assert service.unpaid_requests == 1
+
+
+def test_cache_expiry_and_eviction(monkeypatch):
+    """Test that entries expire after the TTL and the LRU is bounded."""
+    now = [1000.0]
+    monkeypatch.setattr("src.x402.requirements.time.monotonic", lambda: now[0])
+    cache = PaymentRequirementsCache(ttl_seconds=10, max_entries=2)
+
+    cache.put("a", "0.10", "USDC")
+    cache.put("b", "0.10", "USDC")
+    assert cache.get("a").matches(0.1, "USDC")
+    cache.put("c", "0.10", "USDC")
+    assert cache.get("b") is None  # least recently used
+    assert len(cache) == 2
+
+    now[0] += 11
+    assert cache.get("a") is None